@@ -1,17 +1,23 @@
+import contextvars
 import copy
 import functools
 import json
 import re
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from anthropic import APIConnectionError, APIError
 
+import db
 from agent.core import (
     MAX_CONTEXT_MEMBERS_DEFAULT,
     MAX_TOOL_ROUNDS,
     TOOL_RESULT_MAX_CHARS,
     TOOL_RESULT_MAX_ITEMS,
     _create_chat_completion,
+    current_tool_cache,
     log,
     policy_for,
     response_text,
@@ -455,6 +461,66 @@ def _tool_result_succeeded(envelope_json: str) -> bool:
     return bool(envelope.get("ok")) and envelope.get("error") is None
 
 
+# Read-only tool calls from one model round run side by side: five member
+# lookups cost the slowest one, not the sum. Each call opens its own DB
+# connection (the tool layer never shares one) and runs in a copy of the
+# turn's context, so turn-scoped state such as the turn id still applies.
+READ_TOOL_WORKERS = 4
+_READ_TOOL_POOL: ThreadPoolExecutor | None = None
+_READ_TOOL_POOL_LOCK = threading.Lock()
+
+
+def _read_tool_pool() -> ThreadPoolExecutor:
+    global _READ_TOOL_POOL
+    with _READ_TOOL_POOL_LOCK:
+        if _READ_TOOL_POOL is None:
+            _READ_TOOL_POOL = ThreadPoolExecutor(
+                max_workers=READ_TOOL_WORKERS, thread_name_prefix="read-tool"
+            )
+        return _READ_TOOL_POOL
+
+
+def _execute_read_tools(calls, workflow):
+    """Run cleared read-only ``(name, args)`` calls; results come back in call order."""
+    if len(calls) < 2:
+        return [_execute_tool(name, args, workflow=workflow) for name, args in calls]
+    pool = _read_tool_pool()
+    futures = [
+        pool.submit(contextvars.copy_context().run, _execute_tool, name, args, workflow=workflow)
+        for name, args in calls
+    ]
+    return [future.result() for future in futures]
+
+
+_GENERATION_UNKNOWN = object()
+
+
+def _data_generation():
+    """The materialization id tool reads currently see, for the turn cache key.
+
+    Read once per batch of read calls: the engine can land a generation between
+    rounds of one turn, and a result from the old one must not be replayed.
+    """
+    from engine import readiness
+
+    try:
+        conn = db.get_connection()
+    except sqlite3.Error, RuntimeError:
+        log.debug("tool cache: no connection for the data generation", exc_info=True)
+        return _GENERATION_UNKNOWN
+    try:
+        return (readiness.generation_snapshot(conn) or {}).get("materialization_id")
+    except sqlite3.Error:
+        log.debug("tool cache: data generation unreadable", exc_info=True)
+        return _GENERATION_UNKNOWN
+    finally:
+        conn.close()
+
+
+def _tool_cache_key(workflow, name, args, generation) -> tuple:
+    return (workflow, name, json.dumps(args, sort_keys=True, default=str), generation)
+
+
 def _in_turn(fn):
     """Group every model call this function makes under one turn id.
 
@@ -492,7 +558,9 @@ def _chat_with_tools(
         between the system prompt and the current user message.
     tool_stats: optional dict the caller provides; populated in-place with
         ``write_calls_issued``, ``write_calls_succeeded``, ``write_calls_denied``
-        so the caller can persist the awareness-loop tool trace.
+        so the caller can persist the awareness-loop tool trace, plus
+        ``tool_cache`` (hits / misses / invalidations / hit_rate of the turn's
+        read-tool memo).
     Returns the final parsed response dict, or None.
     """
     # Resolve the workflow's ceiling once, here, because this function also
@@ -558,6 +626,16 @@ def _chat_with_tools(
     tool_stats.setdefault("write_calls_issued", 0)
     tool_stats.setdefault("write_calls_succeeded", 0)
     tool_stats.setdefault("write_calls_denied", 0)
+    cache_stats = tool_stats.setdefault(
+        "tool_cache", {"hits": 0, "misses": 0, "invalidations": 0, "hit_rate": None}
+    )
+
+    def _count_cache(hits=0, misses=0, invalidations=0):
+        cache_stats["hits"] += hits
+        cache_stats["misses"] += misses
+        cache_stats["invalidations"] += invalidations
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        cache_stats["hit_rate"] = round(cache_stats["hits"] / lookups, 3) if lookups else None
 
     def _emit(event: dict) -> None:
         """Fire a live progress event (tool call, truncation) to an optional
@@ -663,6 +741,76 @@ def _chat_with_tools(
             completion_latencies_ms,
         )
 
+    def _finish_tool_call(round_num, blocks, tool_use, fn_name, fn_args, allowed, result, ran):
+        """Record one call's result, trace entry and live event, in call order."""
+        nonlocal allowed_tools, allowed_tool_names
+        if ran and _tool_result_succeeded(result):
+            discovered_codes = _extract_tool_result_reference_codes(result)
+            if not discovered_codes <= context_reference_codes:
+                context_reference_codes.update(discovered_codes)
+                allowed_tools = _tools_with_reference_codes(
+                    base_allowed_tools, context_reference_codes
+                )
+                allowed_tool_names = _tool_names(allowed_tools)
+        trace_entry = {
+            "tool": fn_name,
+            "args": _summarize_tool_args(fn_args),
+            "round": round_num,
+            "allowed": allowed,
+            "result": _summarize_tool_result(result),
+        }
+        tool_stats.setdefault("tool_trace", []).append(trace_entry)
+        _emit({"type": "tool", **trace_entry})
+        blocks.append(
+            {
+                "type": "tool_result",
+                "tool_use_id": tool_use.id,
+                "content": result,
+            }
+        )
+
+    def _flush_read_calls(round_num, blocks, batch):
+        """Run the read calls cleared so far, then record them in order."""
+        if not batch:
+            return
+        # Same (workflow, tool, args, generation) earlier in the turn: replay
+        # the raw result. Live CR API lookups are never replayed.
+        cache = current_tool_cache()
+        keys = [None] * len(batch)
+        if cache is not None and any(
+            fn_name not in EXTERNAL_LOOKUP_TOOL_NAMES for _tool_use, fn_name, _args in batch
+        ):
+            generation = _data_generation()
+            if generation is not _GENERATION_UNKNOWN:
+                keys = [
+                    None
+                    if fn_name in EXTERNAL_LOOKUP_TOOL_NAMES
+                    else _tool_cache_key(workflow, fn_name, fn_args, generation)
+                    for _tool_use, fn_name, fn_args in batch
+                ]
+        raw_results = [cache.get(key) if key is not None else None for key in keys]
+        # One execution per distinct call: an uncached call by its position, a
+        # cacheable one by its key, so a repeat inside the batch runs once.
+        pending: dict = {}
+        for index, (key, raw) in enumerate(zip(keys, raw_results, strict=True)):
+            if raw is None:
+                pending.setdefault(index if key is None else key, index)
+        ran_results = _execute_read_tools(
+            [(batch[index][1], batch[index][2]) for index in pending.values()], workflow
+        )
+        fresh = dict(zip(pending, ran_results, strict=True))
+        for index, key in enumerate(keys):
+            if raw_results[index] is None:
+                raw_results[index] = fresh[index if key is None else key]
+        misses = sum(1 for identity in pending if not isinstance(identity, int))
+        _count_cache(hits=sum(1 for key in keys if key is not None) - misses, misses=misses)
+        for (tool_use, fn_name, fn_args), key, raw in zip(batch, keys, raw_results, strict=True):
+            result = _build_tool_result_envelope(fn_name, raw)
+            if key is not None and _tool_result_succeeded(result):
+                cache.put(key, raw)
+            _finish_tool_call(round_num, blocks, tool_use, fn_name, fn_args, True, result, True)
+        batch.clear()
+
     for _round in range(max_tool_rounds + 1):
         try:
             resp = _create_completion(messages)
@@ -729,10 +877,18 @@ def _chat_with_tools(
         # Process tool calls — echo the native content blocks back verbatim
         messages.append({"role": "assistant", "content": resp.content})
         tool_result_blocks = []
+        # Read calls cleared by the gates wait here and run together. Anything
+        # else settles them first, so a write never overtakes an earlier read,
+        # a later read sees the write, and results keep the model's order.
+        read_batch = []
         for tool_use in tool_uses:
             fn_name = tool_use.name
             fn_args = tool_use.input if isinstance(tool_use.input, dict) else {}
+            ran = False
 
+            if fn_name == "lookup_reference" or fn_name not in allowed_tool_names:
+                # An earlier result in this round may unlock this call.
+                _flush_read_calls(_round, tool_result_blocks, read_batch)
             allowed = fn_name in allowed_tool_names
             if not allowed:
                 denied_tool_count += 1
@@ -832,36 +988,26 @@ def _chat_with_tools(
                         external_lookup_calls += 1
                     if is_budgeted_write:
                         tool_stats["write_calls_issued"] += 1
+                    if side_effect != "write":
+                        read_batch.append((tool_use, fn_name, fn_args))
+                        continue
+                    _flush_read_calls(_round, tool_result_blocks, read_batch)
                     result = _build_tool_result_envelope(
                         fn_name,
                         _execute_tool(fn_name, fn_args, workflow=workflow),
                     )
+                    ran = True
+                    # Even a failed write may have changed something a cached read saw.
+                    turn_cache = current_tool_cache()
+                    if turn_cache is not None and turn_cache.clear():
+                        _count_cache(invalidations=1)
                     if is_budgeted_write and _tool_result_succeeded(result):
                         tool_stats["write_calls_succeeded"] += 1
-                    if _tool_result_succeeded(result):
-                        discovered_codes = _extract_tool_result_reference_codes(result)
-                        if not discovered_codes <= context_reference_codes:
-                            context_reference_codes.update(discovered_codes)
-                            allowed_tools = _tools_with_reference_codes(
-                                base_allowed_tools, context_reference_codes
-                            )
-                            allowed_tool_names = _tool_names(allowed_tools)
-            trace_entry = {
-                "tool": fn_name,
-                "args": _summarize_tool_args(fn_args),
-                "round": _round,
-                "allowed": allowed,
-                "result": _summarize_tool_result(result),
-            }
-            tool_stats.setdefault("tool_trace", []).append(trace_entry)
-            _emit({"type": "tool", **trace_entry})
-            tool_result_blocks.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": tool_use.id,
-                    "content": result,
-                }
+            _flush_read_calls(_round, tool_result_blocks, read_batch)
+            _finish_tool_call(
+                _round, tool_result_blocks, tool_use, fn_name, fn_args, allowed, result, ran
             )
+        _flush_read_calls(_round, tool_result_blocks, read_batch)
         messages.append({"role": "user", "content": tool_result_blocks})
 
     # If we hit max rounds, nudge the model to produce a final JSON answer with no more tools
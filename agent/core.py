@@ -1,6 +1,7 @@
 """Shared core state for the agent package."""
 
 import contextvars
+import hashlib
 import logging
 import os
 import sqlite3
@@ -198,22 +199,61 @@ _turn_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
 )
 
 
+# The model often asks for the same read twice in one turn (get_member for a tag
+# it already looked up, get_elixir_state with identical args in a later round).
+# Read-tool results are memoized for the life of the turn, keyed by the caller
+# on (workflow, tool, canonical args, data generation); a write tool anywhere in
+# the turn clears the lot. Lives beside the turn id so the two share a lifetime.
+_turn_tool_cache: contextvars.ContextVar["TurnToolCache | None"] = contextvars.ContextVar(
+    "elixir_turn_tool_cache", default=None
+)
+
+
+class TurnToolCache:
+    """Raw read-tool results memoized within one turn. Thread-safe: a round's
+    read calls run on a pool in copies of the turn's context."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: dict[tuple, str] = {}
+
+    def get(self, key: tuple) -> str | None:
+        with self._lock:
+            return self._results.get(key)
+
+    def put(self, key: tuple, result: str) -> None:
+        with self._lock:
+            self._results[key] = result
+
+    def clear(self) -> int:
+        """Drop every entry; returns how many there were."""
+        with self._lock:
+            dropped = len(self._results)
+            self._results.clear()
+            return dropped
+
+
 class turn:
     """Group every model call made inside this block under one turn id.
 
     Re-entrant on purpose: a workflow that calls another workflow stays part of
     the outer turn, because the outer turn is what actually cost the money.
+    The outermost block also owns the turn's ``TurnToolCache``.
     """
 
     def __init__(self):
         self._token = None
+        self._cache_token = None
 
     def __enter__(self):
         if _turn_id.get() is None:
             self._token = _turn_id.set(uuid.uuid4().hex[:16])
+            self._cache_token = _turn_tool_cache.set(TurnToolCache())
         return self
 
     def __exit__(self, *exc):
+        if self._cache_token is not None:
+            _turn_tool_cache.reset(self._cache_token)
         if self._token is not None:
             _turn_id.reset(self._token)
         return False
@@ -223,6 +263,11 @@ def current_turn_id() -> str | None:
     return _turn_id.get()
 
 
+def current_tool_cache() -> TurnToolCache | None:
+    """The tool-result cache of the turn in progress, or None outside a turn."""
+    return _turn_tool_cache.get()
+
+
 # ── Model capability gates ───────────────────────────────────────────────────
 #
 # These are API *removals*, not style preferences: sending a parameter a model
@@ -278,11 +323,62 @@ TOOL_RESULT_MAX_ITEMS = 50
 TOOL_RESULT_MAX_CHARS = 20000
 
 
+# System prompts are interned by content hash. The same sections always come
+# back as the same string object with the same hash, so a prefix that has not
+# changed is provably byte-identical to the one the API already cached, and a
+# prefix that churns shows up as a hash change per workflow instead of as a
+# quietly falling cache-read rate.
+_SYSTEM_PROMPTS: dict[str, str] = {}
+_SYSTEM_PROMPT_LIMIT = 256
+_system_prompt_lock = threading.Lock()
+_prefix_by_workflow: dict[str, dict] = {}
+
+
+def system_prompt_hash(prompt: str) -> str:
+    """Short content hash of a system prompt (the cacheable prefix)."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
 def _build_system_prompt(*sections):
     parts = [s for s in sections if s]
     parts.append(f"Your release: {RELEASE_LABEL}")
     parts.append(f"Your build version: {BUILD_HASH}")
-    return "\n\n".join(parts)
+    prompt = "\n\n".join(parts)
+    digest = system_prompt_hash(prompt)
+    with _system_prompt_lock:
+        interned = _SYSTEM_PROMPTS.get(digest)
+        if interned is not None:
+            return interned
+        if len(_SYSTEM_PROMPTS) >= _SYSTEM_PROMPT_LIMIT:
+            del _SYSTEM_PROMPTS[next(iter(_SYSTEM_PROMPTS))]
+        _SYSTEM_PROMPTS[digest] = prompt
+    return prompt
+
+
+def _note_system_prefix(workflow: str, system: str) -> None:
+    digest = system_prompt_hash(system)
+    with _system_prompt_lock:
+        entry = _prefix_by_workflow.setdefault(workflow, {"hash": None, "calls": 0, "changes": 0})
+        previous = entry["hash"]
+        entry["calls"] += 1
+        if previous is not None and previous != digest:
+            entry["changes"] += 1
+        entry["hash"] = digest
+    if previous is not None and previous != digest:
+        log.info("system_prefix_changed workflow=%s %s -> %s", workflow, previous, digest)
+
+
+def system_prefix_stats() -> dict:
+    """Per-workflow system-prompt hash, call count and how often it changed."""
+    with _system_prompt_lock:
+        return {workflow: dict(entry) for workflow, entry in _prefix_by_workflow.items()}
+
+
+def _clear_system_prompts() -> None:
+    """Test hook: forget interned prompts and per-workflow prefix history."""
+    with _system_prompt_lock:
+        _SYSTEM_PROMPTS.clear()
+        _prefix_by_workflow.clear()
 
 
 # ── Native response helpers ──────────────────────────────────────────────────
@@ -568,6 +664,7 @@ def _create_chat_completion(
 
     # System prompt with optional prompt caching
     if system:
+        _note_system_prefix(workflow, system)
         system_block = {"type": "text", "text": system}
         if cache_enabled:
             system_block["cache_control"] = prefix_cc
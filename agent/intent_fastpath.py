@@ -0,0 +1,359 @@
+"""Local fast path in front of the LLM intent router.
+
+Every addressed Discord message used to cost a Haiku round trip before any
+real work began, "thanks" and "help" included. The router's own decisions are
+already captured in telemetry (``llm_calls`` rows for the ``intent_router``
+workflow: the message it saw and the route it picked), and channel traffic
+repeats itself. This module fits a multinomial naive Bayes over the word
+unigrams and bigrams of those messages, plus the channel context the router is
+told (workflow, mention, open channel), and answers in-process when it is sure.
+
+It defers to the LLM router (returns None) when:
+
+  * fewer than ``MIN_EXAMPLES`` captured decisions exist, or the predicted
+    label was seen fewer than ``MIN_LABEL_SUPPORT`` times;
+  * the top posterior is under ``MIN_CONFIDENCE``, or the predicted label has
+    seen under ``MIN_FAMILIARITY`` of the message's words and word pairs —
+    naive Bayes is confidently wrong about a new question that shares one
+    word ("how") with a trained one;
+  * the message has recent conversation and reads as a follow-up to it (short,
+    or leaning on "it" / "that" / "swap" ...): the router inherits those
+    routes from history, which this model never sees;
+  * it would answer ``not_for_bot`` to a message that mentioned the bot, or a
+    route the channel's workflow does not offer;
+  * a random ``AUDIT_RATE`` share of confident messages, so the router keeps
+    labelling the traffic this model answers. Prompt captures are pruned at
+    14 days; without fresh labels the model would train on an ever-thinner,
+    ever-harder tail.
+
+The model is refit from telemetry at most every ``MODEL_MAX_AGE`` seconds; a
+few thousand captured decisions fit in well under a second.
+``scripts/eval_intent_fastpath.py`` replays them to measure agreement with the
+router and the latency saved.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from agent.intent_router import Intent, _normalize_mode, _normalize_target
+from runtime.intent_registry import ROUTE_KEYS, get_route
+from storage import telemetry
+
+log = logging.getLogger("elixir_agent")
+
+FASTPATH_MODEL = "local-ngram"
+ENABLED = os.getenv("ELIXIR_INTENT_FASTPATH", "1") != "0"
+MIN_CONFIDENCE = float(os.getenv("ELIXIR_INTENT_FASTPATH_MIN_CONFIDENCE", "0.95"))
+AUDIT_RATE = float(os.getenv("ELIXIR_INTENT_FASTPATH_AUDIT_RATE", "0.1"))
+MIN_EXAMPLES = 200
+MIN_LABEL_SUPPORT = 5
+MIN_FAMILIARITY = 0.5
+MODEL_MAX_AGE = 3600.0  # seconds between refits from telemetry
+_ALPHA = 0.5  # additive smoothing
+
+_ROUTED_WORKFLOWS = {"interactive", "clanops"}
+_NOISE = re.compile(r"<[@#][!&]?\d+>|https?://\S+")
+_WORD = re.compile(r"[a-z0-9#']+")
+# Words that point back at the previous turn ("make it cheaper", "swap that").
+_FOLLOW_UP = re.compile(
+    r"\b(it|its|that|this|those|these|them|they|he|she|him|her|his|one|ones|same|"
+    r"instead|again|another|else|swap|replace|cheaper|lower|higher|more|less|also|too)\b"
+)
+
+# The router's user message (agent.intent_router._build_user_message) and the
+# select_route arguments, straight out of the captured JSON.
+_ROUTED_SQL = """
+    SELECT recorded_at, duration_ms,
+           json_extract(prompt_json, '$.messages[0].content'),
+           json_extract(response_json, '$.tool_uses[0].input')
+    FROM llm_calls
+    WHERE workflow = 'intent_router' AND ok = 1
+      AND json_valid(prompt_json) AND json_valid(response_json)
+    ORDER BY recorded_at, call_id
+"""
+
+
+@dataclass(frozen=True)
+class RoutedMessage:
+    """One captured router decision: what it was shown and what it chose."""
+
+    question: str
+    workflow: str
+    mentioned: bool
+    allows_open_channel_reply: bool
+    has_history: bool
+    route: str
+    mode: Optional[str]
+    target_member: Optional[str]
+    duration_ms: Optional[float] = None
+    recorded_at: str = ""
+
+    @property
+    def label(self) -> tuple:
+        return (self.route, self.mode, self.target_member)
+
+
+def parse_routed_message(
+    content, arguments, *, duration_ms=None, recorded_at: str = ""
+) -> Optional[RoutedMessage]:
+    """A :class:`RoutedMessage` from the router's captured user message and
+    ``select_route`` arguments (either may still be JSON text), or None when
+    the capture is not a complete, known-route decision."""
+    try:
+        if isinstance(arguments, str):
+            arguments = json.loads(arguments)
+        if isinstance(content, str) and content.startswith("["):
+            content = json.loads(content)
+    except ValueError:
+        return None
+    if isinstance(content, list):
+        content = "".join(b.get("text") or "" for b in content if isinstance(b, dict))
+    if not isinstance(content, str) or not isinstance(arguments, dict):
+        return None
+    route = arguments.get("route")
+    head, marker, question = content.partition("\nCurrent message: ")
+    if route not in ROUTE_KEYS or not marker:
+        return None
+    question = question.rsplit("\n\nCall select_route", 1)[0]
+    fields = dict(line.split(": ", 1) for line in head.splitlines() if ": " in line)
+    return RoutedMessage(
+        question=question,
+        workflow=fields.get("Channel workflow", ""),
+        mentioned=fields.get("Bot was mentioned") == "True",
+        allows_open_channel_reply=fields.get("Channel allows open-channel replies") == "True",
+        has_history="Recent conversation (oldest first):" in head,
+        route=route,
+        mode=_normalize_mode(route, arguments.get("mode")),
+        target_member=_normalize_target(arguments.get("target_member")),
+        duration_ms=duration_ms,
+        recorded_at=recorded_at,
+    )
+
+
+def load_routed_messages(conn: Optional[sqlite3.Connection] = None) -> list[RoutedMessage]:
+    """Every captured router decision still holding its prompt, oldest first."""
+    try:
+        rows = (conn or telemetry.connect()).execute(_ROUTED_SQL).fetchall()
+    except sqlite3.Error:
+        log.warning("intent fast path: could not read router captures", exc_info=True)
+        return []
+    out = []
+    for recorded_at, duration_ms, content, arguments in rows:
+        routed = parse_routed_message(
+            content, arguments, duration_ms=duration_ms, recorded_at=recorded_at
+        )
+        if routed is not None:
+            out.append(routed)
+    return out
+
+
+def _words(question: str) -> list[str]:
+    return _WORD.findall(_NOISE.sub(" ", question.lower()))
+
+
+def _grams(question: str) -> list[str]:
+    words = _words(question)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]
+
+
+def features(question: str, *, workflow: str, mentioned: bool, open_reply: bool) -> list[str]:
+    feats = _grams(question)
+    empty = not feats
+    feats += [
+        f"__workflow={workflow}",
+        f"__mentioned={int(mentioned)}",
+        f"__open={int(open_reply)}",
+    ]
+    if empty:
+        feats.append("__empty")
+    return feats
+
+
+def leans_on_history(question: str) -> bool:
+    """Whether a message probably continues the previous turn."""
+    words = _words(question)
+    return len(words) < 3 or bool(_FOLLOW_UP.search(" ".join(words)))
+
+
+class FastPathModel:
+    """Multinomial naive Bayes over (route, mode, target_member) labels."""
+
+    def __init__(self, examples: Iterable[RoutedMessage]):
+        self.label_counts: Counter = Counter()
+        self._token_counts: dict[tuple, Counter] = {}
+        self._token_totals: Counter = Counter()
+        self._vocab: set[str] = set()
+        for ex in examples:
+            feats = features(
+                ex.question,
+                workflow=ex.workflow,
+                mentioned=ex.mentioned,
+                open_reply=ex.allows_open_channel_reply,
+            )
+            self.label_counts[ex.label] += 1
+            self._token_counts.setdefault(ex.label, Counter()).update(feats)
+            self._token_totals[ex.label] += len(feats)
+            self._vocab.update(feats)
+        self.examples = sum(self.label_counts.values())
+
+    def predict(
+        self, question: str, *, workflow: str, mentioned: bool, allows_open_channel_reply: bool
+    ) -> tuple[Optional[tuple], float]:
+        """The most probable label and its posterior; (None, 0.0) untrained."""
+        if not self.examples:
+            return None, 0.0
+        feats = [
+            f
+            for f in features(
+                question,
+                workflow=workflow,
+                mentioned=mentioned,
+                open_reply=allows_open_channel_reply,
+            )
+            if f in self._vocab
+        ]
+        smoothing = _ALPHA * (len(self._vocab) + 1)
+        scores = {}
+        for label, n in self.label_counts.items():
+            counts = self._token_counts[label]
+            denom = math.log(self._token_totals[label] + smoothing)
+            scores[label] = math.log(n / self.examples) + sum(
+                math.log(counts.get(f, 0) + _ALPHA) - denom for f in feats
+            )
+        best = max(scores, key=scores.get)
+        top = scores[best]
+        return best, 1.0 / sum(math.exp(s - top) for s in scores.values())
+
+    def familiarity(self, question: str, label: tuple) -> float:
+        """Share of the message's words and word pairs ``label`` was trained on."""
+        grams = _grams(question)
+        if not grams:
+            return 1.0
+        seen = self._token_counts.get(label) or {}
+        return sum(1 for g in grams if g in seen) / len(grams)
+
+
+def decide(
+    model: FastPathModel,
+    question: str,
+    *,
+    workflow: str,
+    mentioned: bool,
+    allows_open_channel_reply: bool = False,
+    has_history: bool = False,
+    threshold: float = MIN_CONFIDENCE,
+) -> Optional[tuple[tuple, float]]:
+    """``(label, confidence)`` when the model may answer this message itself,
+    else None. Everything but the audit sample; the eval replays through it."""
+    if workflow not in _ROUTED_WORKFLOWS or (has_history and leans_on_history(question)):
+        return None
+    label, confidence = model.predict(
+        question,
+        workflow=workflow,
+        mentioned=mentioned,
+        allows_open_channel_reply=allows_open_channel_reply,
+    )
+    if label is None or confidence < threshold:
+        return None
+    if model.label_counts[label] < MIN_LABEL_SUPPORT:
+        return None
+    if model.familiarity(question, label) < MIN_FAMILIARITY:
+        return None
+    route = label[0]
+    if route == "not_for_bot" and mentioned:
+        return None  # the mention rule (prompts/agents/intent_router.md)
+    if workflow not in ((get_route(route) or {}).get("workflows") or ()):
+        return None
+    return label, confidence
+
+
+_LOCK = threading.Lock()
+# telemetry path -> (fitted at, model or None below MIN_EXAMPLES)
+_MODELS: dict[str, tuple[float, Optional[FastPathModel]]] = {}
+
+
+def _forget() -> None:
+    """Drop the fitted model. Tests call this."""
+    with _LOCK:
+        _MODELS.clear()
+
+
+def _model() -> Optional[FastPathModel]:
+    path = telemetry.telemetry_path()
+    with _LOCK:
+        fitted = _MODELS.get(path)
+        if fitted is not None and time.monotonic() - fitted[0] < MODEL_MAX_AGE:
+            return fitted[1]
+        started = time.perf_counter()
+        examples = load_routed_messages()
+        model = FastPathModel(examples) if len(examples) >= MIN_EXAMPLES else None
+        _MODELS.clear()
+        _MODELS[path] = (time.monotonic(), model)
+    log.info(
+        "intent fast path: fitted on %d router decisions in %.0f ms (%s)",
+        len(examples),
+        (time.perf_counter() - started) * 1000,
+        "active" if model else f"inactive below {MIN_EXAMPLES}",
+    )
+    return model
+
+
+def fast_intent(
+    question: str,
+    *,
+    workflow: str,
+    mentioned: bool,
+    allows_open_channel_reply: bool = False,
+    conversation_history: list[dict] | None = None,
+) -> Optional[Intent]:
+    """An :class:`~agent.intent_router.Intent` answered in-process, or None to
+    ask the LLM router."""
+    if not ENABLED:
+        return None
+    started = time.perf_counter()
+    model = _model()
+    if model is None:
+        return None
+    decided = decide(
+        model,
+        question,
+        workflow=workflow,
+        mentioned=mentioned,
+        allows_open_channel_reply=allows_open_channel_reply,
+        has_history=bool(conversation_history),
+    )
+    if decided is None or random.random() < AUDIT_RATE:
+        return None
+    (route, mode, target_member), confidence = decided
+    return {
+        "route": route,
+        "mode": mode,
+        "target_member": target_member,
+        "confidence": round(confidence, 4),
+        "rationale": f"local fast path over {model.examples} router decisions",
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+        "model": FASTPATH_MODEL,
+    }
+
+
+__all__ = [
+    "FASTPATH_MODEL",
+    "FastPathModel",
+    "RoutedMessage",
+    "decide",
+    "fast_intent",
+    "load_routed_messages",
+    "parse_routed_message",
+]
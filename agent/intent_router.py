@@ -5,7 +5,8 @@ message and the channel context, returns a structured `Intent` describing
 which handler should respond.
 
 The router uses Haiku via tool-use for forced structured output — there is no
-JSON parsing, the SDK hands us a dict directly.
+JSON parsing, the SDK hands us a dict directly. Messages the local classifier
+in `agent.intent_fastpath` is sure about never reach it.
 """
 
 from __future__ import annotations
@@ -150,6 +151,7 @@ def classify_intent(
     allows_open_channel_reply: bool = False,
     conversation_history: list[dict] | None = None,
     model: str | None = None,
+    fast_path: bool = True,
 ) -> Intent:
     """Classify a Discord message into a route. Always returns an Intent.
 
@@ -160,7 +162,23 @@ def classify_intent(
     On failure (LLM error, missing tool call, unknown route) returns an Intent
     with route='llm_chat' and a fallback_reason field set, so the caller can
     log it and continue.
+
+    With ``fast_path`` (and no explicit ``model``), a message the local
+    classifier is confident about is answered in-process without an LLM call;
+    its Intent carries ``model="local-ngram"``.
     """
+    if fast_path and model is None:
+        from agent import intent_fastpath
+
+        local = intent_fastpath.fast_intent(
+            question,
+            workflow=workflow,
+            mentioned=mentioned,
+            allows_open_channel_reply=allows_open_channel_reply,
+            conversation_history=conversation_history,
+        )
+        if local is not None:
+            return local
     started = time.perf_counter()
     selected_model = model or _lightweight_model_name()
 
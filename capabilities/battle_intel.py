@@ -22,6 +22,8 @@ from typing import Any, Optional
 
 import db as db_facade
 from engine.deck_hash import card_form
+from engine.ingest import _COMPETITIVE
+from storage import card_play_columns, card_usage
 
 CAPABILITY_ID = "battle_intelligence"
 CONTRACT_VERSION = 1
@@ -56,6 +58,14 @@ _SCOPES = {
 }
 # Scopes that need the battle_events join (the plays table lacks these flags).
 _SCOPES_NEEDING_JOIN = {"war", "ranked", "ladder"}
+# The same scopes as mode groups, for the daily card-usage rollup: ingest derives
+# every flag above from mode_group, so both name the same battles. None is all.
+_SCOPE_MODE_GROUPS = {
+    "competitive": frozenset(_COMPETITIVE),
+    "war": frozenset({"war"}),
+    "ranked": frozenset({"ranked"}),
+    "ladder": frozenset({"ladder"}),
+}
 
 
 def _plays_from(scope: str) -> str:
@@ -134,13 +144,17 @@ def _player_adjusted_lift(conn, card_id: int, evo, scope: str) -> Optional[dict]
     ).fetchall()
     if len(rows) < _LIFT_MIN_PLAYERS:
         return None
-    base = {
-        r[0]: (r[1], r[2])
-        for r in conn.execute(
-            "SELECT player_tag, SUM(outcome = 'W'), SUM(outcome = 'L') "
-            "FROM battle_card_plays WHERE side = 'member' GROUP BY player_tag"
-        )
-    }
+    # Every member play, grouped per call: the columnar store answers it from
+    # counters, and SQL only where the store declines.
+    base = card_play_columns.member_baselines(conn)
+    if base is None:
+        base = {
+            r[0]: (r[1], r[2])
+            for r in conn.execute(
+                "SELECT player_tag, SUM(outcome = 'W'), SUM(outcome = 'L') "
+                "FROM battle_card_plays WHERE side = 'member' GROUP BY player_tag"
+            )
+        }
     lifts = []
     for tag_, w, losses in rows:
         bw, bl = base.get(tag_, (0, 0))
@@ -177,13 +191,26 @@ def _card_view(conn, tag, card, scope, days=None) -> dict[str, Any]:
         where.append("p.player_tag = ?")
         params.append(tag)
         subject = tag
-    rows = conn.execute(
-        f"SELECT p.side, p.evolution_level, "
-        f"SUM(p.outcome = 'W') w, SUM(p.outcome = 'L') l, COUNT(*) n "
-        f"FROM {_plays_from(scope)} WHERE {' AND '.join(where)} "
-        f"GROUP BY p.side, p.evolution_level",
-        tuple(params),
-    ).fetchall()
+    rows = None
+    if not tag:
+        # Clan-wide: every play of the card in the window, summed from the daily
+        # rollup rather than scanned.
+        totals = card_usage.card_totals(
+            conn, since=cutoff, mode_groups=_SCOPE_MODE_GROUPS.get(scope), card_id=card_id
+        )
+        if totals is not None:
+            rows = [
+                (side, evo, *totals[(cid, evo, side)])
+                for cid, evo, side in sorted(totals, key=lambda k: (k[2], k[1] or 0))
+            ]
+    if rows is None:
+        rows = conn.execute(
+            f"SELECT p.side, p.evolution_level, "
+            f"SUM(p.outcome = 'W') w, SUM(p.outcome = 'L') l, COUNT(*) n "
+            f"FROM {_plays_from(scope)} WHERE {' AND '.join(where)} "
+            f"GROUP BY p.side, p.evolution_level",
+            tuple(params),
+        ).fetchall()
     names = _card_names(conn)
     playing: list[dict] = []
     facing: list[dict] = []
@@ -234,13 +261,41 @@ def _nemesis_view(conn, tag, scope, days=None) -> dict[str, Any]:
     if cutoff:
         where.append("p.battle_time >= ?")
         params.append(cutoff)
-    rows = conn.execute(
-        f"SELECT p.card_id, p.evolution_level, SUM(p.outcome = 'W') w, "
-        f"SUM(p.outcome = 'L') l, COUNT(*) n FROM {_plays_from(scope)} "
-        f"WHERE {' AND '.join(where)} "
-        f"GROUP BY p.card_id, p.evolution_level HAVING n >= ? ORDER BY (1.0 * w / (w + l)) ASC",
-        (*params, _N_FLOOR),
-    ).fetchall()
+    rows = None
+    if not tag and scope in ("all", "competitive"):
+        # Clan-wide over the plays table alone: every opponent play in the window,
+        # which the columnar store folds from per-day counters.
+        totals = card_play_columns.opponent_card_totals(
+            conn, since=cutoff, competitive_only=scope == "competitive"
+        )
+        if totals is not None:
+            rows = sorted(
+                (r for r in totals if r[4] >= _N_FLOOR and r[2] + r[3]),
+                key=lambda r: r[2] / (r[2] + r[3]),
+            )
+    if rows is None and not tag:
+        # The war/ranked/ladder scopes, or the store declined: the daily rollup.
+        totals = card_usage.card_totals(
+            conn, since=cutoff, side="opponent", mode_groups=_SCOPE_MODE_GROUPS.get(scope)
+        )
+        if totals is not None:
+            forms = [
+                (cid, evo, *totals[(cid, evo, side)])
+                for cid, evo, side in sorted(totals, key=lambda k: (k[0], k[1] or 0))
+            ]
+            rows = sorted(
+                (r for r in forms if r[4] >= _N_FLOOR and r[2] + r[3]),
+                key=lambda r: r[2] / (r[2] + r[3]),
+            )
+    if rows is None:
+        rows = conn.execute(
+            f"SELECT p.card_id, p.evolution_level, SUM(p.outcome = 'W') w, "
+            f"SUM(p.outcome = 'L') l, COUNT(*) n FROM {_plays_from(scope)} "
+            f"WHERE {' AND '.join(where)} "
+            f"GROUP BY p.card_id, p.evolution_level HAVING n >= ? "
+            f"ORDER BY (1.0 * w / (w + l)) ASC",
+            (*params, _N_FLOOR),
+        ).fetchall()
     names = _card_names(conn)
     nemeses = [
         {
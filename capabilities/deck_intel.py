@@ -49,12 +49,17 @@ therefore level readiness + structural soundness, with clan usage reported only
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
+import time
 from typing import Any, Optional
 
 import db as db_facade
 from engine import card_roles, deck_links
 from engine.normalize import card_display_level, card_display_max_level
+from storage import deck_index
+
+log = logging.getLogger("elixir.capabilities.deck_intel")
 
 CAPABILITY_ID = "deck_recommendations"
 CONTRACT_VERSION = 1
@@ -220,14 +225,20 @@ def _facts_for(deck_cards, facts: dict) -> list[Optional[dict]]:
     return [facts.get((cid, form)) or facts.get((cid, 0)) for cid, form in deck_cards]
 
 
-def _fielded_by(conn) -> dict[str, int]:
-    """Distinct clan members who field each deck. Context, never a quality claim."""
+def _fielded_by(conn, deck_hashes) -> dict[str, int]:
+    """Distinct clan members who field each of ``deck_hashes``. Context, never a
+    quality claim. Read for the decks being described only: grouping every deck
+    the clan ever fielded cost more than the rest of a recommendation."""
+    hashes = sorted(set(deck_hashes))
+    if not hashes:
+        return {}
     return {
         r["h"]: r["m"]
         for r in conn.execute(
             "SELECT e.our_deck_hash h, COUNT(DISTINCT b.player_tag) m "
             "FROM battle_enrichment e JOIN battle_events b ON b.dedup_key = e.battle_dedup_key "
-            "WHERE e.our_deck_hash IS NOT NULL GROUP BY 1"
+            f"WHERE e.our_deck_hash IN ({','.join('?' * len(hashes))}) GROUP BY 1",
+            hashes,
         )
     }
 
@@ -303,54 +314,29 @@ def _meets(deck, facts: dict, required: list[str]) -> bool:
     return all(card_roles.deck_has_property(deck_facts, p) for p in required)
 
 
-def _candidates(conn, cat, own, forms, *, require_structure=True) -> list[dict]:  # noqa: C901
+def _candidates(conn, cat, own, forms, *, require_structure=True, anchor=None) -> list[dict]:
     """Every buildable deck: owns all 8 cards, owns each required Evo/Hero form, and
-    (optionally) clears the structural floor. ``from_max`` is the rarity-independent
-    readiness measure — the only cross-rarity-comparable level quantity."""
-    champions = _champion_ids(conn)
+    (optionally) clears the structural floor; with ``anchor``, only decks holding that
+    card. ``from_max`` is the rarity-independent readiness measure — the only
+    cross-rarity-comparable level quantity.
+
+    The corpus filter runs on the process-level bitset index (storage.deck_index)
+    rather than a deck_profile scan; only the level arithmetic is per member.
+    """
+    owned = [cid for cid in own if cid in cat]
     out = []
-    for r in conn.execute(
-        "SELECT deck_hash, archetype, family, avg_elixir, cards_json, air_answer_count, "
-        "tank_answer_count, splash_answer_count, has_big_spell, has_small_spell "
-        "FROM deck_profile WHERE facts_complete = 1"
+    for base in deck_index.buildable_decks(
+        conn,
+        _champion_ids(conn),
+        owned,
+        forms,
+        require_structure=require_structure,
+        anchor=anchor,
     ):
-        pairs = [(p[0], p[1] or 0) for p in json.loads(r["cards_json"])]
-        # A deck is eight cards. Anything else is a malformed profile row, and it
-        # used to reach `max(gaps)` on an empty list and take down every
-        # recommendation for every member rather than skipping one bad row.
-        if len(pairs) != 8:
-            continue
-        if any(cid not in own or cid not in cat for cid, _ in pairs):
-            continue
-        if any(f and forms.get(cid, 0) < f for cid, f in pairs):
-            continue
-        # The air floor scales with the deck's own cost: guides ask for 2-3 air answers
-        # and exempt very cheap cycle decks, which defend by rotating rather than by
-        # holding. The old flat floor of 1 passed decks whose only air answer was a
-        # single spell. Cost of the tighter floor, measured over the corpus: 1.0%.
-        if require_structure and (
-            r["air_answer_count"] < card_roles.min_air_answers(r["avg_elixir"])
-            or not r["has_small_spell"]
-        ):
-            continue
-        # Slot legality (Evo + Hero + Wild = 3). Every profiled deck was observed in a
-        # real battle so this cannot fire today; it exists so that a deck assembled by
-        # any future code path can never be recommended in an unfieldable shape.
-        # Evo/Hero forms AND champions both draw on the same three slots.
-        if sum(1 for cid, f in pairs if f or cid in champions) > card_roles.MAX_SPECIAL_SLOTS:
-            continue
-        gaps = [cat[cid]["max_level"] - own[cid] for cid, _ in pairs]
+        gaps = [cat[cid]["max_level"] - own[cid] for cid, _ in base["cards"]]
         out.append(
-            {
-                "deck_hash": r["deck_hash"],
-                "archetype": r["archetype"],
-                "family": r["family"],
-                "avg_elixir": r["avg_elixir"],
-                "air_answers": r["air_answer_count"],
-                "has_big_spell": bool(r["has_big_spell"]),
-                "has_small_spell": bool(r["has_small_spell"]),
-                "cards": pairs,
-                "card_ids": frozenset(cid for cid, _ in pairs),
+            base
+            | {
                 "levels_from_max": round(sum(gaps) / 8, 2),
                 "worst_card_from_max": max(gaps),
             }
@@ -679,7 +665,6 @@ def _discover_view(conn, tag, limit) -> dict[str, Any]:
         return _envelope("discover", available=False, error="no_collection", member_tag=tag)
     forms = _owned_forms(conn, tag)
     played = set(_their_decks(conn, tag))
-    fielded = _fielded_by(conn)
     facts = _card_facts(conn, cat)
     played_arch = _played_archetypes(conn, tag)
     tower = _tower_troop(conn, tag)
@@ -688,16 +673,19 @@ def _discover_view(conn, tag, limit) -> dict[str, Any]:
 
     # One deck per archetype: a list of 8 near-identical lists is not a set of options.
     seen: set[str] = set()
-    picks: list[dict] = []
+    chosen: list[dict] = []
     for d in cands:
         if d["deck_hash"] in played or d["family"] in seen:
             continue
         seen.add(d["family"])
-        picks.append(
-            _describe(d, cat, own, fielded, played, facts, played_arch, tower, forms, champs)
-        )
-        if len(picks) >= max(1, min(int(limit or 6), 12)):
+        chosen.append(d)
+        if len(chosen) >= max(1, min(int(limit or 6), 12)):
             break
+    fielded = _fielded_by(conn, (d["deck_hash"] for d in chosen))
+    picks = [
+        _describe(d, cat, own, fielded, played, facts, played_arch, tower, forms, champs)
+        for d in chosen
+    ]
     meta = _meta_overlay(conn, cat, own, forms)
     field = _threat_profile(conn, tag)
     return _envelope(
@@ -719,7 +707,16 @@ def _discover_view(conn, tag, limit) -> dict[str, Any]:
 
 
 # ── modes C/D: war set and anchored ──────────────────────────────────────────
-def _pick_disjoint(cands, count, *, pinned=None, played=frozenset()) -> list[dict]:
+def _familiarity_rank(played):
+    """The war ranking: readiness, with a deck the member already pilots credited
+    ``_FAMILIARITY_SLACK`` levels, then the weakest card as the tie-break."""
+    return lambda d: (
+        d["levels_from_max"] - (_FAMILIARITY_SLACK if d["deck_hash"] in played else 0.0),
+        d["worst_card_from_max"],
+    )
+
+
+def _greedy_disjoint(cands, count, *, pinned=None, played=frozenset()) -> list[dict]:
     """Greedy maximin: take the best-leveled deck, drop everything sharing a card,
     repeat. Prefers a different family each pick so the set covers varied matchups.
 
@@ -727,14 +724,11 @@ def _pick_disjoint(cands, count, *, pinned=None, played=frozenset()) -> list[dic
     they have never piloted — this view once gave a member four unplayed lists while
     the deck he actually runs sat just outside. A deck he knows wins unless it is more
     than ``_FAMILIARITY_SLACK`` levels behind on readiness.
+
+    Kept as the solver's seed and its yardstick: :func:`_pick_disjoint` starts from
+    this answer and reports how far it beat it.
     """
-    ranked = sorted(
-        cands,
-        key=lambda d: (
-            d["levels_from_max"] - (_FAMILIARITY_SLACK if d["deck_hash"] in played else 0.0),
-            d["worst_card_from_max"],
-        ),
-    )
+    ranked = sorted(cands, key=_familiarity_rank(played))
     picks, used, fams = [], set(), set()
     if pinned is not None:
         picks.append(pinned)
@@ -753,6 +747,132 @@ def _pick_disjoint(cands, count, *, pinned=None, played=frozenset()) -> list[dic
     return picks
 
 
+_WAR_SET_BUDGET_S = 0.2  # wall-clock budget for the exact search; best-so-far after it
+_EPS = 1e-9  # readiness values are 2-dp floats; sums must beat by more than noise
+
+
+def _set_score(picks, rank) -> tuple[float, float]:
+    """(worst, total) familiarity-adjusted readiness — lower is better, worst first:
+    a war set is as strong as its weakest deck."""
+    adjusted = [rank(d)[0] for d in picks]
+    return (max(adjusted), sum(adjusted)) if adjusted else (float("inf"), float("inf"))
+
+
+def _pick_disjoint(
+    cands,
+    count,
+    *,
+    pinned=None,
+    played=frozenset(),
+    budget: float = _WAR_SET_BUDGET_S,
+) -> tuple[list[dict], dict]:
+    """``count`` card-disjoint decks minimizing the weakest deck's readiness, then the
+    set's total — the objective the greedy pass only approximates. Returns
+    ``(picks, report)``.
+
+    Greedy takes the single best deck first, and that deck can hold the one card two
+    other good decks both need; the set then settles for a far worse fourth deck, or
+    for none. This is branch and bound over the same ranking: decks are card-id
+    bitmasks, each level of the search keeps only the decks disjoint from what is
+    already picked, and a branch is cut as soon as its lower bound — the next deck's
+    readiness standing in for every pick still to make — cannot beat the best set so
+    far. The greedy answer seeds that best, so the result is never worse than greedy
+    and ties keep greedy's set.
+
+    The rules the greedy pass enforced are constraints here: at most one family
+    repeat (``count - 1`` distinct families, as the greedy skip allowed), and the
+    ``_FAMILIARITY_SLACK`` credit inside the readiness being minimized. ``budget``
+    bounds the search in seconds; on expiry the best set found so far is returned
+    and ``report["complete"]`` is false.
+    """
+    rank = _familiarity_rank(played)
+    greedy = _greedy_disjoint(cands, count, pinned=pinned, played=played)
+    report: dict[str, Any] = {
+        "solver": "branch_and_bound",
+        "complete": True,
+        "nodes": 0,
+        "greedy_decks": len(greedy),
+        "beat_greedy": False,
+    }
+    bits: dict[int, int] = {}
+
+    def mask(d) -> int:
+        m = 0
+        for cid in d["card_ids"]:
+            m |= 1 << bits.setdefault(cid, len(bits))
+        return m
+
+    pool = [
+        (rank(d)[0], mask(d), d["family"], d)
+        for d in sorted(cands, key=rank)
+        if pinned is None or d is not pinned
+    ]
+    base = [] if pinned is None else [pinned]
+    best = greedy if len(greedy) >= count else None
+    best_score = _set_score(best, rank) if best else (float("inf"), float("inf"))
+    deadline = time.perf_counter() + budget
+
+    def search(pool, picks, used, fams, repeats, worst, total) -> bool:
+        """Depth-first over ``pool`` (sorted by readiness). False once out of time."""
+        nonlocal best, best_score
+        need = count - len(picks)
+        if need == 0:
+            if worst < best_score[0] - _EPS or (
+                worst <= best_score[0] + _EPS and total < best_score[1] - _EPS
+            ):
+                best, best_score = picks, (worst, total)
+            return True
+        for i, (adj, m, fam, d) in enumerate(pool):
+            if len(pool) - i < need:
+                break
+            # Every remaining pick reads at least `adj`, and the pool only gets worse.
+            bound_worst = max(worst, adj)
+            if bound_worst > best_score[0] + _EPS or (
+                bound_worst >= best_score[0] - _EPS and total + adj * need >= best_score[1] - _EPS
+            ):
+                break
+            repeat = fam in fams
+            if repeat and repeats >= 1:
+                continue
+            report["nodes"] += 1
+            if report["nodes"] % 256 == 0 and time.perf_counter() > deadline:
+                return False
+            taken = used | m
+            rest = [e for e in pool[i + 1 :] if not e[1] & taken]
+            if len(rest) < need - 1:
+                continue
+            if not search(
+                rest,
+                picks + [d],
+                taken,
+                fams | {fam},
+                repeats + repeat,
+                bound_worst,
+                total + adj,
+            ):
+                return False
+        return True
+
+    start_worst, start_total = _set_score(base, rank) if base else (float("-inf"), 0.0)
+    report["complete"] = search(
+        pool,
+        base,
+        mask(pinned) if pinned is not None else 0,
+        {pinned["family"]} if pinned is not None else set(),
+        0,
+        start_worst,
+        start_total,
+    )
+    if best is None or best is greedy:
+        return greedy, report
+    # Better than greedy, or feasible where greedy came up short (gains then None).
+    greedy_score = _set_score(greedy, rank) if len(greedy) >= count else None
+    report["beat_greedy"] = True
+    report["worst_gain"] = round(greedy_score[0] - best_score[0], 2) if greedy_score else None
+    report["total_gain"] = round(greedy_score[1] - best_score[1], 2) if greedy_score else None
+    return base + sorted(best[len(base) :], key=rank), report
+
+
 def _resolve_card(cat, own, name) -> tuple[Optional[int], Optional[dict]]:
     """``(card_id, None)`` or ``(None, error_fields)``. Exact name first, then substring."""
     want = str(name or "").strip().lower()
@@ -795,7 +915,6 @@ def _build_view(conn, tag, anchors, count, require=None) -> dict[str, Any]:
             resolved.append(cid)
     forms = _owned_forms(conn, tag)
     played = set(_their_decks(conn, tag))
-    fielded = _fielded_by(conn)
     facts = _card_facts(conn, cat)
     played_arch = _played_archetypes(conn, tag)
     tower = _tower_troop(conn, tag)
@@ -815,7 +934,7 @@ def _build_view(conn, tag, anchors, count, require=None) -> dict[str, Any]:
         pool = cands  # keep the anchor, report the miss
 
     wanted = max(1, min(int(count or len(resolved) or 1), 6))
-    picks: list[dict] = []
+    chosen: list[tuple[dict, Optional[int]]] = []  # (deck, anchor card or None)
     used_hashes: set[str] = set()
     # One deck per anchor, best-first. Anchors are honoured in the order asked.
     for cid in resolved:
@@ -836,22 +955,26 @@ def _build_view(conn, tag, anchors, count, require=None) -> dict[str, Any]:
             unresolved.append({"error": "no_buildable_deck_with_card", "card": cat[cid]["name"]})
             continue
         used_hashes.add(best["deck_hash"])
-        picks.append(
-            _describe(best, cat, own, fielded, played, facts, played_arch, tower, forms, champs)
-            | {"anchor_card": cat[cid]["name"]}
-        )
+        chosen.append((best, cid))
     # Only fill past the anchors when MORE decks were asked for than cards named.
-    seen_fams = {p["family"] for p in picks}
+    seen_fams = {d["family"] for d, _ in chosen}
     for d in pool:
-        if len(picks) >= wanted:
+        if len(chosen) >= wanted:
             break
         if d["deck_hash"] in used_hashes or d["family"] in seen_fams:
             continue
         used_hashes.add(d["deck_hash"])
         seen_fams.add(d["family"])
-        picks.append(
-            _describe(d, cat, own, fielded, played, facts, played_arch, tower, forms, champs)
+        chosen.append((d, None))
+    fielded = _fielded_by(conn, used_hashes)
+    picks = []
+    for d, anchor in chosen:
+        described = _describe(
+            d, cat, own, fielded, played, facts, played_arch, tower, forms, champs
         )
+        if anchor is not None:
+            described |= {"anchor_card": cat[anchor]["name"]}
+        picks.append(described)
     field = _threat_profile(conn, tag)
     return _envelope(
         "build",
@@ -883,13 +1006,17 @@ def _war_set_view(conn, tag) -> dict[str, Any]:
         return _envelope("war_set", available=False, error="no_collection", member_tag=tag)
     forms = _owned_forms(conn, tag)
     played = set(_their_decks(conn, tag))
-    fielded = _fielded_by(conn)
-    facts = _card_facts(conn, cat)
-    played_arch = _played_archetypes(conn, tag)
-    tower = _tower_troop(conn, tag)
-    champs = _champion_ids(conn)
     cands = _candidates(conn, cat, own, forms)
-    picks = _pick_disjoint(cands, _WAR_DECKS, played=frozenset(played))
+    picks, search = _pick_disjoint(cands, _WAR_DECKS, played=frozenset(played))
+    if search["beat_greedy"]:
+        log.info(
+            "war_set %s: search beat greedy (worst %s, total %s, greedy decks %d, complete %s)",
+            tag,
+            search.get("worst_gain"),
+            search.get("total_gain"),
+            search["greedy_decks"],
+            search["complete"],
+        )
     if len(picks) < _WAR_DECKS:
         return _envelope(
             "war_set",
@@ -900,6 +1027,11 @@ def _war_set_view(conn, tag) -> dict[str, Any]:
             buildable_deck_count=len(cands),
         )
     cards = set().union(*[p["card_ids"] for p in picks])
+    fielded = _fielded_by(conn, (p["deck_hash"] for p in picks))
+    facts = _card_facts(conn, cat)
+    played_arch = _played_archetypes(conn, tag)
+    tower = _tower_troop(conn, tag)
+    champs = _champion_ids(conn)
     return _envelope(
         "war_set",
         available=True,
@@ -935,28 +1067,30 @@ def _anchored_view(conn, tag, card, limit, require=None) -> dict[str, Any]:
         )
     forms = _owned_forms(conn, tag)
     played = set(_their_decks(conn, tag))
-    fielded = _fielded_by(conn)
     facts = _card_facts(conn, cat)
     played_arch = _played_archetypes(conn, tag)
     tower = _tower_troop(conn, tag)
     champs = _champion_ids(conn)
     required, unknown_props = _requirements(require)
-    cands = [d for d in _candidates(conn, cat, own, forms) if cid in d["card_ids"]]
+    cands = _candidates(conn, cat, own, forms, anchor=cid)
     narrowed = [d for d in cands if _meets(d, facts, required)] if required else cands
     requirements_met = bool(narrowed)
     if requirements_met:
         cands = narrowed
     seen: set[str] = set()
-    picks: list[dict] = []
+    chosen: list[dict] = []
     for d in cands:
         if d["family"] in seen and len(seen) >= 3:
             continue
         seen.add(d["family"])
-        picks.append(
-            _describe(d, cat, own, fielded, played, facts, played_arch, tower, forms, champs)
-        )
-        if len(picks) >= max(1, min(int(limit or 5), 10)):
+        chosen.append(d)
+        if len(chosen) >= max(1, min(int(limit or 5), 10)):
             break
+    fielded = _fielded_by(conn, (d["deck_hash"] for d in chosen))
+    picks = [
+        _describe(d, cat, own, fielded, played, facts, played_arch, tower, forms, champs)
+        for d in chosen
+    ]
     return _envelope(
         "anchored",
         available=True,
@@ -10,55 +10,48 @@ one deliberate exception, for callers that validate user/LLM input.
 import logging
 import os
 import random
+import threading
 import time
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
-import db
 import prompts
+from engine.db import canonical_payload
 from runtime import status as runtime_status
+from storage import payload_writer
 
 
-def _persist_raw_payload(endpoint_name: str, entity_key: str | None, payload) -> None:
-    """Store a successful CR API response as a receipt plus deduped content.
+def _persist_raw_payload(endpoint_name: str, entity_key: str | None, payload):
+    """Queue a successful CR API response as a receipt plus deduped content.
 
     Endpoints store under their TRUE API names — the legacy
     "riverracelog" → "clan_war_log" alias was removed at the v5.1 cut (C3);
     the archive keeps the old rows.
 
     ``api_observation_receipts`` is append-only (one row per successful HTTP
-    response); ``raw_api_payloads`` remains the bounded content store. Failures
-    here must never break the caller — provenance is diagnostic, not part of the
-    HTTP success contract.
+    response); ``raw_api_payloads`` remains the bounded content store. The
+    write itself happens behind the call on storage.payload_writer's thread —
+    provenance is diagnostic, not part of the HTTP success contract, so the
+    caller never waits on the SQLite writer. Returns the write's handle so a
+    later 304 can receipt against the stored body.
     """
-    label = endpoint_name
-    key = entity_key or "global"
-    try:
-        conn = db.get_connection()
-        try:
-            try:
-                db.bootstrap_api_sentinel_baseline(conn=conn)
-            except Exception:
-                log.exception("api_sentinel_baseline_failed")
-            db._store_raw_payload(conn, label, key, payload)
-            try:
-                if label == "events":
-                    db.upsert_game_mode_contexts_from_events(payload, conn=conn)
-                elif label == "leaderboards":
-                    db.upsert_game_mode_contexts_from_leaderboards(payload, conn=conn)
-            except Exception:
-                log.exception("game_mode_context_persist_failed endpoint=%s entity=%s", label, key)
-            conn.commit()
-            try:
-                db.record_api_payload_sentinel_observations(label, key, payload, conn=conn)
-            except Exception:
-                conn.rollback()
-                log.exception("api_sentinel_observation_failed endpoint=%s entity=%s", label, key)
-        finally:
-            conn.close()
-    except Exception:
-        log.exception("raw_payload_persist_failed endpoint=%s entity=%s", label, key)
+    # Canonicalize once, here: the receipt write and the engine's admission
+    # envelope are handed this same object and reuse the hash.
+    canonical_payload(payload, remember=True)
+    return payload_writer.submit(endpoint_name, entity_key, payload)
+
+
+def _persist_unchanged_payload(endpoint_name: str, entity_key: str | None, payload, stored):
+    """Queue a receipt for a 304 replay without re-storing or re-hashing its body.
+
+    ``stored`` is the handle of the write that stored the body, so the payload
+    row only gets its ``last_fetched_at`` touched, and the sentinel and
+    game-mode side effects have nothing new to see. When that row is gone
+    (retention or a failed first write), the writer stores the body in full.
+    """
+    return payload_writer.submit(endpoint_name, entity_key, payload, prior=stored)
 
 
 load_dotenv()
@@ -73,6 +66,25 @@ _MAX_RETRIES = 2
 _RETRY_BASE_SECONDS = 1.0
 _RETRY_MAX_SECONDS = 30.0
 
+# Per-endpoint (connect, read) timeouts. The connect budget is short — on a
+# warm pool it is usually not paid at all — while the read budget follows the
+# body: the card catalog and ranking pages are the large, slow ones.
+_CONNECT_TIMEOUT_SECONDS = 3.05
+_READ_TIMEOUT_SECONDS = 10.0
+_READ_TIMEOUT_BY_ENDPOINT = {
+    "cards": 20.0,
+    "riverracelog": 15.0,
+    "leaderboard": 15.0,
+    "pathoflegend_location_rankings": 15.0,
+    "pathoflegend_season_rankings": 15.0,
+}
+
+# One keep-alive pool for the process. Bare requests.get paid a fresh TCP+TLS
+# handshake to api.clashroyale.com on every call. maxsize covers the tick's
+# fetch pool plus interactive tool calls running beside it; retries stay ours.
+_POOL_CONNECTIONS = 2
+_POOL_MAXSIZE = 16
+
 _VALID_TAG_CHARS = frozenset("0289PYLQGRJCUV")
 
 
@@ -112,38 +124,146 @@ _TTL_CACHE: dict[tuple[str, str], tuple[float, object]] = {}
 # The LLM-facing `cr_api` tool can fetch arbitrary player/clan tags, so the
 # cache must be bounded or it grows for the life of the process.
 _TTL_CACHE_MAX_ENTRIES = 256
+# The engine tick fetches its poll plan on a thread pool; eviction iterates.
+_TTL_CACHE_LOCK = threading.Lock()
 
 
 def _cache_get(key: tuple[str, str]):
-    entry = _TTL_CACHE.get(key)
-    if entry is None:
-        return None
-    expires_at, payload = entry
-    if time.time() >= expires_at:
-        _TTL_CACHE.pop(key, None)
-        return None
+    with _TTL_CACHE_LOCK:
+        entry = _TTL_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if time.time() >= expires_at:
+            _TTL_CACHE.pop(key, None)
+            return None
     log.debug("cr_api cache hit key=%s", key)
     return payload
 
 
 def _cache_set(key: tuple[str, str], payload, ttl_seconds: float) -> None:
-    if key not in _TTL_CACHE and len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
-        now = time.time()
-        for stale in [k for k, (exp, _) in _TTL_CACHE.items() if exp <= now]:
-            _TTL_CACHE.pop(stale, None)
-        while len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
-            soonest_to_expire = min(_TTL_CACHE, key=lambda k: _TTL_CACHE[k][0])
-            _TTL_CACHE.pop(soonest_to_expire, None)
-    _TTL_CACHE[key] = (time.time() + ttl_seconds, payload)
+    with _TTL_CACHE_LOCK:
+        if key not in _TTL_CACHE and len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
+            now = time.time()
+            for stale in [k for k, (exp, _) in _TTL_CACHE.items() if exp <= now]:
+                _TTL_CACHE.pop(stale, None)
+            while len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
+                soonest_to_expire = min(_TTL_CACHE, key=lambda k: _TTL_CACHE[k][0])
+                _TTL_CACHE.pop(soonest_to_expire, None)
+        _TTL_CACHE[key] = (time.time() + ttl_seconds, payload)
 
 
 def _cache_clear() -> None:
     """Drop all cached entries. Intended for tests."""
-    _TTL_CACHE.clear()
+    with _TTL_CACHE_LOCK:
+        _TTL_CACHE.clear()
+
+
+class _RateLimitGate:
+    """Process-wide 429 back-off shared by every thread calling the API.
+
+    A 429 is a statement about the API key, not one request: when one worker
+    of the tick's fetch pool is throttled, its siblings must stop too rather
+    than each burning its own retries into the same limit. The throttled
+    thread sleeps its own delay and is then exempt from the deadline it set;
+    everyone else waits until the latest deadline any thread has published.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def hold(self, seconds: float) -> float:
+        """Publish a back-off and return this caller's own deadline."""
+        deadline = time.monotonic() + max(0.0, seconds)
+        with self._lock:
+            self._resume_at = max(self._resume_at, deadline)
+        return deadline
+
+    def wait(self, served: float = 0.0) -> None:
+        """Block until the shared deadline, unless ``served`` already covers it."""
+        with self._lock:
+            resume_at = self._resume_at
+        if resume_at <= served:
+            return
+        remaining = resume_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._resume_at = 0.0
+
+
+_RATE_LIMIT_GATE = _RateLimitGate()
 
 
-def _headers():
-    return {"Authorization": f"Bearer {API_KEY}", "Accept": "application/json"}
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _timeout(endpoint_name: str) -> tuple[float, float]:
+    return (
+        _CONNECT_TIMEOUT_SECONDS,
+        _READ_TIMEOUT_BY_ENDPOINT.get(endpoint_name, _READ_TIMEOUT_SECONDS),
+    )
+
+
+# Conditional-request validators, keyed on (endpoint, entity_key). When the
+# API answers a revalidation with 304 the body is replayed from here, and the
+# persisted copy is receipted rather than re-serialized and re-hashed.
+_VALIDATORS: dict[tuple[str, str], dict] = {}
+_VALIDATORS_MAX_ENTRIES = 512
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def _validator_get(key: tuple[str, str]) -> dict | None:
+    with _VALIDATORS_LOCK:
+        return _VALIDATORS.get(key)
+
+
+def _validator_set(key: tuple[str, str], response, payload, stored) -> None:
+    headers = response.headers or {}
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.pop(key, None)
+        if not etag and not last_modified:
+            return
+        while len(_VALIDATORS) >= _VALIDATORS_MAX_ENTRIES:
+            _VALIDATORS.pop(next(iter(_VALIDATORS)))  # oldest revalidation first
+        _VALIDATORS[key] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "payload": payload,
+            "stored": stored,
+        }
+
+
+def _validators_clear() -> None:
+    """Drop all conditional-request validators. Intended for tests."""
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.clear()
+
+
+def _headers(validator: dict | None = None):
+    headers = {"Authorization": f"Bearer {API_KEY}", "Accept": "application/json"}
+    if validator:
+        if validator["etag"]:
+            headers["If-None-Match"] = validator["etag"]
+        if validator["last_modified"]:
+            headers["If-Modified-Since"] = validator["last_modified"]
+    return headers
 
 
 def _elapsed_ms(started):
@@ -173,12 +293,32 @@ def _retry_delay(attempt: int, response: "requests.Response | None") -> float:
 
 def _request_json(endpoint_path, *, endpoint_name, entity_key=None):
     url = f"{API_BASE}{endpoint_path}"
+    validator_key = (endpoint_name, entity_key or "global")
     last_exc = None
+    served = 0.0
     for attempt in range(_MAX_RETRIES + 1):
+        _RATE_LIMIT_GATE.wait(served)
         started = time.perf_counter()
         response = None
         try:
-            response = requests.get(url, headers=_headers(), timeout=10)
+            validator = _validator_get(validator_key)
+            response = _SESSION.get(
+                url, headers=_headers(validator), timeout=_timeout(endpoint_name)
+            )
+            if response.status_code == 304 and validator is not None:
+                runtime_status.record_api_call(
+                    endpoint_name,
+                    entity_key,
+                    ok=True,
+                    status_code=304,
+                    duration_ms=_elapsed_ms(started),
+                )
+                # Chain on the newest write, so a body re-stored after
+                # retention is what the next 304 receipts against.
+                validator["stored"] = _persist_unchanged_payload(
+                    endpoint_name, entity_key, validator["payload"], validator["stored"]
+                )
+                return validator["payload"]
             response.raise_for_status()
             runtime_status.record_api_call(
                 endpoint_name,
@@ -196,7 +336,8 @@ def _request_json(endpoint_path, *, endpoint_name, entity_key=None):
                     _elapsed_ms(started),
                 )
             payload = response.json()
-            _persist_raw_payload(endpoint_name, entity_key, payload)
+            stored = _persist_raw_payload(endpoint_name, entity_key, payload)
+            _validator_set(validator_key, response, payload, stored)
             return payload
         except (requests.ConnectionError, requests.Timeout) as exc:
             last_exc = exc
@@ -231,6 +372,7 @@ def _request_json(endpoint_path, *, endpoint_name, entity_key=None):
                 _MAX_RETRIES + 1,
                 exc,
             )
+            delay = _retry_delay(attempt, response) if status_code == 429 else None
             runtime_status.record_api_call(
                 endpoint_name,
                 entity_key,
@@ -238,8 +380,15 @@ def _request_json(endpoint_path, *, endpoint_name, entity_key=None):
                 status_code=status_code,
                 error=exc,
                 duration_ms=_elapsed_ms(started),
+                retry_after=delay,
             )
-            if _is_transient_status(status_code) and attempt < _MAX_RETRIES:
+            if status_code == 429:
+                # Siblings back off too, even when this caller is out of retries.
+                served = _RATE_LIMIT_GATE.hold(delay)
+                if attempt < _MAX_RETRIES:
+                    time.sleep(delay)
+                    continue
+            elif _is_transient_status(status_code) and attempt < _MAX_RETRIES:
                 time.sleep(_retry_delay(attempt, response))
                 continue
             raise
@@ -257,6 +406,13 @@ def _request_json(endpoint_path, *, endpoint_name, entity_key=None):
     raise last_exc
 
 
+def api_pressure() -> dict:
+    """Recent call volume, latency and throttling (see
+    ``runtime.status.api_pressure``); the engine tick sizes its poll plan from
+    it."""
+    return runtime_status.api_pressure()
+
+
 def _cached_fetch(endpoint_name, tag, path, ttl_seconds):
     """Fetch with TTL cache. Returns payload or None on error.
 
@@ -512,7 +512,12 @@ def _parse_optional_int(
 
 
 def _store_raw_payload(
-    conn: sqlite3.Connection, endpoint: str, entity_key: str, payload
+    conn: sqlite3.Connection,
+    endpoint: str,
+    entity_key: str,
+    payload,
+    *,
+    fetched_at: str | None = None,
 ) -> dict | None:
     payload_json = _json_or_none(payload)
     if payload_json is None:
@@ -526,26 +531,61 @@ def _store_raw_payload(
     entity_key = _tag_key(entity_key) or entity_key
     # Use the observation envelope's canonical hash, not the serialized
     # compatibility blob's whitespace-sensitive hash. This is what lets a
-    # generation point back to the exact network receipt that fed it.
-    from engine.db import payload_hash as canonical_payload_hash
+    # generation point back to the exact network receipt that fed it. cr_api
+    # remembered it when the response was decoded, so this is a lookup.
+    from engine.db import canonical_payload
 
-    payload_hash = canonical_payload_hash(payload)
-    fetched_at = _utcnow()
-    conn.execute(
-        """INSERT INTO raw_api_payloads
-               (endpoint, entity_key, fetched_at, last_fetched_at,
-                payload_hash, payload_json)
-           VALUES (?, ?, ?, ?, ?, ?)
-           ON CONFLICT(endpoint, entity_key, payload_hash) DO UPDATE SET
-               last_fetched_at = excluded.last_fetched_at""",
-        (endpoint, entity_key, fetched_at, fetched_at, payload_hash, payload_json),
-    )
-    payload_row = conn.execute(
+    payload_hash = canonical_payload(payload).hash
+    fetched_at = fetched_at or _utcnow()
+    lookup = (
         """SELECT payload_id FROM raw_api_payloads
            WHERE endpoint = ? AND entity_key = ? AND payload_hash = ?""",
         (endpoint, entity_key, payload_hash),
-    ).fetchone()
+    )
+    payload_row = conn.execute(*lookup).fetchone()
+    if payload_row is not None:
+        conn.execute(
+            "UPDATE raw_api_payloads SET last_fetched_at = ? WHERE payload_id = ?",
+            (fetched_at, payload_row["payload_id"]),
+        )
+    else:
+        # Only a body the table has not seen is encoded (storage.payload_codec):
+        # compressed, or for a battlelog a delta against the entity's last one.
+        from storage import payload_codec
+
+        body = payload_codec.encode(conn, endpoint, entity_key, payload, payload_json, payload_hash)
+        conn.execute(
+            """INSERT INTO raw_api_payloads
+                   (endpoint, entity_key, fetched_at, last_fetched_at, payload_hash,
+                    payload_json, payload_codec, payload_blob, base_payload_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(endpoint, entity_key, payload_hash) DO UPDATE SET
+                   last_fetched_at = excluded.last_fetched_at""",
+            (
+                endpoint,
+                entity_key,
+                fetched_at,
+                fetched_at,
+                payload_hash,
+                body.payload_json,
+                body.codec,
+                body.blob,
+                body.base_payload_id,
+            ),
+        )
+        payload_row = conn.execute(*lookup).fetchone()
     payload_id = int(payload_row["payload_id"])
+    return _insert_raw_receipt(conn, endpoint, entity_key, payload_id, payload_hash, fetched_at)
+
+
+def _insert_raw_receipt(
+    conn: sqlite3.Connection,
+    endpoint: str,
+    entity_key: str,
+    payload_id: int,
+    payload_hash: str,
+    fetched_at: str,
+) -> dict:
     receipt = conn.execute(
         """INSERT INTO api_observation_receipts
                (payload_id, endpoint, entity_key, fetched_at, payload_hash,
@@ -569,6 +609,34 @@ def _store_raw_payload(
     }
 
 
+def _store_unchanged_receipt(
+    conn: sqlite3.Connection,
+    endpoint: str,
+    entity_key: str,
+    stored: dict,
+    *,
+    fetched_at: str | None = None,
+) -> dict | None:
+    """Receipt a 304 Not Modified against the payload row it re-confirmed.
+
+    The body is byte-identical to ``stored`` (what ``_store_raw_payload``
+    returned for it), so nothing is re-serialized or re-hashed. Returns None
+    when retention has pruned that row; the caller then stores the body in full.
+    """
+    entity_key = _tag_key(entity_key) or entity_key
+    fetched_at = fetched_at or _utcnow()
+    touched = conn.execute(
+        """UPDATE raw_api_payloads SET last_fetched_at = ?
+           WHERE payload_id = ? AND endpoint = ? AND entity_key = ? AND payload_hash = ?""",
+        (fetched_at, stored["payload_id"], endpoint, entity_key, stored["payload_hash"]),
+    )
+    if touched.rowcount != 1:
+        return None
+    return _insert_raw_receipt(
+        conn, endpoint, entity_key, int(stored["payload_id"]), stored["payload_hash"], fetched_at
+    )
+
+
 def _existing_tables(conn: sqlite3.Connection) -> set[str]:
     rows = conn.execute(
         "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
@@ -13,8 +13,8 @@ import os
 import re
 import sqlite3
 
-CURRENT_SCHEMA_VERSION = 38
-EXPECTED_TABLE_COUNT = 66  # v38 adds member_dossiers + scheduled_followups
+CURRENT_SCHEMA_VERSION = 40
+EXPECTED_TABLE_COUNT = 67  # v39 adds card_usage_daily
 
 
 def initialize_empty_database(
@@ -273,6 +273,9 @@ REQUIRED_SCHEMA = {
         "fetched_at",
         "last_fetched_at",
         "payload_hash",
+        "payload_codec",
+        "payload_blob",
+        "base_payload_id",
     },
     "materialization_runs": {
         "materialization_id",
@@ -336,6 +339,17 @@ REQUIRED_SCHEMA = {
         "their_deck_hash",
     },
     "deck_profile": {"deck_hash", "family", "archetype", "avg_elixir", "cards_json"},
+    "card_usage_daily": {
+        "metric_date",
+        "card_id",
+        "evolution_level",
+        "side",
+        "mode_group",
+        "plays",
+        "wins",
+        "losses",
+        "members",
+    },
     "card_facts": {"card_id", "evolution_level", "targets", "role", "is_win_condition"},
 }
 
@@ -1979,6 +1993,24 @@ def apply_schema_migrations(conn: sqlite3.Connection) -> None:
         except Exception:
             conn.rollback()
             raise
+        version = 38
+    if version < 39:
+        try:
+            _apply_v39(conn)
+            conn.execute("PRAGMA user_version = 39")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        version = 39
+    if version < 40:
+        try:
+            _apply_v40(conn)
+            conn.execute("PRAGMA user_version = 40")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
     assert_current_schema(conn)
 
 
@@ -2318,6 +2350,66 @@ def _apply_v37(conn: sqlite3.Connection) -> None:
     )
 
 
+def _apply_v39(conn: sqlite3.Connection) -> None:
+    """A daily card-usage read model over ``battle_card_plays``.
+
+    One row per (Chicago day, card, form, side, mode group) with plays, wins,
+    losses and the distinct members behind them that day, so "what is the clan
+    playing / facing" over a window sums at most days x cards rows instead of
+    scanning every play in it. ``evolution_level`` and ``mode_group`` are stored
+    ``0`` / ``''`` for NULL so they can sit in the key.
+
+    A pure function of ``battle_card_plays``, not a durable rollup: the Stage-A
+    worker recomputes each day a batch touched, in the batch's transaction, and
+    ``storage.card_usage`` rebuilds or checks it against the plays table.
+    **No backfill here** -- the plays table is millions of rows and the rebuild
+    is the same code the worker runs; reads use SQL until the rollup covers the
+    table (``scripts/rebuild_card_usage.py --apply`` or the next maintenance).
+    """
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS card_usage_daily (
+            metric_date     TEXT NOT NULL,
+            card_id         INTEGER NOT NULL,
+            evolution_level INTEGER NOT NULL DEFAULT 0,
+            side            TEXT NOT NULL CHECK (side IN ('member', 'opponent')),
+            mode_group      TEXT NOT NULL DEFAULT '',
+            plays           INTEGER NOT NULL,
+            wins            INTEGER NOT NULL,
+            losses          INTEGER NOT NULL,
+            members         INTEGER NOT NULL,
+            PRIMARY KEY (metric_date, card_id, evolution_level, side, mode_group)
+        )"""
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_card_usage_card ON card_usage_daily(card_id, metric_date)"
+    )
+
+
+def _apply_v40(conn: sqlite3.Connection) -> None:
+    """Encoded bodies for ``raw_api_payloads`` (storage.payload_codec).
+
+    ``payload_codec`` names how a row's body is stored -- ``json`` is the text
+    in ``payload_json`` as before; ``zlib:N`` / ``delta:N`` keep it deflated in
+    ``payload_blob``, a delta against the row ``base_payload_id``. The index
+    is what lets retention ask "does a live delta still need this base?".
+
+    **No rewrite here** -- existing rows read as ``json`` and age out within
+    RAW_PAYLOAD_RETENTION_DAYS; new bodies are encoded as they are stored.
+    """
+    columns = _columns(conn, "raw_api_payloads")
+    for column, declaration in (
+        ("payload_codec", "TEXT NOT NULL DEFAULT 'json'"),
+        ("payload_blob", "BLOB"),
+        ("base_payload_id", "INTEGER"),
+    ):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE raw_api_payloads ADD COLUMN {column} {declaration}")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_raw_payloads_base "
+        "ON raw_api_payloads(base_payload_id) WHERE base_payload_id IS NOT NULL"
+    )
+
+
 def assert_current_schema(conn: sqlite3.Connection) -> None:
     """Raise with a precise diagnosis when a caller bypasses DB initialization."""
     version = int(conn.execute("PRAGMA user_version").fetchone()[0])
@@ -2504,8 +2596,8 @@ def schema_fingerprint(conn: sqlite3.Connection) -> str:
 
 
 # Updated deliberately whenever the fresh-build schema changes.
-# v38 (2026-08-19): member_dossiers + scheduled_followups.
-CURRENT_SCHEMA_FINGERPRINT = "b2977bc9431e1d9a674970c58276dce21c1b32515f85cd6619f30a3b9837381b"
+# v39: card_usage_daily. v40: raw_api_payloads body codec columns.
+CURRENT_SCHEMA_FINGERPRINT = "098321970cc2d23fd23694137b96d617bd8a8ca571ee7b55249d6c4384502acf"
 
 
 __all__ = [
@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import sqlite3
 
-from engine.db import payload_hash
+from engine.db import CanonicalPayload, canonical_payload
 
 
 def get_baseline(conn, entity_kind: str, entity_tag: str, aspect: str) -> sqlite3.Row | None:
@@ -25,11 +25,15 @@ def set_baseline(
     entity_kind: str,
     entity_tag: str,
     aspect: str,
-    payload: dict,
+    payload: dict | CanonicalPayload,
     observed_at: str,
 ) -> None:
     """Upsert the baseline, rolling the previous observed_at into
-    prev_observed_at — the (prev, now] window for timing honesty (§8)."""
+    prev_observed_at — the (prev, now] window for timing honesty (§8).
+
+    A :class:`CanonicalPayload` is stored as-is; its text and hash are the
+    ``payload_json``/``payload_hash`` columns, so nothing is re-serialized."""
+    canonical = canonical_payload(payload)
     conn.execute(
         """INSERT INTO state_baselines
                (entity_kind, entity_tag, aspect, payload_json, payload_hash,
@@ -44,8 +48,8 @@ def set_baseline(
             entity_kind,
             entity_tag,
             aspect,
-            json.dumps(payload, sort_keys=True, separators=(",", ":")),
-            payload_hash(payload),
+            canonical.text,
+            canonical.hash,
             observed_at,
         ),
     )
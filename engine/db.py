@@ -12,6 +12,9 @@ import hashlib
 import json
 import os
 import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from db import _canon_tag as canon_tag  # noqa: F401  (shared canonicalization)
@@ -35,10 +38,58 @@ def utcnow() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+# One encoder for every canonical dump: json.dumps() builds a fresh encoder
+# per call whenever it is given options. Output is identical either way — the
+# hashes below are stored (receipts, baselines), so the bytes must never drift.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+_CANONICAL_MEMO: OrderedDict[int, CanonicalPayload] = OrderedDict()
+_CANONICAL_MEMO_MAX = 256
+_CANONICAL_MEMO_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, eq=False)
+class CanonicalPayload:
+    """A decoded payload with its canonical JSON text and hash, computed once.
+
+    ``text`` is the sorted-key, compact serialization; ``hash`` is its SHA-256.
+    The payload is treated as immutable from here on — nothing downstream of a
+    CR response edits it in place.
+    """
+
+    payload: object
+    text: str
+    hash: str
+
+
+def canonical_payload(payload, *, remember: bool = False) -> CanonicalPayload:
+    """Canonicalize ``payload`` (or pass an existing CanonicalPayload through).
+
+    ``remember=True`` keeps the result, keyed on the payload object itself, so
+    later stages handed the same decoded response — the receipt write, the
+    admission envelope — reuse it instead of re-serializing. cr_api remembers
+    each response it decodes; a bounded memo holds the last few hundred.
+    """
+    if isinstance(payload, CanonicalPayload):
+        return payload
+    key = id(payload)
+    with _CANONICAL_MEMO_LOCK:
+        known = _CANONICAL_MEMO.get(key)
+    # The entry holds a reference to its payload, so while it is in the memo
+    # no other object can take that id; the identity check is belt and braces.
+    if known is not None and known.payload is payload:
+        return known
+    text = _CANONICAL_ENCODER.encode(payload)
+    canonical = CanonicalPayload(payload, text, hashlib.sha256(text.encode()).hexdigest())
+    if remember:
+        with _CANONICAL_MEMO_LOCK:
+            _CANONICAL_MEMO[key] = canonical
+            while len(_CANONICAL_MEMO) > _CANONICAL_MEMO_MAX:
+                _CANONICAL_MEMO.popitem(last=False)
+    return canonical
+
+
 def payload_hash(payload) -> str:
-    return hashlib.sha256(
-        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
-    ).hexdigest()
+    return canonical_payload(payload).hash
 
 
 def _ensure_display_name_column(conn) -> None:
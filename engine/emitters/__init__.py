@@ -12,7 +12,7 @@ from __future__ import annotations
 import json
 
 from engine.baselines import baseline_payload, get_baseline, set_baseline
-from engine.db import payload_hash, utcnow
+from engine.db import canonical_payload, utcnow
 
 
 def insert_stream_event(
@@ -88,20 +88,25 @@ def emit(
     if fn is None:
         raise ValueError(f"no emitter registered for ({entity_kind}, {aspect})")
 
+    # Serialized and hashed once: the same text/hash is compared against the
+    # stored baseline and, unless the race merge replaces it, written back.
+    canonical = canonical_payload(new_payload)
     row = get_baseline(conn, entity_kind, entity_tag, aspect)
     if row is None:
-        set_baseline(conn, entity_kind, entity_tag, aspect, new_payload, observed_at)
+        set_baseline(conn, entity_kind, entity_tag, aspect, canonical, observed_at)
         return 0  # first-sight emits nothing (§8)
-    if row["payload_hash"] == payload_hash(new_payload):
-        set_baseline(conn, entity_kind, entity_tag, aspect, new_payload, observed_at)
+    if row["payload_hash"] == canonical.hash:
+        set_baseline(conn, entity_kind, entity_tag, aspect, canonical, observed_at)
         return 0
     old_payload = baseline_payload(row)
     window_start = row["observed_at"]
     emitted = fn(conn, entity_tag, old_payload, new_payload, observed_at, window_start)
-    to_store = new_payload
+    to_store = canonical
     if (entity_kind, aspect) == ("riverrace", "race"):
         # #166: don't let the API's post-battle reset snapshot overwrite the
         # peak race baseline, or the season/week rollover finalizes from zeros.
-        to_store = war.merge_baseline(old_payload, new_payload)
+        merged = war.merge_baseline(old_payload, new_payload)
+        if merged is not new_payload:
+            to_store = merged
     set_baseline(conn, entity_kind, entity_tag, aspect, to_store, observed_at)
     return emitted
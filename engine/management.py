@@ -16,6 +16,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 
 from engine.db import utcnow
@@ -459,17 +460,23 @@ def _ranked_standing(conn, tag) -> tuple[int, int]:
         "SELECT ranked_league, ranked_trophies FROM player_current_state WHERE player_tag = ?",
         (tag,),
     ).fetchone()
-    cur_lg = (row["ranked_league"] if row else None) or 0
-    cur_rt = (row["ranked_trophies"] if row else None) or 0
-    last_lg, last_rt = 0, 0
     bl = conn.execute(
         """SELECT payload_json FROM state_baselines
            WHERE entity_kind = 'player' AND entity_tag = ? AND aspect = 'ranked'""",
         (tag,),
     ).fetchone()
-    if bl:
+    return _standing_of(row, bl["payload_json"] if bl else None)
+
+
+def _standing_of(row, baseline_json: str | None) -> tuple[int, int]:
+    """(league, rating) from a player_current_state row and the 'ranked'
+    baseline payload — the arithmetic shared by the per-member and roster reads."""
+    cur_lg = (row["ranked_league"] if row else None) or 0
+    cur_rt = (row["ranked_trophies"] if row else None) or 0
+    last_lg, last_rt = 0, 0
+    if baseline_json is not None:
         try:
-            last = (json.loads(bl["payload_json"]) or {}).get("last") or {}
+            last = (json.loads(baseline_json) or {}).get("last") or {}
             last_lg = last.get("league") or 0
             last_rt = last.get("trophies") or 0
         except TypeError, ValueError:
@@ -571,6 +578,12 @@ def _war_rate(conn, tag, now: str) -> float:
            WHERE player_tag = ? AND date(observed_at) >= date(?, ?)""",
         (tag, now, f"-{WAR_RATE_WINDOW} days"),
     ).fetchall()
+    return _average_day_credit(rows)
+
+
+def _average_day_credit(rows) -> float:
+    """Mean _war_day_credit over the days that had decks available, summed in
+    row order so the roster read reproduces the per-member float exactly."""
     days = [r for r in rows if (r["decks_available"] or 0) > 0]
     if not days:
         return 0.0
@@ -613,6 +626,114 @@ def _participation_percentile(value: float, values: list[float]) -> float:
     return _percentile(value, participants)
 
 
+def _participation_percentiles(values: list[float]) -> list[float]:
+    """_participation_percentile for every entry of `values` in one pass: sort
+    the participants once and bisect, instead of rescanning the roster per
+    member. Same counts, same arithmetic, so the results are identical."""
+    participants = sorted(v for v in values if v > 0)
+    n = len(participants)
+    out = []
+    for value in values:
+        if value <= 0 or n == 0:
+            out.append(0.0)
+            continue
+        below = bisect_left(participants, value)
+        equal = bisect_right(participants, value) - below
+        out.append((below + 0.5 * equal) / n)
+    return out
+
+
+# Roster-wide reads for the evaluators. Each is the per-member query above run
+# once for the whole roster (grouped by player_tag), so scoring N members costs
+# a handful of statements instead of ~4N. The per-member functions stay as the
+# reference implementation; tests/test_management_bulk.py holds the two equal.
+
+
+def _in_marks(tags) -> str:
+    return ",".join("?" for _ in tags)
+
+
+def _roster_ranked_standings(conn, tags: list[str]) -> dict[str, tuple[int, int]]:
+    """_ranked_standing for every tag: two reads instead of two per member."""
+    if not tags:
+        return {}
+    marks = _in_marks(tags)
+    current = {
+        r["player_tag"]: r
+        for r in conn.execute(
+            f"""SELECT player_tag, ranked_league, ranked_trophies FROM player_current_state
+                WHERE player_tag IN ({marks})""",
+            tags,
+        )
+    }
+    baselines = {
+        r["entity_tag"]: r["payload_json"]
+        for r in conn.execute(
+            f"""SELECT entity_tag, payload_json FROM state_baselines
+                WHERE entity_kind = 'player' AND aspect = 'ranked'
+                  AND entity_tag IN ({marks})""",
+            tags,
+        )
+    }
+    return {tag: _standing_of(current.get(tag), baselines.get(tag)) for tag in tags}
+
+
+def _roster_war_rates(conn, tags: list[str], now: str) -> dict[str, float]:
+    """_war_rate for every tag from one pass over war_attendance_days. Rows come
+    back in table order, as the per-member scan returns them, so each member's
+    credits are summed in the same order and the float is bit-identical."""
+    if not tags:
+        return {}
+    rows_by_tag: dict[str, list] = {tag: [] for tag in tags}
+    for r in conn.execute(
+        f"""SELECT player_tag, decks_used, decks_available
+            FROM war_attendance_days
+            WHERE player_tag IN ({_in_marks(tags)}) AND date(observed_at) >= date(?, ?)
+            ORDER BY rowid""",
+        [*tags, now, f"-{WAR_RATE_WINDOW} days"],
+    ):
+        rows_by_tag[r["player_tag"]].append(r)
+    return {tag: _average_day_credit(rows) for tag, rows in rows_by_tag.items()}
+
+
+def _roster_ranked_battles(conn, tags: list[str], now: str, window: int) -> dict[str, int]:
+    """_ranked_battles for every tag in one grouped count (same window rule)."""
+    if not tags:
+        return {}
+    counts = dict.fromkeys(tags, 0)
+    for tag, n in conn.execute(
+        f"""SELECT player_tag, COUNT(*) FROM battle_events
+            WHERE player_tag IN ({_in_marks(tags)}) AND mode_group = 'ranked'
+              AND battle_time >= strftime('%Y-%m-%dT%H:%M:%SZ', ?, ?)
+            GROUP BY player_tag""",
+        [*tags, now, f"-{window} days"],
+    ):
+        counts[tag] = n or 0
+    return counts
+
+
+def _roster_competitive_floor(conn, tags: list[str], now: str) -> set[str]:
+    """The tags that pass _passes_competitive_floor — war days and ranked
+    battles each counted once for the roster."""
+    if not tags:
+        return set()
+    war_days = dict(
+        conn.execute(
+            f"""SELECT player_tag, COUNT(*) FROM war_attendance_days
+                WHERE player_tag IN ({_in_marks(tags)}) AND decks_used > 0
+                  AND julianday(observed_at) >= julianday(?) - ?
+                GROUP BY player_tag""",
+            [*tags, now, WAR_FLOOR_WINDOW],
+        ).fetchall()
+    )
+    ranked = _roster_ranked_battles(conn, tags, now, WAR_FLOOR_WINDOW)
+    return {
+        tag
+        for tag in tags
+        if war_days.get(tag, 0) >= WAR_FLOOR_DAYS or ranked[tag] >= RANKED_FLOOR_BATTLES
+    }
+
+
 def _elder_scores(conn, now: str, week_anchor: str) -> dict:
     """Rank the active NON-LEADERSHIP roster (members + elders) by a
     war-weighted percentile blend (§3.2). Leaders/co-leaders are excluded from
@@ -628,17 +749,21 @@ def _elder_scores(conn, now: str, week_anchor: str) -> dict:
                          WHERE cm.player_tag = mm.player_tag AND cm.left_at IS NULL)"""
     ).fetchall()
     ranked = [m for m in members if (m["role"] or "member") not in LEADERSHIP_ROLES]
+    tags = [m["player_tag"] for m in ranked]
+    standings = _roster_ranked_standings(conn, tags)
+    war_rates = _roster_war_rates(conn, tags, now)
+    ranked_battles = _roster_ranked_battles(conn, tags, now, WAR_RATE_WINDOW)
     raw = {}
     for m in ranked:
         tag = m["player_tag"]
-        league, rating = _ranked_standing(conn, tag)  # league kept for display only
+        league, rating = standings[tag]  # league kept for display only
         raw[tag] = {
             "role": m["role"] or "member",
             "tenure": m["tenure_days"] or 0,
             "name": m["current_name"],
-            "war_rate": _war_rate(conn, tag, now),
+            "war_rate": war_rates[tag],
             "ranked_league": league,
-            "ranked_battles": _ranked_battles(conn, tag, now, WAR_RATE_WINDOW),
+            "ranked_battles": ranked_battles[tag],
             # Trailing 4-week donation average (materialized by the projection),
             # not a single closed week (2026-07-12): one week's snapshot swings on
             # the donation reset — averaging 4 weeks is stable, and it matches the
@@ -652,10 +777,16 @@ def _elder_scores(conn, now: str, week_anchor: str) -> dict:
     # did none of a thing scores 0 for it, and the members who did are ranked
     # against each other. Before this, doing nothing paid — see
     # _participation_percentile for the measurement.
-    for r in raw.values():
-        r["war_pct"] = _participation_percentile(r["war_rate"], war_vals)
-        r["donation_pct"] = _participation_percentile(r["donations"], don_vals)
-        r["ranked_pct"] = _participation_percentile(r["ranked_battles"], rk_vals)
+    pcts = zip(
+        _participation_percentiles(war_vals),
+        _participation_percentiles(don_vals),
+        _participation_percentiles(rk_vals),
+        strict=True,
+    )
+    for r, (war_pct, donation_pct, ranked_pct) in zip(raw.values(), pcts, strict=True):
+        r["war_pct"] = war_pct
+        r["donation_pct"] = donation_pct
+        r["ranked_pct"] = ranked_pct
         # competitive = war participation PRIMARY; ranked participation fills part
         # of the gap war leaves (headroom), muted by RANKED_WEIGHT because war is
         # direct clan contribution and ranked only reps the clan. War-maxed → ~1;
@@ -701,19 +832,17 @@ def _elder_band(conn, scores: dict, now: str) -> dict:
     # Eligibility to HOLD elder: pass the competitive floor (war OR ranked).
     # A member additionally needs the tenure filter to be promotable IN; an
     # elder who fails the floor entirely has ABANDONED the duty (fast demote).
+    floor_ok = _roster_competitive_floor(conn, list(scores), now)
+
     def _eligible(tag: str) -> bool:
         r = scores[tag]
-        if not _passes_competitive_floor(conn, tag, now):
+        if tag not in floor_ok:
             return False
         if r["role"] == "elder":
             return True
         return (r["tenure"] or 0) >= PROMOTE_TENURE_MIN
 
-    abandoned = {
-        tag
-        for tag, r in scores.items()
-        if r["role"] == "elder" and not _passes_competitive_floor(conn, tag, now)
-    }
+    abandoned = {tag for tag, r in scores.items() if r["role"] == "elder" and tag not in floor_ok}
     eligible_order = [tag for tag, _ in order if _eligible(tag)]
 
     # The band is a TOLERANCE around a target, not a target in itself. Growing to
@@ -982,6 +1111,7 @@ def run_tick_evaluators(
     roster_size = len(members)
     if readiness is not None:
         ready_members = []
+        judgments = []
         member_readiness = readiness.get("members") or {}
         for member in members:
             state = member_readiness.get(member["player_tag"]) or {
@@ -991,21 +1121,24 @@ def run_tick_evaluators(
             }
             status = state.get("status") or "held"
             reasons = state.get("reasons") or []
-            conn.execute(
-                """UPDATE member_management SET
-                       judgment_status = ?, judgment_reason = ?,
-                       evidence_as_of = ?, materialization_id = ?
-                   WHERE player_tag = ?""",
+            judgments.append(
                 (
                     status,
                     ",".join(reasons) if reasons else None,
                     state.get("evidence_as_of"),
                     materialization_id,
                     member["player_tag"],
-                ),
+                )
             )
             if status == "ready":
                 ready_members.append(member)
+        conn.executemany(
+            """UPDATE member_management SET
+                   judgment_status = ?, judgment_reason = ?,
+                   evidence_as_of = ?, materialization_id = ?
+               WHERE player_tag = ?""",
+            judgments,
+        )
         members = ready_members
 
     fired: list[dict] = []
@@ -1014,19 +1147,33 @@ def run_tick_evaluators(
     # at 50/50. Uses roster_size (the full active roster), NOT len(members),
     # which the readiness filter may have shrunk.
     slack = max(0, ROSTER_CAP - roster_size) / ROSTER_CAP
+    tags = [m["player_tag"] for m in members]
+    last_battles = (
+        dict(
+            conn.execute(
+                f"""SELECT player_tag, MAX(battle_time) FROM battle_events
+                    WHERE player_tag IN ({_in_marks(tags)}) GROUP BY player_tag""",
+                tags,
+            ).fetchall()
+        )
+        if tags
+        else {}
+    )
+    # The contribution grace only exists while slots are open; the floor is
+    # read for the whole roster at once rather than per idle member.
+    floor_ok = _roster_competitive_floor(conn, tags, now) if slack > 0 else set()
+    transitions = []
     for m in members:
         tag = m["player_tag"]
-        last_row = conn.execute(
-            "SELECT MAX(battle_time) FROM battle_events WHERE player_tag = ?", (tag,)
-        ).fetchone()
-        if last_row and last_row[0]:
+        last_battle = last_battles.get(tag)
+        if last_battle:
             # A roster join starts this clan's inactivity clock. Imported
             # battle history can predate the current membership, so measuring
             # from the battle alone can recommend a member for removal on the
             # same tick they join. There is still no newcomer shield: once the
             # normal idle threshold has elapsed from the later personal anchor,
             # the ordinary state machine applies.
-            candidates = [_parse_ts(v) for v in (last_row[0], m["membership_joined_at"]) if v]
+            candidates = [_parse_ts(v) for v in (last_battle, m["membership_joined_at"]) if v]
             reference = max(c for c in candidates if c is not None)
         else:
             # Never battled in the stream: idle from THEIR OWN anchor — the
@@ -1042,10 +1189,9 @@ def run_tick_evaluators(
         days_idle = (now_dt - reference).total_seconds() / 86400.0
 
         state = m["kick_state"] or "none"
-        since = m["kick_state_since"]
         new_state = state
 
-        if last_row and last_row[0] and state != "none" and days_idle < KICK_WATCH_DAYS:
+        if last_battle and state != "none" and days_idle < KICK_WATCH_DAYS:
             new_state = "none"  # any battle → none; auto-withdraw (§3.3)
         else:
             # Contribution grace = the SAME floor that earns elder (recent war
@@ -1055,9 +1201,7 @@ def run_tick_evaluators(
             # a full roster. Watch/at_risk are unaffected, so they still surface
             # on the watchlist; only the card is delayed.
             confirm_days = KICK_CONFIRM_DAYS
-            if slack > 0 and (
-                _passes_war_floor(conn, tag, now) or _passes_ranked_floor(conn, tag, now)
-            ):
+            if tag in floor_ok:
                 confirm_days += round(KICK_CONTRIB_GRACE_MAX * slack)
             if days_idle >= KICK_AT_RISK_DAYS + confirm_days:
                 new_state = "recommended"
@@ -1087,12 +1231,13 @@ def run_tick_evaluators(
                         "from_state": state,
                     }
                 )
-            conn.execute(
-                """UPDATE member_management
-                   SET kick_state = ?, kick_state_since = ?
-                   WHERE player_tag = ?""",
-                (new_state, now if new_state != state else since, tag),
-            )
+            transitions.append((new_state, now, tag))
+    conn.executemany(
+        """UPDATE member_management
+           SET kick_state = ?, kick_state_since = ?
+           WHERE player_tag = ?""",
+        transitions,
+    )
     return fired
 
 
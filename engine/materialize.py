@@ -342,6 +342,13 @@ def apply_interactive_observation(
 ) -> ApplyResult:
     """Apply one interactive refresh as a complete, attributable generation."""
     from engine import readiness
+    from storage import payload_writer
+
+    # The refresh's receipt may still be queued behind the fetch. Flushing
+    # while this connection holds the write lock would only wait out the
+    # writer's busy timeout, so an open transaction links without it.
+    if not conn.in_transaction:
+        payload_writer.flush()
 
     materialization_id = readiness.start_materialization(
         conn,
@@ -14,10 +14,11 @@ optional so additive API evolution does not stop the engine.
 
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
 from typing import Literal, TypeAlias
 
-from engine.db import payload_hash
+from engine.db import CanonicalPayload, canonical_payload
 from engine.normalize import canon_tag, canonical_utc_timestamp, parse_cr_time
 
 ObservationEndpoint: TypeAlias = Literal[
@@ -63,9 +64,15 @@ class Observation:
     endpoint: ObservationEndpoint
     entity_key: str
     observed_at: str
-    payload_hash: str
     payload: ObservationPayload
     source: str
+    # Canonical bytes + hash, computed once and reused by the receipt link,
+    # the generation input, and anything else keyed on the payload's identity.
+    canonical: CanonicalPayload = dataclasses.field(repr=False, compare=False)
+
+    @property
+    def payload_hash(self) -> str:
+        return self.canonical.hash
 
 
 def observe(
@@ -88,9 +95,9 @@ def observe(
         endpoint=endpoint,
         entity_key=decision.entity_key,
         observed_at=canonical_at,
-        payload_hash=payload_hash(payload),
         payload=payload,
         source=str(source or "unknown"),
+        canonical=canonical_payload(payload),
     )
 
 
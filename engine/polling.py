@@ -5,15 +5,42 @@ max(heat,2)/warm, decay −1 per tick, floor 0/cold). The per-tick budget covers
 per-player endpoints only; clan/riverrace calls are fixed overhead outside it.
 Fairness floors guarantee every member is polled within a bounded window
 regardless of temperature.
+
+The budget and the non-floor cadences adapt to how the API has been answering
+(:func:`adaptive_budget`): 429s shrink the budget and stretch cadences, slow
+calls cap the budget at what the fetch pool can finish in
+``TARGET_FETCH_SECONDS``, and war battle days spend spare headroom on tighter
+cadences. Floors and floor-starved-first ordering never move.
+
+The planned calls are fetched by :func:`fetch_plan` on a small thread pool:
+the round-trips overlap, but results come back in plan order so admission and
+application stay deterministic.
 """
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from engine.db import canon_tag, utcnow
 
 POLL_BUDGET_PER_TICK = 40  # runtime.md §8, ratified
+# Adaptive bounds. The floors need ~2 calls a tick for a 50-member roster (50
+# battlelogs per 6 h + 50 profiles per 24 h, 10-minute ticks), so even the
+# minimum clears every starved member with room for the hottest.
+POLL_BUDGET_MIN = 12
+POLL_BUDGET_MAX = 120
+# Wall time the per-player fetch should fit in, and the CR API request rate
+# (all callers, from runtime.status) the planner steers under.
+TARGET_FETCH_SECONDS = 30.0
+TARGET_CALLS_PER_MINUTE = 300.0
+# A Retry-After this long means the key is out for a while: drop to the minimum.
+LONG_RETRY_AFTER_SECONDS = 30.0
+_PLAYER_ENDPOINTS = ("player", "player_battlelog")
+# Concurrent per-player fetches per tick. 1 restores the strictly serial walk.
+POLL_FETCH_WORKERS = int(os.getenv("ELIXIR_POLL_FETCH_WORKERS", "6"))
 
 # Cadence minutes per (endpoint, temperature); floor = fairness floor.
 CADENCE = {
@@ -118,16 +145,72 @@ def note_poll_succeeded(conn, player_tag, endpoint: str, now=None) -> None:
 note_polled = note_poll_succeeded
 
 
+@dataclass(frozen=True)
+class PollBudget:
+    """One tick's sizing: per-player call budget, the multiplier on non-floor
+    cadences (2.0 polls half as often, 0.5 twice as often), and why."""
+
+    budget: int
+    cadence_scale: float
+    reason: str
+
+
+def adaptive_budget(pressure: dict | None, *, battle_day: bool = False, workers=None) -> PollBudget:
+    """Size this tick from recent API behaviour (``runtime.status.api_pressure``
+    shape; None or no calls = the ratified baseline).
+
+    Throttled: halve the budget per recent 429, down to ``POLL_BUDGET_MIN``
+    (straight there for a long Retry-After), stretching cadences by the same
+    factor; it recovers a step at a time as 429s age out of the window. Over
+    the target request rate: scale down in proportion. Slow calls: cap the
+    budget at what ``workers`` can fetch in ``TARGET_FETCH_SECONDS`` at p90
+    latency. Battle day with latency and rate headroom: up to double the
+    budget, with cadences halved.
+    """
+    base = POLL_BUDGET_PER_TICK
+    if not pressure or not pressure.get("calls"):
+        return PollBudget(base, 1.0, "baseline")
+    throttled = int(pressure.get("throttled") or 0)
+    if throttled:
+        if float(pressure.get("retry_after_max") or 0.0) >= LONG_RETRY_AFTER_SECONDS:
+            return PollBudget(POLL_BUDGET_MIN, 8.0, "throttled")
+        factor = 2 ** min(throttled, 3)
+        return PollBudget(max(POLL_BUDGET_MIN, base // factor), float(factor), "throttled")
+
+    def clamp(value: float) -> int:
+        return max(POLL_BUDGET_MIN, min(POLL_BUDGET_MAX, int(value)))
+
+    rate = float(pressure.get("calls_per_minute") or 0.0)
+    if rate > TARGET_CALLS_PER_MINUTE:
+        return PollBudget(clamp(base * TARGET_CALLS_PER_MINUTE / rate), 1.0, "rate")
+    by_endpoint = pressure.get("by_endpoint") or {}
+    p90s = [
+        by_endpoint[name]["p90_ms"]
+        for name in _PLAYER_ENDPOINTS
+        if (by_endpoint.get(name) or {}).get("p90_ms")
+    ]
+    size = max(1, POLL_FETCH_WORKERS if workers is None else int(workers))
+    capacity = TARGET_FETCH_SECONDS * 1000.0 * size / max(p90s) if p90s else float(base)
+    if capacity < base:
+        return PollBudget(clamp(capacity), 1.0, "latency")
+    if battle_day and capacity > base and rate < TARGET_CALLS_PER_MINUTE / 2:
+        return PollBudget(clamp(min(capacity, base * 2)), 0.5, "battle_day")
+    return PollBudget(base, 1.0, "steady")
+
+
 def plan(
     conn,
     now=None,
     budget: int = POLL_BUDGET_PER_TICK,
     *,
     roster_tags=None,
+    cadence_scale: float = 1.0,
 ) -> list[tuple[str, str]]:
     """Spend the per-player budget hottest-first with fairness floors
     (runtime.md §4): priority = floor-starved first (most overdue), then heat,
-    then longest-overdue. Returns ordered [(endpoint, player_tag)]."""
+    then longest-overdue. ``cadence_scale`` stretches or tightens the hot/warm/
+    cold cadences (see :func:`adaptive_budget`); floors are never scaled.
+    Returns ordered [(endpoint, player_tag)]."""
     now = now or utcnow()
     now_dt = _parse(now)
     current_roster = {canon_tag(tag) for tag in (roster_tags or []) if tag}
@@ -159,7 +242,7 @@ def plan(
         for endpoint, cad in CADENCE.items():
             last = _parse(r[_LAST_COL[endpoint]])
             overdue_min = (now_dt - last).total_seconds() / 60.0 if last else float("inf")
-            due = overdue_min >= cad[temp]
+            due = overdue_min >= cad[temp] * cadence_scale
             starved = overdue_min >= cad["floor"]
             if due or starved:
                 candidates.append(
@@ -173,3 +256,36 @@ def plan(
                 )
     candidates.sort(key=lambda c: (-c[0], -c[1], -c[2], c[3], c[4]))
     return [(c[3], c[4]) for c in candidates[: max(0, budget)]]
+
+
+@dataclass(frozen=True)
+class Fetched:
+    """One planned call's decoded response (None = transport failure)."""
+
+    endpoint: str
+    player_tag: str
+    payload: object
+
+
+def _fetch_one(api, endpoint: str, tag: str) -> Fetched:
+    if endpoint == "battlelog":
+        return Fetched(endpoint, tag, api.get_player_battle_log(tag))
+    return Fetched(endpoint, tag, api.get_player(tag))
+
+
+def fetch_plan(api, planned: list[tuple[str, str]], *, workers: int | None = None) -> list[Fetched]:
+    """Fetch every planned (endpoint, player_tag) call, returned in plan order.
+
+    ``api`` is the tick's cr_api-shaped seam. cr_api persists each raw payload
+    on its own connection and shares one 429/Retry-After gate across threads,
+    so workers neither hold the tick's writer nor stampede a throttled API.
+    The caller must not hold a write transaction while this runs. An exception
+    from any call surfaces here, exactly as the serial walk would raise it.
+    """
+    size = POLL_FETCH_WORKERS if workers is None else workers
+    size = max(1, min(int(size), len(planned)))
+    if size <= 1:
+        return [_fetch_one(api, endpoint, tag) for endpoint, tag in planned]
+    with ThreadPoolExecutor(max_workers=size, thread_name_prefix="engine-poll") as pool:
+        futures = [pool.submit(_fetch_one, api, endpoint, tag) for endpoint, tag in planned]
+        return [future.result() for future in futures]
@@ -208,70 +208,108 @@ def refresh_card_collection(conn, player_tag, cards_payload, observed_at):
 # --------------------------------------------------------------------- form
 
 
-def refresh_form(conn, player_tag, now=None):
-    """Recompute player_recent_form for every carried scope (last 10 battles
-    per scope, from battle_events). schema.md §6.2: pre-materialized, never
-    per-call."""
-    tag = canon_tag(player_tag)
+_FORM_UPSERT = """INSERT INTO player_recent_form (player_tag, scope, computed_at,
+       sample_size, wins, losses, draws, current_streak,
+       current_streak_type, win_rate, avg_crown_diff,
+       avg_trophy_change, form_label, summary)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(player_tag, scope) DO UPDATE SET
+       computed_at = excluded.computed_at,
+       sample_size = excluded.sample_size, wins = excluded.wins,
+       losses = excluded.losses, draws = excluded.draws,
+       current_streak = excluded.current_streak,
+       current_streak_type = excluded.current_streak_type,
+       win_rate = excluded.win_rate,
+       avg_crown_diff = excluded.avg_crown_diff,
+       avg_trophy_change = excluded.avg_trophy_change,
+       form_label = excluded.form_label, summary = excluded.summary"""
+
+# Every scope predicate evaluated per row by SQLite itself, so membership keeps
+# the exact SQL semantics (NULL columns fall out of a scope exactly as they did
+# in its WHERE clause). Same index and ORDER BY as the per-scope queries, so
+# the newest-first walk — ties included — is the order each of them saw.
+_FORM_SCAN = f"""SELECT outcome, crowns_for, crowns_against, trophy_change,
+       {", ".join(f"({predicate}) AS {scope}" for scope, predicate in FORM_SCOPES.items())}
+   FROM battle_events WHERE player_tag = ?
+   ORDER BY battle_time DESC"""
+
+
+def _form_values(tag: str, scope: str, computed_at: str, rows) -> tuple:
+    sample_size = len(rows)
+    wins = sum(1 for r in rows if r["outcome"] == "W")
+    losses = sum(1 for r in rows if r["outcome"] == "L")
+    draws = sum(1 for r in rows if r["outcome"] == "D")
+    streak_type = rows[0]["outcome"] if rows and rows[0]["outcome"] else None
+    streak = 0
+    for row in rows:
+        if streak_type and row["outcome"] == streak_type:
+            streak += 1
+        else:
+            break
+    diffs = [
+        (r["crowns_for"] or 0) - (r["crowns_against"] or 0)
+        for r in rows
+        if r["crowns_for"] is not None and r["crowns_against"] is not None
+    ]
+    changes = [r["trophy_change"] for r in rows if r["trophy_change"] is not None]
+    label = _form_label(wins, losses, sample_size)
+    return (
+        tag,
+        scope,
+        computed_at,
+        sample_size,
+        wins,
+        losses,
+        draws,
+        streak,
+        streak_type,
+        round(wins / sample_size, 4) if sample_size else 0,
+        round(sum(diffs) / len(diffs), 2) if diffs else None,
+        round(sum(changes) / len(changes), 2) if changes else None,
+        label,
+        _form_summary(wins, losses, draws, sample_size, label),
+    )
+
+
+def _form_samples(conn, tag: str) -> dict[str, list]:
+    """The last FORM_SAMPLE battles of every scope, from one newest-first walk.
+
+    The walk stops as soon as every scope is full; a scope the player rarely
+    plays (tournament, 2v2) costs one pass over their history, not one per
+    rare scope.
+    """
+    samples: dict[str, list] = {scope: [] for scope in FORM_SCOPES}
+    open_scopes = list(FORM_SCOPES)
+    for row in conn.execute(_FORM_SCAN, (tag,)):
+        for scope in open_scopes:
+            if row[scope]:
+                samples[scope].append(row)
+        open_scopes = [scope for scope in open_scopes if len(samples[scope]) < FORM_SAMPLE]
+        if not open_scopes:
+            break
+    return samples
+
+
+def refresh_forms(conn, player_tags, now=None) -> None:
+    """Recompute player_recent_form for every carried scope of each player
+    (last 10 battles per scope, from battle_events). schema.md §6.2:
+    pre-materialized, never per-call.
+
+    One ordered read per player, every scope classified in memory, and one
+    executemany for all players' rows."""
     computed_at = now or utcnow()
-    for scope, predicate in FORM_SCOPES.items():
-        rows = conn.execute(
-            f"""SELECT outcome, crowns_for, crowns_against, trophy_change
-                FROM battle_events WHERE player_tag = ? AND {predicate}
-                ORDER BY battle_time DESC LIMIT {FORM_SAMPLE}""",
-            (tag,),
-        ).fetchall()
-        sample_size = len(rows)
-        wins = sum(1 for r in rows if r["outcome"] == "W")
-        losses = sum(1 for r in rows if r["outcome"] == "L")
-        draws = sum(1 for r in rows if r["outcome"] == "D")
-        streak_type = rows[0]["outcome"] if rows and rows[0]["outcome"] else None
-        streak = 0
-        for row in rows:
-            if streak_type and row["outcome"] == streak_type:
-                streak += 1
-            else:
-                break
-        diffs = [
-            (r["crowns_for"] or 0) - (r["crowns_against"] or 0)
-            for r in rows
-            if r["crowns_for"] is not None and r["crowns_against"] is not None
-        ]
-        changes = [r["trophy_change"] for r in rows if r["trophy_change"] is not None]
-        label = _form_label(wins, losses, sample_size)
-        conn.execute(
-            """INSERT INTO player_recent_form (player_tag, scope, computed_at,
-                   sample_size, wins, losses, draws, current_streak,
-                   current_streak_type, win_rate, avg_crown_diff,
-                   avg_trophy_change, form_label, summary)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(player_tag, scope) DO UPDATE SET
-                   computed_at = excluded.computed_at,
-                   sample_size = excluded.sample_size, wins = excluded.wins,
-                   losses = excluded.losses, draws = excluded.draws,
-                   current_streak = excluded.current_streak,
-                   current_streak_type = excluded.current_streak_type,
-                   win_rate = excluded.win_rate,
-                   avg_crown_diff = excluded.avg_crown_diff,
-                   avg_trophy_change = excluded.avg_trophy_change,
-                   form_label = excluded.form_label, summary = excluded.summary""",
-            (
-                tag,
-                scope,
-                computed_at,
-                sample_size,
-                wins,
-                losses,
-                draws,
-                streak,
-                streak_type,
-                round(wins / sample_size, 4) if sample_size else 0,
-                round(sum(diffs) / len(diffs), 2) if diffs else None,
-                round(sum(changes) / len(changes), 2) if changes else None,
-                label,
-                _form_summary(wins, losses, draws, sample_size, label),
-            ),
+    values = []
+    for tag in dict.fromkeys(canon_tag(player_tag) for player_tag in player_tags):
+        samples = _form_samples(conn, tag)
+        values.extend(
+            _form_values(tag, scope, computed_at, samples[scope]) for scope in FORM_SCOPES
         )
+    conn.executemany(_FORM_UPSERT, values)
+
+
+def refresh_form(conn, player_tag, now=None):
+    """:func:`refresh_forms` for one player."""
+    refresh_forms(conn, [player_tag], now=now)
 
 
 # ------------------------------------------------------------------ rollups
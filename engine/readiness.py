@@ -176,7 +176,11 @@ def add_materialization_input(conn, materialization_id: int, observation) -> int
 
 
 def record_admission_decision(conn, decision, payload) -> None:
-    """Attach an endpoint contract decision to its latest network receipt."""
+    """Attach an endpoint contract decision to its latest network receipt.
+
+    ``payload`` may be the decoded response or, when admission produced an
+    envelope, its :class:`~engine.db.CanonicalPayload` — whose hash is reused.
+    """
     if payload is None:
         return
     from engine.db import payload_hash
@@ -259,6 +263,15 @@ def latest_materialization(conn) -> dict | None:
     return result
 
 
+def applied_generation_id(conn) -> int | None:
+    """Return the id of the newest applied generation, by the same rule as
+    :func:`generation_snapshot`, without its input count — for caches keyed on it."""
+    return conn.execute(
+        "SELECT MAX(materialization_id) FROM materialization_runs "
+        "WHERE apply_ok = 1 AND status IN ('complete', 'partial')"
+    ).fetchone()[0]
+
+
 def generation_snapshot(conn) -> dict | None:
     """Return the exact applied generation visible to the current DB snapshot."""
     row = conn.execute(
@@ -291,6 +304,7 @@ __all__ = [
     "PROFILE_MAX_AGE_MINUTES",
     "evaluate_source_freshness",
     "add_materialization_input",
+    "applied_generation_id",
     "generation_snapshot",
     "record_admission_decision",
     "latest_materialization",
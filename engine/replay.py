@@ -0,0 +1,313 @@
+"""Partitioned replay — OfflineEngine across worker processes.
+
+One OfflineEngine replays a payload stream in receipt order on one thread;
+over the full raw-payload window that is slow enough that
+scripts/replay_gate.py gets skipped. Most of the window is per-player work
+(profiles and battlelogs), and a player's applies read the shared state and
+their own rows, never another player's, so the stream splits by entity:
+
+    shared   clan, currentriverrace and every non-player endpoint -- the war
+             clock, roster and memberships that player applies read. EVERY
+             partition replays all of it, in order, so at each payload a
+             worker holds the shared state the serial run held there.
+    player   player and player_battlelog, by player tag. Each tag belongs
+             to exactly one partition.
+
+Each partition replays against its own copy of the database in a worker
+process (the engine stays single-writer per file). A worker reports only what
+its OWNED payloads did -- its players', plus the shared ones for partition 0:
+the counters they moved, and the rows of SIGNAL_TABLES they inserted or
+changed, each stamped with the payload's position in the stream. The merge
+writes those rows into the caller's database in stream order, so ids come out
+as the serial run assigns them and :func:`signature` matches it byte for byte.
+
+A dedup key claimed by two partitions means they were not independent after
+all; the merge keeps the earlier payload's row and counts the clash in
+``ReplayResult.collisions``, which callers must treat as a failed replay.
+
+Projections (player_current_state, rollups, war tables, ...) stay in the
+worker databases; only the signal is merged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from engine.db import canon_tag
+
+PLAYER_ENDPOINTS = frozenset({"player", "player_battlelog"})
+SIGNAL_TABLES = ("player_events", "clan_events", "war_events", "battle_events")
+# Wall-clock insert stamps: the one signal column no two replays agree on.
+_UNSTABLE_COLUMNS = frozenset({"created_at"})
+
+
+@dataclass(frozen=True)
+class Partition:
+    index: int
+    rows: tuple[int, ...]  # stream positions replayed here, in stream order
+    owned: frozenset[int]  # the positions whose output this partition reports
+    players: tuple[str, ...]
+
+
+@dataclass
+class ReplayResult:
+    counters: dict[str, int]
+    merged: dict[str, int]
+    collisions: int
+    seconds: float
+    # CPU each partition spent: on a host with a core per worker, the slowest
+    # plus ``merge_seconds`` is the wall clock.
+    partition_cpu_seconds: list[float]
+    merge_seconds: float
+
+
+def plan(rows: list[tuple], workers: int) -> list[Partition]:
+    """Split ``(endpoint, entity_key, payload_json, fetched_at)`` rows.
+
+    Players go, most payloads first, to the partition with the fewest player
+    payloads so far (ties by tag, then partition): the same stream always
+    yields the same plan.
+    """
+    shared: list[int] = []
+    by_player: dict[str, list[int]] = defaultdict(list)
+    for seq, (endpoint, entity_key, *_) in enumerate(rows):
+        if endpoint in PLAYER_ENDPOINTS:
+            by_player[canon_tag(entity_key) or entity_key].append(seq)
+        else:
+            shared.append(seq)
+    count = max(1, min(workers, len(by_player)))
+    loads = [0] * count
+    owned: list[list[int]] = [[] for _ in range(count)]
+    players: list[list[str]] = [[] for _ in range(count)]
+    for tag in sorted(by_player, key=lambda t: (-len(by_player[t]), t)):
+        n = min(range(count), key=lambda i: (loads[i], i))
+        loads[n] += len(by_player[tag])
+        owned[n].extend(by_player[tag])
+        players[n].append(tag)
+    return [
+        Partition(
+            n,
+            tuple(sorted([*shared, *owned[n]])),
+            frozenset([*owned[n], *(shared if n == 0 else ())]),
+            tuple(sorted(players[n])),
+        )
+        for n in range(count)
+    ]
+
+
+def _columns(conn, table: str) -> list[str]:
+    """Columns a merged row carries: all but an INTEGER PRIMARY KEY (the rowid)."""
+    return [
+        row[1]
+        for row in conn.execute(f"PRAGMA main.table_info({table})")
+        if not (row[5] and row[2].upper() == "INTEGER")
+    ]
+
+
+def signature(conn, counters: dict | None = None) -> str:
+    """Digest of the signal tables, row ids included, and of ``counters``.
+
+    Equal for two replays of one stream from one database exactly when they
+    emitted the same events and battles in the same order.
+    """
+    digest = hashlib.sha256()
+    for table in SIGNAL_TABLES:
+        columns = [c for c in _columns(conn, table) if c not in _UNSTABLE_COLUMNS]
+        digest.update(f"{table}:{','.join(columns)}\n".encode())
+        for row in conn.execute(f"SELECT rowid, {', '.join(columns)} FROM {table} ORDER BY rowid"):
+            digest.update(json.dumps(list(row), separators=(",", ":")).encode() + b"\n")
+    if counters is not None:
+        digest.update(json.dumps(counters, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _track(conn) -> None:
+    """Temp triggers noting each signal row an owned payload inserts or changes."""
+    conn.execute("CREATE TEMP TABLE replay_cursor (seq INTEGER, owned INTEGER)")
+    conn.execute("INSERT INTO replay_cursor VALUES (-1, 0)")
+    conn.execute(
+        "CREATE TEMP TABLE replay_touched "
+        "(tbl TEXT, row INTEGER, seq INTEGER, kind TEXT, PRIMARY KEY (tbl, row))"
+    )
+    for table in SIGNAL_TABLES:
+        # battle_events enrich-on-dedup UPDATEs every re-polled battle; only a
+        # row that actually changed is output.
+        changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in _columns(conn, table))
+        for kind, when in (("insert", ""), ("update", f" AND ({changed})")):
+            conn.execute(
+                f"CREATE TEMP TRIGGER replay_{kind}_{table} AFTER {kind.upper()} "
+                f"ON main.{table} WHEN (SELECT owned FROM replay_cursor){when} BEGIN "
+                f"INSERT OR IGNORE INTO replay_touched "
+                f"SELECT '{table}', new.rowid, seq, '{kind}' FROM replay_cursor; END"
+            )
+
+
+def _replay_partition(
+    path: str, rows: list[tuple], owned: frozenset[int], reset_baselines: bool
+) -> dict:
+    """Worker body: replay ``(seq, endpoint, entity_key, payload_json,
+    fetched_at)`` rows on ``path``; report the owned rows' counters and signal."""
+    from engine.offline import OfflineEngine
+
+    started = time.process_time()
+    counters: dict[str, int] = {}
+    with OfflineEngine(path) as eng:
+        conn = eng.conn
+        if reset_baselines:
+            conn.execute("DELETE FROM state_baselines")
+            conn.commit()
+        _track(conn)
+        elsewhere: dict[str, int] = {}
+        for seq, endpoint, entity_key, payload_json, fetched_at in rows:
+            mine = seq in owned
+            conn.execute("UPDATE replay_cursor SET seq = ?, owned = ?", (seq, int(mine)))
+            # Another partition reports what a payload it owns counted.
+            eng.counters = counters if mine else elsewhere
+            eng.apply(endpoint, entity_key, payload_json, fetched_at)
+        eng.counters = counters
+        eng.finish()
+        columns = {table: _columns(conn, table) for table in SIGNAL_TABLES}
+        touched = {
+            table: [
+                tuple(row)
+                for row in conn.execute(
+                    f"SELECT t.seq, t.row, t.kind, {', '.join('x.' + c for c in columns[table])} "
+                    f"FROM replay_touched t JOIN main.{table} x ON x.rowid = t.row "
+                    "WHERE t.tbl = ? ORDER BY t.seq, t.row",
+                    (table,),
+                )
+            ]
+            for table in SIGNAL_TABLES
+        }
+    return {
+        "counters": counters,
+        "columns": columns,
+        "touched": touched,
+        "cpu_seconds": time.process_time() - started,
+    }
+
+
+def _merge(conn, results: list[dict]) -> tuple[dict[str, int], int]:
+    merged: dict[str, int] = {}
+    collisions = 0
+    for table in SIGNAL_TABLES:
+        columns = results[0]["columns"][table]
+        key = columns.index("dedup_key")
+        insert = (
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        update = f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in columns)} WHERE dedup_key = ?"
+        # Positions are unique to their owner, so this is the serial write order.
+        rows = sorted(
+            (row for result in results for row in result["touched"][table]),
+            key=lambda row: (row[0], row[1]),
+        )
+        seen: set[str] = set()
+        written = 0
+        for row in rows:
+            values = row[3:]
+            if values[key] in seen:
+                collisions += 1
+                continue
+            seen.add(values[key])
+            if row[2] == "insert":
+                landed = conn.execute(insert, values).rowcount
+                collisions += 1 - landed
+                written += landed
+            else:
+                written += conn.execute(update, (*values, values[key])).rowcount
+        merged[table] = written
+    conn.commit()
+    return merged, collisions
+
+
+class ParallelReplay:
+    """Replay one payload stream over worker processes, merging into a connection.
+
+    The plan is fixed for the stream. Each partition's database is copied from
+    the caller's on the first :meth:`run` and carried over later runs, the way
+    one OfflineEngine's database carries over a second pass.
+    """
+
+    def __init__(self, rows: list[tuple], workers: int, scratch_dir: str):
+        self.rows = rows
+        self.partitions = plan(rows, workers)
+        self.paths = [
+            os.path.join(scratch_dir, f"replay-worker-{p.index}.db") for p in self.partitions
+        ]
+        self._seeded = False
+
+    def _seed(self, conn) -> None:
+        conn.commit()
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
+            copy = sqlite3.connect(path)
+            try:
+                conn.backup(copy)
+            finally:
+                copy.close()
+        self._seeded = True
+
+    def run(self, conn, *, reset_baselines: bool = False) -> ReplayResult:
+        """Replay the stream and merge its signal into ``conn``'s database.
+
+        ``reset_baselines`` clears state_baselines in every worker database
+        first, as a fresh serial pass clears them in the one database.
+        """
+        started = time.perf_counter()
+        if not self._seeded:
+            self._seed(conn)
+        with ProcessPoolExecutor(len(self.partitions)) as pool:
+            futures = [
+                pool.submit(
+                    _replay_partition,
+                    path,
+                    [(seq, *self.rows[seq]) for seq in part.rows],
+                    part.owned,
+                    reset_baselines,
+                )
+                for part, path in zip(self.partitions, self.paths, strict=True)
+            ]
+            results = [future.result() for future in futures]
+        merging = time.perf_counter()
+        merged, collisions = _merge(conn, results)
+        merge_seconds = time.perf_counter() - merging
+        counters: dict[str, int] = defaultdict(int)
+        for result in results:
+            for key, n in result["counters"].items():
+                counters[key] += n
+        out = dict(sorted(counters.items()))
+        out["proactive_mode"] = "awareness_only"
+        return ReplayResult(
+            counters=out,
+            merged=merged,
+            collisions=collisions,
+            seconds=time.perf_counter() - started,
+            partition_cpu_seconds=[result["cpu_seconds"] for result in results],
+            merge_seconds=merge_seconds,
+        )
+
+    def remove(self) -> None:
+        for path in self.paths:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+
+__all__ = [
+    "PLAYER_ENDPOINTS",
+    "SIGNAL_TABLES",
+    "ParallelReplay",
+    "ReplayResult",
+    "plan",
+    "signature",
+]
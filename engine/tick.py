@@ -14,6 +14,7 @@ from datetime import datetime, timezone
 
 from engine import baselines, management, materialize, observations, polling, readiness
 from engine.db import canon_tag, utcnow
+from storage import payload_writer
 
 log = logging.getLogger("engine.tick")
 
@@ -140,9 +141,18 @@ def _current_clock(conn, now: datetime):
     return materialize.current_clock(conn, now, home_clan=HOME_CLAN)
 
 
-def run_tick(conn, now: datetime | None = None, *, api) -> dict:
+def run_tick(
+    conn,
+    now: datetime | None = None,
+    *,
+    api,
+    fetch_workers: int | None = None,
+) -> dict:
     """Poll → ingest → emit → project → manage.
 
+    ``fetch_workers`` bounds the concurrent per-player fetches (default
+    ``polling.POLL_FETCH_WORKERS``; 1 is the serial walk).
+
     This production entrypoint cannot compose or deliver proactive posts. The
     awareness loop consumes its event streams independently and is now the sole
     proactive owner — the deterministic recognizer/intent pipeline it replaced
@@ -183,7 +193,7 @@ def run_tick(conn, now: datetime | None = None, *, api) -> dict:
         result, admitted = observations.observe(
             "clan", HOME_CLAN, raw_clan_payload, now_iso, source="engine_tick"
         )
-        receipt_admissions.append((result, raw_clan_payload))
+        receipt_admissions.append((result, admitted.canonical if admitted else raw_clan_payload))
         if _count_admission(counters, result, contract_rejections):
             clan_payload = raw_clan_payload
             clan_observation = admitted
@@ -196,7 +206,9 @@ def run_tick(conn, now: datetime | None = None, *, api) -> dict:
                 now_iso,
                 source="engine_tick",
             )
-            receipt_admissions.append((result, raw_race_payload))
+            receipt_admissions.append(
+                (result, admitted.canonical if admitted else raw_race_payload)
+            )
             if _count_admission(counters, result, contract_rejections):
                 race_observation = admitted
         # Poll planning can use the admitted roster without first mutating
@@ -205,41 +217,63 @@ def run_tick(conn, now: datetime | None = None, *, api) -> dict:
         roster_tags = [
             canon_tag(member.get("tag")) for member in (clan_payload or {}).get("memberList", [])
         ]
-        plan = polling.plan(conn, now_iso, roster_tags=roster_tags)
+        # Size the tick from how the API has been answering; a seam without
+        # api_pressure (test fakes) plans at the ratified baseline.
+        pressure = getattr(api, "api_pressure", None)
+        sizing = polling.adaptive_budget(
+            pressure() if pressure else None,
+            battle_day=clock is not None and clock.phase != "training",
+            workers=fetch_workers,
+        )
+        plan = polling.plan(
+            conn,
+            now_iso,
+            sizing.budget,
+            roster_tags=roster_tags,
+            cadence_scale=sizing.cadence_scale,
+        )
+        counters["poll_budget"] = sizing.budget
+        counters["poll_budget_reason"] = sizing.reason
         counters["planned_calls"] = len(plan)
-        for endpoint, tag in plan:
-            # Release the writer BEFORE the fetch: cr_api persists the raw
-            # payload on its own connection during the call, so the tick must
-            # not hold a write transaction across the HTTP round-trip
-            # (that's a 30 s busy-timeout stall per call — observed live).
-            conn.commit()
-            if endpoint == "battlelog":
-                raw_battlelog = api.get_player_battle_log(tag)
+        # Release the writer BEFORE the fetch: cr_api's raw payloads are
+        # persisted on the payload writer's own connection, so the tick must
+        # not hold a write transaction across the fetch and the flush below
+        # (that's a 30 s busy-timeout stall — observed live). The calls overlap on
+        # a bounded pool; admission below still walks them in plan order.
+        conn.commit()
+        for fetched in polling.fetch_plan(api, plan, workers=fetch_workers):
+            tag = fetched.player_tag
+            if fetched.endpoint == "battlelog":
                 result, admitted = observations.observe(
                     "player_battlelog",
                     tag,
-                    raw_battlelog,
+                    fetched.payload,
                     now_iso,
                     source="engine_tick",
                 )
-                receipt_admissions.append((result, raw_battlelog))
+                receipt_admissions.append(
+                    (result, admitted.canonical if admitted else fetched.payload)
+                )
                 if _count_admission(counters, result, contract_rejections):
                     assert admitted is not None
                     battlelog_observations[tag] = admitted
             else:
-                raw_player_payload = api.get_player(tag)
                 result, admitted = observations.observe(
                     "player",
                     tag,
-                    raw_player_payload,
+                    fetched.payload,
                     now_iso,
                     source="engine_tick",
                 )
-                receipt_admissions.append((result, raw_player_payload))
+                receipt_admissions.append(
+                    (result, admitted.canonical if admitted else fetched.payload)
+                )
                 if _count_admission(counters, result, contract_rejections):
                     assert admitted is not None
                     player_observations[tag] = admitted
-            conn.commit()
+        # Receipts are written behind the fetch (storage.payload_writer);
+        # wait for this tick's before stamping admission decisions on them.
+        payload_writer.flush()
         for decision, payload in receipt_admissions:
             readiness.record_admission_decision(conn, decision, payload)
         _record_contract_rejections(contract_rejections)
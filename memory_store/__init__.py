@@ -277,11 +277,56 @@ def _event_key(event_type: Optional[str], event_id: Optional[str]) -> Optional[s
     return event_type or event_id or None
 
 
+# Candidate batches are hydrated in chunks so a large IN (...) list stays well
+# under SQLite's bound-parameter limit.
+_HYDRATE_CHUNK = 500
+
+
 def _fetch_memory(conn, memory_id: int) -> Optional[dict]:
-    row = conn.execute("SELECT * FROM memories WHERE memory_id = ?", (memory_id,)).fetchone()
-    if not row:
-        return None
-    item = dict(row)
+    return _fetch_memories(conn, [memory_id]).get(memory_id)
+
+
+def _fetch_memories(
+    conn,
+    memory_ids: Iterable[int],
+    *,
+    scopes: Optional[tuple[str, ...]] = None,
+    live_at: Optional[str] = None,
+) -> dict[int, dict]:
+    """Hydrate many memories at once: one row read and one tag read per chunk
+    instead of two queries per memory. Returns {memory_id: row}; ids that do
+    not exist (or fail the filters) are absent.
+
+    `scopes` / `live_at` push the reader filters into SQL — only rows in those
+    scopes, unretired, and unexpired at `live_at` come back."""
+    ids = list(dict.fromkeys(memory_ids))
+    out: dict[int, dict] = {}
+    for start in range(0, len(ids), _HYDRATE_CHUNK):
+        chunk = ids[start : start + _HYDRATE_CHUNK]
+        sql = f"SELECT * FROM memories WHERE memory_id IN ({','.join('?' for _ in chunk)})"
+        args: list = list(chunk)
+        if scopes is not None:
+            sql += f" AND scope IN ({','.join('?' for _ in scopes)})"
+            args.extend(scopes)
+        if live_at is not None:
+            sql += " AND retired_at IS NULL AND (expires_at IS NULL OR expires_at > ?)"
+            args.append(live_at)
+        rows = {r["memory_id"]: dict(r) for r in conn.execute(sql, args).fetchall()}
+        if not rows:
+            continue
+        tags: dict[int, list[str]] = {memory_id: [] for memory_id in rows}
+        for r in conn.execute(
+            f"SELECT memory_id, tag FROM memory_tags "
+            f"WHERE memory_id IN ({','.join('?' for _ in rows)}) ORDER BY memory_id, tag",
+            list(rows),
+        ).fetchall():
+            tags[r["memory_id"]].append(r["tag"])
+        for memory_id, item in rows.items():
+            out[memory_id] = _memory_row(item, tags[memory_id])
+    return out
+
+
+def _memory_row(item: dict, tags: list[str]) -> dict:
     # Legacy aliases so pre-rebuild callers keep working.
     item["source_type"] = _LEGACY_SOURCE.get(item["kind"], item["kind"])
     item["is_inference"] = 1 if item["kind"] == "inference" else 0
@@ -293,12 +338,7 @@ def _fetch_memory(conn, memory_id: int) -> Optional[dict]:
     else:
         item["event_type"], item["event_id"] = (ek or None), None
     item["channel_id"] = item.get("channel_key")
-    item["tags"] = [
-        r["tag"]
-        for r in conn.execute(
-            "SELECT tag FROM memory_tags WHERE memory_id = ? ORDER BY tag", (memory_id,)
-        ).fetchall()
-    ]
+    item["tags"] = tags
     item["evidence_refs"] = []
     return item
 
@@ -644,7 +684,8 @@ def list_memories(
     sql += " ORDER BY m.updated_at DESC, m.memory_id DESC LIMIT ?"
     args.append(int(limit))
     rows = conn.execute(sql, args).fetchall()
-    return [_fetch_memory(conn, r["memory_id"]) for r in rows]
+    fetched = _fetch_memories(conn, [r["memory_id"] for r in rows])
+    return [fetched[r["memory_id"]] for r in rows if r["memory_id"] in fetched]
 
 
 def _iso_plus_days(iso_now: str, days: int) -> str:
@@ -754,27 +795,24 @@ def select_memories(
             match.setdefault(r["memory_id"], 0.0)
 
     scored = []
-    now_iso = _utcnow()
+    # Retirement/expiry must be re-checked HERE, not only in the candidate
+    # queries. The FTS branch above selects straight out of memories_fts and
+    # carries no scope_sql() predicate, so before this guard an archived or
+    # expired memory that matched the query was scored and injected into the
+    # prompt — while the member/channel/tag branches correctly excluded it.
+    #
+    # That silently defeated soft expiry: runtime/jobs/_memory.py sets
+    # expires_at on stale or contradicted synthesis rows precisely so they
+    # "vanish from readers", and 4 of the 6 conversational lanes retrieve via
+    # FTS. A fact Elixir had decided was wrong could still be recalled.
+    #
+    # The hydration is the single choke point every candidate source passes
+    # through, so its scope/retired/expiry filter also covers any source added
+    # later. One batched read for all candidates, not one per candidate.
+    rows = _fetch_memories(conn, match, scopes=scopes, live_at=_utcnow())
     for memory_id, strength in match.items():
-        row = _fetch_memory(conn, memory_id)
-        if not row or row["scope"] not in scopes:
-            continue
-        # Retirement/expiry must be re-checked HERE, not only in the candidate
-        # queries. The FTS branch above selects straight out of memories_fts and
-        # carries no scope_sql() predicate, so before this guard an archived or
-        # expired memory that matched the query was scored and injected into the
-        # prompt — while the member/channel/tag branches correctly excluded it.
-        #
-        # That silently defeated soft expiry: runtime/jobs/_memory.py sets
-        # expires_at on stale or contradicted synthesis rows precisely so they
-        # "vanish from readers", and 4 of the 6 conversational lanes retrieve via
-        # FTS. A fact Elixir had decided was wrong could still be recalled.
-        #
-        # This is the single choke point every candidate source passes through,
-        # so guarding it also covers any source added later.
-        if row.get("retired_at"):
-            continue
-        if row.get("expires_at") and str(row["expires_at"]) <= now_iso:
+        row = rows.get(memory_id)
+        if row is None:
             continue
         if tags and not set(tags) <= set(row.get("tags") or []):
             continue
@@ -857,8 +895,9 @@ def search_memories(
             "ORDER BY m.updated_at DESC LIMIT ?",
             (*args, limit * 4),
         ).fetchall()
+    fetched = _fetch_memories(conn, [r["memory_id"] for r in rows])
     for rank, r in enumerate(rows, start=1):
-        memory = _fetch_memory(conn, r["memory_id"])
+        memory = fetched.get(r["memory_id"])
         if not memory:
             continue
         strength = 1.0 / (1 + 0.1 * (rank - 1))
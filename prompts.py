@@ -7,9 +7,14 @@ Not to be confused with ``agent.prompt_builders``, which composes the
 blocks loaded here into per-workflow system prompts.
 """
 
+import copy
 import os
 import re
+import sqlite3
+import threading
+import time
 from datetime import date, datetime
+from pathlib import Path
 
 _PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "prompts")
 _AGENT_PROMPTS_DIR = os.path.join(_PROMPTS_DIR, "agents")
@@ -229,17 +234,66 @@ def ensure_valid_discord_channel_config():
         raise ValueError("; ".join(errors))
 
 
+# Prompt files are read through an in-process cache validated against each
+# file's stat on every call, so an edited file is picked up on the next read
+# (prompts hot-load — job prompts depend on it) while an unchanged one costs a
+# stat instead of an open + read. The cache hands back the same str object
+# until the file changes, which is what the parsed-section memo keys on.
+_PROMPT_FILE_CACHE: dict[str, tuple[tuple[int, int, int], str]] = {}
+_PARSED_CACHE: dict[str, tuple[str, object]] = {}
+_PROMPT_CACHE_LOCK = threading.Lock()
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _read_prompt_file(path: str) -> str:
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _PROMPT_CACHE_LOCK:
+        cached = _PROMPT_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path) as f:
+        text = f.read().strip()
+    # A file modified within the last couple of seconds may be rewritten again
+    # inside the filesystem's timestamp granularity with the same size, so it
+    # is not trusted to the cache until its mtime has settled.
+    if time.time_ns() - st.st_mtime_ns >= _RACY_MTIME_NS:
+        with _PROMPT_CACHE_LOCK:
+            _PROMPT_FILE_CACHE[path] = (stamp, text)
+    return text
+
+
+def _parsed(name: str, text: str, parse):
+    """Memoize ``parse(text)`` until ``text`` changes; callers get a copy."""
+    with _PROMPT_CACHE_LOCK:
+        cached = _PARSED_CACHE.get(name)
+    if cached is None or (cached[0] is not text and cached[0] != text):
+        cached = (text, parse(text))
+        with _PROMPT_CACHE_LOCK:
+            _PARSED_CACHE[name] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _clear_prompt_cache() -> None:
+    """Test hook: drop cached prompt files, parsed sections and the floor memo."""
+    global _floor_probe
+    with _PROMPT_CACHE_LOCK:
+        _PROMPT_FILE_CACHE.clear()
+        _PARSED_CACHE.clear()
+    with _FLOOR_LOCK:
+        _FLOOR_MEMO.clear()
+        if _floor_probe is not None:
+            _floor_probe[1].close()
+            _floor_probe = None
+
+
 def _load(filename):
     """Load a prompt file and return its contents as a string."""
-    path = os.path.join(_PROMPTS_DIR, filename)
-    with open(path) as f:
-        return f.read().strip()
+    return _read_prompt_file(os.path.join(_PROMPTS_DIR, filename))
 
 
 def _load_from_prompt_dir(directory: str, filename: str):
-    path = os.path.join(directory, filename)
-    with open(path) as f:
-        return f.read().strip()
+    return _read_prompt_file(os.path.join(directory, filename))
 
 
 def purpose():
@@ -265,6 +319,63 @@ def _clan_raw():
     return _load("CLAN.md")
 
 
+# The floor changes when a materialization applies a new clan payload, or when
+# the live clan refresh snapshots clan_daily_metrics between generations, so it
+# is memoized per (database, applied materialization_id, newest metrics
+# observed_at). The key is probed over one long-lived read-only connection
+# instead of opening (and schema-checking) a fresh one for every system prompt.
+# With no applied generation there is nothing to key on and the floor is read live.
+_FLOOR_MEMO: dict[tuple[str, int, str | None], int | None] = {}
+_FLOOR_LOCK = threading.Lock()
+_floor_probe: tuple[str, sqlite3.Connection] | None = None
+
+
+def _floor_probe_conn(path: str) -> sqlite3.Connection:
+    global _floor_probe
+    if _floor_probe is not None and _floor_probe[0] == path:
+        return _floor_probe[1]
+    if _floor_probe is not None:
+        _floor_probe[1].close()
+        _floor_probe = None
+    conn = sqlite3.connect(
+        f"{Path(path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+    conn.execute("PRAGMA busy_timeout = 5000")
+    _floor_probe = (path, conn)
+    return conn
+
+
+def _read_required_trophies() -> int | None:
+    import db
+
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT required_trophies FROM clan_daily_metrics "
+            "WHERE required_trophies IS NOT NULL "
+            "ORDER BY metric_date DESC LIMIT 1"
+        ).fetchone()
+    if row is None:
+        return None
+    return int(row["required_trophies"] if hasattr(row, "keys") else row[0])
+
+
+def _floor_generation() -> tuple[str, int, str | None] | None:
+    import db
+    from engine.readiness import applied_generation_id
+
+    path = db._resolve_db_path()
+    if path == ":memory:" or not os.path.exists(path):
+        return None
+    with _FLOOR_LOCK:
+        try:
+            probe = _floor_probe_conn(path)
+            generation = applied_generation_id(probe)
+            observed = probe.execute("SELECT MAX(observed_at) FROM clan_daily_metrics").fetchone()
+        except sqlite3.Error:
+            return None
+    return (path, generation, observed[0]) if generation is not None else None
+
+
 def _live_required_trophies() -> int | None:
     """The clan's CURRENT join floor, from the newest clan_daily_metrics row.
 
@@ -277,21 +388,22 @@ def _live_required_trophies() -> int | None:
 
     The value is already polled and stored (`engine/projections.refresh_clan_rollups`
     writes `requiredTrophies` into `clan_daily_metrics.required_trophies`), so
-    this only has to read it. Fails soft: a prompt must never fail to build,
-    and an unavailable floor renders as "read it live" rather than a guess.
+    this only has to read it — once per data generation or metrics snapshot.
+    Fails soft: a prompt must never fail to build, and an unavailable floor
+    renders as "read it live" rather than a guess.
     """
     try:
-        import db
-
-        with db.get_connection() as conn:
-            row = conn.execute(
-                "SELECT required_trophies FROM clan_daily_metrics "
-                "WHERE required_trophies IS NOT NULL "
-                "ORDER BY metric_date DESC LIMIT 1"
-            ).fetchone()
-        if row is None:
-            return None
-        return int(row["required_trophies"] if hasattr(row, "keys") else row[0])
+        key = _floor_generation()
+        if key is not None:
+            with _FLOOR_LOCK:
+                if key in _FLOOR_MEMO:
+                    return _FLOOR_MEMO[key]
+        floor = _read_required_trophies()
+        if key is not None:
+            with _FLOOR_LOCK:
+                _FLOOR_MEMO.clear()
+                _FLOOR_MEMO[key] = floor
+        return floor
     except Exception:  # hygiene: a prompt must build even with no database
         return None
 
@@ -380,7 +492,10 @@ def lane_key_for_channel(channel_name: str, workflow: str | None = None) -> str:
 
 def discord_channel_configs():
     """Parse DISCORD.md channel sections into structured channel config."""
-    text = discord()
+    return _parsed("discord_channel_configs", discord(), _parse_discord_channels)
+
+
+def _parse_discord_channels(text: str) -> list[dict]:
     heading_matches = list(re.finditer(r"^## (.+?)\s*$", text, re.MULTILINE))
     channels = []
 
@@ -575,7 +690,9 @@ def thresholds():
     Returns dict of {key: int_value}. Reads the raw file to avoid triggering
     clan-phase substitution (which itself depends on this).
     """
-    return _parse_config_section(_clan_raw(), "Thresholds")
+    return _parsed(
+        "thresholds", _clan_raw(), lambda text: _parse_config_section(text, "Thresholds")
+    )
 
 
 # Phase boundaries in days. 30.4375 days/month is the mean Gregorian month
@@ -683,14 +800,15 @@ def discord_config():
 
     Returns dict of {key: int_value} for Discord IDs.
     """
-    return _parse_config_section(discord(), "Config")
+    return _parsed("discord_config", discord(), lambda text: _parse_config_section(text, "Config"))
 
 
 def clan_tag():
     """Extract the clan tag from CLAN.md (e.g. 'J2RGCRVG').
 
-    Parses from the 'Clan tag: #J2RGCRVG' line.
+    Parses from the 'Clan tag: #J2RGCRVG' line, which carries no substitution
+    token, so the raw file is enough.
     """
-    text = clan()
+    text = _clan_raw()
     m = re.search(r"Clan tag:\s*#?(\w+)", text)
     return m.group(1) if m else "J2RGCRVG"
@@ -75,6 +75,24 @@ def _summarize_read(read: dict) -> str:
     ]
     if degraded:
         lines.append(f"⚠️ degraded: {', '.join(degraded)}")
+    cache = read.get("_block_cache") or {}
+    if cache:
+        reused = sum(1 for entry in cache.values() if entry.get("hit"))
+        built = sorted(
+            ((name, entry.get("ms") or 0) for name, entry in cache.items() if not entry.get("hit")),
+            key=lambda item: -item[1],
+        )
+        line = f"block cache: {reused}/{len(cache)} reused"
+        if built:
+            line += " · built " + ", ".join(f"{name} {ms:.0f}ms" for name, ms in built[:3])
+        lines.append(line)
+    timing = read.get("_read_timing") or {}
+    if timing:
+        mode = f"{timing['workers']} readers" if timing.get("workers") else "serial"
+        line = f"read built in {timing.get('total_ms') or 0:.0f}ms ({mode})"
+        if timing.get("unpinned"):
+            line += f" · {len(timing['unpinned'])} block(s) re-read on the main snapshot"
+        lines.append(line)
     return "\n".join(lines)
 
 
@@ -13,10 +13,17 @@ discipline, rebuilt from current v5.1 sources.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import db
 from capabilities import awards as awards_capability
@@ -93,8 +100,6 @@ def _delivery_block() -> dict:
     is read from the same env the scheduler uses (AWARENESS_LOOP_HOURS/MINUTE) so
     the brain's self-knowledge never drifts from the actual schedule.
     """
-    import os
-
     now = _now()
     block: dict = {
         "not_continuous": (
@@ -899,14 +904,229 @@ def _due_revisits(conn, limit: int = 20) -> list[dict]:
     ]
 
 
-def build_read(conn=None) -> dict:
+# ------------------------------------------------------------------ block cache
+
+# The loop, the scoped responder and the daily/weekly composers each build a read,
+# often several against one data_generation. The blocks below are the expensive
+# ones, and each is reused while three things hold still: the generation, the
+# block's own dependency stamp (tables written outside materialization) and its
+# time bucket. The bucket bounds how stale a now-relative block (countdowns,
+# rolling windows) can get; a new generation always rebuilds.
+_LEADER_ACTIONS_STAMP = (
+    "SELECT COUNT(*), MAX(action_id), MAX(updated_at), MAX(decided_at) "
+    "FROM leader_action_recommendations"
+)
+_BLOCK_CACHE_SPECS: dict[str, tuple[str | None, int]] = {
+    # name: (dependency stamp SQL, time bucket seconds)
+    "war_status": (None, 60),
+    "war_season": (None, 60),
+    "war_history": (None, 300),
+    "award_races": (None, 60),
+    "mode_pulse": (None, 300),
+    # 15-minute buckets turn over at every Chicago midnight, so the date is in the key.
+    "cake_days_today": ("SELECT MAX(event_id) FROM clan_events", 900),
+    "channel_memory": (
+        "SELECT MAX(post_id), COUNT(discord_message_id) FROM awareness_posts",
+        900,
+    ),
+    "leader_action_board": (_LEADER_ACTIONS_STAMP, 900),
+    # A leader decision resets member_management state outside materialization.
+    "management": (_LEADER_ACTIONS_STAMP, 60),
+}
+_BLOCK_CACHE: dict[tuple[str, str], tuple[tuple, object]] = {}  # (db, block) -> (key, value)
+_BLOCK_STATS: dict[str, dict] = {}  # block -> cumulative hits / misses / build time
+_BLOCK_CACHE_LOCK = threading.Lock()
+_DEGRADED = object()  # _load's default when a cached block's build raised
+
+
+def _clear_block_cache() -> None:
+    """Test hook to drop every cached block and its counters."""
+    with _BLOCK_CACHE_LOCK:
+        _BLOCK_CACHE.clear()
+        _BLOCK_STATS.clear()
+
+
+def block_cache_stats() -> dict[str, dict]:
+    """Cumulative per-block cache counters for this process."""
+    with _BLOCK_CACHE_LOCK:
+        return {name: dict(stats) for name, stats in _BLOCK_STATS.items()}
+
+
+def _db_path(conn) -> str:
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or ""
+    return ""
+
+
+def _block_key(conn, name: str, generation: dict | None) -> tuple | None:
+    """The cache key for one block in this snapshot, or None to always build.
+    No applied generation yet means nothing to key on."""
+    if not generation:
+        return None
+    stamp_sql, bucket = _BLOCK_CACHE_SPECS[name]
+    try:
+        stamp = tuple(conn.execute(stamp_sql).fetchone()) if stamp_sql else ()
+    except sqlite3.Error:
+        log.debug("build_read: no cache stamp for %s", name, exc_info=True)
+        return None
+    return (
+        tuple(sorted(generation.items())),
+        stamp,
+        int(_now().timestamp()) // bucket,
+    )
+
+
+# ------------------------------------------------------------ parallel loading
+
+# Read assembly gates wake latency for hard posts, and most blocks are
+# independent SELECTs. With ELIXIR_AWARENESS_READ_WORKERS > 0 those blocks fan
+# out over a small pool of read-only connections. SQLite cannot hand one
+# snapshot to several connections, so each worker opens its own read
+# transaction and is pinned to the generation the main snapshot sees: a worker
+# that lands on a different materialization_id gives its block back, and the
+# block is rebuilt on the main connection. The event backlog, signals and war
+# clock stay on the main connection, which owns the cursor checkpoints.
+_READ_WORKERS_DEFAULT = 0
+_READ_POOL_LOCK = threading.Lock()
+_READ_POOL: dict[str, list[sqlite3.Connection]] = {}  # db path -> idle readers
+_READ_EXECUTOR: ThreadPoolExecutor | None = None
+_READ_EXECUTOR_WORKERS = 0
+
+
+def read_workers() -> int:
+    """Reader threads for build_read; 0 keeps every block on the caller's connection."""
+    raw = os.getenv("ELIXIR_AWARENESS_READ_WORKERS")
+    if not raw:
+        return _READ_WORKERS_DEFAULT
+    try:
+        return max(0, min(int(raw), 8))
+    except ValueError:
+        log.warning("build_read: bad ELIXIR_AWARENESS_READ_WORKERS=%r, reading serially", raw)
+        return _READ_WORKERS_DEFAULT
+
+
+def _executor(workers: int) -> ThreadPoolExecutor:
+    global _READ_EXECUTOR, _READ_EXECUTOR_WORKERS
+    with _READ_POOL_LOCK:
+        if _READ_EXECUTOR is None or _READ_EXECUTOR_WORKERS != workers:
+            if _READ_EXECUTOR is not None:
+                _READ_EXECUTOR.shutdown(wait=False)
+            _READ_EXECUTOR = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="awareness-read"
+            )
+            _READ_EXECUTOR_WORKERS = workers
+        return _READ_EXECUTOR
+
+
+def _acquire_reader(path: str) -> sqlite3.Connection:
+    with _READ_POOL_LOCK:
+        idle = _READ_POOL.get(path)
+        if idle:
+            return idle.pop()
+    reader = sqlite3.connect(
+        f"{Path(path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+    reader.row_factory = sqlite3.Row
+    reader.execute("PRAGMA busy_timeout = 30000")
+    return reader
+
+
+def _release_reader(path: str, reader: sqlite3.Connection) -> None:
+    with _READ_POOL_LOCK:
+        _READ_POOL.setdefault(path, []).append(reader)
+
+
+def _close_read_pool() -> None:
+    """Test hook to close every pooled reader and stop the reader threads."""
+    global _READ_EXECUTOR, _READ_EXECUTOR_WORKERS
+    with _READ_POOL_LOCK:
+        readers = [reader for idle in _READ_POOL.values() for reader in idle]
+        _READ_POOL.clear()
+        executor, _READ_EXECUTOR, _READ_EXECUTOR_WORKERS = _READ_EXECUTOR, None, 0
+    if executor is not None:
+        executor.shutdown(wait=True)
+    for reader in readers:
+        reader.close()
+
+
+def _on_pinned_reader(path: str, generation_id, run):
+    """Run ``run(reader)`` inside a read transaction that sees ``generation_id``.
+
+    Returns ``(True, value)``, or ``(False, None)`` when the reader could not
+    be opened or its snapshot shows another generation."""
+    from engine import readiness
+
+    try:
+        reader = _acquire_reader(path)
+    except sqlite3.Error:
+        log.warning("build_read: no read-only connection for %s", path, exc_info=True)
+        return False, None
+    healthy = True
+    try:
+        reader.execute("BEGIN")
+        seen = readiness.generation_snapshot(reader)
+        if (seen or {}).get("materialization_id") != generation_id:
+            return False, None
+        return True, run(reader)
+    except sqlite3.Error:
+        healthy = False
+        log.warning("build_read: pinned reader failed", exc_info=True)
+        return False, None
+    finally:
+        try:
+            if reader.in_transaction:
+                reader.rollback()
+        except sqlite3.Error:
+            healthy = False
+        if healthy:
+            _release_reader(path, reader)
+        else:
+            reader.close()
+
+
+# The read's key order is what the brain sees; parallel loading must not shuffle it.
+_READ_KEYS = (
+    "generated_at",
+    "data_generation",
+    "clock",
+    "delivery",
+    "time",
+    "standing",
+    "war_season",
+    "award_races",
+    "war_history",
+    "signals_by_category",
+    "hard_post_signals",
+    "game_context",
+    "mode_pulse",
+    "cake_days_today",
+    "channel_memory",
+    "recent_member_spotlights",
+    "posting_pulse",
+    "recent_agent_writes",
+    "editorial_guidance",
+    "leader_action_board",
+    "management",
+    "due_revisits",
+)
+
+
+def build_read(conn=None, *, workers: int | None = None) -> dict:
     """Assemble the awareness read from the v5.1 storage palette.
 
     Pass ``conn`` to share a connection; otherwise a fresh read connection is
     opened and closed here. Every block degrades independently — the returned
     dict always carries the expected keys plus a ``_degraded`` list naming any
     block whose loader raised this build.
+
+    ``workers`` (default ``read_workers()``) fans the independent blocks out
+    over pinned read-only connections; see "parallel loading" above. A caller
+    holding uncommitted writes, or an in-memory DB, always reads serially.
     """
+    build_started = time.perf_counter()
+    if workers is None:
+        workers = read_workers()
     own = conn is None
     if own:
         conn = db.get_connection()
@@ -924,20 +1144,154 @@ def build_read(conn=None) -> dict:
         conn.execute("BEGIN")
         started_snapshot = True
     degraded: list[str] = []
+    report_lock = threading.Lock()
+    cache_report: dict[str, dict] = {}
+    block_ms: dict[str, float] = {}
 
     def _load(name, fn, default):
         try:
             return fn()
         except Exception:
             log.warning("build_read: block %s degraded", name, exc_info=True)
-            degraded.append(name)
+            with report_lock:
+                degraded.append(name)
             return default
 
+    def _timed(name, fn, default):
+        started = time.perf_counter()
+        value = _load(name, fn, default)
+        block_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+        return value
+
+    def _cached(name, fn, default, on=None):
+        """``_load`` through the block cache. A degraded build is never stored."""
+        on = conn if on is None else on
+        started = time.perf_counter()
+        key = _block_key(on, name, generation) if db_path else None
+        entry = None
+        if key is not None:
+            with _BLOCK_CACHE_LOCK:
+                entry = _BLOCK_CACHE.get((db_path, name))
+        hit = entry is not None and entry[0] == key
+        if hit:
+            # Copies out and in: a caller mutating its read must not reach the cache.
+            value = copy.deepcopy(entry[1])
+        else:
+            value = _load(name, lambda: fn(on), _DEGRADED)
+            if value is _DEGRADED:
+                value = default
+            elif key is not None:
+                with _BLOCK_CACHE_LOCK:
+                    _BLOCK_CACHE[(db_path, name)] = (key, copy.deepcopy(value))
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        with report_lock:
+            cache_report[name] = {"hit": hit, "ms": elapsed_ms}
+            block_ms[name] = elapsed_ms
+        with _BLOCK_CACHE_LOCK:
+            stats = _BLOCK_STATS.setdefault(name, {"hits": 0, "misses": 0, "build_ms": 0.0})
+            if hit:
+                stats["hits"] += 1
+            else:
+                stats["misses"] += 1
+                stats["build_ms"] = round(stats["build_ms"] + elapsed_ms, 1)
+        return value
+
+    def _block(name, fn, default, *, cached=False, on=None):
+        on = conn if on is None else on
+        if cached:
+            return _cached(name, fn, default, on=on)
+        return _timed(name, lambda: fn(on), default)
+
     try:
-        war_read = _load("war_status", lambda: war_capability.get_war_intelligence(conn=conn), {})
+        db_path = _db_path(conn)
+        generation = _timed(
+            "data_generation",
+            lambda: readiness.generation_snapshot(conn),
+            None,
+        )
+
+        # Blocks that only need a snapshot of the current generation; each
+        # loader takes the connection it should read through.
+        independent = {
+            "war_season": (
+                lambda c: war_capability.get_war_season_view(view="snapshot", conn=c)["data"],
+                None,
+                True,
+            ),
+            "award_races": (
+                lambda c: awards_capability.get_awards_recognition(view="races", limit=10, conn=c)[
+                    "data"
+                ],
+                {"war_champ": [], "iron_king": [], "rookie_mvp": []},
+                True,
+            ),
+            # Season-by-season War Champ + free-pass lineage (rolling 6), so a
+            # war-week/season recap or a free-pass designation reflects the deep
+            # history, not just the current season.
+            "war_history": (
+                lambda c: war_capability.get_war_season_view(view="history", limit=6, conn=c)[
+                    "data"
+                ],
+                None,
+                True,
+            ),
+            "mode_pulse": (
+                lambda c: _mode_pulse(c),
+                {
+                    "mode_mix": [],
+                    "top_by_mode": {},
+                    "special_events": [],
+                    "window_days": _MODE_PULSE_DAYS,
+                },
+                True,
+            ),
+            "cake_days_today": (lambda c: _cake_days_today(c), [], True),
+            "channel_memory": (lambda c: _channel_memory(c), {}, True),
+            "recent_member_spotlights": (lambda c: _recent_member_spotlights(c), [], False),
+            "posting_pulse": (lambda c: _posting_pulse(c), {}, False),
+            "recent_agent_writes": (lambda c: _recent_agent_writes(c), [], False),
+            "editorial_guidance": (lambda c: _editorial_guidance(c), [], False),
+            "leader_action_board": (
+                lambda c: _leader_action_board(c),
+                {"open": [], "recent_decisions": []},
+                True,
+            ),
+            "management": (
+                lambda c: _management(c),
+                {
+                    "actionable": {"kick": [], "promote": [], "demote": []},
+                    "building_counts": {},
+                    "members_evaluated": 0,
+                },
+                True,
+            ),
+            "due_revisits": (lambda c: _due_revisits(c), [], False),
+        }
+        # A caller's open transaction may hold writes no other connection can see.
+        parallel = workers > 0 and bool(db_path) and started_snapshot
+        futures = {}
+        if parallel:
+            pool = _executor(workers)
+            generation_id = (generation or {}).get("materialization_id")
+            for name, (fn, default, cached) in independent.items():
+                futures[name] = pool.submit(
+                    _on_pinned_reader,
+                    db_path,
+                    generation_id,
+                    lambda reader, name=name, fn=fn, default=default, cached=cached: _block(
+                        name, fn, default, cached=cached, on=reader
+                    ),
+                )
+
+        war_read = _block(
+            "war_status",
+            lambda c: war_capability.get_war_intelligence(conn=c),
+            {},
+            cached=True,
+        )
         war = war_read.get("current_state") if war_read.get("available") else None
 
-        pending = _load(
+        pending = _timed(
             "event_backlog",
             lambda: _pending_event_batch(conn),
             {
@@ -975,42 +1329,16 @@ def build_read(conn=None) -> dict:
             if (event.get("event_type") or "") in HARD_POST_EVENT_TYPES:
                 hard_post_signals.append(compact)
 
-        read = {
+        main_blocks = {
             "generated_at": _now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "data_generation": _load(
-                "data_generation",
-                lambda: readiness.generation_snapshot(conn),
-                None,
-            ),
-            "clock": _load("clock", _clock_block, None),
-            "delivery": _load("delivery", _delivery_block, None),
-            "time": _load("time", lambda: _time_block(conn, war), None),
-            "standing": _load("standing", lambda: _standing_block(war), None),
-            "war_season": _load(
-                "war_season",
-                lambda: war_capability.get_war_season_view(view="snapshot", conn=conn)["data"],
-                None,
-            ),
-            "award_races": _load(
-                "award_races",
-                lambda: awards_capability.get_awards_recognition(view="races", limit=10, conn=conn)[
-                    "data"
-                ],
-                {"war_champ": [], "iron_king": [], "rookie_mvp": []},
-            ),
-            # Season-by-season War Champ + free-pass lineage (rolling 6), so a
-            # war-week/season recap or a free-pass designation reflects the deep
-            # history, not just the current season.
-            "war_history": _load(
-                "war_history",
-                lambda: war_capability.get_war_season_view(view="history", limit=6, conn=conn)[
-                    "data"
-                ],
-                None,
-            ),
+            "data_generation": generation,
+            "clock": _timed("clock", _clock_block, None),
+            "delivery": _timed("delivery", _delivery_block, None),
+            "time": _timed("time", lambda: _time_block(conn, war), None),
+            "standing": _timed("standing", lambda: _standing_block(war), None),
             "signals_by_category": signals_by_category,
             "hard_post_signals": hard_post_signals,
-            "game_context": _load(
+            "game_context": _timed(
                 "game_context",
                 lambda: _game_context(conn, pending.get("events") or []),
                 {
@@ -1019,45 +1347,30 @@ def build_read(conn=None) -> dict:
                     "window_days": _GAME_CONTEXT_DAYS,
                 },
             ),
-            "mode_pulse": _load(
-                "mode_pulse",
-                lambda: _mode_pulse(conn),
-                {
-                    "mode_mix": [],
-                    "top_by_mode": {},
-                    "special_events": [],
-                    "window_days": _MODE_PULSE_DAYS,
-                },
-            ),
-            "cake_days_today": _load("cake_days_today", lambda: _cake_days_today(conn), []),
-            "channel_memory": _load("channel_memory", lambda: _channel_memory(conn), {}),
-            "recent_member_spotlights": _load(
-                "recent_member_spotlights", lambda: _recent_member_spotlights(conn), []
-            ),
-            "posting_pulse": _load("posting_pulse", lambda: _posting_pulse(conn), {}),
-            "recent_agent_writes": _load(
-                "recent_agent_writes", lambda: _recent_agent_writes(conn), []
-            ),
-            "editorial_guidance": _load(
-                "editorial_guidance", lambda: _editorial_guidance(conn), []
-            ),
-            "leader_action_board": _load(
-                "leader_action_board",
-                lambda: _leader_action_board(conn),
-                {"open": [], "recent_decisions": []},
-            ),
-            "management": _load(
-                "management",
-                lambda: _management(conn),
-                {
-                    "actionable": {"kick": [], "promote": [], "demote": []},
-                    "building_counts": {},
-                    "members_evaluated": 0,
-                },
-            ),
-            "due_revisits": _load("due_revisits", lambda: _due_revisits(conn), []),
         }
+        unpinned = []
+        for name, (fn, default, cached) in independent.items():
+            pinned, value = futures[name].result() if name in futures else (False, None)
+            if name in futures and not pinned:
+                unpinned.append(name)
+            main_blocks[name] = value if pinned else _block(name, fn, default, cached=cached)
+        if unpinned:
+            log.info(
+                "build_read: %d block(s) rebuilt on the main snapshot: %s",
+                len(unpinned),
+                ", ".join(unpinned),
+            )
+        read = {key: main_blocks[key] for key in _READ_KEYS}
+        # Completion order varies with workers; report in read order.
+        degraded.sort(key=lambda name: _READ_KEYS.index(name) if name in _READ_KEYS else -1)
         read["_degraded"] = degraded
+        read["_block_cache"] = cache_report
+        read["_read_timing"] = {
+            "total_ms": round((time.perf_counter() - build_started) * 1000, 1),
+            "workers": workers if parallel else 0,
+            "unpinned": unpinned,
+            "blocks_ms": block_ms,
+        }
         read["_signal_count"] = len(events)
         read["_event_cursor_checkpoints"] = pending.get("checkpoints") or {}
         read["_event_backlog"] = {
@@ -1078,4 +1391,4 @@ def build_read(conn=None) -> dict:
             conn.close()
 
 
-__all__ = ["build_read", "HARD_POST_EVENT_TYPES"]
+__all__ = ["build_read", "read_workers", "HARD_POST_EVENT_TYPES"]
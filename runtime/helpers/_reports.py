@@ -132,6 +132,8 @@ def _build_status_report():
     data = db.get_system_status()
     api = runtime["api"]
     llm = runtime["llm"]
+    writer = runtime.get("payload_writer") or {}
+    telemetry_writer = runtime.get("telemetry_writer") or {}
     roster = data.get("roster_summary") or {}
     freshness = data.get("freshness") or {}
     endpoint_bits = []
@@ -158,11 +160,12 @@ def _build_status_report():
         f"🗄️ DB: `{os.path.basename(data.get('db_path') or 'n/a')}` | schema {schema_display} | {_fmt_bytes(data.get('db_size_bytes'))} | active members {roster.get('active_members', 0)}/50",
         f"🧾 Data freshness: roster {_fmt_relative(freshness.get('member_state_at'))}, profiles {_fmt_relative(freshness.get('player_profile_at'))}, battles {_fmt_relative(freshness.get('battle_fact_at'))}, war {_fmt_relative(freshness.get('war_state_at'))}",
         f"📊 Data counts: raw payloads {data.get('counts', {}).get('raw_payload_count', 0)}, battle facts {data.get('counts', {}).get('battle_fact_count', 0)}, messages {data.get('counts', {}).get('message_count', 0)}, discord links {data.get('counts', {}).get('discord_links', 0)}",
-        f"📥 Raw ingest: latest {((data.get('latest_raw_payload') or {}).get('endpoint') or 'n/a')} @ {_fmt_relative((data.get('latest_raw_payload') or {}).get('fetched_at'))}; endpoints {endpoint_summary}",
+        f"📥 Raw ingest: latest {((data.get('latest_raw_payload') or {}).get('endpoint') or 'n/a')} @ {_fmt_relative((data.get('latest_raw_payload') or {}).get('fetched_at'))}; endpoints {endpoint_summary}; writer queue {writer.get('queue_depth', 0)} (max {writer.get('max_queue_depth', 0)}), flush {writer.get('last_flush_ms') or 'n/a'}ms (avg {writer.get('avg_flush_ms') or 'n/a'}ms), dropped {writer.get('dropped', 0)}",
         f"🎯 Player intel backlog: {data.get('stale_player_intel_targets', 0)} stale target(s)",
         f"🧠 Context memory: {memory.get('total', 0)} total ({memory.get('leader_notes', 0)} leader / {memory.get('inferences', 0)} inference / {memory.get('system_notes', 0)} system) | latest {_fmt_relative(memory.get('latest_memory_at'))} | FTS search",
         f"{_status_badge(api.get('last_ok'))} CR API: last {(api.get('last_endpoint') or 'n/a')} ({api.get('last_entity_key') or '-'}) {_fmt_relative(api.get('last_call_at'))}; status {api.get('last_status_code') or 'n/a'}; {'ok' if api.get('last_ok') else 'error' if api.get('last_ok') is not None else 'n/a'}; {api.get('last_duration_ms') or 'n/a'}ms; total {api.get('call_count', 0)} calls / {api.get('error_count', 0)} errors / {api.get('consecutive_error_count', 0)} consecutive failures",
         f"{_status_badge(llm.get('last_ok'))} Claude: last {(llm.get('last_workflow') or 'n/a')} via {(llm.get('last_model') or 'n/a')} {_fmt_relative(llm.get('last_call_at'))}; {'ok' if llm.get('last_ok') else 'error' if llm.get('last_ok') is not None else 'n/a'}; {llm.get('last_duration_ms') or 'n/a'}ms; tokens p/c/t {llm.get('last_prompt_tokens') or 'n/a'}/{llm.get('last_completion_tokens') or 'n/a'}/{llm.get('last_total_tokens') or 'n/a'}; cache w/r {llm.get('last_cache_creation_tokens') or 'n/a'}/{llm.get('last_cache_read_tokens') or 'n/a'}; total {llm.get('call_count', 0)} calls / {llm.get('error_count', 0)} errors",
+        f"📈 Telemetry writer: queue {telemetry_writer.get('queue_depth', 0)} (max {telemetry_writer.get('max_queue_depth', 0)}), {telemetry_writer.get('written', 0)} written in {telemetry_writer.get('batches', 0)} batch(es), flush avg {telemetry_writer.get('avg_flush_ms') or 'n/a'}ms, dropped {telemetry_writer.get('dropped', 0)}, failed {telemetry_writer.get('failed', 0)}",
         f"💸 Claude spend: 7d ${llm_cost_7d:.2f} across {llm_cost.get('calls', 0)} call(s), projected ${llm_monthly:.2f}/mo; failures {llm_cost.get('failures', 0)}",
         f"👁️ Awareness 7d: {awareness.get('ticks', 0)} tick(s), {awareness.get('signals_in', 0)} signal(s), {awareness.get('posts_delivered', 0)} post(s), failed ticks {awareness.get('failed_ticks', 0)}, delivery failures {awareness.get('delivery_failed', 0)}",
         f"🔐 Env: Discord {discord_badge}, Claude {claude_env_badge}, CR {cr_env_badge}",
@@ -2,10 +2,11 @@
 
 Computed enrichment only — no LLM. Extends ``battle_card_plays`` and
 ``battle_enrichment`` for un-enriched 1v1 battles each interval. Self-catching-up
-and idempotent (the storage layer selects battles lacking an enrichment row and
-uses ``INSERT OR IGNORE``), so this runs safely outside the engine tick and a
-re-run or overlap is a no-op. The one-time historical backfill is
-``storage.battle_intel.backfill`` (bounded chunks, run once at ship).
+and idempotent (the storage layer reads forward from its rowid cursor, commits
+chunk by chunk, and uses ``INSERT OR IGNORE``), so this runs safely outside the
+engine tick and a re-run or overlap is a no-op. The full sweep is
+``storage.battle_intel.backfill`` (run once at ship, and by weekly maintenance
+after VACUUM).
 """
 
 from __future__ import annotations
@@ -14,7 +15,7 @@ import asyncio
 import logging
 
 from runtime import status as runtime_status
-from storage import battle_intel
+from storage import battle_intel, card_play_columns, deck_columns
 
 __all__ = [
     "_battle_intel_stage_a",
@@ -38,6 +39,12 @@ async def _battle_intel_stage_a() -> None:
     runtime_status.mark_job_start("battle_intel_stage_a")
     try:
         result = await asyncio.to_thread(battle_intel.enrich_battles, BATTLE_INTEL_BATCH)
+        # Fold the committed batch into the columnar card-play store now, so the
+        # next battle-intelligence read does not pay for the catch-up. This is
+        # also where the store is built (reads never build it; they use SQL).
+        await asyncio.to_thread(card_play_columns.refresh_card_play_columns)
+        # Likewise the member-deck store behind the clan card reports.
+        await asyncio.to_thread(deck_columns.refresh_deck_columns)
         runtime_status.mark_job_success(
             "battle_intel_stage_a",
             f"enrichment +{result['enriched']}, card_plays +{result['card_plays']}, "
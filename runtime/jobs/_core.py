@@ -830,7 +830,7 @@ async def _weekly_member_report_cycle():
 
     from agent.mail import outbound
     from agent.workflows import generate_member_report
-    from runtime import member_report
+    from runtime import member_report_pipeline
 
     if not outbound.enabled():
         runtime_status.mark_job_success("weekly_member_report", "skipped: mail not configured")
@@ -849,36 +849,18 @@ async def _weekly_member_report_cycle():
         *datetime.now(CHICAGO).isocalendar()[:2]
     )
 
-    def _build_and_send(rec: dict) -> str:
-        tag = rec["player_tag"]
-        dedup_key = f"{tag}:{week_key}"
-        if email_dedup.already_sent("member_report", dedup_key):
-            return "already"
-        name = rec.get("member_name") or tag
-        ctx = member_report.build_member_report_context(tag, name)
-        narrative = generate_member_report(member_report.facts_for_model(ctx))
-        subject, body = member_report.render_member_report(ctx, narrative)
-        outbound.send(to=rec["email"], subject=subject, body=body)
-        if not email_dedup.record_sent("member_report", dedup_key):
-            log.error("arena dispatch: sent to %s but NOT recorded; a re-run will duplicate", tag)
-            return "unrecorded"
-        return "sent"
-
-    sent = 0
-    skipped = 0
-    failed = 0
-    for rec in recipients:
-        try:
-            outcome = await asyncio.to_thread(_build_and_send, rec)
-            if outcome == "sent":
-                sent += 1
-            elif outcome == "already":
-                skipped += 1
-            else:
-                failed += 1
-        except Exception as exc:  # one member's failure never sinks the batch
-            failed += 1
-            log.warning("arena dispatch failed for %s: %s", rec.get("player_tag"), exc)
+    # Build, generate and deliver overlap (runtime.member_report_pipeline);
+    # delivery stays one send at a time, in roster order.
+    outcomes = await asyncio.to_thread(
+        member_report_pipeline.run_member_reports,
+        recipients,
+        week_key=week_key,
+        generate=generate_member_report,
+        send=lambda rec, subject, body: outbound.send(to=rec["email"], subject=subject, body=body),
+    )
+    sent = outcomes.count("sent")
+    skipped = outcomes.count("already")
+    failed = len(outcomes) - sent - skipped
 
     total = len(recipients)
     if failed == 0 and sent + skipped == total:
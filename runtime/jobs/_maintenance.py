@@ -211,6 +211,35 @@ async def _db_maintenance_cycle():
 
         await asyncio.to_thread(_vacuum)
 
+        # 3a. VACUUM may also have renumbered battle_events, which the enrichment
+        # cursor is a rowid into: sweep for anything un-enriched and re-park it.
+        from storage import battle_intel
+
+        swept = await asyncio.to_thread(battle_intel.backfill)
+        if swept["enriched"]:
+            log.info("enrichment sweep after VACUUM: +%d battles", swept["enriched"])
+
+        # 3b. The purge deleted old card plays and battles, and VACUUM may renumber
+        # rowids; check the columnar card-play and deck stores against SQLite and
+        # rebuild either on any drift, then the daily card-usage rollup (which
+        # also builds it the first time after its migration).
+        from storage import card_play_columns, card_usage, deck_columns
+
+        columns = await asyncio.to_thread(card_play_columns.check_card_play_columns)
+        if columns.get("mismatched_days"):
+            log.info(
+                "card-play columns rebuilt: %d day(s) drifted",
+                len(columns["mismatched_days"]),
+            )
+        decks = await asyncio.to_thread(deck_columns.check_deck_columns)
+        if decks.get("mismatched_days"):
+            log.info("deck columns rebuilt: %d day(s) drifted", len(decks["mismatched_days"]))
+        usage = await asyncio.to_thread(card_usage.check_card_usage)
+        if usage.get("mismatched_days"):
+            log.info(
+                "card usage rollup recomputed: %d day(s) drifted", len(usage["mismatched_days"])
+            )
+
         size_after = os.path.getsize(db_path)
         report = _build_maintenance_report(
             size_before,
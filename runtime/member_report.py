@@ -1,12 +1,14 @@
 """The Arena Dispatch — the personalized weekly member report.
 
 Two halves, kept apart on purpose (facts are rendered, voice is generated):
-  * build_member_report_context() gathers a member's week as pure facts.
+  * build_member_report_context() gathers a member's week as pure facts (the
+    clan-wide share from build_clan_report_context(), computed once per send).
   * render_member_report() turns facts + the LLM narrative into the email body.
 
 Every number here is computed from the data; the model only narrates the facts it
 is handed (see agent/prompt_builders._member_report_system). Nothing in this module
-calls the LLM — the job wires generation in between build and render.
+calls the LLM — runtime.member_report_pipeline wires generation in between
+build and render.
 """
 
 from __future__ import annotations
@@ -407,18 +409,18 @@ def _battles_by_type(battles: list[dict]) -> dict:
     return dict(sorted(groups.items(), key=lambda kv: -kv[1]["count"]))
 
 
-def _battles_rank(conn, tag: str, cutoff: str) -> dict | None:
-    """The member's rank among current clanmates by battles played this week."""
+def _battle_ranks(conn, cutoff: str) -> dict[str, dict]:
+    """Every current clanmate's rank by battles played this week, keyed by tag."""
     rows = conn.execute(
         "SELECT b.player_tag, COUNT(*) AS n FROM battle_events b "
         "JOIN clan_memberships cm ON cm.player_tag = b.player_tag AND cm.left_at IS NULL "
         "WHERE b.battle_time >= ? GROUP BY b.player_tag ORDER BY n DESC",
         (cutoff,),
     ).fetchall()
-    for i, r in enumerate(rows, start=1):
-        if r["player_tag"] == tag:
-            return {"rank": i, "of": len(rows), "battles": r["n"]}
-    return None
+    return {
+        r["player_tag"]: {"rank": i, "of": len(rows), "battles": r["n"]}
+        for i, r in enumerate(rows, start=1)
+    }
 
 
 def _clan_trending_cards(conn, cutoff: str, *, min_members: int = 2, limit: int = 6) -> list[dict]:
@@ -522,13 +524,55 @@ def _intelligence(conn, tag: str, days: int) -> dict:
     }
 
 
+def build_clan_report_context(*, days: int = 7, now: str | None = None, conn=None) -> dict:
+    """The clan-wide half of every member's week, computed once per send.
+
+    The battle ranks, the game stream and the card catalog are the same for every
+    recipient; passing this as ``clan=`` to build_member_report_context() keeps a
+    50-member send from recomputing them 50 times. Build it with the same
+    ``days``/``now`` as the member contexts it is shared with.
+    """
+    close = conn is None
+    conn = conn or db.get_connection()
+    try:
+        cutoff = _cutoff(days, now)
+        stream = game_events.recent_game_events(conn, days=days, now=now)
+        return {
+            "days": days,
+            "now": now,
+            "battle_ranks": _battle_ranks(conn, cutoff),
+            "known_cards": card_catalog.card_index(conn=conn),
+            "game_stream": {
+                "new_cards": [s["payload"] for s in stream if s["event_type"] == "card_added"],
+                "new_events": [s["payload"] for s in stream if s["event_type"] == "event_started"],
+                "trending_cards": _clan_trending_cards(conn, cutoff),
+            },
+        }
+    finally:
+        if close:
+            conn.close()
+
+
 def build_member_report_context(
-    tag: str, name: str, *, days: int = 7, now: str | None = None
+    tag: str,
+    name: str,
+    *,
+    days: int = 7,
+    now: str | None = None,
+    clan: dict | None = None,
+    conn=None,
 ) -> dict:
     """Gather one member's week as pure facts — the input to both the renderer and
-    the (grounded) narrative model."""
-    conn = db.get_connection()
+    the (grounded) narrative model.
+
+    ``clan`` is a build_clan_report_context() result to share across a send
+    (computed here when omitted); ``conn`` is borrowed, not closed.
+    """
+    close = conn is None
+    conn = conn or db.get_connection()
     try:
+        if clan is None:
+            clan = build_clan_report_context(days=days, now=now, conn=conn)
         display = preferred_display_name(conn, tag, name)
         cutoff = _cutoff(days, now)  # ISO — for *_events.observed_at
         cutoff_c = _cutoff(days, now)
@@ -552,7 +596,7 @@ def build_member_report_context(
         # Events written before that still carry only the raw key, so fall back to
         # resolving here — against the real catalog, so an unknown key degrades to
         # a generic label instead of naming a card that does not exist.
-        known_cards = card_catalog.card_index(conn=conn)
+        known_cards = clan["known_cards"]
         events = db.list_recent_events(days=days, subject_key=tag, limit=200, conn=conn)
         badges, cards, ranked, other, arena_changes = [], [], [], [], []
         for e in events:
@@ -599,10 +643,6 @@ def build_member_report_context(
 
         war = member_read.get("war")
 
-        stream = game_events.recent_game_events(conn, days=days, now=now)
-        new_cards = [s["payload"] for s in stream if s["event_type"] == "card_added"]
-        new_events = [s["payload"] for s in stream if s["event_type"] == "event_started"]
-
         ctx = {
             "tag": tag,
             "name": display,
@@ -648,18 +688,15 @@ def build_member_report_context(
             "milestones": other,
             "arena_changes": arena_changes,
             "war": war,
-            "clan_standing": _battles_rank(conn, tag, cutoff_c),
-            "game_stream": {
-                "new_cards": new_cards,
-                "new_events": new_events,
-                "trending_cards": _clan_trending_cards(conn, cutoff),
-            },
+            "clan_standing": clan["battle_ranks"].get(tag),
+            "game_stream": {key: list(rows) for key, rows in clan["game_stream"].items()},
         }
         ctx["intel"] = _intelligence(conn, tag, days)
         ctx["progress"] = _progress_items(ctx)
         return ctx
     finally:
-        conn.close()
+        if close:
+            conn.close()
 
 
 def _sig_names(sig) -> list[str]:
@@ -0,0 +1,135 @@
+"""The Arena Dispatch send as a pipeline: build, generate, deliver.
+
+The Monday job used to walk recipients one at a time — build a context, wait
+on the model, render, send — so its wall time was the roster times the model's
+latency, and every member's build recomputed the same clan-wide reads. Here
+the stages overlap:
+
+  1. the clan-wide share of every report (battle ranks, the game stream, the
+     card catalog) is computed once — member_report.build_clan_report_context;
+  2. one builder thread makes each member's context on a single connection, in
+     recipient order, skipping recipients already fulfilled for the period;
+  3. generation runs on a bounded pool (``ELIXIR_MEMBER_REPORT_WORKERS``) as
+     each context lands;
+  4. delivery renders and sends from the caller's thread, strictly in recipient
+     order, each send followed by its dedup receipt — one at a time, exactly as
+     before, so the mail relay never sees a burst.
+
+The builder stays at most two contexts per worker ahead of delivery, so a
+large roster never holds every context in memory. A member's failure at any
+stage is that member's outcome only. Nothing here knows the LLM or the mail
+relay: the job passes ``generate`` and ``send`` in.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import db
+from runtime import email_dedup, member_report
+
+log = logging.getLogger("elixir")
+
+# Concurrent narrative generations. 1 restores one model call at a time.
+MEMBER_REPORT_WORKERS = int(os.getenv("ELIXIR_MEMBER_REPORT_WORKERS", "4"))
+DEDUP_KIND = "member_report"
+_DONE = object()
+
+
+def _resolved(value) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+def _failed(exc: BaseException) -> Future:
+    future: Future = Future()
+    future.set_exception(exc)
+    return future
+
+
+def run_member_reports(
+    recipients: list[dict],
+    *,
+    week_key: str,
+    generate: Callable[[str], dict],
+    send: Callable[[dict, str, str], object],
+    workers: int | None = None,
+) -> list[str]:
+    """Build, generate and deliver one report per recipient.
+
+    ``generate(facts)`` returns the narrative; ``send(recipient, subject, body)``
+    mails one report. Returns one outcome per recipient, in order: ``"sent"``,
+    ``"already"`` (fulfilled for ``week_key`` before this run), ``"unrecorded"``
+    (sent, but the receipt did not stick) or ``"failed"``.
+    """
+    size = max(1, MEMBER_REPORT_WORKERS if workers is None else int(workers))
+    handoff: queue.Queue = queue.Queue(maxsize=size * 2)
+
+    def _narrate(ctx: dict) -> tuple[dict, dict]:
+        return ctx, generate(member_report.facts_for_model(ctx))
+
+    def _build_all(pool: ThreadPoolExecutor) -> None:
+        conn = None
+        clan = None
+        try:
+            conn = db.get_connection()
+            for rec in recipients:
+                tag = rec["player_tag"]
+                if email_dedup.already_sent(DEDUP_KIND, f"{tag}:{week_key}"):
+                    handoff.put((rec, _resolved(None)))
+                    continue
+                try:
+                    if clan is None:
+                        clan = member_report.build_clan_report_context(conn=conn)
+                    ctx = member_report.build_member_report_context(
+                        tag, rec.get("member_name") or tag, clan=clan, conn=conn
+                    )
+                except Exception as exc:  # one member's failure never sinks the batch
+                    log.warning("arena dispatch: context for %s failed: %s", tag, exc)
+                    handoff.put((rec, _failed(exc)))
+                    continue
+                handoff.put((rec, pool.submit(_narrate, ctx)))
+        except Exception as exc:
+            log.error("arena dispatch: builder stopped: %s", exc)
+        finally:
+            if conn is not None:
+                conn.close()
+            handoff.put(_DONE)
+
+    outcomes: list[str] = []
+    with ThreadPoolExecutor(max_workers=size, thread_name_prefix="member-report") as pool:
+        builder = threading.Thread(
+            target=_build_all, args=(pool,), name="member-report-build", daemon=True
+        )
+        builder.start()
+        while (item := handoff.get()) is not _DONE:
+            outcomes.append(_deliver(*item, week_key=week_key, send=send))
+        builder.join()
+    # A builder that died outside a member (no connection) leaves the rest unsent.
+    outcomes.extend("failed" for _ in recipients[len(outcomes) :])
+    return outcomes
+
+
+def _deliver(rec: dict, built: Future, *, week_key: str, send) -> str:
+    tag = rec["player_tag"]
+    try:
+        ready = built.result()
+        if ready is None:
+            return "already"
+        ctx, narrative = ready
+        subject, body = member_report.render_member_report(ctx, narrative)
+        send(rec, subject, body)
+        recorded = email_dedup.record_sent(DEDUP_KIND, f"{tag}:{week_key}")
+    except Exception as exc:  # one member's failure never sinks the batch
+        log.warning("arena dispatch failed for %s: %s", tag, exc)
+        return "failed"
+    if not recorded:
+        log.error("arena dispatch: sent to %s but NOT recorded; a re-run will duplicate", tag)
+        return "unrecorded"
+    return "sent"
@@ -7,6 +7,8 @@ import copy
 import logging
 import os
 import threading
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextvars import ContextVar
@@ -41,6 +43,9 @@ _API_STATUS = {
     "last_duration_ms": None,
     "by_endpoint": {},
 }
+# Recent API calls for the poll planner: (monotonic, endpoint, duration_ms,
+# status_code, retry_after seconds). Bounded; api_pressure() reads a window.
+_API_SAMPLES: deque = deque(maxlen=4096)
 _LLM_STATUS = {
     "call_count": 0,
     "success_count": 0,
@@ -367,9 +372,11 @@ def record_api_call(
     status_code=None,
     error=None,
     duration_ms=None,
+    retry_after=None,
 ) -> None:
     with _LOCK:
         now = _utcnow()
+        _API_SAMPLES.append((time.monotonic(), endpoint, duration_ms, status_code, retry_after))
         _API_STATUS["call_count"] += 1
         if ok:
             _API_STATUS["success_count"] += 1
@@ -396,9 +403,14 @@ def record_api_call(
                 "last_status_code": None,
                 "last_error": None,
                 "last_duration_ms": None,
+                "throttled_count": 0,
+                "last_retry_after": None,
             },
         )
         per_endpoint["call_count"] += 1
+        if status_code == 429:
+            per_endpoint["throttled_count"] += 1
+            per_endpoint["last_retry_after"] = retry_after
         if ok:
             per_endpoint["success_count"] += 1
         else:
@@ -410,6 +422,51 @@ def record_api_call(
         per_endpoint["last_duration_ms"] = duration_ms
 
 
+def _percentile(values: list, q: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else None
+
+
+def api_pressure(window_seconds: float = 1800.0) -> dict:
+    """How the CR API has behaved over the last ``window_seconds``: call count
+    and rate, 429s and the longest Retry-After among them, and per-endpoint
+    p50/p90 durations. What engine.polling.adaptive_budget sizes a tick from."""
+    cutoff = time.monotonic() - window_seconds
+    with _LOCK:
+        samples = [s for s in _API_SAMPLES if s[0] >= cutoff]
+    return summarize_api_samples(samples, window_seconds)
+
+
+def summarize_api_samples(samples, window_seconds: float) -> dict:
+    """The :func:`api_pressure` shape over ``(at, endpoint, duration_ms,
+    status_code, retry_after)`` samples. The simulator's throttle model uses it
+    on synthetic samples."""
+    by_endpoint: dict[str, dict] = {}
+    throttled, retry_after = 0, None
+    for _at, endpoint, duration_ms, status_code, retry in samples:
+        entry = by_endpoint.setdefault(endpoint, {"calls": 0, "throttled": 0, "durations": []})
+        entry["calls"] += 1
+        if duration_ms is not None:
+            entry["durations"].append(duration_ms)
+        if status_code == 429:
+            entry["throttled"] += 1
+            throttled += 1
+            if retry is not None:
+                retry_after = max(retry_after or 0.0, float(retry))
+    for entry in by_endpoint.values():
+        durations = entry.pop("durations")
+        entry["p50_ms"] = _percentile(durations, 0.5)
+        entry["p90_ms"] = _percentile(durations, 0.9)
+    return {
+        "window_seconds": window_seconds,
+        "calls": len(samples),
+        "calls_per_minute": round(len(samples) * 60.0 / window_seconds, 2),
+        "throttled": throttled,
+        "retry_after_max": retry_after,
+        "by_endpoint": by_endpoint,
+    }
+
+
 def record_llm_call(
     workflow: str,
     *,
@@ -505,6 +562,8 @@ def missing_required_secrets() -> list[str]:
 
 
 def snapshot() -> dict:
+    from storage import payload_writer, telemetry_writer
+
     persisted_jobs = _load_persisted_job_status()
     with _LOCK:
         jobs = copy.deepcopy(persisted_jobs)
@@ -518,4 +577,6 @@ def snapshot() -> dict:
             "jobs": jobs,
             "api": copy.deepcopy(_API_STATUS),
             "llm": copy.deepcopy(_LLM_STATUS),
+            "payload_writer": payload_writer.stats(),
+            "telemetry_writer": telemetry_writer.stats(),
         }
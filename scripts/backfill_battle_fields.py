@@ -38,9 +38,11 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 import json  # noqa: E402
+import zlib  # noqa: E402
 
 from engine.ingest import extract_battles  # noqa: E402
 from engine.normalize import canon_tag  # noqa: E402
+from storage.payload_codec import PayloadReader  # noqa: E402
 
 DEFAULT_BACKUP_DIR = Path.home() / "elixir-backups"
 
@@ -62,15 +64,20 @@ def _rows_from_payloads(conn, wanted: set[tuple[str, str]]) -> dict:
     """Replay stored battlelog payloads through the current extractor."""
     out: dict[tuple[str, str], dict] = {}
     try:
+        # Backups from before schema v40 store every body as plain text.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(raw_api_payloads)")}
+        codec = "payload_codec" if "payload_codec" in columns else "'json'"
         cur = conn.execute(
-            "SELECT payload_json FROM raw_api_payloads WHERE endpoint = 'player_battlelog'"
+            f"SELECT payload_id, {codec}, payload_json FROM raw_api_payloads "
+            "WHERE endpoint = 'player_battlelog' ORDER BY entity_key, fetched_at"
         )
     except sqlite3.DatabaseError:
         return out
-    for (payload,) in cur:
+    reader = PayloadReader(conn)
+    for payload_id, payload_codec, payload in cur:
         try:
-            battles = json.loads(payload)
-        except json.JSONDecodeError, TypeError, ValueError:
+            battles = json.loads(reader.text(payload_id, payload_codec, payload))
+        except json.JSONDecodeError, TypeError, ValueError, LookupError, zlib.error:
             continue
         if not isinstance(battles, list):
             continue
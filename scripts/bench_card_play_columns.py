@@ -0,0 +1,187 @@
+"""Microbenchmark — clan-wide card-play aggregates: SQL GROUP BY vs columnar store.
+
+Builds a scratch database per ``--battles`` step: a year of 1v1 battles across
+50 members, each with eight member and eight opponent card plays (so 16 rows per
+battle), a realistic spread of forms, results and competitive flags. Then times
+the two reads the columnar store serves:
+
+    baselines   every member's all-time W/L over member plays, the
+                player_adjusted_lift baseline
+    nemesis     clan-wide opponent card forms, all time and last 30 days
+
+each two ways:
+
+    sql         the GROUP BY over battle_card_plays
+    columns     storage.card_play_columns, warm
+
+and reports the cold build, the incremental catch-up after one enrichment batch
+(500 battles), and the full consistency check. Both paths return the same rows
+(asserted). Nothing touches the network or the live DB.
+
+Usage:
+    uv run python scripts/bench_card_play_columns.py
+    uv run python scripts/bench_card_play_columns.py --battles 50000,250000 --calls 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+CARDS = list(range(26000000, 26000120))
+TAGS = [f"#BENCH{i}" for i in range(50)]
+NOW = datetime(2026, 7, 15, 12, tzinfo=timezone.utc)
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def add_battles(conn, start: int, count: int, rng: random.Random, *, recent: bool = False) -> None:
+    weights = [1.0 / (1 + i) ** 0.8 for i in range(len(CARDS))]  # a meta, not a uniform draw
+    events, plays = [], []
+    for i in range(start, start + count):
+        ago = rng.uniform(0, 1 if recent else 365)
+        stamp = _stamp(NOW - timedelta(days=ago))
+        tag, outcome = rng.choice(TAGS), rng.choice("WWLLD" if rng.random() < 0.02 else "WL")
+        competitive = rng.choice([0, 1, 1, 1])
+        events.append((f"b{i}", tag, stamp, stamp, outcome))
+        for side in ("member", "opponent"):
+            deck = set()
+            while len(deck) < 8:
+                deck.add(rng.choices(CARDS, weights)[0])
+            for cid in deck:
+                evo = rng.choice([None, 0, 0, 0, 1]) if rng.random() < 0.3 else 0
+                plays.append((f"b{i}", side, cid, evo, tag, stamp, outcome, competitive))
+    conn.executemany(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, outcome) "
+        "VALUES (?, ?, ?, ?, ?)",
+        events,
+    )
+    conn.executemany(
+        "INSERT INTO battle_card_plays (battle_dedup_key, side, card_id, evolution_level, "
+        "player_tag, battle_time, outcome, is_competitive) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        plays,
+    )
+    conn.commit()
+
+
+def _sql_baselines(conn) -> dict:
+    return {
+        r[0]: (r[1], r[2])
+        for r in conn.execute(
+            "SELECT player_tag, SUM(outcome = 'W'), SUM(outcome = 'L') "
+            "FROM battle_card_plays WHERE side = 'member' GROUP BY player_tag"
+        )
+    }
+
+
+def _sql_nemesis(conn, since) -> list[tuple]:
+    return [
+        tuple(r)
+        for r in conn.execute(
+            "SELECT card_id, evolution_level, SUM(outcome = 'W'), SUM(outcome = 'L'), COUNT(*) "
+            "FROM battle_card_plays WHERE side = 'opponent' "
+            + ("AND battle_time >= ? " if since else "")
+            + "GROUP BY card_id, evolution_level ORDER BY card_id, evolution_level",
+            (since,) if since else (),
+        )
+    ]
+
+
+def _time(fn, calls: int) -> tuple[float, object]:
+    wall, result = [], None
+    for _ in range(calls):
+        started = time.perf_counter()
+        result = fn()
+        wall.append(time.perf_counter() - started)
+    return round(sum(wall) / len(wall) * 1000, 3), result
+
+
+def run_size(battles: int, calls: int, seed: int) -> dict:
+    from db import get_connection
+    from db.schema import build_database
+    from storage import card_play_columns as cpc
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    db_path = os.path.join(scratch, "bench.db")
+    build_database(db_path, None)
+    conn = get_connection(db_path)
+    try:
+        rng = random.Random(seed)
+        add_battles(conn, 0, battles, rng)
+        cpc._clear_card_play_columns()
+        started = time.perf_counter()
+        cpc.refresh_card_play_columns(conn=conn)
+        result = {
+            "battles": battles,
+            "plays": battles * 16,
+            "build_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        month = _stamp(NOW - timedelta(days=30))
+        reads = {
+            "baselines": (lambda: _sql_baselines(conn), lambda: cpc.member_baselines(conn)),
+            "nemesis_all": (
+                lambda: _sql_nemesis(conn, None),
+                lambda: cpc.opponent_card_totals(conn),
+            ),
+            "nemesis_30d": (
+                lambda: _sql_nemesis(conn, month),
+                lambda: cpc.opponent_card_totals(conn, since=month),
+            ),
+        }
+        for name, (sql, columns) in reads.items():
+            sql_ms, expected = _time(sql, calls)
+            col_ms, got = _time(columns, calls)
+            assert got == expected, f"{name}: columnar read differs from SQL"
+            result[name] = {"sql_ms": sql_ms, "columns_ms": col_ms}
+        add_battles(conn, battles, 500, rng, recent=True)
+        started = time.perf_counter()
+        cpc.refresh_card_play_columns(conn=conn)
+        result["batch_refresh_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        started = time.perf_counter()
+        report = cpc.check_card_play_columns(conn=conn, repair=False)
+        result["check_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        assert report["checked"] and not report["mismatched_days"], report
+        return result
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--battles", default="50000,250000", help="comma-separated battle counts")
+    ap.add_argument("--calls", type=int, default=5, help="reads timed per mode")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    results = [run_size(int(n), args.calls, args.seed) for n in args.battles.split(",") if n]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'plays':>9} {'read':<12} {'sql ms':>9} {'columns ms':>11}")
+    for r in results:
+        for name in ("baselines", "nemesis_all", "nemesis_30d"):
+            print(
+                f"{r['plays']:>9} {name:<12} {r[name]['sql_ms']:>9.3f} "
+                f"{r[name]['columns_ms']:>11.3f}"
+            )
+        print(
+            f"{r['plays']:>9} cold build {r['build_ms']} ms, 500-battle refresh "
+            f"{r['batch_refresh_ms']} ms, consistency check {r['check_ms']} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,190 @@
+"""Microbenchmark — cr_api transport: bare requests.get vs the pooled session
+vs conditional 304 replay.
+
+Starts a local HTTP stub (a subprocess, so its CPU is not billed to the
+client) that serves the recorded battlelog fixture gzip-encoded with an ETag
+and answers If-None-Match revalidations with 304. The client drives
+cr_api._request_json against it with raw-payload persistence going to a
+scratch DB. Those writes happen behind the call (storage.payload_writer), so
+they show up in the CPU column rather than the latency ones.
+
+Three modes, same endpoint and body:
+    bare      requests.get per call (a fresh connection every time) and a full
+              store — the pre-session transport
+    pooled    the keep-alive session, every response a 200 and a full store
+    304       the keep-alive session with validators: unchanged bodies are
+              replayed locally and only receipted
+
+The stub is plain HTTP on loopback, so the pooled-vs-bare gap here is TCP
+setup only; against api.clashroyale.com each fresh connection also pays a TLS
+handshake, which this understates.
+
+Usage:
+    uv run python scripts/bench_cr_api_session.py
+    uv run python scripts/bench_cr_api_session.py --calls 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+
+def serve(port: int) -> None:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from tests.conftest import load_cr_fixture
+
+    body = json.dumps(load_cr_fixture("battlelog")).encode()
+    gz = gzip.compress(body)
+    etag = '"battlelog-v1"'
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; with Nagle on, keep-alive
+        # connections stall ~40 ms on the client's delayed ACK.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):  # noqa: N802 — http.server's naming
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            gzipped = "gzip" in (self.headers.get("Accept-Encoding") or "")
+            out = gz if gzipped else body
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", etag)
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+        def log_message(self, *args):
+            return
+
+    ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+
+
+def _free_port() -> int:
+    import socket
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for(port: int) -> None:
+    import socket
+
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise SystemExit("stub server did not start")
+
+
+class _BareSession:
+    """The pre-session transport: module-level requests.get, no pooling."""
+
+    def get(self, url, **kwargs):
+        import requests
+
+        return requests.get(url, **kwargs)
+
+
+def run_mode(cr_api, mode: str, calls: int) -> dict:
+    from storage import payload_writer
+
+    original = cr_api._SESSION
+    if mode == "bare":
+        cr_api._SESSION = _BareSession()
+    try:
+        cr_api._validators_clear()
+        wall = []
+        cpu_started = time.process_time()
+        for _ in range(calls):
+            if mode != "304":
+                cr_api._validators_clear()
+            started = time.perf_counter()
+            payload = cr_api._request_json(
+                "/players/%23BENCH/battlelog",
+                endpoint_name="player_battlelog",
+                entity_key="BENCH",
+            )
+            wall.append(time.perf_counter() - started)
+            assert payload
+        # Writes land behind the call; drain them so their CPU is billed here.
+        payload_writer.flush()
+        cpu = time.process_time() - cpu_started
+    finally:
+        cr_api._SESSION = original
+    wall.sort()
+    return {
+        "mode": mode,
+        "calls": calls,
+        "mean_ms": round(sum(wall) / calls * 1000, 3),
+        "p50_ms": round(wall[calls // 2] * 1000, 3),
+        "p95_ms": round(wall[int(calls * 0.95) - 1] * 1000, 3),
+        "cpu_ms_per_call": round(cpu / calls * 1000, 3),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--calls", type=int, default=200)
+    ap.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+    if args.serve:
+        serve(args.serve)
+        return 0
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    db_path = os.path.join(scratch, "bench.db")
+    os.environ["ELIXIR_DB_PATH"] = db_path
+    from db.schema import build_database
+
+    build_database(db_path, None)
+
+    port = _free_port()
+    server = subprocess.Popen([sys.executable, __file__, "--serve", str(port)])
+    try:
+        _wait_for(port)
+        import cr_api
+
+        cr_api.API_BASE = f"http://127.0.0.1:{port}/v1"
+        run_mode(cr_api, "pooled", 5)  # warm imports, schema and the pool
+        results = [run_mode(cr_api, mode, args.calls) for mode in ("bare", "pooled", "304")]
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'mode':<8} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'cpu ms/call':>12}")
+    for r in results:
+        print(
+            f"{r['mode']:<8} {r['mean_ms']:>9.3f} {r['p50_ms']:>9.3f} "
+            f"{r['p95_ms']:>9.3f} {r['cpu_ms_per_call']:>12.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
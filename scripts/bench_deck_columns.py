@@ -0,0 +1,285 @@
+"""Microbenchmark — clan card reports: row-by-row decode vs the columnar deck store.
+
+Builds a scratch database per ``--days`` step: that many days of battle_events
+retention across 50 current members (plus a handful of former ones), each
+battle carrying the member's deck as the API records it, drawn from a small
+rotation per member the way real decks repeat. Collections and card-unlock
+events are seeded alongside. Then times each report two ways:
+
+    recently_played   get_clan_recently_played_cards (14 days)
+    overlooked        get_clan_overlooked_cards (collections + 14 days of decks)
+
+    before            the original per-row json.loads / per-member collection loads
+    after             storage.cards as it is now, store warm
+
+and, for reference, the two reports that were already single SQL GROUP BYs and
+stay on SQLite (game_mode_summary over 30 days, _clan_trending_cards over 7).
+Also reports the store's cold build and the consistency check. Both paths return
+the same rows (asserted). Nothing touches the network or the live DB.
+
+Usage:
+    uv run python scripts/bench_deck_columns.py
+    uv run python scripts/bench_deck_columns.py --days 90,730 --per-day 750 --calls 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+CARDS = [(26000000 + i, f"Card {i:03d}", (14, 12, 9, 6)[i % 4]) for i in range(120)]
+MEMBERS = [f"#BENCH{i}" for i in range(50)]
+FORMER = [f"#GONE{i}" for i in range(10)]
+MODES = [("ladder", 72000001, "Ladder"), ("ranked", 72000464, "Ranked1v1"), ("war", 72000267, "CW")]
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def seed(conn, days: int, per_day: int, rng: random.Random) -> int:
+    now = datetime.now(timezone.utc)
+    weights = [1.0 / (1 + i) ** 0.8 for i in range(len(CARDS))]  # a meta, not a uniform draw
+    conn.execute(
+        "INSERT OR IGNORE INTO clans (clan_tag, name, first_seen_at, last_seen_at, is_home) "
+        "VALUES ('#J2RGCRVG', 'BENCH', '2024-01-01', '2026-07-30', 1)"
+    )
+    for card_id, name, max_level in CARDS:
+        conn.execute(
+            "INSERT INTO card_catalog (card_id, name, max_level, rarity, card_type, synced_at) "
+            "VALUES (?, ?, ?, 'common', 'troop', '2026-07-01')",
+            (card_id, name, max_level),
+        )
+    rotations = {}
+    for tag in MEMBERS + FORMER:
+        conn.execute(
+            "INSERT INTO players (player_tag, current_name, first_seen_at, last_seen_at) "
+            "VALUES (?, ?, '2024-01-01', '2026-07-30')",
+            (tag, tag[1:]),
+        )
+        conn.execute(
+            "INSERT INTO clan_memberships (player_tag, joined_at, left_at, join_source) "
+            "VALUES (?, '2024-01-01', ?, 'bench')",
+            (tag, "2026-01-01" if tag in FORMER else None),
+        )
+        conn.executemany(
+            "INSERT INTO player_card_collection (player_tag, card_id, level, observed_at) "
+            "VALUES (?, ?, ?, '2026-07-30')",
+            [(tag, cid, rng.randint(max(1, ml - 5), ml)) for cid, _n, ml in CARDS],
+        )
+        decks = []
+        for _ in range(4):
+            picks = set()
+            while len(picks) < 8:
+                picks.add(rng.choices(range(len(CARDS)), weights)[0])
+            decks.append(sorted(picks))
+        rotations[tag] = decks
+    events, unlocks = [], []
+    total = days * per_day
+    for i in range(total):
+        battle_time = now - timedelta(seconds=rng.uniform(0, days * 86400))
+        tag = rng.choice(MEMBERS + FORMER) if rng.random() < 0.1 else rng.choice(MEMBERS)
+        deck = [
+            {
+                "name": CARDS[ix][1],
+                "id": CARDS[ix][0],
+                "level": rng.randint(CARDS[ix][2] - 3, CARDS[ix][2]),
+                "maxLevel": CARDS[ix][2],
+                "elixirCost": 1 + ix % 8,
+            }
+            for ix in rng.choice(rotations[tag])
+        ]
+        group, mode_id, mode_name = rng.choice(MODES)
+        stamp = _stamp(battle_time)
+        events.append(
+            (
+                f"b{i}",
+                tag,
+                stamp,
+                stamp,
+                json.dumps(deck),
+                rng.choice("WL"),
+                group,
+                mode_id,
+                mode_name,
+                rng.randint(-30, 30),
+            )
+        )
+        if len(events) >= 20000:
+            _insert(conn, events)
+    _insert(conn, events)
+    for i in range(days * 2):
+        observed = _stamp(now - timedelta(seconds=rng.uniform(0, days * 86400)))
+        unlocks.append(
+            (
+                rng.choice(MEMBERS),
+                observed,
+                json.dumps({"card_name": rng.choice(CARDS)[1]}),
+                f"unlock{i}",
+                observed,
+            )
+        )
+    conn.executemany(
+        "INSERT INTO player_events (player_tag, event_type, observed_at, payload_json, "
+        "dedup_key, created_at) VALUES (?, 'card_unlocked', ?, ?, ?, ?)",
+        unlocks,
+    )
+    conn.commit()
+    return total
+
+
+def _insert(conn, events: list) -> None:
+    conn.executemany(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, deck_json, "
+        "outcome, mode_group, game_mode_id, game_mode_name, trophy_change) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        events,
+    )
+    events.clear()
+
+
+def _cutoff(days: int) -> str:
+    return _stamp(datetime.now(timezone.utc) - timedelta(days=days))
+
+
+def _before_deck_counts(conn, cutoff: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for row in conn.execute(
+        "SELECT bf.deck_json FROM battle_events bf WHERE bf.battle_time >= ? AND EXISTS ("
+        "  SELECT 1 FROM clan_memberships cm WHERE cm.player_tag = bf.player_tag "
+        "AND cm.left_at IS NULL)",
+        (cutoff,),
+    ):
+        for card in json.loads(row["deck_json"] or "[]"):
+            if isinstance(card, dict) and card.get("name"):
+                counts[card["name"]] = counts.get(card["name"], 0) + 1
+    return counts
+
+
+def _before_recently_played(conn) -> list[dict]:
+    counts = _before_deck_counts(conn, _cutoff(14))
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0].lower()))
+    return [{"card_name": name, "battles": count} for name, count in ranked[:20]]
+
+
+def _before_overlooked(conn) -> list[dict]:
+    from storage.cards import _card_level, _load_collection_cards
+
+    owned: dict[str, int] = {}
+    for r in conn.execute(
+        "SELECT m.player_tag FROM players m WHERE EXISTS (SELECT 1 FROM clan_memberships cm "
+        "WHERE cm.player_tag = m.player_tag AND cm.left_at IS NULL)"
+    ).fetchall():
+        for raw in _load_collection_cards(conn, r[0])[1]:
+            level = _card_level(raw)
+            if raw.get("name") and level is not None and level >= 14:
+                owned[raw["name"]] = owned.get(raw["name"], 0) + 1
+    played = set(_before_deck_counts(conn, _cutoff(14)))
+    overlooked = [(n, c) for n, c in owned.items() if c >= 3 and n not in played]
+    overlooked.sort(key=lambda item: (-item[1], item[0].lower()))
+    return [{"card_name": n, "owners_at_level": c} for n, c in overlooked[:10]]
+
+
+def _time(fn, calls: int) -> tuple[float, object]:
+    wall, result = [], None
+    for _ in range(calls):
+        started = time.perf_counter()
+        result = fn()
+        wall.append(time.perf_counter() - started)
+    return round(sum(wall) / len(wall) * 1000, 3), result
+
+
+def run_size(days: int, per_day: int, calls: int, seed_: int) -> dict:
+    from db import get_connection
+    from db.schema import build_database
+    from runtime.member_report import _clan_trending_cards
+    from storage import cards, deck_columns
+    from storage.player import get_clan_game_mode_summary
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    db_path = os.path.join(scratch, "bench.db")
+    build_database(db_path, None)
+    conn = get_connection(db_path)
+    try:
+        battles = seed(conn, days, per_day, random.Random(seed_))
+        deck_columns._clear_deck_columns()
+        started = time.perf_counter()
+        deck_columns.member_deck_card_counts(conn, since=_cutoff(14), player_tags=MEMBERS)
+        result = {
+            "days": days,
+            "battles": battles,
+            "build_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        reads = {
+            "recently_played": (
+                lambda: _before_recently_played(conn),
+                lambda: cards.get_clan_recently_played_cards(days=14, limit=20, conn=conn),
+            ),
+            "overlooked": (
+                lambda: _before_overlooked(conn),
+                lambda: cards.get_clan_overlooked_cards(
+                    min_owners=3, min_level=14, battle_days=14, limit=10, conn=conn
+                ),
+            ),
+        }
+        for name, (before, after) in reads.items():
+            before_ms, expected = _time(before, calls)
+            after_ms, got = _time(after, calls)
+            assert got == expected, f"{name}: the new read differs from the old one"
+            result[name] = {"before_ms": before_ms, "after_ms": after_ms}
+        result["game_mode_summary_sql_ms"] = _time(
+            lambda: get_clan_game_mode_summary(days=30, conn=conn), calls
+        )[0]
+        result["trending_cards_sql_ms"] = _time(
+            lambda: _clan_trending_cards(conn, _cutoff(7)), calls
+        )[0]
+        started = time.perf_counter()
+        report = deck_columns.check_deck_columns(conn=conn, repair=False)
+        result["check_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        assert report["checked"] and not report["mismatched_days"], report
+        return result
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--days", default="90,730", help="comma-separated retention windows")
+    ap.add_argument("--per-day", type=int, default=750, help="member battles per day")
+    ap.add_argument("--calls", type=int, default=3, help="reads timed per mode")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    results = [
+        run_size(int(n), args.per_day, args.calls, args.seed) for n in args.days.split(",") if n
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'days':>5} {'battles':>8} {'report':<16} {'before ms':>10} {'after ms':>9}")
+    for r in results:
+        for name in ("recently_played", "overlooked"):
+            print(
+                f"{r['days']:>5} {r['battles']:>8} {name:<16} {r[name]['before_ms']:>10.3f} "
+                f"{r[name]['after_ms']:>9.3f}"
+            )
+        print(
+            f"{r['days']:>5} {r['battles']:>8} cold build {r['build_ms']} ms, consistency "
+            f"check {r['check_ms']} ms; on SQL: game_mode_summary "
+            f"{r['game_mode_summary_sql_ms']} ms, trending_cards {r['trending_cards_sql_ms']} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,251 @@
+"""Microbenchmark — deck recommendation latency as the profiled corpus grows.
+
+Builds a scratch database per corpus size: a 110-card catalog, ``--sizes``
+profiled decks (eight cards each, a few Evo/Hero forms, most facts complete),
+a battle history fielding a slice of those decks across 50 members, and one
+member whose collection covers ~90% of the catalog. Then times three views of
+``get_deck_recommendations`` for that member:
+
+    discover   best deck per family the member has not played
+    war_set    four card-disjoint decks
+    anchored   best decks around one card
+
+each two ways:
+
+    scan       the old path: every call scans and JSON-decodes deck_profile,
+               and groups all of battle_enrichment for fielded_by
+    indexed    storage.deck_index bitsets (warm), fielded_by read for the
+               described decks only
+
+Both modes return the same envelopes (asserted). Nothing touches the network
+or the live DB.
+
+Usage:
+    uv run python scripts/bench_deck_index.py
+    uv run python scripts/bench_deck_index.py --sizes 10000,100000 --calls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+CARDS = list(range(26000000, 26000110))
+MEMBER = "#BENCH0"
+MEMBERS = 50
+FAMILIES = ("beatdown", "cycle", "control", "bait", "siege", "bridge_spam")
+NOW = "2026-07-15T12:00:00Z"
+
+
+def build_corpus(conn, size: int, rng: random.Random) -> None:
+    conn.executemany(
+        "INSERT INTO card_catalog (card_id, name, card_type, rarity, elixir_cost, max_level, "
+        "synced_at) VALUES (?, ?, 'troop', ?, ?, ?, ?)",
+        [
+            (cid, f"Card {i}", r, rng.randint(1, 7), m, NOW)
+            for i, cid in enumerate(CARDS)
+            for r, m in [rng.choice([("common", 16), ("rare", 14), ("epic", 11), ("legendary", 8)])]
+        ],
+    )
+    decks = []
+    for i in range(size):
+        cards = [[cid, 1 if rng.random() < 0.08 else 0] for cid in rng.sample(CARDS, 8)]
+        decks.append(
+            (
+                f"d{i:07d}",
+                rng.choice(FAMILIES),
+                f"arch{rng.randrange(60)}",
+                round(rng.uniform(2.6, 4.6), 1),
+                json.dumps(cards),
+                rng.choice([1, 2, 2, 3]),
+                rng.choice([0, 1]),
+                rng.choice([0, 1, 1, 1]),
+                1 if rng.random() < 0.95 else None,
+                NOW,
+            )
+        )
+    conn.executemany(
+        "INSERT INTO deck_profile (deck_hash, family, archetype, avg_elixir, cards_json, "
+        "air_answer_count, has_big_spell, has_small_spell, facts_complete, scored_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        decks,
+    )
+    tags = [MEMBER] + [f"#BENCH{i}" for i in range(1, MEMBERS)]
+    conn.executemany(
+        "INSERT INTO players (player_tag, first_seen_at, last_seen_at) VALUES (?, ?, ?)",
+        [(t, NOW, NOW) for t in tags],
+    )
+    conn.executemany(
+        "INSERT INTO player_card_collection (player_tag, card_id, level, evolution_level, "
+        "observed_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            (MEMBER, cid, max(1, m - rng.randint(0, 3)), rng.choice([0, 0, 1]), NOW)
+            for cid, m in conn.execute("SELECT card_id, max_level FROM card_catalog")
+            if rng.random() < 0.9
+        ],
+    )
+    # Battle history fields a small slice of the corpus, as the clan does.
+    fielded = [d[0] for d in rng.sample(decks, max(1, size // 50))]
+    battles = size // 2
+    conn.executemany(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, outcome) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(f"b{i}", rng.choice(tags), NOW, NOW, rng.choice("WL")) for i in range(battles)],
+    )
+    conn.executemany(
+        "INSERT INTO battle_enrichment (battle_dedup_key, player_tag, battle_time, "
+        "our_deck_hash, their_deck_hash) VALUES (?, ?, ?, ?, ?)",
+        [
+            (f"b{i}", tag, NOW, rng.choice(fielded), rng.choice(decks)[0])
+            for i, (tag,) in enumerate(conn.execute("SELECT player_tag FROM battle_events"))
+        ],
+    )
+    conn.commit()
+
+
+def _scan_candidates(conn, cat, own, forms, *, require_structure=True, anchor=None):
+    """The pre-index corpus scan, reproduced."""
+    from capabilities import deck_intel
+    from engine import card_roles
+
+    champions = deck_intel._champion_ids(conn)
+    out = []
+    for r in conn.execute(
+        "SELECT deck_hash, archetype, family, avg_elixir, cards_json, air_answer_count, "
+        "has_big_spell, has_small_spell FROM deck_profile WHERE facts_complete = 1"
+    ):
+        pairs = [(p[0], p[1] or 0) for p in json.loads(r["cards_json"])]
+        if len(pairs) != 8:
+            continue
+        if any(cid not in own or cid not in cat for cid, _ in pairs):
+            continue
+        if any(f and forms.get(cid, 0) < f for cid, f in pairs):
+            continue
+        if require_structure and (
+            r["air_answer_count"] < card_roles.min_air_answers(r["avg_elixir"])
+            or not r["has_small_spell"]
+        ):
+            continue
+        if sum(1 for cid, f in pairs if f or cid in champions) > card_roles.MAX_SPECIAL_SLOTS:
+            continue
+        if anchor is not None and anchor not in {cid for cid, _ in pairs}:
+            continue
+        gaps = [cat[cid]["max_level"] - own[cid] for cid, _ in pairs]
+        out.append(
+            {
+                "deck_hash": r["deck_hash"],
+                "archetype": r["archetype"],
+                "family": r["family"],
+                "avg_elixir": r["avg_elixir"],
+                "air_answers": r["air_answer_count"],
+                "has_big_spell": bool(r["has_big_spell"]),
+                "has_small_spell": bool(r["has_small_spell"]),
+                "cards": pairs,
+                "card_ids": frozenset(cid for cid, _ in pairs),
+                "levels_from_max": round(sum(gaps) / 8, 2),
+                "worst_card_from_max": max(gaps),
+            }
+        )
+    out.sort(key=lambda d: (d["levels_from_max"], d["worst_card_from_max"]))
+    return out
+
+
+def _scan_fielded_by(conn, deck_hashes):
+    """The pre-index fielded_by: every deck the clan fields, grouped per call."""
+    return {
+        r["h"]: r["m"]
+        for r in conn.execute(
+            "SELECT e.our_deck_hash h, COUNT(DISTINCT b.player_tag) m "
+            "FROM battle_enrichment e JOIN battle_events b ON b.dedup_key = e.battle_dedup_key "
+            "WHERE e.our_deck_hash IS NOT NULL GROUP BY 1"
+        )
+    }
+
+
+def _time(fn, calls: int) -> tuple[dict, object]:
+    wall, result = [], None
+    for _ in range(calls):
+        started = time.perf_counter()
+        result = fn()
+        wall.append(time.perf_counter() - started)
+    ordered = sorted(wall)
+    return {
+        "mean_ms": round(sum(wall) / len(wall) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }, result
+
+
+def run_size(size: int, calls: int, seed: int) -> dict:
+    from capabilities import deck_intel
+    from db import get_connection
+    from db.schema import build_database
+    from storage import deck_index
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    db_path = os.path.join(scratch, "bench.db")
+    build_database(db_path, None)
+    conn = get_connection(db_path)
+    try:
+        rng = random.Random(seed)
+        build_corpus(conn, size, rng)
+        anchor = deck_intel._catalog(conn)[next(iter(deck_intel._collection(conn, MEMBER)))]["name"]
+        views = {
+            "discover": lambda: deck_intel._discover_view(conn, MEMBER, 6),
+            "war_set": lambda: deck_intel._war_set_view(conn, MEMBER),
+            "anchored": lambda: deck_intel._anchored_view(conn, MEMBER, anchor, 5),
+        }
+        started = time.perf_counter()
+        deck_index._clear_deck_index()
+        views["discover"]()
+        result = {"decks": size, "index_build_ms": round((time.perf_counter() - started) * 1000, 1)}
+        indexed_fns = (deck_intel._candidates, deck_intel._fielded_by)
+        for name, fn in views.items():
+            deck_intel._candidates, deck_intel._fielded_by = _scan_candidates, _scan_fielded_by
+            try:
+                scan, expected = _time(fn, calls)
+            finally:
+                deck_intel._candidates, deck_intel._fielded_by = indexed_fns
+            fast, got = _time(fn, calls)
+            assert got == expected, f"{name}: indexed view differs from the scan"
+            result[name] = {"scan": scan, "indexed": fast}
+        return result
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", default="10000,100000", help="comma-separated profiled deck counts")
+    ap.add_argument("--calls", type=int, default=10, help="view calls timed per mode")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    results = [run_size(int(size), args.calls, args.seed) for size in args.sizes.split(",") if size]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'decks':>7} {'view':<9} {'mode':<8} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}")
+    for r in results:
+        for name in ("discover", "war_set", "anchored"):
+            for mode in ("scan", "indexed"):
+                t = r[name][mode]
+                print(
+                    f"{r['decks']:>7} {name:<9} {mode:<8} {t['mean_ms']:>9.3f} "
+                    f"{t['p50_ms']:>9.3f} {t['max_ms']:>9.3f}"
+                )
+        print(f"{r['decks']:>7} index build (cold, first call): {r['index_build_ms']} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
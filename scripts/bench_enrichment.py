@@ -0,0 +1,310 @@
+"""Microbenchmark — Stage-A battle enrichment throughput: anti-join batches vs the cursor.
+
+Builds a scratch database of ``--battles`` 1v1 battles across 50 members over a
+year (both decks, tower HP, leaked elixir, the usual spread of modes), none of
+them enriched yet, and copies it. Then enriches it two ways:
+
+    before   the pre-cursor writer: every batch re-finds its work with a LEFT JOIN
+             anti-join over all of battle_events sorted by observed_at, and writes
+             two executemany calls plus one INSERT per battle. Timed over the
+             first ``--sample`` battles (its per-batch cost does not fall as the
+             backlog drains, so the rate holds for the rest).
+    after    storage.battle_intel as it is now: a rowid cursor, chunked and
+             committed every WRITE_CHUNK battles, one executemany per table per
+             chunk. Timed over the whole table.
+
+and reports battles/sec for each. On the enriched copy it then times the two
+shapes of a 15-minute run: finding and enriching 500 new battles, and a run with
+nothing to do (old: the anti-join alone). Rows written by the two paths for the
+same battles are identical (asserted). Nothing touches the network or the live DB.
+
+Usage:
+    uv run python scripts/bench_enrichment.py
+    uv run python scripts/bench_enrichment.py --battles 500000 --sample 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+CARDS = [(26000000 + i, (14, 12, 9, 6)[i % 4]) for i in range(120)]
+TAGS = [f"#BENCH{i}" for i in range(50)]
+MODES = [("ladder", 1, 0), ("ranked", 1, 1), ("war", 1, 0), ("friendly", 0, 0)]
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+_OLD_UNENRICHED_SQL = """
+    SELECT b.dedup_key, b.player_tag, b.battle_time, b.outcome, b.mode_group,
+           b.is_competitive, b.is_ranked, b.deck_json, b.opponent_deck_json,
+           b.elixir_leaked, b.opponent_elixir_leaked,
+           b.king_tower_hp, b.princess_towers_hp_json,
+           b.opponent_king_tower_hp, b.opponent_princess_towers_hp_json
+      FROM battle_events b
+      LEFT JOIN battle_enrichment e ON e.battle_dedup_key = b.dedup_key
+     WHERE e.battle_dedup_key IS NULL
+       AND b.teammate_tag IS NULL AND b.rounds_json IS NULL
+       AND b.deck_json IS NOT NULL
+       AND json_array_length(b.deck_json) = 8
+     ORDER BY b.observed_at DESC
+     LIMIT ?
+"""
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _deck(rng: random.Random, weights: list[float]) -> str:
+    picks = set()
+    while len(picks) < 8:
+        picks.add(rng.choices(range(len(CARDS)), weights)[0])
+    return json.dumps(
+        [
+            {"id": CARDS[ix][0], "level": rng.randint(CARDS[ix][1] - 3, CARDS[ix][1])}
+            | ({"evolution_level": 1} if rng.random() < 0.1 else {})
+            for ix in picks
+        ]
+    )
+
+
+def add_battles(conn, start: int, count: int, rng: random.Random, *, days: float = 365) -> None:
+    weights = [1.0 / (1 + i) ** 0.8 for i in range(len(CARDS))]  # a meta, not a uniform draw
+    events = []
+    # Mirrored as they are played, so rowid order is (nearly) time order.
+    ages = sorted((rng.uniform(0, days * 86400) for _ in range(count)), reverse=True)
+    for i, age in zip(range(start, start + count), ages, strict=True):
+        stamp = _stamp(NOW - timedelta(seconds=age))
+        group, competitive, ranked = rng.choice(MODES)
+        events.append(
+            (
+                f"b{i}",
+                rng.choice(TAGS),
+                stamp,
+                stamp,
+                rng.choice("WL"),
+                group,
+                competitive,
+                ranked,
+                _deck(rng, weights),
+                _deck(rng, weights) if rng.random() < 0.97 else None,
+                rng.randint(0, 8),
+                rng.randint(0, 8),
+                rng.choice([0, 0, 2400, 4800]),
+                json.dumps([rng.randint(0, 3000), rng.randint(0, 3000)]),
+                rng.choice([0, 0, 2400, 4800]),
+                json.dumps([rng.randint(0, 3000), rng.randint(0, 3000)]),
+            )
+        )
+        if len(events) >= 20000 or i == start + count - 1:
+            conn.executemany(
+                "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, "
+                "outcome, mode_group, is_competitive, is_ranked, deck_json, opponent_deck_json, "
+                "elixir_leaked, opponent_elixir_leaked, king_tower_hp, princess_towers_hp_json, "
+                "opponent_king_tower_hp, opponent_princess_towers_hp_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                events,
+            )
+            events.clear()
+    conn.commit()
+
+
+def seed(conn, battles: int, rng: random.Random) -> None:
+    conn.executemany(
+        "INSERT INTO card_catalog (card_id, name, max_level, card_type, synced_at) "
+        "VALUES (?, ?, ?, 'troop', '2026-07-01')",
+        [(cid, f"Card {cid}", max_level) for cid, max_level in CARDS],
+    )
+    add_battles(conn, 0, battles, rng)
+
+
+def before_batch(conn, limit: int) -> int:
+    """The pre-cursor enrich_battles body, for comparison."""
+    from engine.battle_metrics import closeness_band, discipline_delta, hp_margin, level_gap
+    from engine.deck_hash import deck_hash
+    from storage import card_usage
+    from storage.battle_intel import _CP_SQL, _card_max_levels, _card_play_rows, _parse_deck
+
+    rows = conn.execute(_OLD_UNENRICHED_SQL, (limit,)).fetchall()
+    max_levels = _card_max_levels(conn)
+    played_at = set()
+    for r in rows:
+        member_cards = _parse_deck(r["deck_json"])
+        opp_cards = _parse_deck(r["opponent_deck_json"])
+        their_cards = opp_cards if len(opp_cards) == 8 else None
+        before = conn.total_changes
+        conn.executemany(_CP_SQL, _card_play_rows(r, "member", member_cards))
+        if their_cards:
+            conn.executemany(_CP_SQL, _card_play_rows(r, "opponent", their_cards))
+        if conn.total_changes > before:
+            played_at.add(r["battle_time"])
+        margin = hp_margin(
+            r["king_tower_hp"],
+            r["princess_towers_hp_json"],
+            r["opponent_king_tower_hp"],
+            r["opponent_princess_towers_hp_json"],
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO battle_enrichment "
+            "(battle_dedup_key, player_tag, battle_time, hp_margin, closeness, "
+            " discipline_delta, level_gap, our_deck_hash, their_deck_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                r["dedup_key"],
+                r["player_tag"],
+                r["battle_time"],
+                margin,
+                closeness_band(margin),
+                discipline_delta(r["opponent_elixir_leaked"], r["elixir_leaked"]),
+                level_gap(
+                    member_cards, their_cards, is_ranked=bool(r["is_ranked"]), max_levels=max_levels
+                ),
+                deck_hash(member_cards),
+                deck_hash(their_cards) if their_cards else None,
+            ),
+        )
+    card_usage.fold_battles(conn, played_at)
+    conn.commit()
+    return len(rows)
+
+
+def _same_rows(after_path: str, before_conn) -> int:
+    """Every battle the old path enriched has the same rows in the new path's copy."""
+    before_conn.execute("ATTACH DATABASE ? AS other", (after_path,))
+    try:
+        diffs = 0
+        for table, key in (
+            ("battle_enrichment", "battle_dedup_key"),
+            ("battle_card_plays", "battle_dedup_key"),
+        ):
+            diffs += before_conn.execute(
+                f"SELECT COUNT(*) FROM (SELECT * FROM main.{table} EXCEPT "
+                f"SELECT * FROM other.{table} WHERE {key} IN "
+                f"(SELECT {key} FROM main.{table}))"
+            ).fetchone()[0]
+        return diffs
+    finally:
+        before_conn.execute("DETACH DATABASE other")
+
+
+def run(battles: int, sample: int, seed_: int) -> dict:
+    from db import get_connection
+    from db.schema import build_database
+    from storage import battle_intel
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    after_path = os.path.join(scratch, "after.db")
+    before_path = os.path.join(scratch, "before.db")
+    build_database(after_path, None)
+    rng = random.Random(seed_)
+    conn = get_connection(after_path)
+    try:
+        started = time.perf_counter()
+        seed(conn, battles, rng)
+        result = {"battles": battles, "seed_s": round(time.perf_counter() - started, 1)}
+    finally:
+        conn.close()
+    shutil.copyfile(after_path, before_path)
+
+    conn = get_connection(before_path)
+    try:
+        done, started = 0, time.perf_counter()
+        while done < sample:
+            n = before_batch(conn, min(2000, sample - done))
+            if not n:
+                break
+            done += n
+        seconds = time.perf_counter() - started
+        result["before"] = {"battles": done, "seconds": round(seconds, 2)}
+        result["before"]["per_sec"] = round(done / seconds)
+    finally:
+        conn.close()
+
+    conn = get_connection(after_path)
+    try:
+        started = time.perf_counter()
+        enriched = 0
+        while True:
+            got = battle_intel._enrich(conn, 20000, since="", checkpoint=conn.commit)
+            enriched += got["enriched"]
+            if got["enriched"] < 20000:
+                break
+        seconds = time.perf_counter() - started
+        result["after"] = {"battles": enriched, "seconds": round(seconds, 2)}
+        result["after"]["per_sec"] = round(enriched / seconds)
+
+        add_battles(conn, battles, 500, rng, days=0.01)
+        started = time.perf_counter()
+        conn.execute(_OLD_UNENRICHED_SQL, (500,)).fetchall()
+        old_find = time.perf_counter() - started
+        started = time.perf_counter()
+        tick = battle_intel.enrich_battles(500, conn=conn)
+        conn.commit()
+        new_tick = time.perf_counter() - started
+        assert tick["enriched"] == 500, tick
+        started = time.perf_counter()
+        assert not conn.execute(_OLD_UNENRICHED_SQL, (500,)).fetchall()
+        old_idle = time.perf_counter() - started
+        started = time.perf_counter()
+        assert battle_intel.enrich_battles(500, conn=conn)["enriched"] == 0
+        new_idle = time.perf_counter() - started
+        result["tick_500"] = {
+            "before_find_ms": round(old_find * 1000, 1),
+            "after_total_ms": round(new_tick * 1000, 1),
+        }
+        result["tick_idle"] = {
+            "before_ms": round(old_idle * 1000, 1),
+            "after_ms": round(new_idle * 1000, 1),
+        }
+    finally:
+        conn.close()
+
+    conn = get_connection(before_path)
+    try:
+        diffs = _same_rows(after_path, conn)
+        assert diffs == 0, f"{diffs} rows differ between the two paths"
+    finally:
+        conn.close()
+    shutil.rmtree(scratch, ignore_errors=True)
+    return result
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--battles", type=int, default=500000, help="battles in the scratch DB")
+    ap.add_argument("--sample", type=int, default=20000, help="battles the old path is timed on")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    r = run(args.battles, args.sample, args.seed)
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return 0
+    print(f"{'path':<8} {'battles':>8} {'seconds':>8} {'battles/s':>10}")
+    for path in ("before", "after"):
+        print(
+            f"{path:<8} {r[path]['battles']:>8} {r[path]['seconds']:>8.2f} {r[path]['per_sec']:>10}"
+        )
+    print(
+        f"15-minute run, 500 new: before {r['tick_500']['before_find_ms']} ms to find them, "
+        f"after {r['tick_500']['after_total_ms']} ms to find and enrich them"
+    )
+    print(
+        f"15-minute run, nothing new: before {r['tick_idle']['before_ms']} ms, "
+        f"after {r['tick_idle']['after_ms']} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,294 @@
+"""Benchmark — the Arena Dispatch send: serial walk vs the report pipeline.
+
+Builds a scratch database with a ``--members`` fixture roster (50 by default),
+each with a week of battles carrying decks, plus clan-wide card unlocks, the
+card catalog and the prior week for the trend line. The model is a stub that
+sleeps ``--llm-ms`` per report (roughly one real member_report generation) and
+returns a fixed narrative; sends are captured in memory. Then runs the whole
+send two ways:
+
+    before   the original job: per member, build (clan-wide reads included),
+             generate, render, send, record — one after another
+    after    runtime.member_report_pipeline.run_member_reports with
+             ``--workers`` concurrent generations
+
+Also times the shared clan context on its own and a member build with and
+without it. Both runs mail the same recipients in the same order with the same
+subjects (asserted). Nothing touches the network, the LLM or the live DB.
+
+Usage:
+    uv run python scripts/bench_member_report.py
+    uv run python scripts/bench_member_report.py --members 50 --llm-ms 4000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+CARDS = [(26000000 + i, f"Card {i:03d}", (14, 12, 9, 6)[i % 4]) for i in range(120)]
+MODES = [("ladder", 72000001, "Ladder"), ("ranked", 72000464, "Ranked1v1"), ("war", 72000267, "CW")]
+NARRATIVE = {
+    "overview": "A steady week.",
+    "standouts": "One big duel.",
+    "meta": "Nothing new.",
+    "closer": "See you next week. — E",
+}
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _deck(rng: random.Random, picks: list[int]) -> str:
+    return json.dumps(
+        [
+            {
+                "name": CARDS[ix][1],
+                "id": CARDS[ix][0],
+                "level": rng.randint(CARDS[ix][2] - 3, CARDS[ix][2]),
+                "maxLevel": CARDS[ix][2],
+                "elixirCost": 1 + ix % 8,
+            }
+            for ix in picks
+        ]
+    )
+
+
+def seed(conn, members: list[str], per_day: int, rng: random.Random) -> int:
+    now = datetime.now(timezone.utc)
+    conn.execute(
+        "INSERT OR IGNORE INTO clans (clan_tag, name, first_seen_at, last_seen_at, is_home) "
+        "VALUES ('#J2RGCRVG', 'BENCH', '2024-01-01', '2026-07-30', 1)"
+    )
+    for card_id, name, max_level in CARDS:
+        conn.execute(
+            "INSERT INTO card_catalog (card_id, name, max_level, rarity, card_type, synced_at) "
+            "VALUES (?, ?, ?, 'common', 'troop', '2026-07-01')",
+            (card_id, name, max_level),
+        )
+    battles, unlocks = [], []
+    for m, tag in enumerate(members):
+        conn.execute(
+            "INSERT INTO players (player_tag, current_name, first_seen_at, last_seen_at) "
+            "VALUES (?, ?, '2024-01-01', '2026-07-30')",
+            (tag, tag[1:]),
+        )
+        conn.execute(
+            "INSERT INTO clan_memberships (player_tag, joined_at, left_at, join_source) "
+            "VALUES (?, '2024-01-01', NULL, 'bench')",
+            (tag,),
+        )
+        rotation = [rng.sample(range(len(CARDS)), 8) for _ in range(3)]
+        for i in range(14 * per_day):  # this week and the prior one
+            stamp = _stamp(now - timedelta(seconds=rng.uniform(0, 14 * 86400)))
+            group, mode_id, mode_name = rng.choice(MODES)
+            won = rng.random() < 0.55
+            battles.append(
+                (
+                    f"{tag}:{i}",
+                    tag,
+                    stamp,
+                    stamp,
+                    _deck(rng, rng.choice(rotation)),
+                    _deck(rng, rng.sample(range(len(CARDS)), 8)),
+                    "W" if won else "L",
+                    group,
+                    mode_id,
+                    mode_name,
+                    rng.randint(20, 35) if won else -rng.randint(20, 35),
+                    rng.randint(1, 3) if won else rng.randint(0, 2),
+                    rng.randint(0, 2) if won else rng.randint(1, 3),
+                )
+            )
+        for i in range(3):
+            observed = _stamp(now - timedelta(seconds=rng.uniform(0, 7 * 86400)))
+            unlocks.append(
+                (
+                    tag,
+                    observed,
+                    json.dumps({"card_name": CARDS[rng.randrange(8) + m % 4][1]}),
+                    f"unlock:{tag}:{i}",
+                    observed,
+                )
+            )
+    conn.executemany(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, deck_json, "
+        "opponent_deck_json, outcome, mode_group, game_mode_id, game_mode_name, trophy_change, "
+        "crowns_for, crowns_against) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        battles,
+    )
+    conn.executemany(
+        "INSERT INTO player_events (player_tag, event_type, observed_at, payload_json, "
+        "dedup_key, created_at) VALUES (?, 'card_unlocked', ?, ?, ?, ?)",
+        unlocks,
+    )
+    conn.commit()
+    return len(battles)
+
+
+class _Stages:
+    """Wall time per stage, summed across members (threads add up)."""
+
+    def __init__(self, llm_ms: float):
+        self.llm_ms = llm_ms
+        self.ms = {"build": 0.0, "generate": 0.0, "send": 0.0}
+        self.sent: list[tuple[str, str]] = []
+
+    def timed(self, stage: str, fn, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.ms[stage] += (time.perf_counter() - started) * 1000
+
+    def generate(self, facts: str) -> dict:
+        return self.timed("generate", lambda: time.sleep(self.llm_ms / 1000) or dict(NARRATIVE))
+
+    def send(self, rec: dict, subject: str, body: str) -> None:
+        self.timed("send", self.sent.append, (rec["email"], subject))
+
+
+def _before(recipients: list[dict], week_key: str, stages: _Stages) -> list[str]:
+    from runtime import email_dedup, member_report
+
+    outcomes = []
+    for rec in recipients:
+        tag = rec["player_tag"]
+        key = f"{tag}:{week_key}"
+        if email_dedup.already_sent("member_report", key):
+            outcomes.append("already")
+            continue
+        ctx = stages.timed(
+            "build", member_report.build_member_report_context, tag, rec["member_name"]
+        )
+        narrative = stages.generate(member_report.facts_for_model(ctx))
+        subject, body = member_report.render_member_report(ctx, narrative)
+        stages.send(rec, subject, body)
+        outcomes.append("sent" if email_dedup.record_sent("member_report", key) else "unrecorded")
+    return outcomes
+
+
+def _after(recipients: list[dict], week_key: str, stages: _Stages, workers: int) -> list[str]:
+    from runtime import member_report, member_report_pipeline
+
+    build = member_report.build_member_report_context
+    member_report.build_member_report_context = lambda *a, **kw: stages.timed(
+        "build", build, *a, **kw
+    )
+    try:
+        return member_report_pipeline.run_member_reports(
+            recipients,
+            week_key=week_key,
+            generate=stages.generate,
+            send=stages.send,
+            workers=workers,
+        )
+    finally:
+        member_report.build_member_report_context = build
+
+
+def _time(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = fn()
+    return round((time.perf_counter() - started) * 1000, 1), result
+
+
+def run(members: int, per_day: int, llm_ms: float, workers: int, seed_: int) -> dict:
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    os.environ["ELIXIR_DB_PATH"] = os.path.join(scratch, "bench.db")
+    from db import get_connection
+    from db.schema import build_database
+    from runtime import member_report
+
+    build_database(os.environ["ELIXIR_DB_PATH"], None)
+    tags = [f"#BENCH{i}" for i in range(members)]
+    conn = get_connection()
+    try:
+        battles = seed(conn, tags, per_day, random.Random(seed_))
+        member_report.build_member_report_context(tags[-1], "warm-up", conn=conn)
+        clan_ms, clan = _time(lambda: member_report.build_clan_report_context(conn=conn))
+        alone_ms, _ = _time(lambda: member_report.build_member_report_context(tags[0], "x"))
+        shared_ms, _ = _time(
+            lambda: member_report.build_member_report_context(tags[0], "x", clan=clan, conn=conn)
+        )
+    finally:
+        conn.close()
+    recipients = [
+        {"player_tag": tag, "member_name": tag[1:], "email": f"{tag[1:].lower()}@bench"}
+        for tag in tags
+    ]
+    result = {
+        "members": members,
+        "battles": battles,
+        "llm_ms": llm_ms,
+        "workers": workers,
+        "clan_context_ms": clan_ms,
+        "member_build_ms": {"alone": alone_ms, "shared_clan": shared_ms},
+    }
+    sent = {}
+    for mode in ("before", "after"):
+        stages = _Stages(llm_ms)
+        started = time.perf_counter()
+        if mode == "before":
+            outcomes = _before(recipients, "BENCH-before", stages)
+        else:
+            outcomes = _after(recipients, "BENCH-after", stages, workers)
+        wall_ms = round((time.perf_counter() - started) * 1000, 1)
+        assert outcomes == ["sent"] * members, f"{mode}: {outcomes}"
+        sent[mode] = stages.sent
+        result[mode] = {
+            "wall_ms": wall_ms,
+            "per_member_ms": round(wall_ms / members, 1),
+            "stage_ms": {k: round(v, 1) for k, v in stages.ms.items()},
+        }
+    assert sent["before"] == sent["after"], "the pipeline mailed a different sequence"
+    result["speedup"] = round(result["before"]["wall_ms"] / result["after"]["wall_ms"], 2)
+    return result
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--members", type=int, default=50, help="fixture roster size")
+    ap.add_argument("--per-day", type=int, default=12, help="battles per member per day")
+    ap.add_argument("--llm-ms", type=float, default=2000.0, help="stubbed generation latency")
+    ap.add_argument("--workers", type=int, default=4, help="concurrent generations")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    r = run(args.members, args.per_day, args.llm_ms, args.workers, args.seed)
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return 0
+    print(
+        f"{r['members']} members, {r['battles']} battles, stub LLM {r['llm_ms']:.0f} ms, "
+        f"{r['workers']} workers"
+    )
+    print(
+        f"clan context {r['clan_context_ms']} ms once; member build "
+        f"{r['member_build_ms']['alone']} ms alone, "
+        f"{r['member_build_ms']['shared_clan']} ms sharing it"
+    )
+    print(f"{'mode':<7} {'wall ms':>10} {'ms/member':>10} {'build':>9} {'generate':>10}")
+    for mode in ("before", "after"):
+        m = r[mode]
+        print(
+            f"{mode:<7} {m['wall_ms']:>10.1f} {m['per_member_ms']:>10.1f} "
+            f"{m['stage_ms']['build']:>9.1f} {m['stage_ms']['generate']:>10.1f}"
+        )
+    print(f"speedup x{r['speedup']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,216 @@
+"""Microbenchmark — memory recall latency as the corpus grows.
+
+Builds a scratch database per corpus size with a synthetic memory corpus shaped
+like the live one (97% inference, member- and channel-keyed, a few tags; ages
+spread over 200 days, so many inference rows are past their 90-day expiry and
+5% are retired) and times the two recall entry points:
+
+    select_memories   member + channel + FTS query, the answer-time context
+    search_memories   FTS search with filters, the memory tool
+
+each two ways:
+
+    per-row    the old hydration: one memories read + one memory_tags read
+               per candidate, filters re-checked in Python
+    batched    memory_store._fetch_memories: all candidates in one row read
+               and one tag read, scope/retired/expiry filtered in SQL
+
+Both modes return the same memories (asserted). Nothing touches the network
+or the live DB.
+
+Usage:
+    uv run python scripts/bench_memory_recall.py
+    uv run python scripts/bench_memory_recall.py --sizes 10000,50000,100000 --calls 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+_WORDS = (
+    "hog rider princess tornado log miner balloon golem wizard witch knight archer "
+    "donation war deck ranked trophy ladder champion colosseum river race elder "
+    "upgrade maxed evolution tower crown streak season quiet active"
+).split()
+MEMBERS = 50
+CHANNELS = 12
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_corpus(conn, size: int, rng: random.Random) -> None:
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(size):
+        kind = "inference" if rng.random() < 0.97 else rng.choice(["leader_note", "synthesis"])
+        updated = now - timedelta(days=rng.uniform(0, 200))
+        expires = None
+        if kind == "inference":
+            expires = _stamp(updated + timedelta(days=90))
+        retired = _stamp(updated) if rng.random() < 0.05 else None
+        body = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 24)))
+        rows.append(
+            (
+                kind,
+                f"note {i}",
+                body,
+                rng.choice(["public", "public", "leadership"]),
+                round(rng.uniform(0.3, 0.95), 2),
+                f"#M{rng.randrange(MEMBERS):03d}" if rng.random() < 0.8 else None,
+                str(rng.randrange(CHANNELS)) if rng.random() < 0.6 else None,
+                _stamp(updated),
+                _stamp(updated),
+                expires,
+                retired,
+            )
+        )
+    conn.executemany(
+        """INSERT INTO memories (kind, title, body, scope, confidence, member_tag,
+               channel_key, created_by, created_at, updated_at, expires_at, retired_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, 'bench', ?, ?, ?, ?)""",
+        rows,
+    )
+    ids = [r[0] for r in conn.execute("SELECT memory_id FROM memories").fetchall()]
+    conn.executemany(
+        "INSERT OR IGNORE INTO memory_tags (memory_id, tag) VALUES (?, ?)",
+        [(i, rng.choice(["war", "deck", "editorial", "loa"])) for i in ids if rng.random() < 0.3],
+    )
+    conn.commit()
+
+
+def _per_row_fetch(conn, memory_ids, *, scopes=None, live_at=None):
+    """The pre-batching hydration, reproduced through the same row shaping."""
+    import memory_store
+
+    out = {}
+    for memory_id in dict.fromkeys(memory_ids):
+        row = conn.execute("SELECT * FROM memories WHERE memory_id = ?", (memory_id,)).fetchone()
+        if not row:
+            continue
+        tags = [
+            r["tag"]
+            for r in conn.execute(
+                "SELECT tag FROM memory_tags WHERE memory_id = ? ORDER BY tag", (memory_id,)
+            ).fetchall()
+        ]
+        item = memory_store._memory_row(dict(row), tags)
+        if scopes is not None and item["scope"] not in scopes:
+            continue
+        if live_at is not None:
+            if item.get("retired_at"):
+                continue
+            if item.get("expires_at") and str(item["expires_at"]) <= live_at:
+                continue
+        out[memory_id] = item
+    return out
+
+
+def _calls(rng: random.Random, n: int) -> list[dict]:
+    return [
+        {
+            "member_tag": f"#M{rng.randrange(MEMBERS):03d}",
+            "channel_key": str(rng.randrange(CHANNELS)),
+            "query": " ".join(rng.sample(_WORDS, 2)),
+        }
+        for _ in range(n)
+    ]
+
+
+def _time(fn, calls) -> tuple[dict, list]:
+    wall, results = [], []
+    for call in calls:
+        started = time.perf_counter()
+        results.append(fn(call))
+        wall.append(time.perf_counter() - started)
+    ordered = sorted(wall)
+    return {
+        "mean_ms": round(sum(wall) / len(wall) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 3),
+    }, results
+
+
+def run_size(size: int, calls: int, seed: int) -> dict:
+    import memory_store
+    from db import get_connection
+    from db.schema import build_database
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    db_path = os.path.join(scratch, "bench.db")
+    build_database(db_path, None)
+    conn = get_connection(db_path)
+    try:
+        build_corpus(conn, size, random.Random(seed))
+        workload = _calls(random.Random(seed + 1), calls)
+
+        def select(call):
+            got = memory_store.select_memories(
+                **call, viewer_scope="leadership", limit=8, conn=conn
+            )
+            return [m["memory_id"] for m in got]
+
+        def search(call):
+            got = memory_store.search_memories(
+                call["query"],
+                viewer_scope="leadership",
+                filters={"member_tag": call["member_tag"]},
+                limit=10,
+                conn=conn,
+            )
+            return [h.memory["memory_id"] for h in got]
+
+        result = {"memories": size}
+        batched = memory_store._fetch_memories
+        for name, fn in (("select", select), ("search", search)):
+            fn(workload[0])  # warm the page cache and FTS index
+            memory_store._fetch_memories = _per_row_fetch
+            try:
+                per_row, expected = _time(fn, workload)
+            finally:
+                memory_store._fetch_memories = batched
+            fast, got = _time(fn, workload)
+            assert got == expected, f"{name}: batched recall differs from per-row"
+            result[name] = {"per_row": per_row, "batched": fast}
+        return result
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", default="10000,30000,100000", help="comma-separated corpus sizes")
+    ap.add_argument("--calls", type=int, default=200, help="recall calls timed per mode")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    results = [run_size(int(size), args.calls, args.seed) for size in args.sizes.split(",") if size]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'memories':>9} {'call':<7} {'mode':<8} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for r in results:
+        for name in ("select", "search"):
+            for mode in ("per_row", "batched"):
+                t = r[name][mode]
+                print(
+                    f"{r['memories']:>9} {name:<7} {mode:<8} {t['mean_ms']:>9.3f} "
+                    f"{t['p50_ms']:>9.3f} {t['p95_ms']:>9.3f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""Microbenchmark — canonical payload serialization/hashing per engine tick.
+
+Builds one tick's worth of recorded CR responses from tests/fixtures/cr (the
+clan, the war-day river race, and --players profile + battlelog pairs) and
+times the canonical JSON + SHA-256 work a tick does on them, two ways:
+
+    before    every stage canonicalizes for itself: the receipt write, the
+              admission envelope, the receipt's admission stamp, and per
+              emitter aspect the baseline compare, the baseline payload_json
+              and the baseline hash
+    after     engine.db.canonical_payload: cr_api canonicalizes each response
+              once and the receipt write, envelope and admission stamp reuse
+              it; each aspect is canonicalized once for compare + store
+
+Only the serialization and hashing are timed — no database, no network. The
+"before" column reproduces the pre-change call sequence with the same
+json.dumps options, so both columns produce identical hashes (asserted).
+
+Usage:
+    uv run python scripts/bench_payload_canonical.py
+    uv run python scripts/bench_payload_canonical.py --players 50 --ticks 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import sys
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+
+def _legacy_text(payload) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _legacy_hash(payload) -> str:
+    return hashlib.sha256(_legacy_text(payload).encode()).hexdigest()
+
+
+def build_tick(players: int) -> list[tuple[str, object, list]]:
+    """(endpoint, response, aspect payloads) for one tick, each response distinct."""
+    from engine.emitters.clan import project_clan_aspects
+    from engine.emitters.player import project_player_aspects
+    from engine.emitters.war import project_race_aspect
+    from tests.conftest import load_cr_fixture
+
+    clan = load_cr_fixture("clan")
+    race = load_cr_fixture("riverrace_warday")
+    profiles = [load_cr_fixture("player_plain"), load_cr_fixture("player_evo")]
+    battlelog = load_cr_fixture("battlelog")
+    tick = [
+        ("clan", clan, list(project_clan_aspects(clan).values())),
+        ("currentriverrace", race, [project_race_aspect(race, 130)]),
+    ]
+    for i in range(players):
+        # Fresh objects per player, as a real tick decodes each response anew.
+        profile = copy.deepcopy(profiles[i % 2])
+        tick.append(("player", profile, list(project_player_aspects(profile).values())))
+        tick.append(("player_battlelog", copy.deepcopy(battlelog), []))
+    return tick
+
+
+def before(tick) -> list[str]:
+    hashes = []
+    for _endpoint, response, aspects in tick:
+        _legacy_hash(response)  # db._store_raw_payload
+        hashes.append(_legacy_hash(response))  # observations.observe
+        _legacy_hash(response)  # readiness.record_admission_decision
+        for aspect in aspects:
+            _legacy_hash(aspect)  # emitters.emit: compare with the baseline
+            _legacy_text(aspect)  # baselines.set_baseline: payload_json
+            _legacy_hash(aspect)  # baselines.set_baseline: payload_hash
+    return hashes
+
+
+def after(tick) -> list[str]:
+    from engine.db import canonical_payload
+
+    hashes = []
+    for _endpoint, response, aspects in tick:
+        canonical_payload(response, remember=True)  # cr_api, at decode
+        canonical_payload(response)  # db._store_raw_payload (memo hit)
+        envelope = canonical_payload(response)  # observations.observe (memo hit)
+        hashes.append(envelope.hash)
+        canonical_payload(envelope)  # record_admission_decision (pass-through)
+        for aspect in aspects:
+            canonical = canonical_payload(aspect)  # emit: compare...
+            canonical_payload(canonical)  # ...and set_baseline reuses it
+    return hashes
+
+
+def _time(fn, tick, ticks: int) -> dict:
+    from engine import db as engine_db
+
+    wall = []
+    cpu_started = time.process_time()
+    for _ in range(ticks):
+        with engine_db._CANONICAL_MEMO_LOCK:
+            engine_db._CANONICAL_MEMO.clear()
+        started = time.perf_counter()
+        fn(tick)
+        wall.append(time.perf_counter() - started)
+    cpu = time.process_time() - cpu_started
+    wall.sort()
+    return {
+        "cpu_ms_per_tick": round(cpu / ticks * 1000, 3),
+        "p50_ms": round(wall[ticks // 2] * 1000, 3),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--players", type=int, default=30, help="profile+battlelog pairs per tick")
+    ap.add_argument("--ticks", type=int, default=100)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    tick = build_tick(args.players)
+    assert before(tick) == after(tick), "canonical hashes drifted"
+    response_bytes = sum(len(_legacy_text(response)) for _e, response, _a in tick)
+    results = {
+        "responses": len(tick),
+        "aspects": sum(len(aspects) for _e, _r, aspects in tick),
+        "response_kib": round(response_bytes / 1024, 1),
+        "before": _time(before, tick, args.ticks),
+        "after": _time(after, tick, args.ticks),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"{results['responses']} responses ({results['response_kib']} KiB canonical), "
+        f"{results['aspects']} baseline aspects per tick"
+    )
+    print(f"{'':<8} {'cpu ms/tick':>12} {'p50 ms':>9}")
+    for mode in ("before", "after"):
+        r = results[mode]
+        print(f"{mode:<8} {r['cpu_ms_per_tick']:>12.3f} {r['p50_ms']:>9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+"""Report — raw_api_payloads storage size and throughput per body codec.
+
+Builds a poll history from the recorded responses in tests/fixtures/cr: per
+player, ``--polls`` successive battlelogs (each finding 1-3 new battles on top
+of the last, the fixture's battles re-stamped so every poll is distinct) and a
+profile whose trophies move; per poll, the clan, the current river race and
+the race log. Stores the whole history through db._store_raw_payload into a
+scratch database three times, once per storage.payload_codec setting:
+
+    json     full JSON text, the only storage before schema v40
+    zlib     every body deflated against the preset dictionary
+    delta    zlib, and battlelogs as deltas against the player's previous one
+
+Reports bytes stored per endpoint (``payload_json`` plus ``payload_blob``),
+the database file after VACUUM, and write and read throughput -- reads decode
+every body in replay order (scripts/replay_gate.py's order) through
+PayloadReader, and every decoded body is asserted identical to what was
+stored. The dictionary was trained on these same fixtures, so the zlib column
+is a best case for bodies this small; battlelogs dominate either way.
+
+Usage:
+    uv run python scripts/bench_payload_codec.py
+    uv run python scripts/bench_payload_codec.py --players 50 --polls 24 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+CODECS = ("json", "zlib", "delta")
+_WINDOW = 25
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y%m%dT%H%M%S.000Z")
+
+
+def history(players: int, polls: int, seed: int) -> list[tuple[str, str, object, str]]:
+    """(endpoint, entity_key, payload, fetched_at) in fetch order."""
+    from tests.conftest import load_cr_fixture
+
+    rng = random.Random(seed)
+    battles = load_cr_fixture("battlelog")
+    profiles = [load_cr_fixture("player_plain"), load_cr_fixture("player_evo")]
+    clan = load_cr_fixture("clan")
+    races = [load_cr_fixture(f"riverrace_{kind}") for kind in ("training", "warday")]
+    racelog = load_cr_fixture("riverracelog")
+    start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+    streams, offsets = [], []
+    for p in range(players):
+        # Newest first, like the API: the battle at index k happened k slots ago.
+        needed = _WINDOW + polls * 3
+        stream = []
+        for k in range(needed):
+            battle = copy.deepcopy(battles[(k + p) % len(battles)])
+            battle["battleTime"] = _stamp(start - timedelta(minutes=7 * k + p))
+            stream.append(battle)
+        streams.append(stream)
+        offsets.append(needed - _WINDOW)
+
+    out = []
+    for i in range(polls):
+        at = (start + timedelta(minutes=10 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        out.append(("clan", "J2RGCRVG", clan, at))
+        race = copy.deepcopy(races[i % 2])
+        race.setdefault("clan", {})["fame"] = 1000 + i
+        out.append(("currentriverrace", "J2RGCRVG", race, at))
+        if i == 0:
+            out.append(("riverracelog", "J2RGCRVG", racelog, at))
+        for p in range(players):
+            tag = f"BENCH{p}"
+            offsets[p] = max(0, offsets[p] - rng.randint(1, 3))
+            log_ = streams[p][offsets[p] : offsets[p] + _WINDOW]
+            out.append(("player_battlelog", tag, log_, at))
+            profile = copy.deepcopy(profiles[p % 2])
+            profile["trophies"] = int(profile.get("trophies") or 0) + i
+            out.append(("player", tag, profile, at))
+    return out
+
+
+def _bytes(conn) -> dict:
+    sizes: dict = defaultdict(int)
+    for endpoint, size in conn.execute(
+        "SELECT endpoint, SUM(LENGTH(CAST(payload_json AS BLOB)) + COALESCE(LENGTH(payload_blob), 0)) "
+        "FROM raw_api_payloads GROUP BY endpoint"
+    ):
+        sizes[endpoint] = int(size)
+    return dict(sizes)
+
+
+def run_codec(codec: str, rows: list, scratch: str) -> dict:
+    import db
+    from db.schema import build_database
+    from storage import payload_codec
+
+    path = os.path.join(scratch, f"{codec}.db")
+    build_database(path, None)
+    payload_codec.CODEC = codec
+    conn = db.get_connection(path)
+    try:
+        started = time.perf_counter()
+        for n, (endpoint, entity, payload, at) in enumerate(rows, 1):
+            db._store_raw_payload(conn, endpoint, entity, payload, fetched_at=at)
+            if n % 64 == 0:  # storage.payload_writer's batch
+                conn.commit()
+        conn.commit()
+        write_s = time.perf_counter() - started
+
+        expected = {}
+        for endpoint, entity, payload, _ in rows:
+            expected[(endpoint, db._tag_key(entity) or entity, db._json_or_none(payload))] = True
+        started = time.perf_counter()
+        reader = payload_codec.PayloadReader(conn)
+        decoded = [
+            (endpoint, entity, reader.text(payload_id, stored_codec, text))
+            for endpoint, entity, payload_id, stored_codec, text in conn.execute(
+                """SELECT r.endpoint, r.entity_key, p.payload_id, p.payload_codec, p.payload_json
+                   FROM api_observation_receipts r
+                   JOIN raw_api_payloads p ON p.payload_id = r.payload_id
+                   ORDER BY r.fetched_at ASC, r.receipt_id ASC"""
+            )
+        ]
+        read_s = time.perf_counter() - started
+        assert len(decoded) == len(rows), f"{codec}: {len(decoded)} receipts for {len(rows)}"
+        assert all(key in expected for key in decoded), f"{codec}: a body read back altered"
+        sizes = _bytes(conn)
+        stored = conn.execute("SELECT COUNT(*) FROM raw_api_payloads").fetchone()[0]
+        codecs = dict(
+            conn.execute(
+                "SELECT payload_codec, COUNT(*) FROM raw_api_payloads GROUP BY payload_codec"
+            ).fetchall()
+        )
+    finally:
+        conn.close()
+    vacuumed = _vacuumed_size(path)
+    return {
+        "bodies": stored,
+        "codecs": codecs,
+        "bytes": sizes,
+        "total_bytes": sum(sizes.values()),
+        "file_bytes": vacuumed,
+        "write_per_s": round(len(rows) / write_s, 1),
+        "read_per_s": round(len(rows) / read_s, 1),
+    }
+
+
+def _vacuumed_size(path: str) -> int:
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return os.path.getsize(path)
+
+
+def run(players: int, polls: int, seed: int) -> dict:
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    os.environ["ELIXIR_DB_PATH"] = os.path.join(scratch, "default.db")
+    rows = history(players, polls, seed)
+    result = {"players": players, "polls": polls, "payloads": len(rows)}
+    for codec in CODECS:
+        result[codec] = run_codec(codec, rows, scratch)
+    base = result["json"]["total_bytes"]
+    for codec in CODECS:
+        result[codec]["ratio"] = round(base / result[codec]["total_bytes"], 1)
+    return result
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--players", type=int, default=50, help="players polled each round")
+    ap.add_argument("--polls", type=int, default=12, help="poll rounds")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    r = run(args.players, args.polls, args.seed)
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return 0
+    print(f"{r['payloads']} responses: {r['players']} players x {r['polls']} polls + clan/race")
+    endpoints = sorted(r["json"]["bytes"], key=lambda e: -r["json"]["bytes"][e])
+    print(f"{'endpoint':<18}" + "".join(f"{codec + ' KB':>12}" for codec in CODECS))
+    for endpoint in endpoints:
+        cells = "".join(f"{r[codec]['bytes'].get(endpoint, 0) / 1024:>12.1f}" for codec in CODECS)
+        print(f"{endpoint:<18}{cells}")
+    print(f"{'total':<18}" + "".join(f"{r[c]['total_bytes'] / 1024:>12.1f}" for c in CODECS))
+    print(
+        f"{'file (vacuumed)':<18}" + "".join(f"{r[c]['file_bytes'] / 1024:>12.1f}" for c in CODECS)
+    )
+    print(f"{'ratio vs json':<18}" + "".join(f"{r[c]['ratio']:>11.1f}x" for c in CODECS))
+    print(f"{'writes/s':<18}" + "".join(f"{r[c]['write_per_s']:>12.0f}" for c in CODECS))
+    print(f"{'reads/s':<18}" + "".join(f"{r[c]['read_per_s']:>12.0f}" for c in CODECS))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
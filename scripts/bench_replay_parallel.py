@@ -0,0 +1,197 @@
+"""Report — OfflineEngine replay wall clock, serial vs partitioned (engine.replay).
+
+Builds a poll history from the recorded responses in tests/fixtures/cr: per
+poll, the clan (one member away every few polls, so leaves and rejoins land on
+the shared stream, and donations moving), the current river race with its fame
+climbing, and for each member a profile whose trophies move and a battlelog
+finding 1-3 new battles on top of the last (the fixture's battles re-stamped
+and re-tagged to the member). Replays it from one freshly built database two
+ways:
+
+    serial     one OfflineEngine, every payload in order (replay_gate.py's
+               --workers 1)
+    parallel   engine.replay.ParallelReplay over ``--workers`` processes, the
+               signal merged back into a copy of the same database
+
+Asserts the merged signal tables and counters are byte-identical to the serial
+run (engine.replay.signature) with no dedup collisions, and reports both wall
+clocks. ``critical path`` is the slowest partition's CPU time plus the merge:
+what the parallel run takes when every worker has a core to itself, so on a
+machine with fewer cores than workers compare it, not the measured wall clock.
+
+Usage:
+    uv run python scripts/bench_replay_parallel.py
+    uv run python scripts/bench_replay_parallel.py --members 47 --polls 24 --workers 4 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+_WINDOW = 25
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y%m%dT%H%M%S.000Z")
+
+
+def history(members: int, polls: int, seed: int = 7) -> list[tuple[str, str, str, str]]:
+    """(endpoint, entity_key, payload_json, fetched_at) in fetch order."""
+    from db import _json_or_none
+    from tests.conftest import load_cr_fixture
+
+    rng = random.Random(seed)
+    clan = load_cr_fixture("clan")
+    roster = clan["memberList"][:members]
+    race = load_cr_fixture("riverrace_warday")
+    battles = load_cr_fixture("battlelog")
+    profiles = [load_cr_fixture("player_plain"), load_cr_fixture("player_evo")]
+    start = datetime(2026, 7, 4, 16, 0, tzinfo=timezone.utc)
+
+    streams, offsets = [], []
+    for m, member in enumerate(roster):
+        needed = _WINDOW + polls * 3
+        stream = []
+        for k in range(needed):
+            battle = copy.deepcopy(battles[(k + m) % len(battles)])
+            battle["battleTime"] = _stamp(start - timedelta(minutes=7 * k + m))
+            battle["team"][0]["tag"] = member["tag"]
+            battle["team"][0]["name"] = member["name"]
+            stream.append(battle)
+        streams.append(stream)
+        offsets.append(needed - _WINDOW)
+
+    out = []
+    for i in range(polls):
+        at = (start + timedelta(minutes=10 * i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        payload = copy.deepcopy(clan)
+        present = [
+            dict(member, donations=member["donations"] + i)
+            for m, member in enumerate(roster)
+            if (i + m) % 7 != 6
+        ]
+        payload["memberList"] = present
+        payload["members"] = len(present)
+        out.append(("clan", clan["tag"], _json_or_none(payload), at))
+        payload = copy.deepcopy(race)
+        payload["seasonId"] = 130
+        payload["clan"]["fame"] += 100 * i
+        out.append(("currentriverrace", clan["tag"], _json_or_none(payload), at))
+        for m, member in enumerate(roster):
+            offsets[m] = max(0, offsets[m] - rng.randint(1, 3))
+            battlelog = streams[m][offsets[m] : offsets[m] + _WINDOW]
+            out.append(("player_battlelog", member["tag"], _json_or_none(battlelog), at))
+            profile = copy.deepcopy(profiles[m % 2])
+            profile.update(tag=member["tag"], name=member["name"])
+            profile["trophies"] = int(profile.get("trophies") or 0) + 40 * i
+            profile["bestTrophies"] = max(profile["bestTrophies"], profile["trophies"])
+            out.append(("player", member["tag"], _json_or_none(profile), at))
+    return out
+
+
+def run_serial(path: str, rows: list) -> tuple[dict, float]:
+    from engine.offline import OfflineEngine
+
+    started = time.perf_counter()
+    with OfflineEngine(path) as eng:
+        for row in rows:
+            eng.apply(*row)
+        counters = eng.finish()
+    return counters, time.perf_counter() - started
+
+
+def run(members: int, polls: int, workers: int, seed: int) -> dict:
+    from db.schema import build_database
+    from engine.db import connect
+    from engine.replay import ParallelReplay, signature
+
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    os.environ["ELIXIR_DB_PATH"] = os.path.join(scratch, "default.db")
+    try:
+        template = os.path.join(scratch, "template.db")
+        build_database(template, None)
+        rows = history(members, polls, seed)
+        serial_path, parallel_path = (os.path.join(scratch, f"{n}.db") for n in ("s", "p"))
+        shutil.copy(template, serial_path)
+        shutil.copy(template, parallel_path)
+
+        counters, serial_s = run_serial(serial_path, rows)
+        conn = connect(serial_path)
+        try:
+            expected = signature(conn, {k: v for k, v in sorted(counters.items())})
+        finally:
+            conn.close()
+
+        replay = ParallelReplay(rows, workers, scratch)
+        conn = connect(parallel_path)
+        try:
+            result = replay.run(conn)
+            actual = signature(conn, result.counters)
+        finally:
+            conn.close()
+        critical_s = max(result.partition_cpu_seconds) + result.merge_seconds
+        assert result.collisions == 0, f"{result.collisions} dedup collision(s)"
+        assert actual == expected, "partitioned replay differs from the serial run"
+        return {
+            "members": members,
+            "polls": polls,
+            "payloads": len(rows),
+            "workers": len(replay.partitions),
+            "cpus": os.cpu_count(),
+            "identical": True,
+            "signature": expected,
+            "counters": result.counters,
+            "merged": result.merged,
+            "serial_s": round(serial_s, 2),
+            "parallel_s": round(result.seconds, 2),
+            "partition_cpu_s": [round(s, 2) for s in result.partition_cpu_seconds],
+            "merge_s": round(result.merge_seconds, 2),
+            "critical_path_s": round(critical_s, 2),
+            "speedup": round(serial_s / result.seconds, 2),
+            "critical_path_speedup": round(serial_s / critical_s, 2),
+        }
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--members", type=int, default=47, help="roster size (fixture has 47)")
+    ap.add_argument("--polls", type=int, default=12, help="poll rounds")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    r = run(args.members, args.polls, args.workers, args.seed)
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return 0
+    print(
+        f"{r['payloads']} payloads: {r['members']} members x {r['polls']} polls + clan/race; "
+        f"{r['workers']} workers on {r['cpus']} cpu(s)"
+    )
+    print(f"signal + counters identical to serial: {r['identical']} ({r['signature'][:12]})")
+    print("merged rows: " + ", ".join(f"{t}={n}" for t, n in r["merged"].items()))
+    print(f"serial          {r['serial_s']:>8.2f} s")
+    print(f"parallel        {r['parallel_s']:>8.2f} s  ({r['speedup']:.2f}x)")
+    print(f"partition cpu   {', '.join(f'{s:.2f}' for s in r['partition_cpu_s'])} s")
+    print(f"merge           {r['merge_s']:>8.2f} s")
+    print(f"critical path   {r['critical_path_s']:>8.2f} s  ({r['critical_path_speedup']:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
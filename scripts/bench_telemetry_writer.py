@@ -0,0 +1,172 @@
+"""Microbenchmark — caller-side cost of a telemetry write: inline vs write-behind.
+
+Times what the agent loop and the committing thread pay per telemetry row,
+against a scratch telemetry file, two ways:
+
+    before   the original writers: insert + commit on the caller's cached
+             connection (record_llm_call with ``--blob-kb`` of prompt and
+             response JSON, record_transaction with a per-site breakdown)
+    after    storage.telemetry as it is now: the row is queued and committed
+             in batches on storage.telemetry_writer's thread
+
+With ``--threads`` > 1 the calls come from that many threads at once, like the
+engine tick, the awareness worker and the scheduler. Also reports how long the
+queued rows take to drain, in how many batches, and that every row landed
+(asserted). Nothing touches the network, the LLM or the live telemetry file.
+
+Usage:
+    uv run python scripts/bench_telemetry_writer.py
+    uv run python scripts/bench_telemetry_writer.py --calls 5000 --threads 4 --blob-kb 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+_LLM_INSERT = (
+    "INSERT INTO llm_calls (recorded_at, workflow, model, ok, duration_ms, prompt_tokens, "
+    "completion_tokens, total_tokens, prompt_json, response_json, turn_id) "
+    "VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)"
+)
+_TXN_INSERT = (
+    "INSERT INTO db_transactions (recorded_at, call_site, held_ms, statements, outcome, "
+    "sites_json) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def _blobs(kb: int) -> tuple[str, str, str]:
+    prompt = json.dumps({"system": "x" * (kb * 512), "messages": [{"content": "y" * (kb * 256)}]})
+    response = json.dumps({"text": "z" * (kb * 256)})
+    sites = json.dumps([{"site": f"engine/x.py:{i}", "n": i, "ms": i * 1.5} for i in range(8)])
+    return prompt, response, sites
+
+
+def _before(kind: str, i: int, blobs) -> None:
+    from storage import telemetry
+
+    prompt, response, sites = blobs
+    conn = telemetry.connect()
+    if kind == "llm_call":
+        now = telemetry._utcnow()
+        row = (now, "interactive", "haiku", 900, 4000, 300, 4300, prompt, response, f"turn{i}")
+        conn.execute(_LLM_INSERT, row)
+    else:
+        conn.execute(
+            _TXN_INSERT, (telemetry._utcnow(), "engine/tick.py:1", 250, 40, "commit", sites)
+        )
+    conn.commit()
+
+
+def _after(kind: str, i: int, blobs) -> None:
+    from storage import telemetry
+
+    prompt, response, sites = blobs
+    if kind == "llm_call":
+        telemetry.record_llm_call(
+            "interactive",
+            "haiku",
+            duration_ms=900,
+            prompt_tokens=4000,
+            completion_tokens=300,
+            total_tokens=4300,
+            prompt_json=prompt,
+            response_json=response,
+            turn_id=f"turn{i}",
+        )
+    else:
+        telemetry.record_transaction(
+            "engine/tick.py:1", 250, statements=40, outcome="commit", sites_json=sites
+        )
+
+
+def _run(fn, kind: str, calls: int, threads: int, blobs) -> list[float]:
+    per_thread = calls // threads
+    samples: list[list[float]] = [[] for _ in range(threads)]
+
+    def worker(slot: int) -> None:
+        out = samples[slot]
+        for i in range(per_thread):
+            started = time.perf_counter()
+            fn(kind, slot * per_thread + i, blobs)
+            out.append((time.perf_counter() - started) * 1_000_000)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return sorted(us for chunk in samples for us in chunk)
+
+
+def _summary(us: list[float]) -> dict:
+    return {
+        "mean_us": round(sum(us) / len(us), 1),
+        "p50_us": round(us[len(us) // 2], 1),
+        "p99_us": round(us[min(len(us) - 1, int(len(us) * 0.99))], 1),
+    }
+
+
+def _count(table: str) -> int:
+    from storage import telemetry
+
+    return telemetry.connect().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def run(calls: int, threads: int, blob_kb: int) -> dict:
+    scratch = tempfile.mkdtemp(prefix="elixir-bench-")
+    os.environ["ELIXIR_TELEMETRY_DB_PATH"] = os.path.join(scratch, "telemetry.db")
+    from storage import telemetry, telemetry_writer
+
+    blobs = _blobs(blob_kb)
+    telemetry.connect()
+    result: dict = {"calls": calls, "threads": threads, "blob_kb": blob_kb}
+    for kind, table in (("llm_call", "llm_calls"), ("transaction", "db_transactions")):
+        before = _summary(_run(_before, kind, calls, threads, blobs))
+        landed = _count(table)
+        queued = _summary(_run(_after, kind, calls, threads, blobs))
+        started = time.perf_counter()
+        assert telemetry_writer.flush(timeout=120)
+        drain_ms = round((time.perf_counter() - started) * 1000, 1)
+        assert _count(table) == landed * 2, f"{kind}: queued rows went missing"
+        result[kind] = {"before": before, "after": queued, "drain_ms": drain_ms}
+    result["writer"] = telemetry_writer.stats()
+    return result
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--calls", type=int, default=2000, help="rows written per mode")
+    ap.add_argument("--threads", type=int, default=1, help="concurrent calling threads")
+    ap.add_argument("--blob-kb", type=int, default=8, help="prompt/response JSON size")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    r = run(args.calls, max(1, args.threads), args.blob_kb)
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return 0
+    print(f"{r['calls']} rows per mode, {r['threads']} thread(s), {r['blob_kb']} KB blobs")
+    print(f"{'record':<12} {'mode':<7} {'mean us':>9} {'p50 us':>8} {'p99 us':>8}")
+    for kind in ("llm_call", "transaction"):
+        for mode in ("before", "after"):
+            s = r[kind][mode]
+            print(
+                f"{kind:<12} {mode:<7} {s['mean_us']:>9.1f} {s['p50_us']:>8.1f} {s['p99_us']:>8.1f}"
+            )
+        print(f"{kind:<12} drained the queued rows in {r[kind]['drain_ms']} ms")
+    w = r["writer"]
+    print(f"writer: {w['written']} rows in {w['batches']} batches, dropped {w['dropped']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+"""Microbenchmark — war-set selection: greedy vs branch and bound.
+
+Generates candidate lists shaped like a member's buildable decks: each deck is
+drawn mostly from one archetype's core cards (the clan corpus clusters that
+way) plus a Zipf-skewed pick of staples that recur across archetypes, which is
+what makes four card-disjoint decks hard to find. Readiness clusters near the
+member's collection level, and a few decks are marked as ones they already play
+so the familiarity slack is exercised. For each ``--sizes`` step, ``--sets``
+candidate lists are solved two ways:
+
+    greedy    capabilities.deck_intel._greedy_disjoint, the previous solver
+    search    capabilities.deck_intel._pick_disjoint, branch and bound seeded
+              with greedy, under the production time budget
+
+and the table reports time per set, how often the search beat greedy (better
+weakest deck, better total, or a set where greedy found none), the mean gain
+on the weakest deck when it did, and how often it proved optimality inside the
+budget. Pure CPU — no database.
+
+Usage:
+    uv run python scripts/bench_war_set.py
+    uv run python scripts/bench_war_set.py --sizes 200,1000,5000 --sets 50 --budget 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+ARCHETYPES = 24
+CORE = 12  # cards per archetype core
+STAPLES = 30  # cross-archetype cards (spells, cheap cycle) with skewed popularity
+FAMILIES = ("beatdown", "cycle", "control", "bait", "siege", "bridge_spam")
+
+
+def candidate_set(rng: random.Random, size: int) -> tuple[list[dict], frozenset]:
+    staples = range(ARCHETYPES * CORE, ARCHETYPES * CORE + STAPLES)
+    weights = [1.0 / (1 + i) for i in range(STAPLES)]
+    level = rng.uniform(0.1, 1.5)  # where this member's collection sits
+    cands = []
+    for i in range(size):
+        arch = rng.randrange(ARCHETYPES)
+        cards = set(rng.sample(range(arch * CORE, arch * CORE + CORE), rng.randint(5, 7)))
+        while len(cards) < 8:
+            cards.add(rng.choices(staples, weights)[0])
+        lfm = max(0.0, round(rng.gauss(level, 0.6), 2))
+        cands.append(
+            {
+                "deck_hash": f"d{i}",
+                "family": FAMILIES[arch % len(FAMILIES)],
+                "card_ids": frozenset(cards),
+                "levels_from_max": lfm,
+                "worst_card_from_max": int(lfm * 2 + rng.randint(0, 2)),
+            }
+        )
+    cands.sort(key=lambda d: (d["levels_from_max"], d["worst_card_from_max"]))
+    played = frozenset(d["deck_hash"] for d in rng.sample(cands, min(len(cands), 6)))
+    return cands, played
+
+
+def run_size(size: int, sets: int, budget: float, seed: int) -> dict:
+    from capabilities import deck_intel
+
+    rng = random.Random(seed + size)
+    greedy_s, search_s, beat, gains, complete, greedy_short, nodes = [], [], 0, [], 0, 0, []
+    for _ in range(sets):
+        cands, played = candidate_set(rng, size)
+        started = time.perf_counter()
+        greedy = deck_intel._greedy_disjoint(cands, 4, played=played)
+        greedy_s.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        _picks, report = deck_intel._pick_disjoint(cands, 4, played=played, budget=budget)
+        search_s.append(time.perf_counter() - started)
+        greedy_short += len(greedy) < 4
+        beat += report["beat_greedy"]
+        complete += report["complete"]
+        nodes.append(report["nodes"])
+        if report.get("worst_gain") is not None:
+            gains.append(report["worst_gain"])
+    return {
+        "candidates": size,
+        "sets": sets,
+        "greedy_mean_ms": round(sum(greedy_s) / sets * 1000, 3),
+        "search_mean_ms": round(sum(search_s) / sets * 1000, 3),
+        "search_max_ms": round(max(search_s) * 1000, 3),
+        "beat_greedy_pct": round(100 * beat / sets, 1),
+        "greedy_short_pct": round(100 * greedy_short / sets, 1),
+        "mean_worst_gain": round(sum(gains) / len(gains), 3) if gains else 0.0,
+        "proved_optimal_pct": round(100 * complete / sets, 1),
+        "mean_nodes": round(sum(nodes) / sets),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", default="200,1000,5000", help="comma-separated candidate counts")
+    ap.add_argument("--sets", type=int, default=40, help="candidate lists solved per size")
+    ap.add_argument("--budget", type=float, default=None, help="search budget in seconds")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    from capabilities import deck_intel
+
+    budget = deck_intel._WAR_SET_BUDGET_S if args.budget is None else args.budget
+    results = [
+        run_size(int(size), args.sets, budget, args.seed) for size in args.sizes.split(",") if size
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"{'cands':>6} {'greedy ms':>10} {'search ms':>10} {'max ms':>9} {'beat %':>7} "
+        f"{'g-short %':>10} {'worst gain':>11} {'optimal %':>10} {'nodes':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['candidates']:>6} {r['greedy_mean_ms']:>10.3f} {r['search_mean_ms']:>10.3f} "
+            f"{r['search_max_ms']:>9.3f} {r['beat_greedy_pct']:>7.1f} "
+            f"{r['greedy_short_pct']:>10.1f} {r['mean_worst_gain']:>11.3f} "
+            f"{r['proved_optimal_pct']:>10.1f} {r['mean_nodes']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -57,15 +57,17 @@ BROAD_EXCEPTION_BASELINE = {
     "capabilities/decks.py": 2,
     "capabilities/members.py": 1,
     "capabilities/war.py": 1,
-    "cr_api.py": 4,
+    # cr_api.py 5 -> 0 (2026-10-16): raw-payload persistence moved behind the
+    # call to storage/payload_writer.py, which carries those catches now.
     "db/__init__.py": 2,
     # prompts.py: +1 for the fail-soft live-trophy-floor read. A prompt must build
     # even with no database; an unavailable floor renders as "read it live"
     # rather than a guessed number.
     "prompts.py": 1,
     # 37 -> 38 (2026-08-19): the v38 ladder rung, which rolls back and re-raises
-    # exactly like every rung before it.
-    "db/schema.py": 38,  # +1: v37 migration rollback/re-raise (same pattern as v2-v36)
+    # exactly like every rung before it. 38 -> 39: the v39 rung, likewise.
+    # 39 -> 40: the v40 rung (encoded raw payload bodies), likewise.
+    "db/schema.py": 40,  # +1: v37 migration rollback/re-raise (same pattern as v2-v36)
     "engine/chronicles.py": 1,
     "engine/emitters/clan.py": 2,
     "engine/game_check.py": 1,
@@ -144,7 +146,9 @@ BROAD_EXCEPTION_BASELINE = {
     "runtime/helpers/_reports.py": 10,
     # +1 (2026-08-03): the weekly email composer logs and falls back to the
     # reformatted Discord post — a plainer email beats a missing one.
-    "runtime/jobs/_core.py": 16,
+    # 16 -> 15: the Arena Dispatch per-member guard moved to
+    # runtime/member_report_pipeline.py.
+    "runtime/jobs/_core.py": 15,
     "runtime/jobs/_battle_intel.py": 2,  # Stage-A/B jobs: mark_job_failure on any tick error
     # 6 -> 2 (2026-08-03): the Discord version of the intel report was removed —
     # email is the path for it — taking its four guards with it. The two that
@@ -164,6 +168,12 @@ BROAD_EXCEPTION_BASELINE = {
     "runtime/jobs/_promotion.py": 3,
     "runtime/jobs/_tournament.py": 7,  # autowatch scan + clan-chat relay
     "runtime/leader_action_feedback.py": 1,
+    # Per-member isolation in the Arena Dispatch pipeline, one guard for the
+    # context build and one for generate/render/send: a member's failure is
+    # logged and counted, and the rest of the roster still gets its email.
+    # 2 -> 3: the builder logs whatever stopped it (a failed connect) and still
+    # hands delivery its end marker, so the unbuilt recipients come back failed.
+    "runtime/member_report_pipeline.py": 3,
     "runtime/leader_action_ui.py": 9,
     "runtime/leader_note_interpreter.py": 5,  # interpret/apply/undo/fix all fail-open off the delivery path
     "runtime/onboarding.py": 3,
@@ -202,13 +212,27 @@ BROAD_EXCEPTION_BASELINE = {
     # 6 -> 5 (2026-08-06): record_lock_wait deleted with the db_lock_waits table
     # it wrote — no caller, and no row in its lifetime.
     "storage/telemetry.py": 5,
+    # The write-behind telemetry writer (2026-10-17): its commit rolls back and
+    # re-raises into storage._write_behind's per-row retry. Telemetry never
+    # raises into the model call or the commit it measures.
+    "storage/telemetry_writer.py": 1,
+    # The queue both write-behind writers share: a failed batch is retried one
+    # item per transaction, and an item that fails alone is logged, counted and
+    # given up on. Nothing here may raise into the caller that submitted it.
+    "storage/_write_behind.py": 2,
     "storage/metadata.py": 1,  # telemetry retention never fails clan maintenance
     # storage/incidents.py removed with the ledger it wrote (2026-07-28).
     "storage/leader_actions.py": 2,
-    # rebuild_interpreted manages its own connection instead of using
-    # @managed_connection, so it must reproduce the decorator's rollback/close —
-    # the catch re-raises after rolling back, exactly like the decorator's.
-    "storage/battle_intel.py": 1,
+    # rebuild_interpreted and enrich_battles manage their own connection instead
+    # of using @managed_connection (both commit between chunks), so each must
+    # reproduce the decorator's rollback/close — the catches re-raise after
+    # rolling back, exactly like the decorator's.
+    "storage/battle_intel.py": 2,
+    # The write-behind raw-payload writer (2026-10-16) inherits cr_api's inline
+    # catches: sentinel baseline/observations and game-mode contexts fail soft,
+    # and the batch commit rolls back and re-raises into storage._write_behind's
+    # per-item retry. Nothing here may raise into an API call.
+    "storage/payload_writer.py": 4,
 }
 
 _LOG_CALLS = {"critical", "debug", "error", "exception", "info", "warn", "warning"}
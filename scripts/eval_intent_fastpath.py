@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Replay captured intent-router decisions through the local fast path.
+
+``agent.intent_fastpath`` answers confident messages in-process and sends the
+rest to the LLM router. This measures that trade on real traffic, offline:
+every ``intent_router`` call still holding its prompt in the telemetry
+database is split by time, the model is fitted on the older share, and the
+newer share is replayed in order, as production would meet it. Per confidence
+threshold it reports:
+
+  * coverage — the share of replayed messages answered locally
+  * agreement — of those, how many match the router's route, and its full
+    (route, mode, target_member) label
+  * latency — router milliseconds avoided (the captured ``duration_ms`` of the
+    covered calls) against the local check's cost on every message
+
+Production also sends ``AUDIT_RATE`` of confident messages to the router to
+keep the training set fresh; the report's coverage is before that sample.
+
+No network, no LLM. Results go to ``scripts/intent_fastpath_eval_results.json``.
+
+Usage:
+    uv run --locked python scripts/eval_intent_fastpath.py
+    uv run --locked python scripts/eval_intent_fastpath.py --holdout 0.3 --thresholds 0.9,0.99
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agent import intent_fastpath  # noqa: E402
+
+
+def _replay(model, replayed, threshold: float) -> dict:
+    covered = agree_route = agree_label = 0
+    saved_ms = local_ms = 0.0
+    misses: Counter = Counter()
+    by_history = {False: [0, 0], True: [0, 0]}  # [replayed, covered]
+    for msg in replayed:
+        started = time.perf_counter()
+        decided = intent_fastpath.decide(
+            model,
+            msg.question,
+            workflow=msg.workflow,
+            mentioned=msg.mentioned,
+            allows_open_channel_reply=msg.allows_open_channel_reply,
+            has_history=msg.has_history,
+            threshold=threshold,
+        )
+        local_ms += (time.perf_counter() - started) * 1000
+        by_history[msg.has_history][0] += 1
+        if decided is None:
+            continue
+        label = decided[0]
+        covered += 1
+        by_history[msg.has_history][1] += 1
+        saved_ms += msg.duration_ms or 0.0
+        agree_route += label[0] == msg.route
+        agree_label += label == msg.label
+        if label[0] != msg.route:
+            misses[f"{msg.route} -> {label[0]}"] += 1
+    n = len(replayed)
+    return {
+        "threshold": threshold,
+        "replayed": n,
+        "answered_locally": covered,
+        "coverage": round(covered / n, 4) if n else 0.0,
+        "route_agreement": round(agree_route / covered, 4) if covered else None,
+        "label_agreement": round(agree_label / covered, 4) if covered else None,
+        "router_ms_saved": round(saved_ms),
+        "local_ms_spent": round(local_ms, 1),
+        "net_ms_saved_per_message": round((saved_ms - local_ms) / n, 1) if n else 0.0,
+        "coverage_without_history": _share(*by_history[False]),
+        "coverage_with_history": _share(*by_history[True]),
+        "disagreements": dict(misses.most_common(10)),
+    }
+
+
+def _share(total: int, covered: int):
+    return round(covered / total, 4) if total else None
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument(
+        "--holdout", type=float, default=0.25, help="newest share of decisions to replay"
+    )
+    ap.add_argument("--thresholds", default="0.8,0.9,0.95,0.98,0.99")
+    ap.add_argument("--out", default="scripts/intent_fastpath_eval_results.json")
+    args = ap.parse_args()
+
+    messages = intent_fastpath.load_routed_messages()
+    cut = int(len(messages) * (1 - args.holdout))
+    history, replayed = messages[:cut], messages[cut:]
+    if len(history) < intent_fastpath.MIN_EXAMPLES or not replayed:
+        print(
+            f"{len(messages)} captured router decisions; need {intent_fastpath.MIN_EXAMPLES} "
+            "to fit on plus some to replay",
+            file=sys.stderr,
+        )
+        return 1
+    started = time.perf_counter()
+    model = intent_fastpath.FastPathModel(history)
+    fit_ms = (time.perf_counter() - started) * 1000
+    router_ms = [m.duration_ms for m in replayed if m.duration_ms]
+    results = {
+        "fitted_on": len(history),
+        "fit_ms": round(fit_ms, 1),
+        "labels": len(model.label_counts),
+        "replay_window": [replayed[0].recorded_at, replayed[-1].recorded_at],
+        "router_mean_ms": round(sum(router_ms) / len(router_ms), 1) if router_ms else None,
+        "audit_rate": intent_fastpath.AUDIT_RATE,
+        "by_threshold": [
+            _replay(model, replayed, float(t)) for t in args.thresholds.split(",") if t
+        ],
+    }
+
+    print(
+        f"fitted on {results['fitted_on']} decisions ({results['labels']} labels) in "
+        f"{results['fit_ms']} ms; replaying {len(replayed)} "
+        f"({results['replay_window'][0]} .. {results['replay_window'][1]}), "
+        f"router mean {results['router_mean_ms']} ms\n"
+    )
+    print(f"{'threshold':>9} {'coverage':>9} {'route ok':>9} {'label ok':>9} {'saved/msg':>10}")
+    for row in results["by_threshold"]:
+        print(
+            f"{row['threshold']:>9} {row['coverage']:>9.1%} "
+            f"{row['route_agreement'] if row['route_agreement'] is not None else '-':>9} "
+            f"{row['label_agreement'] if row['label_agreement'] is not None else '-':>9} "
+            f"{row['net_ms_saved_per_message']:>8} ms"
+        )
+        for pair, count in row["disagreements"].items():
+            print(f"{'':>12}{count:>4}  {pair}")
+    Path(args.out).write_text(json.dumps(results, indent=2) + "\n")
+    print(f"\nwrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,8 @@
 Round 1: ask Claude to generate a diverse batch of realistic clan-member questions
 across clan/deck/member-highlight/general categories. Run each through the router.
 Tally: route distribution, low-confidence cases, fallbacks, suspicious choices.
+Calls the LLM router directly (``fast_path=False``), so it measures the prompt,
+not the local classifier in front of it (see eval_intent_fastpath.py).
 
 Run with:  python scripts/eval_intent_router.py [--rounds N] [--per-round N]
 """
@@ -144,6 +146,7 @@ def evaluate_batch(questions: list[dict], *, workflow: str = "interactive") -> l
             workflow=workflow,
             mentioned=True,
             allows_open_channel_reply=False,
+            fast_path=False,
         )
         expected = EXPECTED_ROUTES.get(item["category"], set(ROUTE_KEYS))
         sane = intent.get("route") in expected
@@ -261,6 +264,7 @@ def run_golden() -> int:
             workflow=c["workflow"],
             mentioned=c["mentioned"],
             allows_open_channel_reply=False,
+            fast_path=False,
         )
         route = intent.get("route")
         ok = True
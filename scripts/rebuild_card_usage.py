@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Check or rebuild the daily card-usage rollup (``card_usage_daily``).
+
+The rollup is recomputed from ``battle_card_plays`` by the enrichment job for
+each day a batch touches, and checked (and repaired) by weekly maintenance.
+Schema v39 creates it empty; run this with ``--apply`` once after migrating so
+the clan-wide card views read from it straight away instead of from SQL.
+
+Without ``--apply`` it only compares the rollup with a scan of the plays table
+and prints the drifted days.
+
+Usage:
+    uv run --locked python scripts/rebuild_card_usage.py            # check only
+    uv run --locked python scripts/rebuild_card_usage.py --apply
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import db  # noqa: E402
+from storage import card_usage  # noqa: E402
+
+
+def main() -> int:
+    conn = db.get_connection()
+    try:
+        started = time.perf_counter()
+        if "--apply" in sys.argv:
+            result = card_usage.rebuild_card_usage(conn=conn)
+            conn.commit()
+        else:
+            result = card_usage.check_card_usage(repair=False, conn=conn)
+        result["seconds"] = round(time.perf_counter() - started, 2)
+    finally:
+        conn.close()
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
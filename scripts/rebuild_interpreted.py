@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Fill or restate the derived battle-intelligence layers: deck facts, level gaps
+and per-battle structural tags (``storage.battle_intel.rebuild_interpreted``).
+
+The hourly Stage-B job fills what is missing. After a role-definition or
+formula change, run this with ``--force`` to restate everything already there;
+``--workers`` spreads the level-gap and deck-fact computation over processes.
+It commits chunk by chunk, so the bot can keep running.
+
+Usage:
+    uv run --locked python scripts/rebuild_interpreted.py
+    uv run --locked python scripts/rebuild_interpreted.py --force --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from storage import battle_intel  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--force", action="store_true", help="restate rows already filled")
+    ap.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="processes for --force"
+    )
+    args = ap.parse_args()
+
+    result = battle_intel.rebuild_interpreted(force=args.force, workers=args.workers)
+    result["rows_per_sec"] = {
+        stage: round(result[stage] / seconds) if seconds else None
+        for stage, seconds in result["seconds"].items()
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
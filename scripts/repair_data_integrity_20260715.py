@@ -22,6 +22,7 @@ import argparse
 import json
 import os
 import sys
+import zlib
 from collections import defaultdict
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -32,6 +33,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import db
 from engine.normalize import canonical_utc_timestamp, parse_cr_time
+from storage.payload_codec import PayloadReader
 
 CHICAGO = ZoneInfo("America/Chicago")
 
@@ -169,16 +171,18 @@ def repair_current_player_projection(conn) -> int:
 def _raw_profile_history(conn) -> dict[str, list[tuple[str, int | None, int | None]]]:
     history: dict[str, list[tuple[str, int | None, int | None]]] = defaultdict(list)
     rows = conn.execute(
-        "SELECT entity_key, fetched_at, payload_json FROM raw_api_payloads "
-        "WHERE endpoint = 'player' ORDER BY fetched_at ASC, rowid ASC"
+        "SELECT entity_key, fetched_at, payload_id, payload_codec, payload_json "
+        "FROM raw_api_payloads WHERE endpoint = 'player' ORDER BY fetched_at ASC, rowid ASC"
     ).fetchall()
+    reader = PayloadReader(conn)
     for row in rows:
         when = parse_cr_time(row["fetched_at"])
         if when is None:
             continue
         try:
-            payload = json.loads(row["payload_json"] or "{}")
-        except TypeError, ValueError:
+            text = reader.text(row["payload_id"], row["payload_codec"], row["payload_json"])
+            payload = json.loads(text or "{}")
+        except TypeError, ValueError, LookupError, zlib.error:
             continue
         best = payload.get("bestTrophies")
         exp = payload.get("expLevel")
@@ -25,10 +25,19 @@ Finishes with the season-close rehearsal (scripts/rehearse_season_close.py) on
 the same scratch copy when the latest season is
 still open there, and the global DB invariants (tests/conftest.py).
 
+``--workers N`` runs both passes through engine.replay: the clan-scoped stream
+replays in every worker, each player's payloads in exactly one, each worker on
+its own copy of the scratch DB, and the workers' events and battles merge back
+into the scratch copy in receipt order -- the same rows, ids included, that
+the serial passes write (scripts/bench_replay_parallel.py checks that). The
+workers keep the projections, so the invariants also run on each worker copy;
+a dedup key claimed by two partitions fails the gate.
+
 Usage:
     uv run python scripts/replay_gate.py            # full window since go-live
     uv run python scripts/replay_gate.py --days 3   # recent window only
     uv run python scripts/replay_gate.py --keep     # keep the scratch DB
+    uv run python scripts/replay_gate.py --workers 4  # partitioned replay
 """
 
 from __future__ import annotations
@@ -39,6 +48,7 @@ import sqlite3
 import subprocess
 import sys
 import tempfile
+import time
 from datetime import datetime, timedelta, timezone
 
 _REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -86,6 +96,16 @@ def replay_rows(eng, rows) -> None:
             print(f"  ... {i}/{len(rows)}")
 
 
+def print_partitions(result) -> None:
+    cpu = ", ".join(f"{s:.1f}" for s in result.partition_cpu_seconds)
+    print(
+        f"  {len(result.partition_cpu_seconds)} partitions (cpu {cpu}s); merged "
+        f"{sum(result.merged.values())} signal rows in {result.merge_seconds:.1f}s"
+    )
+    if result.collisions:
+        print(f"  {result.collisions} dedup key(s) claimed by two partitions")
+
+
 def print_event_deltas(conn, rowid_mark: dict) -> None:
     for table in EVENT_TABLES:
         for row in conn.execute(
@@ -112,6 +132,12 @@ def main() -> int:
     )
     ap.add_argument("--keep", action="store_true", help="keep the scratch DB for inspection")
     ap.add_argument("--skip-season-close", action="store_true")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="replay partitions in this many worker processes (default: serial)",
+    )
     args = ap.parse_args()
 
     scratch_dir = args.scratch_dir or tempfile.mkdtemp(prefix="elixir-replay-gate-")
@@ -121,7 +147,10 @@ def main() -> int:
     print(f"snapshot: {args.live_db} -> {scratch}")
     snapshot(args.live_db, scratch)
 
+    from engine.db import connect
     from engine.offline import OfflineEngine
+    from engine.replay import ParallelReplay
+    from storage.payload_codec import PayloadReader
 
     eng = OfflineEngine(scratch)
     conn = eng.conn
@@ -147,17 +176,33 @@ def main() -> int:
     conn.execute("DELETE FROM state_baselines")
     conn.commit()
 
-    rows = conn.execute(
-        """SELECT r.endpoint, r.entity_key, p.payload_json, r.fetched_at
-           FROM api_observation_receipts r
-           JOIN raw_api_payloads p ON p.payload_id = r.payload_id
-           WHERE r.fetched_at >= ?
-           ORDER BY r.fetched_at ASC, r.receipt_id ASC""",
-        (window_start,),
-    ).fetchall()
+    # Bodies may be stored compressed or as battlelog deltas; the reader hands
+    # the engine the same text either way.
+    reader = PayloadReader(conn)
+    rows = [
+        (endpoint, entity_key, reader.text(payload_id, codec, text), fetched_at)
+        for endpoint, entity_key, payload_id, codec, text, fetched_at in conn.execute(
+            """SELECT r.endpoint, r.entity_key, p.payload_id, p.payload_codec, p.payload_json,
+                      r.fetched_at
+               FROM api_observation_receipts r
+               JOIN raw_api_payloads p ON p.payload_id = r.payload_id
+               WHERE r.fetched_at >= ?
+               ORDER BY r.fetched_at ASC, r.receipt_id ASC""",
+            (window_start,),
+        )
+    ]
+    replay = ParallelReplay(rows, args.workers, scratch_dir) if args.workers > 1 else None
+    collisions = 0
     print(f"pass 1/2 — historical drift inventory over {len(rows)} payloads...")
-    replay_rows(eng, rows)
-    eng.finish()
+    started = time.perf_counter()
+    if replay is None:
+        replay_rows(eng, rows)
+        eng.finish()
+    else:
+        result = replay.run(conn)
+        print_partitions(result)
+        collisions += result.collisions
+    print(f"  replayed in {time.perf_counter() - started:.1f}s")
     current = counts(conn)
 
     print("\n=== HISTORICAL DRIFT (informational: live history -> current code) ===")
@@ -182,8 +227,15 @@ def main() -> int:
     conn.execute("DELETE FROM state_baselines")
     conn.commit()
     print(f"\npass 2/2 — current-code idempotence over {len(rows)} payloads...")
-    replay_rows(eng, rows)
-    eng.finish()
+    started = time.perf_counter()
+    if replay is None:
+        replay_rows(eng, rows)
+        eng.finish()
+    else:
+        result = replay.run(conn, reset_baselines=True)
+        print_partitions(result)
+        collisions += result.collisions
+    print(f"  replayed in {time.perf_counter() - started:.1f}s")
     after = counts(conn)
 
     print("\n=== IDEMPOTENCE DELTAS (must all be zero) ===")
@@ -199,11 +251,19 @@ def main() -> int:
     gates["second-pass new events == 0"] = new_events == 0
     gates["new battle rows == 0"] = after["battle_events"] == before["battle_events"]
     gates["new awareness posts == 0"] = after["awareness_posts"] == before["awareness_posts"]
+    if replay is not None:
+        gates["replay partitions independent"] = collisions == 0
 
     try:
         from tests.conftest import assert_db_invariants
 
         assert_db_invariants(conn, label="replay gate")
+        for n, path in enumerate(replay.paths if replay else ()):
+            worker = connect(path)
+            try:
+                assert_db_invariants(worker, label=f"replay gate worker {n}")
+            finally:
+                worker.close()
         gates["global DB invariants"] = True
     except AssertionError as exc:
         print(f"\n{exc}")
@@ -273,8 +333,12 @@ def main() -> int:
         ok = ok and v
     if args.keep or not ok:
         print(f"\nscratch DB kept at {scratch}")
+        if replay is not None:
+            print(f"worker DBs kept in {scratch_dir}")
     else:
         os.remove(scratch)
+        if replay is not None:
+            replay.remove()
     return 0 if ok else 1
 
 
@@ -18,6 +18,10 @@ The world it simulates (deterministic; no randomness):
   - two players fighting war battles on battle days (battlelog + race
     participants stay consistent)
   - donations accruing across the week
+  - API latency and throttling: every fake call records a synthetic duration
+    (--latency-ms, deterministic jitter), and for two hours of one battle day
+    (--throttle-day) every call is answered 429 with a Retry-After before the
+    retry succeeds — the samples runtime.status keeps for the live planner
 
 What it gates:
   - zero step errors across every tick (the _guard counters)
@@ -27,6 +31,9 @@ What it gates:
   - membership events fire exactly once each and the awareness read sees the
     hard-post event stream
   - training-day race polling is hourly, battle-day polling every tick
+  - the adaptive poll budget: baseline on training days, grown on battle days
+    with headroom, shrunk under the throttle episode and recovered after it,
+    with every member's fairness floors held throughout
   - war_participation accrues fame for the fighters and nobody else
   - the production path raises no legacy recognition claims, the retired
     delivery queue is absent, and global DB invariants hold
@@ -43,6 +50,7 @@ import json
 import os
 import sys
 import tempfile
+import zlib
 from datetime import datetime, timedelta
 
 _REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -70,7 +78,16 @@ LEAVER = "#SIM00005"
 class SimWorld:
     """Deterministic state machine serving CR-shaped payloads for a sim time."""
 
-    def __init__(self, start: datetime, reset_hh: int, reset_mm: int):
+    def __init__(
+        self,
+        start: datetime,
+        reset_hh: int,
+        reset_mm: int,
+        *,
+        latency_ms: float = 350.0,
+        throttle_day: int = 4,
+        pressure_window: float = 3600.0,
+    ):
         from tests.conftest import load_cr_fixture
 
         self.player_fixture = load_cr_fixture("player_plain")
@@ -82,6 +99,13 @@ class SimWorld:
             hour=reset_hh, minute=reset_mm, second=0, microsecond=0
         ) - timedelta(days=1)
         self.race_calls_by_day: dict[int, int] = {}
+        self.latency_ms = latency_ms
+        self.throttle_day = throttle_day
+        self.pressure_window = pressure_window
+        # (sim_at, endpoint, duration_ms, status_code, retry_after) — the
+        # runtime.status sample shape; list.append is safe from fetch workers
+        self.api_samples: list[tuple] = []
+        self.polls: dict[tuple[str, str], list[datetime]] = {}
 
     # --- world clock -----------------------------------------------------
     def day_index(self) -> int:
@@ -141,8 +165,37 @@ class SimWorld:
             return 0  # new section — race fame resets
         return 225 * sum(self._decks_by(tag, p) for p in range(3, 7))
 
+    # --- latency / throttle model -------------------------------------------
+    def throttled(self) -> bool:
+        """Two hours of the throttle day, starting 5 h after its reset."""
+        if self.throttle_day < 0:
+            return False
+        opens = self.period_start(self.throttle_day) + timedelta(hours=5)
+        return opens <= self.now < opens + timedelta(hours=2)
+
+    def _call(self, endpoint: str, tag: str = "") -> None:
+        at = self.now.timestamp()
+        jitter = zlib.crc32(f"{endpoint}{tag}{at}".encode()) % 100 / 100.0
+        duration = self.latency_ms * (0.6 + jitter)  # 0.6x-1.6x
+        if self.throttled():
+            # cr_api records the 429 with its Retry-After, then the retry lands
+            self.api_samples.append((at, endpoint, duration / 4, 429, 5.0))
+        self.api_samples.append((at, endpoint, duration, 200, None))
+        if tag:
+            self.polls.setdefault((endpoint, tag), []).append(self.now)
+
+    def api_pressure(self) -> dict:
+        """runtime.status.api_pressure over the sim clock."""
+        from runtime.status import summarize_api_samples
+
+        cutoff = self.now.timestamp() - self.pressure_window
+        return summarize_api_samples(
+            [s for s in self.api_samples if s[0] >= cutoff], self.pressure_window
+        )
+
     # --- CR-shaped payloads (the fake cr_api) ------------------------------
     def get_clan(self):
+        self._call("clan")
         return {
             "tag": HOME,
             "name": "SIM KINGS",
@@ -166,6 +219,7 @@ class SimWorld:
         }
 
     def get_current_war(self):
+        self._call("currentriverrace")
         d = self.day_index()
         self.race_calls_by_day[d] = self.race_calls_by_day.get(d, 0) + 1
         period_type = "training" if (d % 7) < 3 else "warDay"
@@ -211,6 +265,7 @@ class SimWorld:
         }
 
     def get_player(self, tag):
+        self._call("player", tag)
         p = dict(self.player_fixture)
         p.update(
             {
@@ -234,6 +289,7 @@ class SimWorld:
         return p
 
     def get_player_battle_log(self, tag):
+        self._call("player_battlelog", tag)
         if tag not in FIGHTERS:
             return []
         battles = []
@@ -266,6 +322,13 @@ def main() -> int:
         help="skewed daily reset hour (HH:MM UTC) — the drift learning",
     )
     ap.add_argument("--tick-minutes", type=int, default=30)
+    ap.add_argument("--latency-ms", type=float, default=350.0, help="median fake API call duration")
+    ap.add_argument(
+        "--throttle-day",
+        type=int,
+        default=4,
+        help="period (0-based, 3-6 are battle days) with a 2 h 429 episode; -1 for none",
+    )
     ap.add_argument("--keep", action="store_true")
     args = ap.parse_args()
 
@@ -296,7 +359,14 @@ def main() -> int:
     )
     conn.commit()
 
-    world = SimWorld(start, reset_hh, reset_mm)
+    world = SimWorld(
+        start,
+        reset_hh,
+        reset_mm,
+        latency_ms=args.latency_ms,
+        throttle_day=args.throttle_day,
+        pressure_window=2 * args.tick_minutes * 60.0,
+    )
     # freeze the Chicago day to sim time (calendar emitter, rollups)
     tick_mod.chicago_today = lambda: (world.now - timedelta(hours=5)).strftime("%Y-%m-%d")
 
@@ -306,6 +376,7 @@ def main() -> int:
         f"from {args.start} (reset {args.reset}Z) into {db_path}"
     )
     errors = []
+    sizing = []  # (period, throttled, poll_budget, reason) per tick
     for i in range(ticks):
         world.now = start + timedelta(minutes=args.tick_minutes * i)
         counters = tick_mod.run_tick(
@@ -318,6 +389,14 @@ def main() -> int:
             for k, v in counters.items()
             if k.endswith("_error")
         )
+        sizing.append(
+            (
+                world.day_index(),
+                world.throttled(),
+                counters.get("poll_budget"),
+                counters.get("poll_budget_reason"),
+            )
+        )
     end = world.now
 
     # --- gates -------------------------------------------------------------
@@ -397,6 +476,40 @@ def main() -> int:
         ).fetchone()[0]
         g["week_finished emitted at section rollover"] = wf == 1
 
+    from engine import polling
+
+    base = polling.POLL_BUDGET_PER_TICK
+    # A period's first tick plans on the clock the previous one left (the
+    # tick reads its clock before polling the race), so judge from the second.
+    settled = [row for prev, row in zip(sizing, sizing[1:], strict=False) if prev[0] == row[0]]
+    training = [b for d, t, b, _ in settled if d % 7 < 3 and not t]
+    g["poll budget at baseline on training days"] = bool(training) and set(training) == {base}
+    if args.days >= 4:
+        war = [(b, r) for d, t, b, r in settled if 3 <= d % 7 and not t]
+        g["poll budget grows on battle days with headroom"] = any(
+            r == "battle_day" and b > base for b, r in war
+        )
+    episode = [i for i, (_d, t, _b, _r) in enumerate(sizing) if t]
+    if episode:
+        # the first throttled tick plans before it has seen a 429
+        hit = [sizing[i] for i in episode[1:]]
+        after = sizing[episode[-1] + 1 :]
+        recovered = after[3] if len(after) > 3 else None  # window (2 ticks) drained
+        g["poll budget shrinks under throttling and recovers"] = (
+            bool(hit)
+            and all(b <= base // 2 and r == "throttled" for _d, _t, b, r in hit)
+            and (recovered is None or recovered[2] >= base)
+        )
+    floors_ok = True
+    for (endpoint, tag), seen in world.polls.items():
+        cadence = polling.CADENCE["battlelog" if endpoint == "player_battlelog" else "profile"]
+        floor = timedelta(minutes=cadence["floor"] + args.tick_minutes)
+        gaps = [b - a for a, b in zip(seen, seen[1:], strict=False)]
+        if gaps and max(gaps) > floor:
+            print(f"  floor missed: {endpoint} {tag} gap {max(gaps)}")
+            floors_ok = False
+    g["fairness floors held under every budget"] = floors_ok and bool(world.polls)
+
     g["retired delivery queue absent"] = (
         conn.execute(
             "SELECT 1 FROM sqlite_master WHERE type='table' AND name='communication_intents'"
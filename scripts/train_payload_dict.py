@@ -0,0 +1,137 @@
+"""Train the zlib preset dictionary for raw_api_payloads (storage.payload_codec).
+
+zlib has no trainer of its own: a preset dictionary is just up to 32 KB of
+bytes the compressor may back-reference before the body starts. What earns a
+place there is the text that recurs ACROSS payloads -- the key skeleton of a
+battle, a member, a card, a river-race participant -- which a single body
+cannot reference until it has spelled it out once itself.
+
+This is a small greedy cover, after zstd's COVER trainer: every sample (each
+fixture, and each record inside its top-level lists) votes once for each
+``--kmer``-byte substring it contains; candidate segments are scored by the
+votes of the k-mers they cover that no chosen segment covers yet; the best are
+taken until ``--size`` bytes. The strongest segments go LAST, nearest the
+body, where zlib's back-references are cheapest.
+
+Samples are the recorded responses in tests/fixtures/cr, serialized exactly as
+db._store_raw_payload writes them. The output is deterministic.
+
+A dictionary is frozen once rows have been written with it: retrain to a NEW
+version (``--out storage/payload_dict_v2.bin``), register it in
+payload_codec._DICTIONARIES, and point DICTIONARY_VERSION at it; rows keep
+decoding with the version they name.
+
+Usage:
+    uv run python scripts/train_payload_dict.py --check
+    uv run python scripts/train_payload_dict.py --out storage/payload_dict_v1.bin
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import heapq
+import json
+import os
+import sys
+from collections import Counter
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO)
+
+FIXTURES = os.path.join(_REPO, "tests", "fixtures", "cr")
+
+
+def _dumps(value) -> bytes:
+    from db import _json_or_none
+
+    return _json_or_none(value).encode()
+
+
+def samples(fixtures_dir: str = FIXTURES) -> list[bytes]:
+    """Every fixture body, plus each dict record in its lists one and two levels down."""
+    out: list[bytes] = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, "*.json"))):
+        with open(path) as f:
+            payload = json.load(f)
+        out.append(_dumps(payload))
+        tops = payload if isinstance(payload, list) else list(payload.values())
+        for top in tops:
+            records = top if isinstance(top, list) else [top]
+            for record in records:
+                if not isinstance(record, dict):
+                    continue
+                out.append(_dumps(record))
+                for value in record.values():
+                    if isinstance(value, list):
+                        out.extend(_dumps(v) for v in value if isinstance(v, dict))
+    return out
+
+
+def train(corpus: list[bytes], *, size: int, kmer: int, segment: int) -> bytes:
+    votes: Counter = Counter()
+    for sample in corpus:
+        votes.update({sample[i : i + kmer] for i in range(len(sample) - kmer + 1)})
+
+    candidates: dict[bytes, set[bytes]] = {}
+    step = segment // 2
+    for sample in corpus:
+        for start in range(0, max(1, len(sample) - segment + 1), step):
+            seg = sample[start : start + segment]
+            if seg not in candidates:
+                candidates[seg] = {seg[i : i + kmer] for i in range(len(seg) - kmer + 1)}
+
+    def score(kmers: set[bytes]) -> int:
+        # Only what recurs is worth a byte; a k-mer seen in one sample is noise.
+        return sum(votes[k] for k in kmers if votes[k] > 1)
+
+    # Lazy greedy: a popped score may be stale (its k-mers got covered since);
+    # re-score and push back unless it still beats the next best.
+    heap = [(-score(kmers), seg) for seg, kmers in candidates.items()]
+    heapq.heapify(heap)
+    chosen: list[bytes] = []
+    total = 0
+    while heap and total < size:
+        neg, seg = heapq.heappop(heap)
+        fresh = score(candidates[seg])
+        if fresh <= 0:
+            continue
+        if heap and fresh < -heap[0][0]:
+            heapq.heappush(heap, (-fresh, seg))
+            continue
+        chosen.append(seg)
+        total += len(seg)
+        for k in candidates[seg]:
+            votes[k] = 0
+    # Best first out of the heap; zlib wants the best nearest the body.
+    return b"".join(reversed(chosen))[-size:]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--size", type=int, default=16 * 1024, help="dictionary bytes (max 32768)")
+    ap.add_argument("--kmer", type=int, default=8)
+    ap.add_argument("--segment", type=int, default=64)
+    ap.add_argument("--out", help="write the dictionary here")
+    ap.add_argument("--check", action="store_true", help="compare with the shipped dictionary")
+    args = ap.parse_args()
+
+    corpus = samples()
+    zdict = train(corpus, size=min(args.size, 32 * 1024), kmer=args.kmer, segment=args.segment)
+    print(f"{len(corpus)} samples -> {len(zdict)} byte dictionary")
+    if args.out:
+        with open(args.out, "wb") as f:
+            f.write(zdict)
+        print(f"wrote {args.out}")
+    if args.check:
+        from storage import payload_codec
+
+        shipped = payload_codec.dictionary(payload_codec.DICTIONARY_VERSION)
+        same = shipped == zdict
+        print(f"shipped v{payload_codec.DICTIONARY_VERSION}: {'identical' if same else 'DIFFERS'}")
+        return 0 if same else 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
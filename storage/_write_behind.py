@@ -0,0 +1,277 @@
+"""The write-behind queue shared by storage.payload_writer and storage.telemetry_writer.
+
+Both take a SQLite commit off a caller's path the same way. The caller only
+enqueues; one daemon thread drains the queue and commits a batch per
+transaction — up to ``batch_size`` items, or whatever arrived within
+``flush_interval_ms`` of the first one. Consecutive items for the same file
+share a transaction. A batch that fails is retried one item per transaction,
+so one bad item is the only one lost.
+
+:meth:`WriteBehindWriter.flush` is a barrier, not a poll: it returns once
+everything submitted before it is committed or given up on. The queue is
+bounded and a full queue drops the item and counts it. :meth:`close` drains
+the queue at interpreter exit; anything submitted after it is written inline.
+
+A subclass says what an item's transaction is (``_commit``) and which file it
+targets (``_target``). Nothing here raises into a caller.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+log = logging.getLogger("elixir")
+
+
+@dataclass(frozen=True)
+class _Barrier:
+    reached: threading.Event = field(default_factory=threading.Event)
+
+
+_STOP = object()
+
+
+class WriteBehindWriter:
+    # Writer thread name, and the prefix of this writer's log events.
+    thread_name = "elixir-write-behind"
+    event = "write_behind"
+    # Drops are logged on the first and then every Nth, not one warning per item.
+    drop_log_every = 1
+    # Default wait for flush() and close().
+    timeout = 30.0
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        flush_interval_ms: int,
+        max_items: int,
+        put_timeout: float | None = None,
+    ):
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0, int(flush_interval_ms)) / 1000
+        # None: a submit never waits on a full queue.
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(max_items)))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Items queued but not yet committed or given up on; flush() is free at 0.
+        self._unsettled = 0
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 0,
+            "max_queue_depth": 0,
+            "last_batch_size": 0,
+            "last_flush_ms": None,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    # -- subclass hooks ----------------------------------------------------
+
+    def _commit(self, items: list) -> None:
+        """Persist ``items`` in one transaction; raise to have them retried singly."""
+        raise NotImplementedError
+
+    def _target(self, item) -> str:
+        """The database file ``item`` is written to."""
+        raise NotImplementedError
+
+    def _describe(self, item) -> str:
+        """Log detail identifying ``item``."""
+        return ""
+
+    def _given_up(self, item) -> None:
+        """Called once ``item`` is dropped or has failed on its own."""
+
+    def _stopped(self) -> None:
+        """Called on the writer thread as it exits."""
+
+    # -- caller side -------------------------------------------------------
+
+    def _enqueue(self, item) -> bool:
+        """Hand ``item`` to the writer thread; False when it was dropped."""
+        with self._lock:
+            self._stats["submitted"] += 1
+            closed = self._closed
+            if not closed:
+                self._unsettled += 1
+        if closed:
+            # Past shutdown there is no writer to hand off to.
+            self._write_batch([item])
+            return True
+        self._ensure_started()
+        try:
+            if self.put_timeout is None:
+                self._queue.put_nowait(item)
+            else:
+                self._queue.put(item, timeout=self.put_timeout)
+        except queue.Full:
+            with self._lock:
+                self._unsettled -= 1
+                self._stats["dropped"] += 1
+                dropped = self._stats["dropped"]
+            if (dropped - 1) % self.drop_log_every == 0:
+                log.warning(
+                    "%s_write_dropped total=%d depth=%d %s",
+                    self.event,
+                    dropped,
+                    self._queue.qsize(),
+                    self._describe(item),
+                )
+            self._given_up(item)
+            return False
+        depth = self._queue.qsize()
+        with self._lock:
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until everything submitted so far is committed (or given up on)."""
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            if self._unsettled == 0:
+                return True
+            thread = self._thread
+        if thread is None or not thread.is_alive() or thread is threading.current_thread():
+            return False
+        barrier = _Barrier()
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except queue.Full:
+            return False
+        return barrier.reached.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Drain the queue and stop the writer (registered with atexit)."""
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            log.error("%s_writer_close_timeout depth=%d", self.event, self._queue.qsize())
+            return
+        thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = dict(self._stats)
+            running = self._thread is not None and self._thread.is_alive()
+        total_ms = out.pop("total_flush_ms")
+        out["avg_flush_ms"] = round(total_ms / out["batches"], 2) if out["batches"] else None
+        out["queue_depth"] = self._queue.qsize()
+        out["running"] = running
+        return out
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            thread.start()
+            self._thread = thread
+        atexit.register(self.close)
+
+    # -- writer thread -----------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: list = []
+            barriers: list[_Barrier] = []
+            stop = False
+            deadline = None
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, _Barrier):
+                    barriers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+                with self._lock:
+                    self._unsettled -= len(batch)
+            for barrier in barriers:
+                barrier.reached.set()
+            if stop:
+                self._stopped()
+                return
+
+    def _write_batch(self, batch: list) -> None:
+        # Items carry the file they were submitted against; consecutive runs for
+        # the same file share a transaction.
+        start = 0
+        while start < len(batch):
+            end = start + 1
+            target = self._target(batch[start])
+            while end < len(batch) and self._target(batch[end]) == target:
+                end += 1
+            self._write_group(batch[start:end])
+            start = end
+
+    def _write_group(self, items: list) -> None:
+        started = time.perf_counter()
+        written = len(items)
+        try:
+            self._commit(items)
+        except Exception:
+            log.warning(
+                "%s_batch_failed items=%d; retrying one transaction each",
+                self.event,
+                len(items),
+                exc_info=True,
+            )
+            written = 0
+            for item in items:
+                try:
+                    self._commit([item])
+                    written += 1
+                except Exception:
+                    log.warning(
+                        "%s_write_failed %s", self.event, self._describe(item), exc_info=True
+                    )
+                    self._given_up(item)
+                    with self._lock:
+                        self._stats["failed"] += 1
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        with self._lock:
+            stats = self._stats
+            stats["written"] += written
+            stats["batches"] += 1
+            stats["last_batch_size"] = len(items)
+            stats["last_flush_ms"] = elapsed_ms
+            stats["max_flush_ms"] = max(stats["max_flush_ms"], elapsed_ms)
+            stats["total_flush_ms"] += elapsed_ms
@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 import sqlite3
 import threading
+import zlib
 
 from db import _json_or_none, _utcnow, managed_connection
+from storage.payload_codec import PayloadReader
 
 
 def _json_kind(value) -> str:
@@ -311,16 +313,19 @@ def bootstrap_api_sentinel_baseline(conn=None) -> dict:
 
     rows = conn.execute(
         """
-        SELECT endpoint, entity_key, payload_json
+        SELECT endpoint, entity_key, payload_id, payload_codec, payload_json
         FROM raw_api_payloads
         ORDER BY fetched_at ASC, payload_id ASC
         """
     ).fetchall()
+    reader = PayloadReader(conn)
     observation_count = 0
     for row in rows:
         try:
-            payload = json.loads(row["payload_json"])
-        except TypeError, ValueError, json.JSONDecodeError:
+            payload = json.loads(
+                reader.text(row["payload_id"], row["payload_codec"], row["payload_json"])
+            )
+        except TypeError, ValueError, LookupError, zlib.error:
             continue
         observation_count += len(
             _record_api_sentinel_observations(
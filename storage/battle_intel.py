@@ -2,11 +2,12 @@
 
 Extracts ``battle_card_plays`` (both sides, form-aware) and computed
 ``battle_enrichment`` rows for 1v1 battles, clan-wide, no model. Idempotent
-(``INSERT OR IGNORE`` on dedup-keyed PKs) and self-catching-up: it processes
-battles that lack a ``battle_enrichment`` row, so the 15-minute job and the
-one-time backfill are the SAME operation at different batch sizes, and a re-run
-or an overlap is a no-op. Duels (``rounds_json``) and 2v2 (``teammate_tag``)
-get no rows.
+(``INSERT OR IGNORE`` on dedup-keyed PKs) and self-catching-up: the 15-minute
+job reads forward from a rowid cursor over battle_events (``stream_cursors``)
+plus a short look-back, the backfill sweeps every battle lacking a
+``battle_enrichment`` row, and a re-run or an overlap is a no-op. Duels
+(``rounds_json``) and 2v2 (``teammate_tag``) get no rows. Each chunk also
+recomputes the ``card_usage_daily`` days it added plays to (storage.card_usage).
 
 Keys are ``battle_events.dedup_key`` verbatim (the v25/v26 lesson).
 """
@@ -15,7 +16,8 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from db import managed_connection
@@ -26,6 +28,7 @@ from engine.battle_metrics import (
     level_gap,
 )
 from engine.deck_hash import _identity_pairs, deck_hash
+from storage import card_usage, deck_index
 
 
 def _now() -> str:
@@ -74,126 +77,263 @@ def _card_play_rows(row: sqlite3.Row, side: str, cards: list[dict]) -> list[tupl
     ]
 
 
-# Only clean 1v1 battles with an exactly-8-card member deck are enriched. The
-# json_array_length filter excludes 12-card boat payloads and any non-8 shape in
-# SQL, so they never clog the self-catching-up scan (which finds battles lacking
-# an enrichment row). Duels/2v2 are already excluded by rounds_json/teammate_tag.
-_UNENRICHED_SQL = """
-    SELECT b.dedup_key, b.player_tag, b.battle_time, b.outcome, b.mode_group,
-           b.is_competitive, b.is_ranked, b.deck_json, b.opponent_deck_json,
-           b.elixir_leaked, b.opponent_elixir_leaked,
-           b.king_tower_hp, b.princess_towers_hp_json,
-           b.opponent_king_tower_hp, b.opponent_princess_towers_hp_json
+# The enrichment cursor: the highest battle_events rowid the forward pass has
+# read past, kept in stream_cursors and advanced in each chunk's own transaction.
+ENRICH_CURSOR_KEY = "battle_intel:enrichment"
+
+# How far back, by battle_time, each run looks BEHIND the cursor. A battle first
+# mirrored thin (an interactive refresh with no deck) gets its deck_json from the
+# enrich-on-dedup UPDATE when a later poll sees it again, which leaves its rowid
+# where it was; battles stay in a member's battlelog for days, not weeks.
+REVISIT_DAYS = 14
+
+_BATTLE_COLUMNS = """
+    b.dedup_key, b.player_tag, b.battle_time, b.outcome, b.mode_group,
+    b.is_competitive, b.is_ranked, b.deck_json, b.opponent_deck_json,
+    b.elixir_leaked, b.opponent_elixir_leaked,
+    b.king_tower_hp, b.princess_towers_hp_json,
+    b.opponent_king_tower_hp, b.opponent_princess_towers_hp_json
+"""
+
+# The forward pass reads every row past the cursor in rowid order — a seek, not a
+# scan — and decides eligibility itself, because the cursor has to move past the
+# rows it skips as well as the ones it enriches. Only clean 1v1 battles with an
+# exactly-8-card member deck are enriched: duels (rounds_json), 2v2
+# (teammate_tag) and 12-card boat payloads never get rows.
+_FORWARD_SQL = f"""
+    SELECT b.rowid,
+           b.teammate_tag IS NULL AND b.rounds_json IS NULL AND b.deck_json IS NOT NULL
+           AND NOT EXISTS (SELECT 1 FROM battle_enrichment e
+                            WHERE e.battle_dedup_key = b.dedup_key) AS pending,
+           {_BATTLE_COLUMNS}
+      FROM battle_events b
+     WHERE b.rowid > ?
+     ORDER BY b.rowid
+     LIMIT ?
+"""
+
+# Behind the cursor: battles since ``?`` still lacking an enrichment row, through
+# the battle_time index. The json_valid guard keeps one malformed deck from
+# failing every run that looks back over it.
+_REVISIT_SQL = f"""
+    SELECT {_BATTLE_COLUMNS}
       FROM battle_events b
       LEFT JOIN battle_enrichment e ON e.battle_dedup_key = b.dedup_key
      WHERE e.battle_dedup_key IS NULL
+       AND b.rowid <= ? AND b.battle_time >= ?
        AND b.teammate_tag IS NULL AND b.rounds_json IS NULL
        AND b.deck_json IS NOT NULL
-       AND json_array_length(b.deck_json) = 8
-     ORDER BY b.observed_at DESC
+       AND CASE WHEN json_valid(b.deck_json) THEN json_array_length(b.deck_json) END = 8
+     ORDER BY b.battle_time DESC
      LIMIT ?
 """
 
+_CP_SQL = (
+    "INSERT OR IGNORE INTO battle_card_plays "
+    "(battle_dedup_key, side, card_id, level, evolution_level, star_level, "
+    " player_tag, battle_time, outcome, mode_group, is_competitive) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_ENRICHMENT_SQL = (
+    "INSERT OR IGNORE INTO battle_enrichment "
+    "(battle_dedup_key, player_tag, battle_time, hp_margin, closeness, "
+    " discipline_delta, level_gap, our_deck_hash, their_deck_hash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _member_deck(deck_json) -> Optional[list]:
+    """The member deck as stored, if it is an 8-element JSON array; else None."""
+    try:
+        cards = json.loads(deck_json) if isinstance(deck_json, str) else deck_json
+    except TypeError, ValueError:
+        return None
+    return cards if isinstance(cards, list) and len(cards) == 8 else None
+
+
+def _enrichment_values(r, raw_deck: list, max_levels: dict, plays: list) -> tuple:
+    """One battle's battle_enrichment row; its card plays are appended to ``plays``."""
+    member_cards = [c for c in raw_deck if isinstance(c, dict)]
+    if len(member_cards) != 8:
+        # Defensive: 8-element JSON but a non-dict card. Mark it processed with
+        # NULL metrics so it is never re-scanned (no backfill clog).
+        return (
+            r["dedup_key"],
+            r["player_tag"],
+            r["battle_time"],
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+    opp_cards = _parse_deck(r["opponent_deck_json"])  # [] if absent/duel-shaped
+    their_cards = opp_cards if len(opp_cards) == 8 else None
+    plays.extend(_card_play_rows(r, "member", member_cards))
+    if their_cards:
+        plays.extend(_card_play_rows(r, "opponent", their_cards))
+    margin = hp_margin(
+        r["king_tower_hp"],
+        r["princess_towers_hp_json"],
+        r["opponent_king_tower_hp"],
+        r["opponent_princess_towers_hp_json"],
+    )
+    return (
+        r["dedup_key"],
+        r["player_tag"],
+        r["battle_time"],
+        margin,
+        closeness_band(margin),
+        discipline_delta(r["opponent_elixir_leaked"], r["elixir_leaked"]),
+        level_gap(member_cards, their_cards, is_ranked=bool(r["is_ranked"]), max_levels=max_levels),
+        deck_hash(member_cards),
+        deck_hash(their_cards) if their_cards else None,
+    )
+
+
+def _write_chunk(conn, battles: list[tuple], max_levels: dict) -> int:
+    """Enrich ``(row, raw member deck)`` pairs with one executemany per table, then
+    recompute the card-usage days they added plays to in the same transaction, so
+    the rollup never disagrees with the plays it counts. Returns plays inserted."""
+    if not battles:
+        return 0
+    plays: list[tuple] = []
+    values = [_enrichment_values(r, raw, max_levels, plays) for r, raw in battles]
+    before = conn.total_changes
+    conn.executemany(_CP_SQL, plays)
+    card_plays = conn.total_changes - before
+    conn.executemany(_ENRICHMENT_SQL, values)
+    if card_plays:
+        card_usage.fold_battles(conn, {p[7] for p in plays})
+    return card_plays
+
+
+def _enrichment_cursor(conn) -> int:
+    row = conn.execute(
+        "SELECT cursor_int FROM stream_cursors WHERE consumer_key = ? AND scope_key = ''",
+        (ENRICH_CURSOR_KEY,),
+    ).fetchone()
+    return int(row[0]) if row is not None and row[0] is not None else 0
+
+
+def _set_enrichment_cursor(conn, rowid: int) -> None:
+    conn.execute(
+        "INSERT INTO stream_cursors (consumer_key, scope_key, cursor_int, updated_at) "
+        "VALUES (?, '', ?, ?) ON CONFLICT(consumer_key, scope_key) DO UPDATE SET "
+        "cursor_int = excluded.cursor_int, updated_at = excluded.updated_at",
+        (ENRICH_CURSOR_KEY, rowid, _now()),
+    )
+
+
+def _enrich(conn, limit: int, *, since: str, checkpoint) -> dict:
+    """Forward pass from the cursor, then the look-back to ``since`` with what is
+    left of ``limit``. Each chunk of up to WRITE_CHUNK rows is written, the cursor
+    moved and ``checkpoint`` called before the next is read. ``scanned`` counts
+    the rows read, enriched or not."""
+    max_levels = _card_max_levels(conn)
+    cursor = _enrichment_cursor(conn)
+    enriched = card_plays = scanned = 0
+    while enriched < limit:
+        rows = conn.execute(_FORWARD_SQL, (cursor, WRITE_CHUNK)).fetchall()
+        if not rows:
+            break
+        scanned += len(rows)
+        battles = []
+        for r in rows:
+            cursor = r["rowid"]
+            raw = _member_deck(r["deck_json"]) if r["pending"] else None
+            if raw is not None:
+                battles.append((r, raw))
+                if enriched + len(battles) == limit:
+                    break
+        card_plays += _write_chunk(conn, battles, max_levels)
+        enriched += len(battles)
+        _set_enrichment_cursor(conn, cursor)
+        checkpoint()
+        if len(rows) < WRITE_CHUNK:
+            break
+    while enriched < limit:
+        rows = conn.execute(
+            _REVISIT_SQL, (cursor, since, min(WRITE_CHUNK, limit - enriched))
+        ).fetchall()
+        scanned += len(rows)
+        battles = [(r, raw) for r in rows if (raw := _member_deck(r["deck_json"])) is not None]
+        card_plays += _write_chunk(conn, battles, max_levels)
+        enriched += len(battles)
+        checkpoint()
+        # Every selected row gets an enrichment row, so a short page is the end.
+        if len(rows) < WRITE_CHUNK:
+            break
+    return {"enriched": enriched, "card_plays": card_plays, "scanned": scanned}
+
 
-@managed_connection
 def enrich_battles(limit: int = 500, *, conn: Optional[sqlite3.Connection] = None) -> dict:
     """Process up to ``limit`` un-enriched 1v1 battles. Returns work-set counts
     for job telemetry: a caught-up run reports ``enriched=0`` distinctly from a
-    broken one. Runs in one transaction (the decorator commits)."""
-    limit = max(1, min(int(limit or 500), 20000))
-    rows = conn.execute(_UNENRICHED_SQL, (limit,)).fetchall()
-    max_levels = _card_max_levels(conn)
+    broken one.
 
-    _CP_SQL = (
-        "INSERT OR IGNORE INTO battle_card_plays "
-        "(battle_dedup_key, side, card_id, level, evolution_level, star_level, "
-        " player_tag, battle_time, outcome, mode_group, is_competitive) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
-    )
-    card_plays = 0
-    enriched = 0
-    for r in rows:
-        member_cards = _parse_deck(r["deck_json"])
-        opp_cards = _parse_deck(r["opponent_deck_json"])  # [] if absent/duel-shaped
-        their_cards = opp_cards if len(opp_cards) == 8 else None
-
-        if len(member_cards) == 8:  # SQL guarantees 8 elements; guards a non-dict element
-            before = conn.total_changes
-            conn.executemany(_CP_SQL, _card_play_rows(r, "member", member_cards))
-            if their_cards:
-                conn.executemany(_CP_SQL, _card_play_rows(r, "opponent", their_cards))
-            card_plays += conn.total_changes - before
-            margin = hp_margin(
-                r["king_tower_hp"],
-                r["princess_towers_hp_json"],
-                r["opponent_king_tower_hp"],
-                r["opponent_princess_towers_hp_json"],
-            )
-            values = (
-                r["dedup_key"],
-                r["player_tag"],
-                r["battle_time"],
-                margin,
-                closeness_band(margin),
-                discipline_delta(r["opponent_elixir_leaked"], r["elixir_leaked"]),
-                level_gap(
-                    member_cards,
-                    their_cards,
-                    is_ranked=bool(r["is_ranked"]),
-                    max_levels=max_levels,
-                ),
-                deck_hash(member_cards),
-                deck_hash(their_cards) if their_cards else None,
-            )
-        else:
-            # Defensive: 8-element JSON but a non-dict card. Mark it processed with
-            # NULL metrics so it is never re-scanned (no backfill clog).
-            values = (
-                r["dedup_key"],
-                r["player_tag"],
-                r["battle_time"],
-                None,
-                None,
-                None,
-                None,
-                None,
-                None,
-            )
+    Work is found from the enrichment cursor forward (oldest unread rowid first),
+    then among the last REVISIT_DAYS of battles behind it. The old work-set query
+    anti-joined the whole of battle_events and sorted it on every 15-minute run,
+    and the cost of finding nothing grew with retention.
 
-        conn.execute(
-            "INSERT OR IGNORE INTO battle_enrichment "
-            "(battle_dedup_key, player_tag, battle_time, hp_margin, closeness, "
-            " discipline_delta, level_gap, our_deck_hash, their_deck_hash) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            values,
-        )
-        enriched += 1
+    Not @managed_connection, for the reason ``rebuild_interpreted`` gives: when it
+    owns the connection it commits after every chunk, cursor included, so the
+    single writer is handed back between chunks and an interrupted run resumes
+    where it stopped. A BORROWED connection is never committed.
+    """
+    from db import get_connection
 
-    return {"enriched": enriched, "card_plays": card_plays, "scanned": len(rows)}
+    limit = max(1, min(int(limit or 500), 20000))
+    owns = conn is None
+    conn = conn or get_connection()
+    since = (datetime.now(timezone.utc) - timedelta(days=REVISIT_DAYS)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+    try:
+        return _enrich(
+            conn, limit, since=since, checkpoint=conn.commit if owns else _noop_checkpoint
+        )
+    except Exception:
+        if owns:
+            conn.rollback()
+        raise
+    finally:
+        if owns:
+            conn.close()
 
 
 def backfill(*, batch: int = 2000, db_path: Optional[str] = None) -> dict:
-    """One-time backfill: loop ``enrich_battles`` in bounded, self-committing
-    batches until no un-enriched 1v1 battles remain. Bounded chunks keep each
-    transaction small so it never blocks the running bot's WAL for long. Opens
-    its own connections (one per batch) via the ``managed_connection`` default
-    path; pass ``db_path`` only in tests/validation.
+    """Enrich every un-enriched 1v1 battle, wherever it sits relative to the
+    cursor, then park the cursor at the table's last rowid as of the start.
+
+    The one-time backfill, and what weekly maintenance runs after VACUUM: VACUUM
+    may renumber battle_events rowids, which would leave the cursor pointing
+    anywhere. The sweep finds its work by anti-join, not rowid; a battle written
+    after the snapshot is above it and left to the forward pass. Commits every
+    chunk on its own connection; pass ``db_path`` only in tests/validation.
     """
     import db as db_facade
 
+    conn = db_facade.get_connection(db_path) if db_path else db_facade.get_connection()
     totals = {"enriched": 0, "card_plays": 0, "batches": 0}
-    while True:
-        conn = db_facade.get_connection(db_path) if db_path else db_facade.get_connection()
-        try:
-            result = enrich_battles(batch, conn=conn)
-            conn.commit()
-        finally:
-            conn.close()
-        totals["enriched"] += result["enriched"]
-        totals["card_plays"] += result["card_plays"]
-        totals["batches"] += 1
-        if result["scanned"] == 0:  # every scanned battle gets a row, so this terminates
-            break
+    try:
+        high = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM battle_events").fetchone()[0]
+        _set_enrichment_cursor(conn, high)
+        while True:
+            # Everything up to ``high`` is behind the cursor now, so a look-back
+            # to the beginning of time is the whole sweep.
+            result = _enrich(conn, batch, since="", checkpoint=conn.commit)
+            totals["enriched"] += result["enriched"]
+            totals["card_plays"] += result["card_plays"]
+            totals["batches"] += 1
+            if result["enriched"] < batch:
+                break
+        conn.commit()
+    finally:
+        conn.close()  # closing discards an interrupted chunk; committed ones stand
     return totals
 
 
@@ -277,6 +417,8 @@ def rebuild_deck_intel(*, conn: Optional[sqlite3.Connection] = None) -> dict:
     matchup measured ~3 points once adjusted for who plays which archetype, against
     22 for card levels, so it was a confident number in front of members that said
     almost nothing."""
+    # New rows reach the buildable-deck index (storage.deck_index) through its rowid
+    # high-water check on the next lookup; an insert-only pass needs no signal.
     profiled = _profile_new_decks(conn)
     return {"profiled": profiled}
 
@@ -297,15 +439,12 @@ def _card_facts_map(conn) -> dict:
     return {(r["card_id"], r["evolution_level"] or 0): dict(r) for r in rows}
 
 
-def _deck_card_facts(conn, deck_hash: str, facts: dict) -> list[dict]:
-    """The 8 cards' facts for a deck, via its stored (card_id, evolution_level) set."""
-    row = conn.execute(
-        "SELECT cards_json FROM deck_profile WHERE deck_hash = ?", (deck_hash,)
-    ).fetchone()
-    if not row or not row["cards_json"]:
+def _pair_facts(cards_json, facts: dict) -> list[dict]:
+    """The facts of a deck's stored (card_id, evolution_level) pairs."""
+    if not cards_json:
         return []
     try:
-        pairs = json.loads(row["cards_json"])
+        pairs = json.loads(cards_json)
     except TypeError, ValueError:
         return []
     out = []
@@ -318,35 +457,12 @@ def _deck_card_facts(conn, deck_hash: str, facts: dict) -> list[dict]:
     return out
 
 
-def _restate_level_gaps(conn) -> int:
-    """Recompute battle_enrichment.level_gap for every enriched battle.
-
-    level_gap is a stored snapshot of a formula that changed: it used to average
-    rarity-relative API levels, which measured a deck's rarity mix as much as its
-    strength. Without a restatement the correction reaches only battles enriched
-    from here on, leaving 13,000 rows carrying a number that decisive_factor ranks
-    above every other explanation.
-    """
-    max_levels = _card_max_levels(conn)
-    updated = 0
-    rows = conn.execute(
-        "SELECT e.battle_dedup_key, b.deck_json, b.opponent_deck_json, b.is_ranked "
-        "FROM battle_enrichment e JOIN battle_events b ON b.dedup_key = e.battle_dedup_key "
-        "WHERE b.opponent_deck_json IS NOT NULL"
-    ).fetchall()
-    for r in rows:
-        mine, theirs = _parse_deck(r["deck_json"]), _parse_deck(r["opponent_deck_json"])
-        if len(mine) != 8 or len(theirs) != 8:
-            continue
-        conn.execute(
-            "UPDATE battle_enrichment SET level_gap = ? WHERE battle_dedup_key = ?",
-            (
-                level_gap(mine, theirs, is_ranked=bool(r["is_ranked"]), max_levels=max_levels),
-                r["battle_dedup_key"],
-            ),
-        )
-        updated += 1
-    return updated
+def _deck_card_facts(conn, deck_hash: str, facts: dict) -> list[dict]:
+    """The 8 cards' facts for a deck, via its stored (card_id, evolution_level) set."""
+    row = conn.execute(
+        "SELECT cards_json FROM deck_profile WHERE deck_hash = ?", (deck_hash,)
+    ).fetchone()
+    return _pair_facts(row["cards_json"], facts) if row else []
 
 
 def _noop_checkpoint() -> None:
@@ -359,38 +475,111 @@ def _noop_checkpoint() -> None:
 WRITE_CHUNK = 500
 
 
-def _fill_deck_facts(conn, *, restate: bool = False, checkpoint=_noop_checkpoint) -> int:
-    """Compute each deck's completeness counts from its cards' enriched facts.
+def _pages(conn, sql: str):
+    """Stream a restatement's input as lists of plain tuples, WRITE_CHUNK rows at a
+    time. ``sql`` selects a rowid first and takes ``(after_rowid, limit)``; paging
+    on it rather than holding one cursor open lets the caller write and commit
+    between pages without disturbing the read."""
+    last = 0
+    while True:
+        rows = conn.execute(sql, (last, WRITE_CHUNK)).fetchall()
+        if not rows:
+            return
+        last = rows[-1][0]
+        yield [tuple(r)[1:] for r in rows]
+        if len(rows) < WRITE_CHUNK:
+            return
 
-    ``restate`` recomputes every profiled deck rather than only the incomplete ones,
-    and is what a ROLE DEFINITION change needs. The counts are a snapshot of rules
-    that do change: is_air_answer was fixed on 2026-08-01 after big spells were
-    found to be counted as air answers on 10% of the corpus, and without a restate
-    those decks would have carried the inflated count forever behind their own
-    facts_complete=1 stamp. The same trap as the expected_advantage IS NULL guard.
+
+# Set in each pool process by its initializer, so the card tables a restatement
+# needs are pickled once per worker rather than once per page.
+_WORKER_CONTEXT: dict = {}
+
+
+def _init_worker(context: dict) -> None:
+    _WORKER_CONTEXT.update(context)
+
+
+def _in_worker(fn, page: list[tuple]) -> list[tuple]:
+    return fn(page, **_WORKER_CONTEXT)
+
+
+def _computed(fn, pages, context: dict, workers: int):
+    """``fn(page, **context)`` for each page, in page order. With ``workers`` > 1
+    the pure computation runs on a process pool, a bounded number of pages ahead
+    of the writes; the connection never leaves this process."""
+    if workers <= 1:
+        for page in pages:
+            yield fn(page, **context)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(context,)) as pool:
+        inflight: deque = deque()
+        for page in pages:
+            inflight.append(pool.submit(_in_worker, fn, page))
+            if len(inflight) >= 2 * workers:
+                yield inflight.popleft().result()
+        while inflight:
+            yield inflight.popleft().result()
+
+
+def _level_gap_rows(page: list[tuple], max_levels: dict) -> list[tuple]:
+    """``(level_gap, key)`` for each ``(key, deck_json, opponent_deck_json,
+    is_ranked, stored_gap)`` whose recomputed gap differs from the stored one."""
+    out = []
+    for key, deck_json, opponent_json, is_ranked, stored in page:
+        mine, theirs = _parse_deck(deck_json), _parse_deck(opponent_json)
+        if len(mine) != 8 or len(theirs) != 8:
+            continue
+        gap = level_gap(mine, theirs, is_ranked=bool(is_ranked), max_levels=max_levels)
+        if gap != stored:
+            out.append((gap, key))
+    return out
+
+
+def _restate_level_gaps(conn, *, checkpoint=_noop_checkpoint, workers: int = 0) -> int:
+    """Recompute battle_enrichment.level_gap for every enriched battle, writing
+    only the rows whose value changes. Returns rows rewritten.
+
+    level_gap is a stored snapshot of a formula that changed: it used to average
+    rarity-relative API levels, which measured a deck's rarity mix as much as its
+    strength. Without a restatement the correction reaches only battles enriched
+    from here on, leaving 13,000 rows carrying a number that decisive_factor ranks
+    above every other explanation.
     """
+    pages = _pages(
+        conn,
+        "SELECT e.rowid, e.battle_dedup_key, b.deck_json, b.opponent_deck_json, b.is_ranked, "
+        "e.level_gap FROM battle_enrichment e "
+        "JOIN battle_events b ON b.dedup_key = e.battle_dedup_key "
+        "WHERE b.opponent_deck_json IS NOT NULL AND e.rowid > ? ORDER BY e.rowid LIMIT ?",
+    )
+    updated = 0
+    context = {"max_levels": _card_max_levels(conn)}
+    for changed in _computed(_level_gap_rows, pages, context, workers):
+        if changed:
+            conn.executemany(
+                "UPDATE battle_enrichment SET level_gap = ? WHERE battle_dedup_key = ?", changed
+            )
+            updated += len(changed)
+        checkpoint()
+    return updated
+
+
+def _deck_fact_rows(page: list[tuple], facts: dict) -> list[tuple]:
+    """The deck_profile fact columns, then deck_hash, for each ``(deck_hash,
+    cards_json)`` with any enriched card."""
     from engine.card_roles import deck_facts
 
-    facts = _card_facts_map(conn)
-    if not facts:
-        return 0
-    updated = 0
-    # Retry decks marked incomplete, not just never-scored ones. A deck scored while
-    # the card enricher was still running got counts from a partial fact table; without
-    # this it would keep those wrong counts forever, because its own `facts_complete=0`
-    # stamp excluded it from the next pass.
-    rows = conn.execute(
-        "SELECT deck_hash FROM deck_profile"
-        if restate
-        else "SELECT deck_hash FROM deck_profile WHERE facts_complete IS NULL OR facts_complete = 0"
-    ).fetchall()
-    pending: list[tuple] = []
-    for r in rows:
-        card_facts = _deck_card_facts(conn, r["deck_hash"], facts)
+    out = []
+    for deck_hash_, cards_json in page:
+        card_facts = _pair_facts(cards_json, facts)
         if not card_facts:
             continue
         d = deck_facts(card_facts)
-        pending.append(
+        out.append(
             (
                 d["air_answer_count"],
                 d["tank_answer_count"],
@@ -400,14 +589,41 @@ def _fill_deck_facts(conn, *, restate: bool = False, checkpoint=_noop_checkpoint
                 d["has_big_spell"],
                 d["has_small_spell"],
                 d["facts_complete"],
-                r["deck_hash"],
+                deck_hash_,
             )
         )
-        if len(pending) >= WRITE_CHUNK:
-            updated += _flush_deck_facts(conn, pending)
-            checkpoint()
-    updated += _flush_deck_facts(conn, pending)
-    checkpoint()
+    return out
+
+
+def _fill_deck_facts(
+    conn, *, restate: bool = False, checkpoint=_noop_checkpoint, workers: int = 0
+) -> int:
+    """Compute each deck's completeness counts from its cards' enriched facts.
+
+    ``restate`` recomputes every profiled deck rather than only the incomplete ones,
+    and is what a ROLE DEFINITION change needs. The counts are a snapshot of rules
+    that do change: is_air_answer was fixed on 2026-08-01 after big spells were
+    found to be counted as air answers on 10% of the corpus, and without a restate
+    those decks would have carried the inflated count forever behind their own
+    facts_complete=1 stamp. The same trap as the expected_advantage IS NULL guard.
+    """
+    facts = _card_facts_map(conn)
+    if not facts:
+        return 0
+    # Retry decks marked incomplete, not just never-scored ones. A deck scored while
+    # the card enricher was still running got counts from a partial fact table; without
+    # this it would keep those wrong counts forever, because its own `facts_complete=0`
+    # stamp excluded it from the next pass.
+    where = "" if restate else "(facts_complete IS NULL OR facts_complete = 0) AND "
+    pages = _pages(
+        conn,
+        f"SELECT rowid, deck_hash, cards_json FROM deck_profile WHERE {where}rowid > ? "
+        "ORDER BY rowid LIMIT ?",
+    )
+    updated = 0
+    for pending in _computed(_deck_fact_rows, pages, {"facts": facts}, workers):
+        updated += _flush_deck_facts(conn, pending)
+        checkpoint()
     return updated
 
 
@@ -420,6 +636,9 @@ def _flush_deck_facts(conn, pending: list[tuple]) -> int:
         "has_small_spell=?, facts_complete=? WHERE deck_hash=?",
         pending,
     )
+    # The buildable-deck index re-reads these rows until it sees the values
+    # written here, so it tracks the fill without rescanning deck_profile.
+    deck_index.note_fact_updates(conn, ((p[0], p[5], p[6], p[7], p[8]) for p in pending))
     n = len(pending)
     pending.clear()
     return n
@@ -518,7 +737,9 @@ def _flush_battle_tags(conn, pending: list[tuple]) -> int:
     return n
 
 
-def rebuild_interpreted(*, force: bool = False, conn: Optional[sqlite3.Connection] = None) -> dict:
+def rebuild_interpreted(
+    *, force: bool = False, workers: int = 0, conn: Optional[sqlite3.Connection] = None
+) -> dict:
     """v2 Layers 2-3 (all $0): deck facts from enriched card facts, then per-battle
     structural tags. Safe to re-run; fills what is missing, and with ``force`` also
     RESTATES what is already there — which is what a role-definition change needs.
@@ -527,6 +748,10 @@ def rebuild_interpreted(*, force: bool = False, conn: Optional[sqlite3.Connectio
     table gains coverage, because a battle tagged against partial facts looks settled:
     its decks are complete now, so the incremental guard would skip it.
 
+    ``workers`` > 1 computes a forced restatement's level gaps and deck facts on
+    that many processes (scripts/rebuild_interpreted.py); the scheduled job never
+    passes it. ``seconds`` reports each stage's wall time.
+
     **Deliberately NOT @managed_connection.** That decorator makes the whole call one
     transaction, and SQLite has exactly one writer. On 2026-08-03 this held it for
     46.1s across 117,434 statements: every API persist failed with `database is
@@ -543,10 +768,17 @@ def rebuild_interpreted(*, force: bool = False, conn: Optional[sqlite3.Connectio
     owns = conn is None
     conn = conn or get_connection()
     checkpoint = conn.commit if owns else _noop_checkpoint
+    workers = workers if force else 0
+    seconds = {}
     try:
-        gaps = _restate_level_gaps(conn) if force else 0
+        started = time.perf_counter()
+        gaps = _restate_level_gaps(conn, checkpoint=checkpoint, workers=workers) if force else 0
         checkpoint()
-        decks = _fill_deck_facts(conn, restate=force, checkpoint=checkpoint)
+        seconds["level_gaps"] = round(time.perf_counter() - started, 3)
+        started = time.perf_counter()
+        decks = _fill_deck_facts(conn, restate=force, checkpoint=checkpoint, workers=workers)
+        seconds["deck_facts"] = round(time.perf_counter() - started, 3)
+        started = time.perf_counter()
         if force:
             battles = _fill_battle_tags(conn, limit=None, force=True, checkpoint=checkpoint)
         else:
@@ -562,7 +794,13 @@ def rebuild_interpreted(*, force: bool = False, conn: Optional[sqlite3.Connectio
                 if n < _BATTLE_TAG_BATCH:
                     break
         checkpoint()
-        return {"deck_facts": decks, "battle_tags": battles, "level_gaps": gaps}
+        seconds["battle_tags"] = round(time.perf_counter() - started, 3)
+        return {
+            "deck_facts": decks,
+            "battle_tags": battles,
+            "level_gaps": gaps,
+            "seconds": seconds,
+        }
     except Exception:
         if owns:
             conn.rollback()
@@ -0,0 +1,397 @@
+"""Columnar side store over ``battle_card_plays`` for the clan-wide aggregates.
+
+Two battle-intelligence reads group the whole plays table on every call: the
+per-player baseline behind ``player_adjusted_lift`` (every member play, by
+player) and the clan-wide ``nemesis`` ranking (every opponent play, by card
+form). At a year of clan history that is millions of rows through SQLite's
+GROUP BY for a number that changes by a few hundred rows every fifteen minutes.
+
+This keeps those plays in process memory as compact columns, one block per
+``(UTC day, side)``: ``cell`` packs card, form, outcome and the competitive flag
+into one int64, ``who`` packs player and outcome, ``tod`` is the second of the
+day. A block's reduction is ``Counter(column)`` — counted in C and cached until
+the block grows — so a clan-wide read is a fold over per-day counters, and only
+the window's boundary day is filtered row by row.
+
+The SQLite rows stay the source of truth:
+
+  * Sync is by rowid. ``battle_card_plays`` is insert-only (``INSERT OR
+    IGNORE``), so each read loads just the rows past the high water mark; a
+    lower ``MAX(rowid)`` or a moved ``MIN(rowid)`` means rows were deleted and
+    the store is rebuilt, as it is past ``STORE_MAX_AGE``. A delete inside the
+    range moves neither mark; that is the checker's job.
+  * A full build reads the whole table, so it never runs on a read. Stage A
+    of the enrichment job (:func:`refresh_card_play_columns`) and maintenance
+    build it outside the lock; until one has, and while one is running, a read
+    returns None.
+  * Anything the encoding cannot hold exactly (a non-canonical battle_time, an
+    unexpected form level), a connection with uncommitted writes, or an
+    in-memory database returns None, and the caller answers from SQL.
+  * :func:`check_card_play_columns` compares per-day counts, results and card
+    sums against SQLite and rebuilds on any drift. Maintenance runs it after
+    the weekly purge.
+
+The stdlib ``array`` columns pack the same way a per-day BLOB would
+(:meth:`_Block.pack`); they are not written to disk, so there is no second
+durable copy to keep in step — a restart rebuilds in one pass.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter
+from typing import Optional
+
+from db import managed_connection
+
+log = logging.getLogger("elixir.storage.card_play_columns")
+
+STORE_MAX_AGE = 6 * 3600.0  # seconds before a full rebuild, whatever the rowids say
+_STORE_MAX = 2  # one per database file; FIFO beyond that
+_FETCH = 20000
+
+# cell = ((card_id * _FORMS + form) * 3 + outcome) * 2 + competitive
+_FORMS = 16  # form 0 is a NULL evolution_level, n + 1 is level n
+_OUTCOME_SQL = "CASE outcome WHEN 'W' THEN 1 WHEN 'L' THEN 2 ELSE 0 END"  # draws, NULL: 0
+_SIDES = {"member": 0, "opponent": 1}
+_CELL_STRIDE = _FORMS * 3 * 2
+
+_STORES: dict[str, "CardPlayColumns"] = {}
+_BUILDING: set[str] = set()  # paths with a full build in flight
+_LOCK = threading.Lock()
+
+
+def _clear_card_play_columns() -> None:
+    """Test hook to drop every cached store."""
+    with _LOCK:
+        _STORES.clear()
+
+
+def _db_path(conn: sqlite3.Connection) -> str:
+    """The main database file, or "" for an in-memory / temporary database."""
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or ""
+    return ""
+
+
+def _second_of_day(stamp: str) -> Optional[int]:
+    """Seconds into the UTC day for a canonical ``YYYY-MM-DDTHH:MM:SSZ`` stamp,
+    else None. Only that exact shape orders the same as an int and as TEXT."""
+    if len(stamp) != 20 or stamp[10] != "T" or stamp[19] != "Z":
+        return None
+    try:
+        return int(stamp[11:13]) * 3600 + int(stamp[14:16]) * 60 + int(stamp[17:19])
+    except ValueError:
+        return None
+
+
+class _Block:
+    """One UTC day of one side's plays."""
+
+    __slots__ = ("cell", "who", "tod", "_cells")
+
+    def __init__(self):
+        self.cell = array("q")
+        self.who = array("i")
+        self.tod = array("i")
+        self._cells: Optional[Counter] = None
+
+    def cells(self) -> Counter:
+        if self._cells is None:
+            self._cells = Counter(self.cell)
+        return self._cells
+
+    def cells_since(self, second: int) -> Counter:
+        """Cell counts for the plays at or after ``second`` into the day."""
+        return Counter(c for c, t in zip(self.cell, self.tod, strict=True) if t >= second)
+
+    def pack(self) -> bytes:
+        """The block as one BLOB: three little-endian columns, back to back."""
+        return self.cell.tobytes() + self.who.tobytes() + self.tod.tobytes()
+
+
+class CardPlayColumns:
+    """The columnar copy of one database's ``battle_card_plays``. Cached
+    instances are only read or mutated under ``_LOCK``."""
+
+    def __init__(self):
+        self.built_at = time.monotonic()
+        self.min_rowid: Optional[int] = None
+        self.max_rowid = 0
+        self.exact = True
+        self.players: list[str] = []
+        self.player_ix: dict[str, int] = {}
+        self.blocks: dict[tuple[str, int], _Block] = {}
+        self.member_whos: Counter = Counter()  # all time
+        self.opponent_cells: Counter = Counter()  # all time
+
+    def load(self, conn: sqlite3.Connection, *, after_rowid: int = 0) -> int:
+        """Append every row past ``after_rowid``. Returns the rows loaded."""
+        # SQLite does the per-row arithmetic; Python keeps only what varies per
+        # battle. Rows arrive in rowid order, which is insert order, so a battle's
+        # sixteen plays come through together and share one lookup.
+        cur = conn.execute(
+            "SELECT rowid, side, player_tag, battle_time, evolution_level, "
+            f"((card_id * {_FORMS} + COALESCE(evolution_level + 1, 0)) * 3 + {_OUTCOME_SQL}) * 2 "
+            f"+ (is_competitive IS 1), {_OUTCOME_SQL} "
+            "FROM battle_card_plays WHERE rowid > ? ORDER BY rowid",
+            (after_rowid,),
+        )
+        blocks, player_ix, players = self.blocks, self.player_ix, self.players
+        loaded = 0
+        last = block = pix = second = None
+        while rows := cur.fetchmany(_FETCH):
+            member_whos, opponent_cells = [], []
+            for _rowid, side, tag, stamp, evo, cell, code in rows:
+                if (side, tag, stamp) != last:
+                    last = (side, tag, stamp)
+                    second = _second_of_day(stamp)
+                    pix = player_ix.get(tag)
+                    if pix is None:
+                        pix = player_ix[tag] = len(players)
+                        players.append(tag)
+                    block = blocks.get((stamp[:10], _SIDES[side]))
+                    if block is None:
+                        block = blocks[(stamp[:10], _SIDES[side])] = _Block()
+                    block._cells = None
+                if second is None or (evo is not None and not 0 <= evo < _FORMS - 1):
+                    self.exact = False
+                    continue
+                who = pix * 3 + code
+                block.cell.append(cell)
+                block.who.append(who)
+                block.tod.append(second)
+                if side == "member":
+                    member_whos.append(who)
+                else:
+                    opponent_cells.append(cell)
+            self.member_whos.update(member_whos)
+            self.opponent_cells.update(opponent_cells)
+            if self.min_rowid is None:
+                self.min_rowid = rows[0][0]
+            self.max_rowid = rows[-1][0]
+            loaded += len(rows)
+        return loaded
+
+    def baselines(self) -> dict[str, tuple[int, int]]:
+        """Every member's all-time ``(wins, losses)`` over member plays."""
+        out: dict[str, list[int]] = {}
+        players = self.players
+        for who, n in self.member_whos.items():
+            pix, code = divmod(who, 3)
+            entry = out.setdefault(players[pix], [0, 0])  # all draws is still a (0, 0) row
+            if code:
+                entry[code - 1] += n
+        return {tag: (w, losses) for tag, (w, losses) in out.items()}
+
+    def opponent_totals(self, since: Optional[str], competitive_only: bool) -> list[tuple]:
+        """``(card_id, evolution_level, wins, losses, n)`` per opponent card form,
+        ordered by card then form, for plays at or after ``since``."""
+        if since is None:
+            cells = self.opponent_cells
+        else:
+            day, second = since[:10], _second_of_day(since) or 0
+            cells = Counter()
+            for (block_day, side), block in self.blocks.items():
+                if side != _SIDES["opponent"] or block_day < day:
+                    continue
+                cells.update(block.cells() if block_day > day else block.cells_since(second))
+        totals: dict[tuple[int, int], list[int]] = {}
+        for cell, n in cells.items():
+            rest, competitive = divmod(cell, 2)
+            if competitive_only and not competitive:
+                continue
+            key, code = divmod(rest, 3)
+            entry = totals.setdefault(key, [0, 0, 0])
+            if code:
+                entry[code - 1] += n
+            entry[2] += n
+        out = []
+        for key in sorted(totals):
+            card_id, form = divmod(key, _FORMS)
+            out.append((card_id, None if form == 0 else form - 1, *totals[key]))
+        return out
+
+    def day_summary(self) -> dict[tuple[str, str], tuple[int, int, int, int]]:
+        """``(plays, wins, losses, card_id sum)`` per ``(day, side)`` — the figures
+        :func:`check_card_play_columns` compares against SQLite."""
+        sides = {v: k for k, v in _SIDES.items()}
+        out = {}
+        for (day, side), block in self.blocks.items():
+            w = losses = card_sum = 0
+            for cell, n in block.cells().items():
+                card_sum += cell // _CELL_STRIDE * n
+                code = cell // 2 % 3
+                w += n * (code == 1)
+                losses += n * (code == 2)
+            out[(day, sides[side])] = (len(block.cell), w, losses, card_sum)
+        return out
+
+
+def _synced(
+    conn: sqlite3.Connection, path: str, *, expire: bool = False
+) -> Optional[CardPlayColumns]:
+    """The cached store for ``path`` caught up to what ``conn`` sees, or None when
+    it needs a full build. Caller holds ``_LOCK``. ``expire`` also retires a store
+    past ``STORE_MAX_AGE``; reads keep serving it until the next build replaces it."""
+    store = _STORES.get(path)
+    if store is None:
+        return None
+    # Two statements: SQLite answers a lone MIN or MAX from the b-tree edge, but
+    # both in one SELECT is a full scan.
+    low = conn.execute("SELECT MIN(rowid) FROM battle_card_plays").fetchone()[0]
+    high = conn.execute("SELECT MAX(rowid) FROM battle_card_plays").fetchone()[0]
+    if (
+        (expire and time.monotonic() - store.built_at > STORE_MAX_AGE)
+        or (high or 0) < store.max_rowid  # rows deleted, or the table reset
+        or (store.min_rowid is not None and low != store.min_rowid)  # the oldest purged
+    ):
+        return None
+    if (high or 0) > store.max_rowid:
+        store.load(conn, after_rowid=store.max_rowid)
+    return store
+
+
+def _store(
+    conn: sqlite3.Connection, path: str, *, rebuild: bool = False
+) -> Optional[CardPlayColumns]:
+    """The store for ``path``, built first if it needs one, or None while another
+    caller is building it. The build runs outside ``_LOCK``, so reads answer from
+    SQL meanwhile instead of queueing behind it. Not for the request path."""
+    with _LOCK:
+        if path in _BUILDING:
+            return None
+        if not rebuild:
+            store = _synced(conn, path, expire=True)
+            if store is not None:
+                return store
+        _BUILDING.add(path)
+    try:
+        store = CardPlayColumns()
+        store.load(conn)
+    finally:
+        with _LOCK:
+            _BUILDING.discard(path)
+    with _LOCK:
+        _STORES.pop(path, None)
+        if len(_STORES) >= _STORE_MAX:
+            _STORES.pop(next(iter(_STORES)))
+        _STORES[path] = store
+    return store
+
+
+def _usable(conn: sqlite3.Connection) -> Optional[str]:
+    """The path to key a store on, or None when this connection must use SQL.
+    Uncommitted rows this connection wrote could still roll back, and in-memory
+    databases have no identity across connections."""
+    if conn.in_transaction:
+        return None
+    return _db_path(conn) or None
+
+
+def member_baselines(conn: sqlite3.Connection) -> Optional[dict[str, tuple[int, int]]]:
+    """Every member's all-time ``(wins, losses)`` across their member-side card
+    plays — ``GROUP BY player_tag`` over the whole table — or None to use SQL."""
+    path = _usable(conn)
+    if path is None:
+        return None
+    with _LOCK:
+        store = _synced(conn, path)
+        return store.baselines() if store is not None and store.exact else None
+
+
+def opponent_card_totals(
+    conn: sqlite3.Connection, *, since: Optional[str] = None, competitive_only: bool = False
+) -> Optional[list[tuple]]:
+    """Clan-wide ``(card_id, evolution_level, wins, losses, n)`` per opponent card
+    form, ordered by card then form, or None to use SQL. ``since`` is a canonical
+    UTC stamp compared as ``battle_time >= since``."""
+    path = _usable(conn)
+    if path is None or (since is not None and _second_of_day(since) is None):
+        return None
+    with _LOCK:
+        store = _synced(conn, path)
+        if store is None or not store.exact:
+            return None
+        return store.opponent_totals(since, competitive_only)
+
+
+@managed_connection
+def refresh_card_play_columns(*, conn: Optional[sqlite3.Connection] = None) -> dict:
+    """Bring this process's store up to the committed table, building it when
+    there is none or it is stale. Stage A of the enrichment job calls it after
+    each batch; reads only ever catch up an existing store, and answer from SQL
+    until this (or maintenance) has built one."""
+    path = _usable(conn)
+    if path is None:
+        return {"synced": False}
+    with _LOCK:
+        before = _STORES.get(path)
+        mark = before.max_rowid if before is not None else 0
+    store = _store(conn, path)
+    if store is None:
+        return {"synced": False, "building": True}
+    with _LOCK:
+        rebuilt = store is not before
+        return {
+            "synced": True,
+            "rebuilt": rebuilt,
+            "max_rowid": store.max_rowid,
+            "advanced": store.max_rowid - mark,
+            "exact": store.exact,
+        }
+
+
+@managed_connection
+def check_card_play_columns(
+    *, repair: bool = True, conn: Optional[sqlite3.Connection] = None
+) -> dict:
+    """Compare the store with SQLite, day by day and side by side: play count,
+    wins, losses and the sum of card ids. Rows past the store's high water mark
+    are left out of the SQL side, so a commit landing mid-check is not drift.
+    With ``repair``, any mismatch rebuilds the store from SQLite."""
+    path = _usable(conn)
+    if path is None:
+        return {"checked": False, "mismatched_days": []}
+    store = _store(conn, path)
+    if store is None:
+        return {"checked": False, "mismatched_days": [], "building": True}
+    with _LOCK:
+        if not store.exact:
+            # Rows the encoding skipped would read as drift on every pass; reads
+            # already go to SQL for this database.
+            return {"checked": False, "mismatched_days": [], "exact": False}
+        expected = {
+            (day, side): (n, int(w), int(losses), card_sum)
+            for day, side, n, w, losses, card_sum in conn.execute(
+                "SELECT substr(battle_time, 1, 10), side, COUNT(*), TOTAL(outcome = 'W'), "
+                "TOTAL(outcome = 'L'), SUM(card_id) FROM battle_card_plays WHERE rowid <= ? "
+                "GROUP BY 1, 2",
+                (store.max_rowid,),
+            )
+        }
+        got = store.day_summary()
+    mismatched = sorted(
+        {key[0] for key in expected.keys() | got.keys() if expected.get(key) != got.get(key)}
+    )
+    if mismatched:
+        log.warning(
+            "card-play columns drifted from SQLite on %d day(s), first %s",
+            len(mismatched),
+            mismatched[0],
+        )
+    repaired = bool(mismatched) and repair
+    if repaired:
+        _store(conn, path, rebuild=True)
+    return {
+        "checked": True,
+        "days": len(expected),
+        "mismatched_days": mismatched,
+        "repaired": repaired,
+        "exact": True,
+    }
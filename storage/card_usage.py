@@ -0,0 +1,256 @@
+"""Daily card-usage rollup (``card_usage_daily``) over ``battle_card_plays``.
+
+"What is the clan playing / facing" reads grouped every play in their window on
+every call — a scan that grows with retention, for an answer that changes by a
+few hundred rows every fifteen minutes. The rollup keeps one row per (Chicago
+day, card, form, side, mode group) with plays, wins, losses and the distinct
+members behind them that day, so a window read sums at most days x cards rows.
+
+The plays table stays the source of truth:
+
+  * A day is always recomputed whole, never patched by deltas — ``members`` is
+    distinct per day and does not add up. The enrichment writer recomputes each
+    day its batch touched, in the batch's own transaction, finding the day's
+    plays through the ``battle_events`` time index.
+  * Reads use the rollup only while it covers the table: its plays add up to
+    the table's row count. That is re-checked whenever the table's rowid edges
+    move. Until then — a freshly migrated database, plays written some other
+    way — readers return None and the caller answers from SQL.
+  * A window that starts mid-day reads whole days from the rollup and the rest
+    of its first day from the plays table, so the answer equals the scan's.
+  * :func:`check_card_usage` compares every day with a scan of the plays table
+    and recomputes any day that drifted; maintenance runs it after the purge.
+    :func:`rebuild_card_usage` recomputes every day.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from db import chicago_date_for_cr_timestamp, chicago_day_bounds_utc, managed_connection
+from storage.card_play_columns import _db_path, _second_of_day
+
+log = logging.getLogger("elixir.storage.card_usage")
+
+_COVERED_MAX = 4  # one per database file; FIFO beyond that
+
+# path -> (MIN(rowid), MAX(rowid), covered) of battle_card_plays when last checked
+_COVERED: dict[str, tuple[Optional[int], Optional[int], bool]] = {}
+_LOCK = threading.Lock()
+
+# A day's plays, found through the battle_events time index (the plays table has
+# none) and bounded on their own battle_time, which is what the check scans.
+_IN_DAY = (
+    "battle_dedup_key IN (SELECT dedup_key FROM battle_events "
+    "WHERE battle_time >= ? AND battle_time < ?) AND battle_time >= ? AND battle_time < ?"
+)
+
+_DAY_SQL = (
+    "SELECT card_id, COALESCE(evolution_level, 0), side, COALESCE(mode_group, ''), COUNT(*), "
+    "COALESCE(SUM(outcome = 'W'), 0), COALESCE(SUM(outcome = 'L'), 0), "
+    f"COUNT(DISTINCT player_tag) FROM battle_card_plays WHERE {_IN_DAY} GROUP BY 1, 2, 3, 4"
+)
+
+
+def _forget() -> None:
+    """Drop every coverage verdict. Tests and the rebuild call this."""
+    with _LOCK:
+        _COVERED.clear()
+
+
+def _recompute_day(conn: sqlite3.Connection, day: str) -> int:
+    start, end = chicago_day_bounds_utc(day)
+    rows = conn.execute(_DAY_SQL, (start, end, start, end)).fetchall()
+    conn.execute("DELETE FROM card_usage_daily WHERE metric_date = ?", (day,))
+    conn.executemany(
+        "INSERT INTO card_usage_daily (metric_date, card_id, evolution_level, side, mode_group, "
+        "plays, wins, losses, members) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [(day, *row) for row in rows],
+    )
+    return len(rows)
+
+
+def fold_battles(conn: sqlite3.Connection, battle_times: Iterable[str]) -> int:
+    """Recompute every Chicago day holding one of ``battle_times``. The
+    enrichment writer calls it with the battles it just wrote plays for, on its
+    own connection, so the rollup commits (or rolls back) with them."""
+    days = {chicago_date_for_cr_timestamp(t) for t in battle_times}
+    days.discard(None)
+    for day in sorted(days):
+        _recompute_day(conn, day)
+    return len(days)
+
+
+def _day_span(conn: sqlite3.Connection) -> list[str]:
+    """Every Chicago day from the oldest retained battle to the newest."""
+    # Two statements: SQLite answers a lone MIN or MAX from the index edge.
+    low = conn.execute("SELECT MIN(battle_time) FROM battle_events").fetchone()[0]
+    high = conn.execute("SELECT MAX(battle_time) FROM battle_events").fetchone()[0]
+    first, last = chicago_date_for_cr_timestamp(low), chicago_date_for_cr_timestamp(high)
+    if first is None or last is None:
+        return []
+    day, stop = date.fromisoformat(first), date.fromisoformat(last)
+    span = []
+    while day <= stop:
+        span.append(day.isoformat())
+        day += timedelta(days=1)
+    return span
+
+
+@managed_connection
+def rebuild_card_usage(*, conn: Optional[sqlite3.Connection] = None) -> dict:
+    """Recompute every day from ``battle_card_plays`` in one transaction, and
+    drop days no retained battle falls on. Readers in other processes pick the
+    result up once the plays table next grows."""
+    span = _day_span(conn)
+    rows = sum(_recompute_day(conn, day) for day in span)
+    if span:
+        conn.execute(
+            "DELETE FROM card_usage_daily WHERE metric_date < ? OR metric_date > ?",
+            (span[0], span[-1]),
+        )
+    else:
+        conn.execute("DELETE FROM card_usage_daily")
+    _forget()
+    return {"days": len(span), "rows": rows}
+
+
+def _covered(conn: sqlite3.Connection) -> bool:
+    """Whether the rollup accounts for every play. Cached per database on the
+    plays table's rowid edges, which any insert or purge moves; a connection
+    with uncommitted writes is checked fresh and not cached."""
+    low = conn.execute("SELECT MIN(rowid) FROM battle_card_plays").fetchone()[0]
+    high = conn.execute("SELECT MAX(rowid) FROM battle_card_plays").fetchone()[0]
+    path = "" if conn.in_transaction else _db_path(conn)
+    with _LOCK:
+        seen = _COVERED.get(path) if path else None
+    if seen is not None and seen[:2] == (low, high):
+        return seen[2]
+    plays = conn.execute("SELECT COUNT(*) FROM battle_card_plays").fetchone()[0]
+    rolled = conn.execute("SELECT TOTAL(plays) FROM card_usage_daily").fetchone()[0]
+    covered = int(rolled) == plays
+    if path:
+        with _LOCK:
+            _COVERED.pop(path, None)
+            if len(_COVERED) >= _COVERED_MAX:
+                _COVERED.pop(next(iter(_COVERED)))
+            _COVERED[path] = (low, high, covered)
+    return covered
+
+
+def card_totals(
+    conn: sqlite3.Connection,
+    *,
+    since: Optional[str] = None,
+    side: Optional[str] = None,
+    mode_groups: Optional[Iterable[str]] = None,
+    card_id: Optional[int] = None,
+) -> Optional[dict[tuple, list[int]]]:
+    """``{(card_id, evolution_level, side): [wins, losses, plays]}`` over plays
+    at or after ``since`` (a canonical UTC stamp, None for all time), optionally
+    for one card, one side and a set of mode groups — or None to use SQL.
+    ``evolution_level`` is None for the base form, as in the plays table."""
+    edge = None
+    if since is not None:
+        edge = chicago_date_for_cr_timestamp(since) if _second_of_day(since) is not None else None
+        if edge is None:
+            return None
+    if not _covered(conn):
+        return None
+    where, params = ["1 = 1"], []
+    if card_id is not None:
+        where.append("card_id = ?")
+        params.append(card_id)
+    if side is not None:
+        where.append("side = ?")
+        params.append(side)
+    if mode_groups is not None:
+        groups = sorted(mode_groups)
+        where.append(f"COALESCE(mode_group, '') IN ({', '.join('?' * len(groups))})")
+        params.extend(groups)
+    where = " AND ".join(where)
+
+    totals: dict[tuple, list[int]] = {}
+    rows = conn.execute(
+        "SELECT card_id, evolution_level, side, SUM(wins), SUM(losses), SUM(plays) "
+        f"FROM card_usage_daily WHERE {where}"
+        + (" AND metric_date > ?" if edge else "")
+        + " GROUP BY 1, 2, 3",
+        (*params, edge) if edge else params,
+    ).fetchall()
+    if edge:
+        # The window's first day, from ``since`` to its end, straight from the plays.
+        end = chicago_day_bounds_utc(edge)[1]
+        rows += conn.execute(
+            "SELECT card_id, evolution_level, side, COALESCE(SUM(outcome = 'W'), 0), "
+            f"COALESCE(SUM(outcome = 'L'), 0), COUNT(*) FROM battle_card_plays "
+            f"WHERE {where} AND {_IN_DAY} GROUP BY 1, 2, 3",
+            (*params, since, end, since, end),
+        ).fetchall()
+    for cid, evo, side_, w, losses, n in rows:
+        acc = totals.setdefault((cid, evo or None, side_), [0, 0, 0])
+        acc[0] += w
+        acc[1] += losses
+        acc[2] += n
+    return totals
+
+
+@managed_connection
+def check_card_usage(*, repair: bool = True, conn: Optional[sqlite3.Connection] = None) -> dict:
+    """Compare the rollup with a scan of ``battle_card_plays``, day by day, side
+    by side and mode group by mode group: plays, wins, losses, and card id and
+    form sums. ``members`` is not additive, so it is recomputed with a repaired
+    day rather than compared. With ``repair``, every drifted day is recomputed
+    (a day with no plays left is dropped)."""
+    day_of: dict[str, Optional[str]] = {}
+    expected: dict[tuple[str, str, str], list[int]] = {}
+    unplaced = 0
+    for hour, side, group, *sums in conn.execute(
+        "SELECT substr(battle_time, 1, 13), side, COALESCE(mode_group, ''), COUNT(*), "
+        "TOTAL(outcome = 'W'), TOTAL(outcome = 'L'), SUM(card_id), "
+        "TOTAL(COALESCE(evolution_level, 0)) FROM battle_card_plays GROUP BY 1, 2, 3"
+    ):
+        if hour not in day_of:
+            # Chicago's offset is whole hours, so the UTC hour fixes the day.
+            canonical = len(hour) == 13 and hour[10] == "T"
+            day_of[hour] = chicago_date_for_cr_timestamp(f"{hour}:00:00Z") if canonical else None
+        day = day_of[hour]
+        if day is None:
+            unplaced += sums[0]
+            continue
+        acc = expected.setdefault((day, side, group), [0, 0, 0, 0, 0])
+        for i, value in enumerate(sums):
+            acc[i] += int(value)
+    got = {
+        (day, side, group): [int(v) for v in sums]
+        for day, side, group, *sums in conn.execute(
+            "SELECT metric_date, side, mode_group, SUM(plays), SUM(wins), SUM(losses), "
+            "SUM(card_id * plays), SUM(evolution_level * plays) FROM card_usage_daily "
+            "GROUP BY 1, 2, 3"
+        )
+    }
+    mismatched = sorted(
+        {key[0] for key in expected.keys() | got.keys() if expected.get(key) != got.get(key)}
+    )
+    if mismatched:
+        log.warning(
+            "card usage rollup drifted from battle_card_plays on %d day(s), first %s",
+            len(mismatched),
+            mismatched[0],
+        )
+    repaired = bool(mismatched) and repair
+    if repaired:
+        for day in mismatched:
+            _recompute_day(conn, day)
+        _forget()
+    return {
+        "checked": True,
+        "days": len({key[0] for key in expected}),
+        "mismatched_days": mismatched,
+        "repaired": repaired,
+        "unplaced_plays": unplaced,
+    }
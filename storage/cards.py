@@ -18,6 +18,7 @@ from db import (
     _card_level,
     managed_connection,
 )
+from storage import deck_columns
 from storage._enrichment import _member_reference_fields
 
 
@@ -1034,14 +1035,19 @@ def get_clan_favourite_card_counts(
     return [{"card_name": n, "member_count": c} for n, c in ranked[:limit]]
 
 
-@managed_connection
-def get_clan_recently_played_cards(
-    days: int = 14, limit: int = 20, conn: Optional[sqlite3.Connection] = None
-) -> list[dict]:
-    """Cards that appeared most often in clan members' recent battle decks."""
-    cutoff = (datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)).strftime(
-        "%Y-%m-%dT%H:%M:%SZ"
-    )
+def _member_deck_card_counts(conn, cutoff: str) -> dict[str, int]:
+    """Deck appearances per card across current members' battles at or after
+    ``cutoff``: folded from ``storage.deck_columns``, or decoded row by row
+    where the store declines."""
+    tags = [
+        r[0]
+        for r in conn.execute(
+            "SELECT DISTINCT player_tag FROM clan_memberships WHERE left_at IS NULL"
+        ).fetchall()
+    ]
+    counts = deck_columns.member_deck_card_counts(conn, since=cutoff, player_tags=tags)
+    if counts is not None:
+        return counts
     rows = conn.execute(
         "SELECT bf.deck_json "
         "FROM battle_events bf "
@@ -1049,11 +1055,23 @@ def get_clan_recently_played_cards(
         "  SELECT 1 FROM clan_memberships cm WHERE cm.player_tag = bf.player_tag AND cm.left_at IS NULL)",
         (cutoff,),
     ).fetchall()
-    counts: dict[str, int] = {}
+    counts = {}
     for row in rows:
         for card in json.loads(row["deck_json"] or "[]"):
             if isinstance(card, dict) and card.get("name"):
                 counts[card["name"]] = counts.get(card["name"], 0) + 1
+    return counts
+
+
+@managed_connection
+def get_clan_recently_played_cards(
+    days: int = 14, limit: int = 20, conn: Optional[sqlite3.Connection] = None
+) -> list[dict]:
+    """Cards that appeared most often in clan members' recent battle decks."""
+    cutoff = (datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+    counts = _member_deck_card_counts(conn, cutoff)
     ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0].lower()))
     return [{"card_name": name, "battles": count} for name, count in ranked[:limit]]
 
@@ -1067,40 +1085,28 @@ def get_clan_overlooked_cards(
     conn: Optional[sqlite3.Connection] = None,
 ) -> list[dict]:
     """Cards that many members have leveled up but almost nobody actually plays."""
-    # Step 1: cards owned at min_level+ across the clan, with owner counts
-    member_tags = [
-        r["player_tag"]
-        for r in conn.execute(
-            "SELECT m.player_tag FROM players m WHERE EXISTS ("
-            "  SELECT 1 FROM clan_memberships cm WHERE cm.player_tag = m.player_tag AND cm.left_at IS NULL)"
-        ).fetchall()
-    ]
+    # Step 1: cards owned at min_level+ across the clan, with owner counts. One
+    # grouped read over every current member's collection; the display-level
+    # math runs once per distinct (level, max_level), not once per card owned.
     owned: dict[str, int] = {}
-    for _tag in member_tags:
-        _fetched, _cards = _load_collection_cards(conn, _tag)
-        for raw in _cards:
-            if not isinstance(raw, dict) or not raw.get("name"):
-                continue
-            level = _card_level(raw)
-            if level is not None and level >= min_level:
-                owned[raw["name"]] = owned.get(raw["name"], 0) + 1
+    for r in conn.execute(
+        "SELECT COALESCE(NULLIF(cc.name, ''), 'card:' || pc.card_id) AS name, pc.level, "
+        "cc.max_level, COUNT(*) AS owners "
+        "FROM player_card_collection pc "
+        "LEFT JOIN card_catalog cc ON cc.card_id = pc.card_id "
+        "WHERE EXISTS (SELECT 1 FROM players m WHERE m.player_tag = pc.player_tag) AND EXISTS ("
+        "  SELECT 1 FROM clan_memberships cm WHERE cm.player_tag = pc.player_tag AND cm.left_at IS NULL) "
+        "GROUP BY 1, 2, 3"
+    ).fetchall():
+        level = _card_level({"level": r["level"], "maxLevel": r["max_level"]})
+        if level is not None and level >= min_level:
+            owned[r["name"]] = owned.get(r["name"], 0) + r["owners"]
 
     # Step 2: cards actually played in recent battles
     cutoff = (
         datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=battle_days)
     ).strftime("%Y-%m-%dT%H:%M:%SZ")
-    battle_rows = conn.execute(
-        "SELECT bf.deck_json "
-        "FROM battle_events bf "
-        "WHERE bf.battle_time >= ? AND EXISTS ("
-        "  SELECT 1 FROM clan_memberships cm WHERE cm.player_tag = bf.player_tag AND cm.left_at IS NULL)",
-        (cutoff,),
-    ).fetchall()
-    played: set[str] = set()
-    for row in battle_rows:
-        for card in json.loads(row["deck_json"] or "[]"):
-            if isinstance(card, dict) and card.get("name"):
-                played.add(card["name"])
+    played = set(_member_deck_card_counts(conn, cutoff))
 
     # Step 3: high-level cards owned by many but played by nobody (or very few)
     overlooked = [
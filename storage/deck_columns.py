@@ -0,0 +1,385 @@
+"""Columnar side store over member decks in ``battle_events`` for the clan card reports.
+
+``get_clan_recently_played_cards`` and ``get_clan_overlooked_cards`` answered
+"which cards did current members put in their decks since X" by pulling every
+``deck_json`` in the window out of SQLite and ``json.loads``-ing it row by row.
+The deck a member brings changes a few times a week; the same JSON text is
+decoded thousands of times per report.
+
+This decodes each battle's deck once and keeps it in process memory as integer
+columns, one block per UTC day: ``code`` packs player and card (card names are
+interned to small ints) for every named card in every deck, ``tod`` is the
+second of the day the battle happened. A block's reduction is
+``Counter(code)`` — counted in C and cached until the block grows — so a report
+is a fold over per-day counters filtered to the current members, and only the
+window's boundary day is filtered row by row. Identical deck texts share one
+decode while loading.
+
+The SQLite rows stay the source of truth, kept in step the way
+:mod:`storage.card_play_columns` keeps its plays:
+
+  * Sync is by rowid: new battles are appended past the high water mark, and a
+    lower ``MAX(rowid)`` or a moved ``MIN(rowid)`` (the retention purge) means a
+    rebuild, as does ``STORE_MAX_AGE``.
+  * A full build decodes every deck, so it never runs on a read. Battle-intel
+    Stage A (:func:`refresh_deck_columns`) and maintenance build it outside the
+    lock; until one has, and while one is running, a read returns None.
+  * A battle first seen with no deck can have it filled in later by the
+    ingest's enrich-on-dedup update, which changes no rowid. Those rows are
+    remembered and re-read whenever a new generation is applied or new rows
+    arrive, so the store is current as of every generation.
+  * A non-canonical battle_time, a deck that is not a JSON array, a connection
+    with uncommitted writes, or an in-memory database returns None, and the
+    caller answers from SQL.
+  * :func:`check_deck_columns` compares per-day battle and card counts against
+    SQLite and rebuilds on any drift. Maintenance runs it after the weekly purge.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter
+from typing import Iterable, Optional
+
+from db import managed_connection
+from engine.readiness import applied_generation_id
+from storage.card_play_columns import _db_path, _second_of_day
+
+log = logging.getLogger("elixir.storage.deck_columns")
+
+STORE_MAX_AGE = 6 * 3600.0  # seconds before a full rebuild, whatever the rowids say
+_STORE_MAX = 2  # one per database file; FIFO beyond that
+_FETCH = 20000
+_PENDING_CHUNK = 500
+_CARD_BITS = 16  # code = player_ix << _CARD_BITS | card_ix
+
+_STORES: dict[str, "DeckColumns"] = {}
+_BUILDING: set[str] = set()  # paths with a full build in flight
+_LOCK = threading.Lock()
+
+
+def _clear_deck_columns() -> None:
+    """Test hook to drop every cached store."""
+    with _LOCK:
+        _STORES.clear()
+
+
+class _Block:
+    """One UTC day of member decks."""
+
+    __slots__ = ("code", "tod", "battles", "_codes")
+
+    def __init__(self):
+        self.code = array("q")
+        self.tod = array("i")
+        self.battles = 0
+        self._codes: Optional[Counter] = None
+
+    def codes(self) -> Counter:
+        if self._codes is None:
+            self._codes = Counter(self.code)
+        return self._codes
+
+    def codes_since(self, second: int) -> Counter:
+        """Code counts for the decks at or after ``second`` into the day."""
+        return Counter(c for c, t in zip(self.code, self.tod, strict=True) if t >= second)
+
+
+class DeckColumns:
+    """The columnar copy of one database's member decks. Cached instances are
+    only read or mutated under ``_LOCK``."""
+
+    def __init__(self):
+        self.built_at = time.monotonic()
+        self.min_rowid: Optional[int] = None
+        self.max_rowid = 0
+        self.generation: Optional[int] = None
+        self.exact = True
+        self.players: list[str] = []
+        self.player_ix: dict[str, int] = {}
+        self.cards: list[str] = []
+        self.card_ix: dict[str, int] = {}
+        self.blocks: dict[str, _Block] = {}
+        self.pending: set[int] = set()  # rowids seen with a NULL deck_json
+
+    def _add(self, rows: Iterable[tuple], decoded: dict) -> None:
+        blocks, player_ix, players = self.blocks, self.player_ix, self.players
+        for rowid, tag, stamp, deck_json in rows:
+            if deck_json is None:
+                self.pending.add(rowid)
+                continue
+            if deck_json == "":  # decodes as no cards, and enrichment never fills it
+                continue
+            second = _second_of_day(stamp)
+            cards = decoded.get(deck_json)
+            if cards is None:
+                cards = decoded[deck_json] = self._decode(deck_json)
+            if second is None or cards is False:
+                self.exact = False
+                continue
+            pix = player_ix.get(tag)
+            if pix is None:
+                pix = player_ix[tag] = len(players)
+                players.append(tag)
+            block = blocks.get(stamp[:10])
+            if block is None:
+                block = blocks[stamp[:10]] = _Block()
+            block._codes = None
+            block.battles += 1
+            base = pix << _CARD_BITS
+            block.code.extend(base | cix for cix in cards)
+            block.tod.extend([second] * len(cards))
+
+    def _decode(self, deck_json: str):
+        """The deck's card indexes in order, or False when the reports' own
+        decode (``json.loads(deck_json or "[]")``) would not read it as a list."""
+        try:
+            deck = json.loads(deck_json)
+        except ValueError:
+            return False
+        if not isinstance(deck, list):
+            return False
+        out = []
+        card_ix, cards = self.card_ix, self.cards
+        for card in deck:
+            if isinstance(card, dict) and card.get("name"):
+                name = card["name"]
+                if not isinstance(name, str):
+                    return False
+                cix = card_ix.get(name)
+                if cix is None:
+                    if len(cards) >= 1 << _CARD_BITS:
+                        return False
+                    cix = card_ix[name] = len(cards)
+                    cards.append(name)
+                out.append(cix)
+        return tuple(out)
+
+    def load(self, conn: sqlite3.Connection, *, after_rowid: int = 0) -> int:
+        """Append every battle past ``after_rowid``. Returns the rows loaded."""
+        cur = conn.execute(
+            "SELECT rowid, player_tag, battle_time, deck_json FROM battle_events "
+            "WHERE rowid > ? ORDER BY rowid",
+            (after_rowid,),
+        )
+        decoded: dict[str, object] = {}
+        loaded = 0
+        while rows := cur.fetchmany(_FETCH):
+            self._add(rows, decoded)
+            if self.min_rowid is None:
+                self.min_rowid = rows[0][0]
+            self.max_rowid = rows[-1][0]
+            loaded += len(rows)
+        return loaded
+
+    def recheck_pending(self, conn: sqlite3.Connection) -> int:
+        """Pick up decks filled in on rows first seen without one. Returns how
+        many arrived."""
+        pending = sorted(self.pending)
+        decoded: dict[str, object] = {}
+        arrived = 0
+        for start in range(0, len(pending), _PENDING_CHUNK):
+            chunk = pending[start : start + _PENDING_CHUNK]
+            rows = conn.execute(
+                "SELECT rowid, player_tag, battle_time, deck_json FROM battle_events "
+                f"WHERE rowid IN ({','.join('?' * len(chunk))}) AND deck_json IS NOT NULL",
+                chunk,
+            ).fetchall()
+            self.pending.difference_update(row[0] for row in rows)
+            self._add(rows, decoded)
+            arrived += len(rows)
+        return arrived
+
+    def card_counts(self, since: str, player_tags: Iterable[str]) -> dict[str, int]:
+        """Deck appearances per card name for ``player_tags``' battles at or after
+        ``since`` (a canonical UTC stamp)."""
+        day, second = since[:10], _second_of_day(since) or 0
+        codes: Counter = Counter()
+        for block_day, block in self.blocks.items():
+            if block_day < day:
+                continue
+            codes.update(block.codes() if block_day > day else block.codes_since(second))
+        wanted = {self.player_ix[tag] for tag in player_tags if tag in self.player_ix}
+        mask = (1 << _CARD_BITS) - 1
+        out: dict[str, int] = {}
+        cards = self.cards
+        for code, n in codes.items():
+            if code >> _CARD_BITS in wanted:
+                name = cards[code & mask]
+                out[name] = out.get(name, 0) + n
+        return out
+
+    def day_summary(self) -> dict[str, tuple[int, int]]:
+        """``(battles with a deck, named cards)`` per day — the figures
+        :func:`check_deck_columns` compares against SQLite."""
+        return {
+            day: (block.battles, len(block.code))
+            for day, block in self.blocks.items()
+            if block.battles
+        }
+
+
+def _synced(conn: sqlite3.Connection, path: str, *, expire: bool = False) -> Optional[DeckColumns]:
+    """The cached store for ``path`` caught up to what ``conn`` sees, or None when
+    it needs a full build. Caller holds ``_LOCK``. ``expire`` also retires a store
+    past ``STORE_MAX_AGE``; reads keep serving it until the next build replaces it."""
+    store = _STORES.get(path)
+    if store is None:
+        return None
+    # Two statements: SQLite answers a lone MIN or MAX from the b-tree edge, but
+    # both in one SELECT is a full scan.
+    low = conn.execute("SELECT MIN(rowid) FROM battle_events").fetchone()[0]
+    high = conn.execute("SELECT MAX(rowid) FROM battle_events").fetchone()[0]
+    if (
+        (expire and time.monotonic() - store.built_at > STORE_MAX_AGE)
+        or (high or 0) < store.max_rowid  # rows deleted, or the table reset
+        or (store.min_rowid is not None and low != store.min_rowid)  # the oldest purged
+    ):
+        return None
+    generation = applied_generation_id(conn)
+    advanced = (high or 0) > store.max_rowid
+    if store.pending and (advanced or generation != store.generation):
+        store.recheck_pending(conn)
+    if advanced:
+        store.load(conn, after_rowid=store.max_rowid)
+    store.generation = generation
+    return store
+
+
+def _store(conn: sqlite3.Connection, path: str, *, rebuild: bool = False) -> Optional[DeckColumns]:
+    """The store for ``path``, built first if it needs one, or None while another
+    caller is building it. The build runs outside ``_LOCK``, so reads answer from
+    SQL meanwhile instead of queueing behind it. Not for the request path."""
+    with _LOCK:
+        if path in _BUILDING:
+            return None
+        if not rebuild:
+            store = _synced(conn, path, expire=True)
+            if store is not None:
+                return store
+        _BUILDING.add(path)
+    try:
+        store = DeckColumns()
+        # Read before the load, so a generation landing mid-build re-reads the
+        # decks it filled in.
+        store.generation = applied_generation_id(conn)
+        store.load(conn)
+    finally:
+        with _LOCK:
+            _BUILDING.discard(path)
+    with _LOCK:
+        _STORES.pop(path, None)
+        if len(_STORES) >= _STORE_MAX:
+            _STORES.pop(next(iter(_STORES)))
+        _STORES[path] = store
+    return store
+
+
+def _usable(conn: sqlite3.Connection) -> Optional[str]:
+    """The path to key a store on, or None when this connection must use SQL.
+    Uncommitted rows this connection wrote could still roll back, and in-memory
+    databases have no identity across connections."""
+    if conn.in_transaction:
+        return None
+    return _db_path(conn) or None
+
+
+def member_deck_card_counts(
+    conn: sqlite3.Connection, *, since: str, player_tags: Iterable[str]
+) -> Optional[dict[str, int]]:
+    """How many of ``player_tags``' battles at or after ``since`` had each card
+    in the member's deck (a card listed twice counts twice, as the row-by-row
+    decode did), or None to use SQL."""
+    path = _usable(conn)
+    if path is None or _second_of_day(since) is None:
+        return None
+    with _LOCK:
+        store = _synced(conn, path)
+        if store is None or not store.exact:
+            return None
+        return store.card_counts(since, player_tags)
+
+
+@managed_connection
+def refresh_deck_columns(*, conn: Optional[sqlite3.Connection] = None) -> dict:
+    """Bring this process's store up to the committed table, building it when
+    there is none or it is stale. Battle-intel Stage A calls it each interval;
+    reads only ever catch up an existing store, and answer from SQL until this
+    (or maintenance) has built one."""
+    path = _usable(conn)
+    if path is None:
+        return {"synced": False}
+    with _LOCK:
+        before = _STORES.get(path)
+    store = _store(conn, path)
+    if store is None:
+        return {"synced": False, "building": True}
+    with _LOCK:
+        return {
+            "synced": True,
+            "rebuilt": store is not before,
+            "max_rowid": store.max_rowid,
+            "exact": store.exact,
+        }
+
+
+@managed_connection
+def check_deck_columns(*, repair: bool = True, conn: Optional[sqlite3.Connection] = None) -> dict:
+    """Compare the store with SQLite day by day: battles carrying a deck and
+    named cards across them. Rows past the store's high water mark are left out
+    of the SQL side, so a commit landing mid-check is not drift. With
+    ``repair``, any mismatch rebuilds the store from SQLite."""
+    path = _usable(conn)
+    if path is None:
+        return {"checked": False, "mismatched_days": []}
+    store = _store(conn, path)
+    if store is None:
+        return {"checked": False, "mismatched_days": [], "building": True}
+    with _LOCK:
+        if not store.exact:
+            # Rows the encoding skipped would read as drift on every pass; reads
+            # already go to SQL for this database.
+            return {"checked": False, "mismatched_days": [], "exact": False}
+        battles = dict(
+            conn.execute(
+                "SELECT substr(battle_time, 1, 10), COUNT(*) FROM battle_events "
+                "WHERE rowid <= ? AND deck_json IS NOT NULL AND deck_json != '' GROUP BY 1",
+                (store.max_rowid,),
+            ).fetchall()
+        )
+        cards = dict(
+            conn.execute(
+                "SELECT substr(b.battle_time, 1, 10), COUNT(*) "
+                "FROM battle_events b, json_each(b.deck_json) j "
+                "WHERE b.rowid <= ? AND b.deck_json IS NOT NULL AND b.deck_json != '' "
+                "AND j.type = 'object' AND json_type(j.value, '$.name') = 'text' "
+                "AND json_extract(j.value, '$.name') != '' GROUP BY 1",
+                (store.max_rowid,),
+            ).fetchall()
+        )
+        got = store.day_summary()
+    expected = {day: (n, cards.get(day, 0)) for day, n in battles.items()}
+    mismatched = sorted(
+        day for day in expected.keys() | got.keys() if expected.get(day) != got.get(day)
+    )
+    if mismatched:
+        log.warning(
+            "deck columns drifted from SQLite on %d day(s), first %s",
+            len(mismatched),
+            mismatched[0],
+        )
+    repaired = bool(mismatched) and repair
+    if repaired:
+        _store(conn, path, rebuild=True)
+    return {
+        "checked": True,
+        "days": len(expected),
+        "mismatched_days": mismatched,
+        "repaired": repaired,
+        "exact": True,
+    }
@@ -0,0 +1,326 @@
+"""Process-level buildable-deck index over ``deck_profile``.
+
+Every deck recommendation used to scan and JSON-decode the whole profiled corpus
+to find the decks one member can build — 10k+ rows per call, most of them
+rejected by the first unowned card. The index keeps that corpus in memory as
+bitsets over deck positions: one inverted bitset per card (decks containing
+it), one per Evo/Hero form requirement, and one each for "facts complete and
+eight cards", "clears the structural floor" and "slot-legal". A member's
+buildable set is then ``live & ~(decks using a card they lack)`` — a handful of
+big-int ops — and only the survivors are turned back into deck dicts.
+
+Positions follow ``deck_profile`` rowid order, which is the order the old scan
+returned rows in, so ties in the readiness sort land exactly where they did.
+
+Freshness, without a table scan per call:
+
+  * New profiles: every lookup compares ``MAX(rowid)`` with the index's high
+    water mark and loads only the rows past it. ``_profile_new_decks`` only
+    ever inserts, so this is all a profiling pass needs.
+  * Fact fills: ``_flush_deck_facts`` calls :func:`note_fact_updates` with the
+    values it is writing. Those rows are re-read at each lookup until the read
+    shows the written values — i.e. until the writer commits — so neither a
+    lookup racing the commit nor a rolled-back batch leaves the index stale.
+  * A change in the champion set (a card_facts edit) rebuilds from scratch, as
+    does age past ``INDEX_MAX_AGE``, which bounds staleness from writers in
+    another process.
+
+In-memory databases have no stable identity across connections, so they get a
+fresh, uncached index per call — the same code path, just not retained.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from engine import card_roles
+
+INDEX_MAX_AGE = 3600.0  # seconds before a full rebuild, whatever the hooks saw
+_INDEX_MAX = 4  # one per database file; FIFO beyond that
+_REREAD_CHUNK = 500
+
+_INDEXES: dict[str, "DeckIndex"] = {}
+_PENDING: dict[str, dict[str, tuple]] = {}  # db path -> {deck_hash: written facts}
+_LOCK = threading.Lock()
+
+_COLUMNS = (
+    "rowid, deck_hash, archetype, family, avg_elixir, cards_json, air_answer_count, "
+    "has_big_spell, has_small_spell, facts_complete"
+)
+
+
+def _clear_deck_index() -> None:
+    """Test hook to drop every cached index and pending fact update."""
+    with _LOCK:
+        _INDEXES.clear()
+        _PENDING.clear()
+
+
+def _db_path(conn: sqlite3.Connection) -> str:
+    """The main database file, or "" for an in-memory / temporary database."""
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or ""
+    return ""
+
+
+def _bit_positions(mask: int) -> list[int]:
+    """Set bit positions of ``mask``, ascending. ``str.find`` walks the binary
+    string in C, so this costs per set bit rather than per deck."""
+    bits = bin(mask)[:1:-1]
+    out = []
+    i = bits.find("1")
+    while i != -1:
+        out.append(i)
+        i = bits.find("1", i + 1)
+    return out
+
+
+def _mask(positions: list[int]) -> int:
+    """An int with ``positions`` set, built in one pass over a byte buffer."""
+    buf = bytearray(max(positions) // 8 + 1)
+    for pos in positions:
+        buf[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buf, "little")
+
+
+class DeckIndex:
+    """Bitset index of one database's profiled decks. Cached instances are only
+    read or mutated under ``_LOCK``; an entry dict is replaced, never mutated, so
+    a list :meth:`buildable` returned stays valid after the lock is released."""
+
+    def __init__(self, champions: frozenset):
+        self.champions = champions
+        self.built_at = time.monotonic()
+        self.max_rowid = 0
+        self.decks: list[Optional[dict]] = []
+        self.positions: dict[str, int] = {}
+        self.by_card: dict[int, int] = {}
+        self.by_form: dict[tuple[int, int], int] = {}
+        self.live = 0
+        self.structural = 0
+        self.slot_legal = 0
+
+    def _unset(self, pos: int) -> None:
+        deck = self.decks[pos]
+        bit = 1 << pos
+        self.live &= ~bit
+        self.structural &= ~bit
+        self.slot_legal &= ~bit
+        if deck is None:
+            return
+        for cid, form in deck["cards"]:
+            self.by_card[cid] &= ~bit
+            if form:
+                self.by_form[(cid, form)] &= ~bit
+        self.decks[pos] = None
+
+    def _or(self, key: tuple, bits: int) -> None:
+        if key[0] == "card":
+            self.by_card[key[1]] = self.by_card.get(key[1], 0) | bits
+        elif key[0] == "form":
+            self.by_form[key[1:]] = self.by_form.get(key[1:], 0) | bits
+        else:
+            setattr(self, key[0], getattr(self, key[0]) | bits)
+
+    def apply(self, row, staged: Optional[dict] = None) -> None:
+        """Insert or restate one deck_profile row. With ``staged``, the row's set
+        bits are collected there as positions for :meth:`load` to OR in at once —
+        setting one bit at a time copies every mask per row, quadratic in the corpus."""
+        # Unpacked positionally: a by-name sqlite3.Row lookup costs more than the
+        # rest of this method at corpus scale.
+        _rowid, deck_hash, archetype, family, avg, cards_json, air, big, small, complete = row
+        pos = self.positions.get(deck_hash)
+        if pos is None:
+            pos = len(self.decks)
+            self.positions[deck_hash] = pos
+            self.decks.append(None)
+        else:
+            self._unset(pos)
+        if complete != 1:
+            return
+        try:
+            pairs = [(p[0], p[1] or 0) for p in json.loads(cards_json)]
+        except TypeError, ValueError, IndexError:
+            return  # unreadable cards_json: not a deck anyone can be handed
+        # A deck is eight cards. Anything else is a malformed profile row, and it
+        # used to reach `max(gaps)` on an empty list and take down every
+        # recommendation for every member rather than skipping one bad row.
+        if len(pairs) != 8:
+            return
+        self.decks[pos] = {
+            "deck_hash": deck_hash,
+            "archetype": archetype,
+            "family": family,
+            "avg_elixir": avg,
+            "air_answers": air,
+            "has_big_spell": bool(big),
+            "has_small_spell": bool(small),
+            "cards": pairs,
+            "card_ids": frozenset(cid for cid, _ in pairs),
+        }
+        keys = [("live",)]
+        for cid, form in pairs:
+            keys.append(("card", cid))
+            if form:
+                keys.append(("form", cid, form))
+        # The air floor scales with the deck's own cost: guides ask for 2-3 air answers
+        # and exempt very cheap cycle decks, which defend by rotating rather than by
+        # holding. Cost of the tighter floor, measured over the corpus: 1.0%.
+        if air is not None and air >= card_roles.min_air_answers(avg) and small:
+            keys.append(("structural",))
+        # Slot legality (Evo + Hero + Wild = 3): Evo/Hero forms AND champions both
+        # draw on the same three slots.
+        slots = sum(1 for cid, f in pairs if f or cid in self.champions)
+        if slots <= card_roles.MAX_SPECIAL_SLOTS:
+            keys.append(("slot_legal",))
+        if staged is None:
+            for key in keys:
+                self._or(key, 1 << pos)
+        else:
+            for key in keys:
+                staged[key].append(pos)
+
+    def load(self, conn: sqlite3.Connection, *, after_rowid: int = 0) -> list:
+        rows = conn.execute(
+            f"SELECT {_COLUMNS} FROM deck_profile WHERE rowid > ? ORDER BY rowid",
+            (after_rowid,),
+        ).fetchall()
+        staged: defaultdict[tuple, list[int]] = defaultdict(list)
+        for row in rows:
+            self.apply(row, staged)
+            self.max_rowid = max(self.max_rowid, row[0])
+        for key, positions in staged.items():
+            self._or(key, _mask(positions))
+        return rows
+
+    def reread(self, conn: sqlite3.Connection, hashes: list[str]) -> list:
+        rows = []
+        for i in range(0, len(hashes), _REREAD_CHUNK):
+            chunk = hashes[i : i + _REREAD_CHUNK]
+            rows += conn.execute(
+                f"SELECT {_COLUMNS} FROM deck_profile "
+                f"WHERE deck_hash IN ({','.join('?' * len(chunk))}) ORDER BY rowid",
+                chunk,
+            ).fetchall()
+        for row in rows:
+            # A hash past the high water mark is a row this index has not loaded
+            # yet; the rowid pass owns it, so its position keeps rowid order.
+            if row[0] <= self.max_rowid:
+                self.apply(row)
+        return rows
+
+    def buildable(
+        self,
+        owned: Iterable[int],
+        forms: dict,
+        *,
+        require_structure: bool = True,
+        anchor: Optional[int] = None,
+    ) -> list[dict]:
+        """The profiled decks ``owned`` covers, in rowid order: every card owned,
+        every required form owned, slot-legal and (optionally) structurally sound.
+        Returned dicts are the shared index entries; callers copy before adding."""
+        owned = set(owned)
+        mask = self.live & self.slot_legal
+        if require_structure:
+            mask &= self.structural
+        if anchor is not None:
+            mask &= self.by_card.get(anchor, 0)
+        blocked = 0
+        for cid, bits in self.by_card.items():
+            if cid not in owned:
+                blocked |= bits
+        for (cid, form), bits in self.by_form.items():
+            if forms.get(cid, 0) < form:
+                blocked |= bits
+        mask &= ~blocked
+        decks = self.decks
+        return [decks[pos] for pos in _bit_positions(mask)]
+
+
+def _build(conn: sqlite3.Connection, champions: frozenset) -> DeckIndex:
+    index = DeckIndex(champions)
+    index.load(conn)
+    return index
+
+
+def _settle(pending: dict[str, tuple], rows) -> None:
+    """Drop pending updates the database now shows as written (committed)."""
+    for row in rows:
+        expected = pending.get(row[1])
+        if expected is not None and expected == tuple(row[6:]):
+            del pending[row[1]]
+
+
+def _current(conn: sqlite3.Connection, path: str, champions: frozenset) -> DeckIndex:
+    """The cached index for ``path``, refreshed incrementally. Caller holds ``_LOCK``."""
+    pending = _PENDING.setdefault(path, {})
+    index = _INDEXES.get(path)
+    high = conn.execute("SELECT MAX(rowid) FROM deck_profile").fetchone()[0] or 0
+    aged = index is not None and time.monotonic() - index.built_at > INDEX_MAX_AGE
+    if aged:
+        # An update that never became visible in an hour was rolled back (or its
+        # row never existed); the fresh load below is the authority either way.
+        pending.clear()
+    if (
+        index is None
+        or aged
+        or index.champions != champions
+        or high < index.max_rowid  # the table was reset under us
+        or len(pending) > len(index.positions) // 4  # a restate: reload, don't re-read
+    ):
+        index = DeckIndex(champions)
+        _settle(pending, index.load(conn))
+        _INDEXES.pop(path, None)
+        if len(_INDEXES) >= _INDEX_MAX:
+            _INDEXES.pop(next(iter(_INDEXES)))
+        _INDEXES[path] = index
+        return index
+    if pending:
+        _settle(pending, index.reread(conn, list(pending)))
+    if high > index.max_rowid:
+        _settle(pending, index.load(conn, after_rowid=index.max_rowid))
+    return index
+
+
+def buildable_decks(
+    conn: sqlite3.Connection,
+    champions: frozenset,
+    owned: Iterable[int],
+    forms: dict,
+    *,
+    require_structure: bool = True,
+    anchor: Optional[int] = None,
+) -> list[dict]:
+    """Index entries for every profiled deck buildable from ``owned`` and
+    ``forms``, in deck_profile rowid order. See :meth:`DeckIndex.buildable`."""
+    path = _db_path(conn)
+    if not path:
+        return _build(conn, champions).buildable(
+            owned, forms, require_structure=require_structure, anchor=anchor
+        )
+    with _LOCK:
+        return _current(conn, path, champions).buildable(
+            owned, forms, require_structure=require_structure, anchor=anchor
+        )
+
+
+def note_fact_updates(conn: sqlite3.Connection, updates: Iterable[tuple]) -> None:
+    """Record deck fact writes for the index to pick up once they are visible.
+
+    ``updates`` are ``(air_answer_count, has_big_spell, has_small_spell,
+    facts_complete, deck_hash)`` — the columns the index reads, as written.
+    """
+    path = _db_path(conn)
+    if not path:
+        return
+    with _LOCK:
+        pending = _PENDING.setdefault(path, {})
+        for air, big, small, complete, deck_hash in updates:
+            pending[deck_hash] = (air, big, small, complete)
@@ -247,6 +247,29 @@ _PURGE_TARGETS = [
 _PURGE_DATE_TARGETS = []
 
 
+def _purge_raw_payloads(conn: sqlite3.Connection, predicate: str, cutoff: str) -> int:
+    """Expire raw payload bodies, but never one a surviving delta decodes from.
+
+    A battlelog stored as a delta (storage.payload_codec) needs its base row.
+    An expired base stays until the deltas on it expire too; each pass frees
+    the next link, so a fully expired chain goes in one call.
+    """
+    deleted = 0
+    while True:
+        cursor = conn.execute(
+            f"""DELETE FROM raw_api_payloads
+                WHERE {predicate} < ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM raw_api_payloads AS delta
+                      WHERE delta.base_payload_id = raw_api_payloads.payload_id
+                  )""",
+            (cutoff,),
+        )
+        if cursor.rowcount <= 0:
+            return deleted
+        deleted += cursor.rowcount
+
+
 @managed_connection
 def purge_old_data(conn: Optional[sqlite3.Connection] = None) -> dict[str, int]:
     """Delete expired rows and return per-table deletion counts."""
@@ -259,6 +282,9 @@ def purge_old_data(conn: Optional[sqlite3.Connection] = None) -> dict[str, int]:
             cutoff = _date_cutoff(days).replace("-", "")
         else:
             predicate, cutoff = column, _utc_cutoff(days)
+        if table == "raw_api_payloads":
+            stats[table] = _purge_raw_payloads(conn, predicate, cutoff)
+            continue
         cursor = conn.execute(f"DELETE FROM {table} WHERE {predicate} < ?", (cutoff,))
         stats[table] = cursor.rowcount
     for table, column, days in _PURGE_DATE_TARGETS:
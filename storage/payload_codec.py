@@ -0,0 +1,267 @@
+"""Storage codec for ``raw_api_payloads`` bodies.
+
+Every new body used to land as full JSON text. Battlelogs dominate the table
+(about 32 MB a day, kept ``RAW_PAYLOAD_RETENTION_DAYS``), and two successive
+battlelogs for one player are mostly the same battles shifted down a slot.
+Rows now name how their body is stored in ``payload_codec``:
+
+    json      the text in ``payload_json`` -- every row written before schema
+              v40, and everything while ``ELIXIR_RAW_PAYLOAD_CODEC=json``
+    zlib:N    ``payload_blob`` is the text deflated against preset dictionary
+              N (scripts/train_payload_dict.py; the files sit next to this
+              module and are frozen once shipped)
+    delta:N   ``payload_blob`` is a deflated (dictionary N) delta against the
+              row ``base_payload_id``: the battles in front of the base's, and
+              how many of the base's follow them
+
+Encoded rows keep ``payload_json`` as '' (the carried column is NOT NULL), so
+read bodies through :class:`PayloadReader` or :func:`payload_json`, never the
+column. A delta is only written when it decodes back to the exact text, and a
+chain is cut with a full body every ``ELIXIR_RAW_PAYLOAD_DELTA_CHAIN`` rows.
+Retention keeps a base until the deltas on it expire (storage.metadata).
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from db import _json_or_none
+
+log = logging.getLogger(__name__)
+
+# json: store text as before; zlib: deflate every body; delta: deflate, and
+# store battlelogs as deltas against the entity's previous body.
+CODEC = os.getenv("ELIXIR_RAW_PAYLOAD_CODEC", "delta")
+MAX_DELTA_CHAIN = int(os.getenv("ELIXIR_RAW_PAYLOAD_DELTA_CHAIN", "12"))
+DELTA_ENDPOINTS = frozenset({"player_battlelog"})
+DICTIONARY_VERSION = 1
+_DICTIONARIES = {1: "payload_dict_v1.bin"}
+_LEVEL = 6
+# Decoded bodies a reader keeps -- the head of each delta chain it is walking.
+# A replay interleaves every player's logs, so this wants to cover the roster.
+_READER_CACHE = 64
+# Item texts of the newest body per battlelog entity, so a write does not
+# inflate its base's whole chain again. Keyed by content hash: a hit is never stale.
+_WRITER_CACHE = 256
+_recent: OrderedDict[tuple, tuple[int, str]] = OrderedDict()
+_recent_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Encoded:
+    """Column values for one new ``raw_api_payloads`` row."""
+
+    codec: str
+    payload_json: str
+    blob: bytes | None = None
+    base_payload_id: int | None = None
+
+
+@functools.cache
+def dictionary(version: int) -> bytes:
+    with open(os.path.join(os.path.dirname(__file__), _DICTIONARIES[version]), "rb") as f:
+        return f.read()
+
+
+def _deflate(text: str) -> bytes:
+    packer = zlib.compressobj(_LEVEL, zdict=dictionary(DICTIONARY_VERSION))
+    return packer.compress(text.encode()) + packer.flush()
+
+
+def _inflate(blob: bytes, version: int) -> str:
+    unpacker = zlib.decompressobj(zdict=dictionary(version))
+    return (unpacker.decompress(blob) + unpacker.flush()).decode()
+
+
+def _split(codec: str | None) -> tuple[str, int]:
+    kind, _, version = (codec or "json").partition(":")
+    if kind == "json":
+        return kind, 0
+    if kind not in {"zlib", "delta"} or not version.isdigit():
+        raise ValueError(f"unknown raw payload codec {codec!r}")
+    return kind, int(version)
+
+
+def _items(value: list) -> list[str]:
+    return [_json_or_none(item) for item in value]
+
+
+def _joined(items: list[str]) -> str:
+    # json.dumps writes a list as exactly this, so a list body is its items.
+    return "[" + ", ".join(items) + "]"
+
+
+def _apply(delta: dict, base_items: list[str]) -> list[str]:
+    return _items(delta["head"]) + base_items[: delta["keep"]]
+
+
+class _Body:
+    """A decoded body: its text, or (for a list) the text of each item.
+
+    A delta is rebuilt from its base's items and its own new ones, so neither
+    is parsed or re-serialized whole; the text is joined on demand, not kept.
+    """
+
+    __slots__ = ("_items", "_text", "depth")
+
+    def __init__(self, depth: int, *, text: str | None = None, items: list[str] | None = None):
+        self.depth = depth
+        self._text = text
+        self._items = items
+
+    @property
+    def text(self) -> str:
+        return self._text if self._text is not None else _joined(self._items)
+
+    @property
+    def items(self) -> list[str]:
+        if self._items is None:
+            value = json.loads(self._text)
+            if not isinstance(value, list):
+                raise ValueError("body is not a list")
+            self._items = _items(value)
+        return self._items
+
+
+class PayloadReader:
+    """Decode ``raw_api_payloads`` bodies on one connection.
+
+    Select ``payload_id, payload_codec, payload_json`` and hand them to
+    :meth:`text`: plain rows cost nothing, encoded rows fetch their blob (and
+    their delta bases) by primary key, through a small cache of recent bodies.
+    """
+
+    def __init__(self, conn, *, cache_size: int = _READER_CACHE):
+        self.conn = conn
+        self.cache_size = max(1, cache_size)
+        self._cache: OrderedDict[int, _Body] = OrderedDict()
+
+    def text(self, payload_id: int, codec: str | None = "json", payload_json: str | None = None):
+        """The body's JSON text, exactly as it was stored."""
+        if (codec or "json") == "json":
+            return payload_json
+        # Only deltas are kept: a full body is read again only as a base.
+        return self._body(int(payload_id), keep=codec.startswith("delta")).text
+
+    def _body(self, payload_id: int, *, keep: bool = True) -> _Body:
+        body = self._cache.get(payload_id)
+        if body is not None:
+            self._cache.move_to_end(payload_id)
+            return body
+        row = self.conn.execute(
+            """SELECT payload_codec, payload_json, payload_blob, base_payload_id
+               FROM raw_api_payloads WHERE payload_id = ?""",
+            (payload_id,),
+        ).fetchone()
+        if row is None:
+            raise LookupError(f"raw payload {payload_id} is gone")
+        codec, text, blob, base_id = row
+        kind, version = _split(codec)
+        if kind == "json":
+            body = _Body(0, text=text)
+        elif kind == "zlib":
+            body = _Body(0, text=_inflate(blob, version))
+        else:
+            base = self._body(int(base_id))
+            delta = json.loads(_inflate(blob, version))
+            body = _Body(base.depth + 1, items=_apply(delta, base.items))
+            # A chain moves forward: its next delta decodes from this body,
+            # not from the base, so one entry per chain stays cached.
+            self._cache.pop(int(base_id), None)
+        if keep:
+            self._cache[payload_id] = body
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return body
+
+
+def payload_json(conn, payload_id: int) -> str | None:
+    """One row's body text; None when the row is gone."""
+    try:
+        return PayloadReader(conn, cache_size=1)._body(int(payload_id)).text
+    except LookupError:
+        return None
+
+
+def _overlap(new: list[str], old: list[str]) -> int | None:
+    """Where ``new`` stops being new: ``new[i:]`` is a prefix of ``old``."""
+    if not old:
+        return None
+    for i, item in enumerate(new):
+        if item == old[0] and new[i:] == old[: len(new) - i]:
+            return i
+    return None
+
+
+def _database(conn) -> str:
+    return conn.execute("PRAGMA database_list").fetchone()[2]
+
+
+def _remember(key: tuple, depth: int, items: list[str]) -> None:
+    with _recent_lock:
+        _recent[key] = (depth, items)
+        _recent.move_to_end(key)
+        if len(_recent) > _WRITER_CACHE:
+            _recent.popitem(last=False)
+
+
+def _base(conn, key: tuple, payload_id: int) -> _Body:
+    with _recent_lock:
+        hit = _recent.get(key)
+    if hit is not None:
+        return _Body(hit[0], items=hit[1])
+    return PayloadReader(conn, cache_size=MAX_DELTA_CHAIN + 1)._body(payload_id)
+
+
+def _delta(conn, key: tuple, payload: list, items: list[str], text: str) -> tuple:
+    """The delta for a new battlelog, and the chain depth it would sit at."""
+    _, endpoint, entity_key, _ = key
+    prior = conn.execute(
+        """SELECT payload_id, payload_hash FROM raw_api_payloads
+           WHERE endpoint = ? AND entity_key = ?
+           ORDER BY fetched_at DESC, payload_id DESC LIMIT 1""",
+        (endpoint, entity_key),
+    ).fetchone()
+    if prior is None:
+        return None, 0
+    try:
+        base = _base(conn, (*key[:3], prior[1]), int(prior[0]))
+        base_items = base.items
+    except (LookupError, ValueError, zlib.error) as exc:
+        log.warning("raw payload %s unreadable as a delta base: %s", prior[0], exc)
+        return None, 0
+    if base.depth >= MAX_DELTA_CHAIN:
+        return None, 0
+    split = _overlap(items, base_items)
+    if split is None:
+        return None, 0
+    doc = _json_or_none({"head": payload[:split], "keep": len(items) - split})
+    # Decode it the way a reader will; anything short of identical stays whole.
+    if _joined(_apply(json.loads(doc), base_items)) != text:
+        return None, 0
+    return Encoded(f"delta:{DICTIONARY_VERSION}", "", _deflate(doc), int(prior[0])), base.depth + 1
+
+
+def encode(conn, endpoint: str, entity_key: str, payload, text: str, payload_hash: str) -> Encoded:
+    """Pick the storage for a new body; ``text`` is its ``payload_json``."""
+    if CODEC == "json":
+        return Encoded("json", text)
+    if CODEC == "delta" and endpoint in DELTA_ENDPOINTS and isinstance(payload, list):
+        key = (_database(conn), endpoint, entity_key, payload_hash)
+        items = _items(payload)
+        delta, depth = _delta(conn, key, payload, items, text)
+        # This body is the next one's base. Keep text, never the caller's object.
+        _remember(key, depth, items)
+        if delta is not None:
+            return delta
+    return Encoded(f"zlib:{DICTIONARY_VERSION}", "", _deflate(text))
+
+
+__all__ = ["Encoded", "PayloadReader", "dictionary", "encode", "payload_json"]
@@ -0,0 +1,221 @@
+"""Write-behind persistence for CR API receipts and raw payloads.
+
+Every successful API call leaves a receipt in ``api_observation_receipts`` and
+(content-deduplicated) a row in ``raw_api_payloads``. Writing those inline made
+the HTTP path wait on the SQLite writer: a fetch that came back in 20 ms could
+then sit behind a tick's apply transaction for the full busy timeout, and with
+the poll fan-out every worker queued on the same lock.
+
+Here the API path only enqueues (storage._write_behind). One writer thread
+drains the queue and commits a batch per transaction — up to
+``ELIXIR_RAW_PAYLOAD_BATCH`` items, or whatever arrived within
+``ELIXIR_RAW_PAYLOAD_FLUSH_MS`` of the first one. ``fetched_at``
+is stamped at submit, so a receipt records when the response arrived, not when
+it was written.
+
+Consumers that join against receipts (the tick's admission bookkeeping, an
+interactive refresh linking its generation input) call :func:`flush` first; it
+is a barrier, not a poll. The queue is bounded: a full queue waits a moment and
+then drops the write with a counter and a warning — provenance is diagnostic,
+and a dropped receipt only leaves that observation unlinked. Pending writes are
+drained at interpreter exit.
+
+Like the inline writes it replaced, nothing here raises into the API caller.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+import db
+from storage._write_behind import WriteBehindWriter
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv("ELIXIR_RAW_PAYLOAD_BATCH", "64"))
+FLUSH_INTERVAL_MS = int(os.getenv("ELIXIR_RAW_PAYLOAD_FLUSH_MS", "250"))
+QUEUE_MAX_ITEMS = 2048
+# How long a submit may wait on a full queue before the write is dropped.
+_PUT_TIMEOUT_SECONDS = 0.25
+
+
+class PendingWrite:
+    """Handle for one queued write; resolves to the stored payload identity.
+
+    The result is the ``{payload_id, receipt_id, payload_hash}`` dict the store
+    returned, or None when the write was dropped or failed.
+    """
+
+    __slots__ = ("_done", "_result")
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._result: dict | None = None
+
+    def _resolve(self, result: dict | None) -> None:
+        self._result = result
+        self._done.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: float | None = None) -> dict | None:
+        self._done.wait(timeout)
+        return self._result
+
+
+@dataclass(frozen=True)
+class _Write:
+    endpoint: str
+    entity_key: str
+    payload: object
+    fetched_at: str
+    db_path: str
+    pending: PendingWrite
+    # Set for a 304 replay: the write that stored the body it re-confirmed.
+    prior: PendingWrite | None = None
+
+
+class PayloadWriter(WriteBehindWriter):
+    thread_name = "elixir-raw-payloads"
+    event = "raw_payload"
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = BATCH_SIZE,
+        flush_interval_ms: int = FLUSH_INTERVAL_MS,
+        max_items: int = QUEUE_MAX_ITEMS,
+        put_timeout: float = _PUT_TIMEOUT_SECONDS,
+    ):
+        super().__init__(
+            batch_size=batch_size,
+            flush_interval_ms=flush_interval_ms,
+            max_items=max_items,
+            put_timeout=put_timeout,
+        )
+
+    def submit(
+        self,
+        endpoint: str,
+        entity_key: str | None,
+        payload,
+        *,
+        prior: PendingWrite | None = None,
+    ) -> PendingWrite:
+        """Queue one response for persistence; never blocks past the put timeout."""
+        pending = PendingWrite()
+        self._enqueue(
+            _Write(
+                endpoint=endpoint,
+                entity_key=entity_key or "global",
+                payload=payload,
+                fetched_at=db._utcnow(),
+                db_path=os.fspath(db._resolve_db_path()),
+                pending=pending,
+                prior=prior,
+            )
+        )
+        return pending
+
+    def _commit(self, items: list[_Write]) -> None:
+        _commit(items)
+
+    def _target(self, item: _Write) -> str:
+        return item.db_path
+
+    def _describe(self, item: _Write) -> str:
+        return f"endpoint={item.endpoint} entity={item.entity_key}"
+
+    def _given_up(self, item: _Write) -> None:
+        item.pending._resolve(None)
+
+
+def _store(conn, item: _Write, staged: dict[int, dict | None]) -> tuple[dict | None, bool]:
+    """Write one item inside the batch transaction; returns (stored, is_new_body)."""
+    if item.prior is not None:
+        # The prior write is either earlier in this batch or already committed.
+        prior = staged[id(item.prior)] if id(item.prior) in staged else item.prior.result(0)
+        if prior:
+            receipt = db._store_unchanged_receipt(
+                conn, item.endpoint, item.entity_key, prior, fetched_at=item.fetched_at
+            )
+            if receipt is not None:
+                return receipt, False
+    stored = db._store_raw_payload(
+        conn, item.endpoint, item.entity_key, item.payload, fetched_at=item.fetched_at
+    )
+    try:
+        if item.endpoint == "events":
+            db.upsert_game_mode_contexts_from_events(item.payload, conn=conn)
+        elif item.endpoint == "leaderboards":
+            db.upsert_game_mode_contexts_from_leaderboards(item.payload, conn=conn)
+    except Exception:
+        log.exception(
+            "game_mode_context_persist_failed endpoint=%s entity=%s",
+            item.endpoint,
+            item.entity_key,
+        )
+    return stored, True
+
+
+def _commit(items: list[_Write]) -> None:
+    """Persist ``items`` in one transaction, then resolve their handles."""
+    conn = db.get_connection(items[0].db_path)
+    try:
+        try:
+            db.bootstrap_api_sentinel_baseline(conn=conn)
+        except Exception:
+            log.exception("api_sentinel_baseline_failed")
+        staged: dict[int, dict | None] = {}
+        new_bodies = []
+        try:
+            for item in items:
+                stored, is_new = _store(conn, item, staged)
+                staged[id(item.pending)] = stored
+                if is_new:
+                    new_bodies.append(item)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        for item in items:
+            item.pending._resolve(staged[id(item.pending)])
+        # Sentinel observations commit on their own; a 304 body has nothing
+        # new to show them.
+        for item in new_bodies:
+            try:
+                db.record_api_payload_sentinel_observations(
+                    item.endpoint, item.entity_key, item.payload, conn=conn
+                )
+            except Exception:
+                conn.rollback()
+                log.exception(
+                    "api_sentinel_observation_failed endpoint=%s entity=%s",
+                    item.endpoint,
+                    item.entity_key,
+                )
+    finally:
+        conn.close()
+
+
+_WRITER = PayloadWriter()
+
+
+def submit(endpoint: str, entity_key: str | None, payload, *, prior=None) -> PendingWrite:
+    return _WRITER.submit(endpoint, entity_key, payload, prior=prior)
+
+
+def flush(timeout: float = 30.0) -> bool:
+    return _WRITER.flush(timeout)
+
+
+def stats() -> dict:
+    return _WRITER.stats()
+
+
+__all__ = ["PayloadWriter", "PendingWrite", "flush", "stats", "submit"]
@@ -1345,7 +1345,10 @@ def get_clan_game_mode_summary(
         "FROM battle_events bf "
         "JOIN players m ON m.player_tag = bf.player_tag "
         "WHERE bf.is_ranked = 1 AND bf.battle_time >= strftime('%Y-%m-%dT%H:%M:%SZ', 'now', ?) "
-        "GROUP BY bf.player_tag "
+        # The unary + keeps SQLite from walking idx_battle_events_player_time to
+        # get the groups pre-sorted: that reads all retained battles, where the
+        # battle_time index reads only the window.
+        "GROUP BY +bf.player_tag "
         "ORDER BY ranked_battles DESC, trophy_delta DESC, m.current_name COLLATE NOCASE "
         "LIMIT ?",
         (f"-{days} day", limit),
@@ -12,8 +12,10 @@ cares about.
 It is a database rather than a log file on purpose. The first question anyone
 asks of this data is "p95 transaction hold time by call site this week", which is
 a GROUP BY. JSONL would mean writing a parser, and then maintaining a worse
-database. (If volume ever makes the direct writes hurt, the upgrade is to append
-JSONL on the hot path and roll it in here on a schedule — but measure first.)
+database. The hot-path writers (model calls, write transactions, wake
+observations) no longer commit inline: they enqueue for storage.telemetry_writer,
+which commits in batches on its own thread, and connect() flushes that queue so
+a reader still sees every row recorded before it.
 
 **Nothing in this module may raise into a caller.** Telemetry that can break the
 workload is worse than no telemetry, so every public function swallows and logs.
@@ -35,6 +37,8 @@ import threading
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from storage import telemetry_writer
+
 log = logging.getLogger("elixir")
 
 DEFAULT_PATH = "elixir-telemetry.db"
@@ -183,8 +187,10 @@ def connect() -> sqlite3.Connection:
 
     Per-thread because this is written from the engine tick, the awareness worker
     and the scheduler concurrently, and sqlite3 connections are not shareable
-    across threads by default.
+    across threads by default. Rows still queued in storage.telemetry_writer are
+    committed first, so whatever reads through this connection sees them.
     """
+    telemetry_writer.flush()
     conn = getattr(_local, "conn", None)
     if conn is not None:
         try:
@@ -197,7 +203,18 @@ def connect() -> sqlite3.Connection:
             # turns every later write into a hard error, and telemetry must never
             # be the thing that breaks — reopen instead.
             _local.conn = None
-    path = telemetry_path()
+    conn = _open(telemetry_path(), ensure_schema=False)
+    _local.conn = conn
+    _ensure_schema(conn)
+    return conn
+
+
+def _open(path: str, *, ensure_schema: bool = True) -> sqlite3.Connection:
+    """A new, uncached connection to the telemetry file at ``path``.
+
+    The background writer holds one of these per file rather than going through
+    connect(), whose cache and schema flag belong to the calling thread.
+    """
     _narrow_owner_only_family(path)
     conn = sqlite3.connect(path, timeout=10)
     conn.row_factory = sqlite3.Row
@@ -207,8 +224,8 @@ def connect() -> sqlite3.Connection:
     # Durability is not worth a fsync per row for telemetry: losing the last few
     # observations to a hard crash costs nothing, and the writes are frequent.
     conn.execute("PRAGMA synchronous = NORMAL")
-    _local.conn = conn
-    _ensure_schema(conn)
+    if ensure_schema:
+        _apply_schema(conn)
     return conn
 
 
@@ -268,6 +285,11 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     global _schema_ready
     if _schema_ready:
         return
+    _apply_schema(conn)
+    _schema_ready = True
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
     with _schema_lock:
         for statement in _SCHEMA:
             conn.execute(statement)
@@ -276,7 +298,6 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
             if column not in existing:
                 conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
         conn.commit()
-        _schema_ready = True
 
 
 def record_llm_call(
@@ -309,10 +330,12 @@ def record_llm_call(
 
     Everything after ``response_json`` is the call's configuration and outcome as
     first-class columns rather than fields buried in the two blobs, which are
-    pruned at 14 days while the row itself lives 90. See ``_ADDED_COLUMNS``."""
+    pruned at 14 days while the row itself lives 90. See ``_ADDED_COLUMNS``.
+
+    Queued, not written: the row commits on storage.telemetry_writer's thread."""
     try:
-        telemetry = connect()
-        telemetry.execute(
+        telemetry_writer.submit(
+            telemetry_path(),
             "INSERT INTO llm_calls (recorded_at, workflow, model, ok, error, duration_ms, "
             "prompt_tokens, completion_tokens, total_tokens, cache_creation_tokens, "
             "cache_read_tokens, prompt_json, response_json, effort, max_tokens, timeout_s, "
@@ -342,11 +365,16 @@ def record_llm_call(
                 turn_id,
             ),
         )
-        telemetry.commit()
     except Exception:
         log.debug("telemetry: llm call record failed", exc_info=True)
 
 
+_TRANSACTION_INSERT = (
+    "INSERT INTO db_transactions (recorded_at, call_site, held_ms, statements, outcome, "
+    "sites_json) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
 def record_transaction(
     call_site: str,
     held_ms: int,
@@ -356,30 +384,34 @@ def record_transaction(
     sites_json: Optional[str] = None,
     txn_id: Optional[int] = None,
 ) -> Optional[int]:
-    """Record one write transaction; returns its row id.
+    """Record one write transaction.
 
     ``txn_id`` UPDATES an existing row instead of inserting. The watchdog writes a
     provisional ``outcome='stalled'`` row as soon as a transaction crosses the
     threshold, because a transaction that hangs and dies with its process would
     otherwise never be recorded at all — and those are the ones that matter.
     Finalizing in place keeps it to one row per transaction.
+
+    That provisional row is written inline and its row id returned: it has to
+    land before the process might die, and the watchdog needs the id. Every
+    other row — the finalize included — is queued for storage.telemetry_writer,
+    off the committing thread, and returns ``txn_id`` (None for an insert).
     """
     try:
-        conn = connect()
         if txn_id is not None:
-            conn.execute(
+            telemetry_writer.submit(
+                telemetry_path(),
                 "UPDATE db_transactions SET held_ms = ?, statements = ?, outcome = ?, "
                 "sites_json = COALESCE(?, sites_json) WHERE txn_id = ?",
                 (int(held_ms), int(statements), outcome, sites_json, int(txn_id)),
             )
-            conn.commit()
             return txn_id
-        cur = conn.execute(
-            "INSERT INTO db_transactions "
-            "(recorded_at, call_site, held_ms, statements, outcome, sites_json) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (_utcnow(), call_site, int(held_ms), int(statements), outcome, sites_json),
-        )
+        row = (_utcnow(), call_site, int(held_ms), int(statements), outcome, sites_json)
+        if outcome != "stalled":
+            telemetry_writer.submit(telemetry_path(), _TRANSACTION_INSERT, row)
+            return None
+        conn = connect()
+        cur = conn.execute(_TRANSACTION_INSERT, row)
         conn.commit()
         return int(cur.lastrowid)
     except Exception:
@@ -415,11 +447,11 @@ def record_wake_observation(
 
     Held decisions are recorded too (``fired=0``): "we would have fired but the
     daily budget was spent" is the observation that tells us the budget is
-    wrong, and it is invisible if only fires are stored.
+    wrong, and it is invisible if only fires are stored. Queued, like model calls.
     """
     try:
-        conn = connect()
-        conn.execute(
+        telemetry_writer.submit(
+            telemetry_path(),
             "INSERT INTO wake_observations (recorded_at, mode, wake_class, wake_model, "
             "event_count, signal_keys_json, event_types_json, oldest_observed_at, reason, fired) "
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -436,11 +468,15 @@ def record_wake_observation(
                 1 if fired else 0,
             ),
         )
-        conn.commit()
     except Exception:
         log.debug("telemetry: wake observation record failed", exc_info=True)
 
 
+def flush(timeout: float = 10.0) -> bool:
+    """Commit every queued telemetry row now; False if the writer did not finish."""
+    return telemetry_writer.flush(timeout)
+
+
 def purge_old(now: datetime | None = None) -> dict:
     """Retention for the telemetry file. Runs on its own connection, so it can
     never block the clan database."""
@@ -475,6 +511,7 @@ def purge_old(now: datetime | None = None) -> dict:
 
 __all__ = [
     "connect",
+    "flush",
     "purge_old",
     "record_llm_call",
     "record_stall",
@@ -0,0 +1,123 @@
+"""Write-behind persistence for telemetry rows.
+
+``record_llm_call`` and ``record_transaction`` used to insert and commit one
+row each, inline — on the agent loop after every model call, and on every
+clan-DB commit that held the writer past ``db_watch.REPORT_MS``, the tick's
+included. Each of those paid a SQLite commit on the telemetry file (and its
+busy timeout, when another process held it) for a row nobody reads until a
+report runs.
+
+Here the callers only enqueue (storage._write_behind). One writer thread
+drains the queue and commits a batch per transaction — up to
+``ELIXIR_TELEMETRY_BATCH`` rows, or whatever arrived within
+``ELIXIR_TELEMETRY_FLUSH_MS`` of the first one. Rows are
+stamped at submit, so ``recorded_at`` is when the thing happened, not when it
+was written.
+
+Readers go through ``storage.telemetry.connect()``, which calls :func:`flush`
+first: a read sees every row queued before it. The queue is bounded and a
+submit never waits on it — a full queue drops the row and counts it.
+Telemetry is allowed to be lossy; a model call or a tick waiting on its own
+instrument is not. Pending rows are drained at interpreter exit.
+
+Like the inline writes it replaced, nothing here raises into a caller.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from storage._write_behind import WriteBehindWriter
+
+BATCH_SIZE = int(os.getenv("ELIXIR_TELEMETRY_BATCH", "256"))
+FLUSH_INTERVAL_MS = int(os.getenv("ELIXIR_TELEMETRY_FLUSH_MS", "500"))
+QUEUE_MAX_ITEMS = int(os.getenv("ELIXIR_TELEMETRY_QUEUE", "10000"))
+# Drops are logged on the first and then every Nth, not one warning per row.
+_DROP_LOG_EVERY = 1000
+
+
+@dataclass(frozen=True)
+class _Row:
+    path: str
+    sql: str
+    params: tuple
+
+
+class TelemetryWriter(WriteBehindWriter):
+    thread_name = "elixir-telemetry"
+    event = "telemetry"
+    drop_log_every = _DROP_LOG_EVERY
+    timeout = 10.0
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = BATCH_SIZE,
+        flush_interval_ms: int = FLUSH_INTERVAL_MS,
+        max_items: int = QUEUE_MAX_ITEMS,
+    ):
+        super().__init__(
+            batch_size=batch_size, flush_interval_ms=flush_interval_ms, max_items=max_items
+        )
+        # The writer thread's connection, reopened when the target file changes.
+        self._conn = None
+        self._conn_path: str | None = None
+
+    def submit(self, path: str, sql: str, params: tuple) -> bool:
+        """Queue one statement against the telemetry file at ``path``.
+
+        Returns False when the row was dropped. Never blocks.
+        """
+        return self._enqueue(_Row(path, sql, tuple(params)))
+
+    def _commit(self, rows: list[_Row]) -> None:
+        conn = self._connection(rows[0].path)
+        try:
+            for row in rows:
+                conn.execute(row.sql, row.params)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _target(self, row: _Row) -> str:
+        return row.path
+
+    def _describe(self, row: _Row) -> str:
+        return f"sql={row.sql[:60]}"
+
+    def _stopped(self) -> None:
+        self._close_connection()
+
+    def _connection(self, path: str):
+        from storage import telemetry
+
+        if self._conn is None or self._conn_path != path:
+            self._close_connection()
+            self._conn = telemetry._open(path)
+            self._conn_path = path
+        return self._conn
+
+    def _close_connection(self) -> None:
+        conn, self._conn, self._conn_path = self._conn, None, None
+        if conn is not None:
+            conn.close()
+
+
+_WRITER = TelemetryWriter()
+
+
+def submit(path: str, sql: str, params: tuple) -> bool:
+    return _WRITER.submit(path, sql, params)
+
+
+def flush(timeout: float = 10.0) -> bool:
+    return _WRITER.flush(timeout)
+
+
+def stats() -> dict:
+    return _WRITER.stats()
+
+
+__all__ = ["TelemetryWriter", "flush", "stats", "submit"]
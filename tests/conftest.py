@@ -21,6 +21,7 @@ import json
 import os
 import shutil
 import sqlite3
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -264,13 +265,16 @@ def _isolate_telemetry_db(tmp_path, monkeypatch):
     """Telemetry lives in its own file, so tests need their own copy of it too --
     otherwise a test run writes llm_calls rows into the developer's real
     elixir-telemetry.db. Also resets the module's cached per-thread connection
-    and schema flag, which would otherwise leak the previous test's path."""
+    and schema flag, which would otherwise leak the previous test's path, and
+    drains the background writer so no queued row outlives its test."""
     from storage import telemetry
 
+    telemetry.flush()
     monkeypatch.setenv("ELIXIR_TELEMETRY_DB_PATH", str(tmp_path / "telemetry.db"))
     telemetry._local.__dict__.pop("conn", None)
     telemetry._schema_ready = False
     yield
+    telemetry.flush()
     telemetry._local.__dict__.pop("conn", None)
     telemetry._schema_ready = False
 
@@ -304,8 +308,10 @@ def _flush_async_status_writes(_isolate_default_sqlite_db):
     """Finish best-effort worker writes before each temp database disappears."""
     yield
     from runtime import status as runtime_status
+    from storage import payload_writer
 
     runtime_status.flush_status_writes()
+    payload_writer.flush()
 
 
 @pytest.fixture(autouse=True)
@@ -356,3 +362,37 @@ def engine_conn(_isolate_default_sqlite_db):
     conn.execute("PRAGMA foreign_keys=ON")
     yield conn
     conn.close()
+
+
+@pytest.fixture()
+def new_generation(_isolate_default_sqlite_db):
+    """Factory that records one materialization run — an applied generation
+    unless ``applied=False``. Writes through ``conn`` when one is passed, else
+    through its own connection to the per-test DB (safe from any thread)."""
+
+    def _new_generation(conn: sqlite3.Connection | None = None, *, applied: bool = True) -> None:
+        owned = conn is None
+        if owned:
+            conn = sqlite3.connect(_isolate_default_sqlite_db)
+        try:
+            conn.execute(
+                "INSERT INTO materialization_runs (started_at, completed_at, status, apply_ok, "
+                "manage_ok) VALUES ('2026-07-01T00:00:00Z', '2026-07-01T00:01:00Z', ?, ?, 1)",
+                ("complete" if applied else "failed", int(applied)),
+            )
+            conn.commit()
+        finally:
+            if owned:
+                conn.close()
+
+    return _new_generation
+
+
+@pytest.fixture()
+def tool_use():
+    """Factory for a model response's ``tool_use`` content block."""
+
+    def _tool_use(tool_id: str, name: str, arguments: dict) -> SimpleNamespace:
+        return SimpleNamespace(type="tool_use", id=tool_id, name=name, input=arguments)
+
+    return _tool_use
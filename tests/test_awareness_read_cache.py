@@ -0,0 +1,152 @@
+"""build_read's block cache: reuse within a generation, never across one.
+
+Every cached block is replaced with a fake that reports the generation (and, for
+stamped blocks, the table state) it was built from, so a stale block is visible
+as a mismatch with the read's own ``data_generation``.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from engine.readiness import applied_generation_id
+from runtime.awareness import diagnostic
+from runtime.awareness import read as read_mod
+
+CACHED = tuple(read_mod._BLOCK_CACHE_SPECS)
+
+
+def _install_fakes(monkeypatch, calls: dict) -> None:
+    def fake(name, stamp_sql=None):
+        def build(conn):
+            calls[name] = calls.get(name, 0) + 1
+            value = {"gen": applied_generation_id(conn)}
+            if stamp_sql:
+                value["stamp"] = list(conn.execute(stamp_sql).fetchone())
+            return value
+
+        return build
+
+    specs = read_mod._BLOCK_CACHE_SPECS
+    war = fake("war_status")
+    season = fake("war_season")
+    history = fake("war_history")
+    races = fake("award_races")
+    monkeypatch.setattr(
+        read_mod.war_capability,
+        "get_war_intelligence",
+        lambda conn: {"available": False, **war(conn)},
+    )
+    monkeypatch.setattr(
+        read_mod.war_capability,
+        "get_war_season_view",
+        lambda view, conn, **_: {"data": (season if view == "snapshot" else history)(conn)},
+    )
+    monkeypatch.setattr(
+        read_mod.awards_capability,
+        "get_awards_recognition",
+        lambda conn, **_: {"data": races(conn)},
+    )
+    for name, attr in (
+        ("mode_pulse", "_mode_pulse"),
+        ("cake_days_today", "_cake_days_today"),
+        ("channel_memory", "_channel_memory"),
+        ("leader_action_board", "_leader_action_board"),
+        ("management", "_management"),
+    ):
+        monkeypatch.setattr(read_mod, attr, fake(name, specs[name][0]))
+
+
+def _fresh(read: dict) -> None:
+    gen = (read["data_generation"] or {}).get("materialization_id")
+    for name in CACHED:
+        if name == "war_status":  # consumed by the time/standing blocks, not kept
+            continue
+        assert read[name]["gen"] == gen, f"{name} served from generation {read[name]['gen']}"
+
+
+def test_a_new_generation_always_invalidates(engine_conn, monkeypatch, new_generation):
+    read_mod._clear_block_cache()
+    calls: dict[str, int] = {}
+    _install_fakes(monkeypatch, calls)
+    clock = [datetime(2026, 7, 1, 12, tzinfo=timezone.utc)]
+    monkeypatch.setattr(read_mod, "_now", lambda: clock[0])
+
+    # No applied generation yet: nothing to key on, so every build builds.
+    read_mod.build_read(conn=engine_conn)
+    read_mod.build_read(conn=engine_conn)
+    assert all(calls[name] == 2 for name in CACHED)
+
+    rng = random.Random(2026_07_01)
+    new_generation(engine_conn)
+    for step in range(60):
+        op = rng.choice(["generation", "failed_run", "post", "action", "tick", "same"])
+        if op == "generation":
+            new_generation(engine_conn)
+        elif op == "failed_run":
+            new_generation(engine_conn, applied=False)
+        elif op == "post":
+            engine_conn.execute(
+                "INSERT INTO awareness_posts (lane, content_preview, posted_at) "
+                "VALUES ('elixir', 'x', '2026-07-01T12:00:00Z')"
+            )
+            engine_conn.commit()
+        elif op == "action":
+            engine_conn.execute(
+                "INSERT INTO leader_action_recommendations (action_key, action_type, "
+                "objective, status, prompt_text, proposed_at, created_at, updated_at, is_test) "
+                "VALUES (?, 'kick_recommendation', 'o', 'proposed', 'p', ?, ?, ?, 0)",
+                (f"kick:#AAA:{step}", *["2026-07-01T12:00:00Z"] * 3),
+            )
+            engine_conn.commit()
+        elif op == "tick":
+            clock[0] += timedelta(seconds=rng.choice([5, 30, 90, 400]))
+        before = dict(calls)
+        read = read_mod.build_read(conn=engine_conn)
+        _fresh(read)
+        gen = read["data_generation"]["materialization_id"]
+        for name in ("channel_memory",):
+            assert (
+                read[name]["stamp"][0]
+                == engine_conn.execute("SELECT MAX(post_id) FROM awareness_posts").fetchone()[0]
+            )
+        if op == "generation":
+            assert all(calls[name] == before[name] + 1 for name in CACHED), f"step {step}"
+            assert not any(e["hit"] for e in read["_block_cache"].values())
+        if op in ("same", "failed_run"):
+            # Nothing a block depends on moved (a failed run is not a generation).
+            assert calls == before, f"step {step}: {op} rebuilt a block"
+            assert all(e["hit"] for e in read["_block_cache"].values())
+        assert gen == applied_generation_id(engine_conn)
+
+    stats = read_mod.block_cache_stats()
+    assert all(stats[name]["hits"] and stats[name]["misses"] for name in CACHED)
+    assert "block cache:" in diagnostic.read_summary(read)
+
+
+def test_cached_blocks_are_copies(engine_conn, monkeypatch, new_generation):
+    read_mod._clear_block_cache()
+    _install_fakes(monkeypatch, {})
+    new_generation(engine_conn)
+    first = read_mod.build_read(conn=engine_conn)
+    first["management"]["gen"] = "mutated by a caller"
+    second = read_mod.build_read(conn=engine_conn)
+    assert second["_block_cache"]["management"]["hit"]
+    assert second["management"]["gen"] == applied_generation_id(engine_conn)
+
+
+def test_a_degraded_block_is_not_cached(engine_conn, monkeypatch, new_generation):
+    read_mod._clear_block_cache()
+    _install_fakes(monkeypatch, {})
+    new_generation(engine_conn)
+
+    def boom(conn):
+        raise RuntimeError("mode pulse down")
+
+    monkeypatch.setattr(read_mod, "_mode_pulse", boom)
+    assert "mode_pulse" in read_mod.build_read(conn=engine_conn)["_degraded"]
+    monkeypatch.setattr(read_mod, "_mode_pulse", lambda conn: {"gen": applied_generation_id(conn)})
+    read = read_mod.build_read(conn=engine_conn)
+    assert "mode_pulse" not in read["_degraded"]
+    assert read["_block_cache"]["mode_pulse"]["hit"] is False
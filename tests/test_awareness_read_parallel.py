@@ -0,0 +1,126 @@
+"""build_read with reader threads: same read as the serial build, one generation.
+
+Workers read through their own read-only connections, so each one is pinned to
+the generation the main snapshot sees; a block whose worker lands on another
+generation is re-read on the main connection.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from engine import readiness
+from runtime.awareness import diagnostic
+from runtime.awareness import read as read_mod
+
+_VOLATILE = ("generated_at", "_block_cache", "_read_timing")
+
+
+@pytest.fixture()
+def wal_conn(engine_conn):
+    # Production runs WAL; a reader pinned mid-build must not block the writer.
+    engine_conn.execute("PRAGMA journal_mode = WAL")
+    read_mod._clear_block_cache()
+    yield engine_conn
+    read_mod._close_read_pool()
+    read_mod._clear_block_cache()
+
+
+def _seed(conn, new_generation) -> None:
+    new_generation(conn)
+    for lane in ("elixir", "announcements"):
+        conn.execute(
+            "INSERT INTO awareness_posts (lane, content_preview, posted_at, discord_message_id) "
+            "VALUES (?, 'hello', '2026-07-01T12:00:00Z', ?)",
+            (lane, f"m-{lane}"),
+        )
+    conn.execute(
+        "INSERT INTO leader_action_recommendations (action_key, action_type, objective, "
+        "status, prompt_text, proposed_at, created_at, updated_at, is_test) VALUES "
+        "('kick:#AAA:1', 'kick_recommendation', 'o', 'proposed', 'p', "
+        "'2026-07-01T12:00:00Z', '2026-07-01T12:00:00Z', '2026-07-01T12:00:00Z', 0)"
+    )
+    conn.commit()
+
+
+def _stable(read: dict) -> dict:
+    return {key: value for key, value in read.items() if key not in _VOLATILE}
+
+
+def test_parallel_read_matches_the_serial_read(wal_conn, new_generation):
+    _seed(wal_conn, new_generation)
+    read_mod.build_read(conn=wal_conn)  # bootstraps the event cursors
+    wal_conn.commit()
+
+    serial = read_mod.build_read(conn=wal_conn, workers=0)
+    read_mod._clear_block_cache()
+    parallel = read_mod.build_read(conn=wal_conn, workers=4)
+
+    assert _stable(parallel) == _stable(serial)
+    assert list(parallel) == list(serial)
+    assert parallel["_degraded"] == []
+    timing = parallel["_read_timing"]
+    assert timing["workers"] == 4 and timing["unpinned"] == []
+    assert set(read_mod._READ_KEYS[2:]) - {"signals_by_category", "hard_post_signals"} <= set(
+        timing["blocks_ms"]
+    )
+    assert "read built in" in diagnostic.read_summary(parallel)
+    assert serial["_read_timing"]["workers"] == 0
+    assert wal_conn.in_transaction is False
+
+
+def test_a_worker_on_a_newer_generation_gives_its_block_back(wal_conn, monkeypatch, new_generation):
+    _seed(wal_conn, new_generation)
+    read_mod.build_read(conn=wal_conn)
+    wal_conn.commit()
+    read_mod._clear_block_cache()
+    real_snapshot = readiness.generation_snapshot
+    state = {"main": None}
+
+    def racing_snapshot(conn):
+        result = real_snapshot(conn)
+        if state["main"] is None:
+            # The main snapshot is taken; the engine lands a generation before
+            # any worker opens its own.
+            state["main"] = result["materialization_id"]
+            new_generation()
+        return result
+
+    def generation_seen(c):
+        return c.execute(
+            "SELECT MAX(materialization_id) FROM materialization_runs WHERE apply_ok = 1"
+        ).fetchone()[0]
+
+    monkeypatch.setattr(readiness, "generation_snapshot", racing_snapshot)
+    monkeypatch.setattr(read_mod, "_channel_memory", lambda c: {"gen": generation_seen(c)})
+    monkeypatch.setattr(read_mod, "_posting_pulse", lambda c: {"gen": generation_seen(c)})
+
+    read = read_mod.build_read(conn=wal_conn, workers=2)
+
+    assert read["data_generation"]["materialization_id"] == state["main"]
+    assert read["channel_memory"] == {"gen": state["main"]}
+    assert read["posting_pulse"] == {"gen": state["main"]}
+    assert {"channel_memory", "posting_pulse"} <= set(read["_read_timing"]["unpinned"])
+    assert "re-read on the main snapshot" in diagnostic.read_summary(read)
+
+
+def test_uncommitted_caller_writes_keep_the_read_serial(wal_conn, new_generation):
+    _seed(wal_conn, new_generation)
+    wal_conn.execute(
+        "INSERT INTO awareness_posts (lane, content_preview, posted_at) "
+        "VALUES ('elixir', 'pending', '2026-07-02T12:00:00Z')"
+    )
+    read = read_mod.build_read(conn=wal_conn, workers=4)
+    assert read["_read_timing"]["workers"] == 0
+    previews = [p["preview"] for p in read["channel_memory"]["elixir"]["recent_posts"]]
+    assert "pending" in previews
+    wal_conn.rollback()
+
+
+def test_read_workers_env(monkeypatch):
+    monkeypatch.delenv("ELIXIR_AWARENESS_READ_WORKERS", raising=False)
+    assert read_mod.read_workers() == 0
+    monkeypatch.setenv("ELIXIR_AWARENESS_READ_WORKERS", "4")
+    assert read_mod.read_workers() == 4
+    monkeypatch.setenv("ELIXIR_AWARENESS_READ_WORKERS", "lots")
+    assert read_mod.read_workers() == 0
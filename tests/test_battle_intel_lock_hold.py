@@ -11,6 +11,9 @@ atomic. It needs to give the writer back.
 
 from __future__ import annotations
 
+import json
+import random
+
 import storage.battle_intel as bi
 
 
@@ -106,3 +109,117 @@ def test_deck_updates_go_through_executemany(engine_conn):
     spy = _WriteSpy(engine_conn)
     bi._fill_deck_facts(spy, restate=True)
     assert spy.single_updates == 0, "deck facts must not be written one row per statement"
+
+
+def _seed_battles(conn, n: int) -> None:
+    deck = json.dumps([{"id": 26000000 + i, "level": 11} for i in range(8)])
+    conn.executemany(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, outcome, "
+        "deck_json) VALUES (?, '#M', ?, ?, 'W', ?)",
+        [
+            (f"lock{i}", f"2026-08-03T00:00:{i:02d}Z", "2026-08-03T01:00:00Z", deck)
+            for i in range(n)
+        ],
+    )
+    conn.commit()
+
+
+def test_enrichment_commits_per_chunk_only_when_it_owns_the_connection(engine_conn, monkeypatch):
+    """The Stage-A writer follows the same contract, cursor included."""
+    _seed_battles(engine_conn, 4)
+    monkeypatch.setattr(bi, "WRITE_CHUNK", 1)
+    borrowed = _CommitSpy(engine_conn)
+    assert bi.enrich_battles(2, conn=borrowed)["enriched"] == 2
+    assert borrowed.commits == 0, "borrowed connection must not be committed"
+    engine_conn.commit()
+
+    owned = _CommitSpy(engine_conn)
+    monkeypatch.setattr("db.get_connection", lambda *a, **k: owned)
+    monkeypatch.setattr(owned, "close", lambda: None, raising=False)
+    assert bi.enrich_battles(100)["enriched"] == 2
+    assert owned.commits >= 2, "an owned run must commit each chunk, not once at the end"
+
+
+def _seed_interpreted(conn) -> None:
+    """Enriched battles with both decks, card facts for half the cards, and profiles."""
+    rng = random.Random(19)
+    cards = list(range(26000000, 26000024))
+    conn.executemany(
+        "INSERT INTO card_catalog (card_id, name, max_level, card_type, synced_at) "
+        "VALUES (?, ?, ?, 'troop', 'x')",
+        [(cid, f"c{cid}", (14, 12, 9, 6)[cid % 4]) for cid in cards],
+    )
+    conn.executemany(
+        "INSERT INTO card_facts (card_id, unit_domain, spell_tier, role) VALUES (?, ?, ?, ?)",
+        [
+            (cid, rng.choice(["air", "ground"]), rng.choice(["none", "small", "big"]), "support")
+            for cid in cards[::2]
+        ],
+    )
+
+    def deck():
+        return json.dumps(
+            [{"id": cid, "level": rng.randint(3, 11)} for cid in rng.sample(cards, 8)]
+        )
+
+    conn.executemany(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, outcome, "
+        "is_ranked, deck_json, opponent_deck_json) VALUES (?, '#M', ?, ?, 'W', ?, ?, ?)",
+        [
+            (
+                f"r{i}",
+                f"2026-08-03T00:{i // 60:02d}:{i % 60:02d}Z",
+                "2026-08-03T02:00:00Z",
+                int(i % 7 == 0),
+                deck(),
+                deck(),
+            )
+            for i in range(120)
+        ],
+    )
+    conn.commit()
+    bi.enrich_battles(500, conn=conn)
+    bi.rebuild_deck_intel(conn=conn)
+    conn.commit()
+
+
+def test_level_gaps_restate_only_changed_rows_in_batches(engine_conn):
+    _seed_interpreted(engine_conn)
+    expected = dict(
+        engine_conn.execute("SELECT battle_dedup_key, level_gap FROM battle_enrichment")
+    )
+    engine_conn.execute(
+        "UPDATE battle_enrichment SET level_gap = 99 WHERE battle_dedup_key IN ('r1', 'r2', 'r3')"
+    )
+    spy = _WriteSpy(engine_conn)
+    assert bi._restate_level_gaps(spy) == 3
+    assert spy.single_updates == 0 and spy.batched_rows == 3
+    assert (
+        dict(engine_conn.execute("SELECT battle_dedup_key, level_gap FROM battle_enrichment"))
+        == expected
+    )
+    assert bi._restate_level_gaps(engine_conn) == 0
+
+
+def test_a_process_pool_restates_exactly_what_one_process_does(engine_conn, monkeypatch):
+    _seed_interpreted(engine_conn)
+    monkeypatch.setattr(bi, "WRITE_CHUNK", 7)  # many pages, several in flight
+
+    def state():
+        return (
+            engine_conn.execute("SELECT * FROM deck_profile ORDER BY deck_hash").fetchall(),
+            engine_conn.execute(
+                "SELECT battle_dedup_key, level_gap FROM battle_enrichment ORDER BY 1"
+            ).fetchall(),
+        )
+
+    engine_conn.execute("UPDATE battle_enrichment SET level_gap = NULL")
+    serial = bi.rebuild_interpreted(force=True, conn=engine_conn)
+    expected = [[tuple(r) for r in rows] for rows in state()]
+    engine_conn.execute("UPDATE battle_enrichment SET level_gap = NULL")
+    engine_conn.execute("UPDATE deck_profile SET air_answer_count = NULL, facts_complete = NULL")
+    pooled = bi.rebuild_interpreted(force=True, workers=2, conn=engine_conn)
+    assert [[tuple(r) for r in rows] for rows in state()] == expected
+    assert pooled["level_gaps"] == serial["level_gaps"] > 0
+    assert pooled["deck_facts"] == serial["deck_facts"] > 0
+    assert set(pooled["seconds"]) == {"level_gaps", "deck_facts", "battle_tags"}
@@ -1,11 +1,13 @@
 """Stage-A worker regression tests: card-play extraction, duel/2v2 skip,
-idempotency, and the ranked level_gap guard (Battle Intelligence F1)."""
+idempotency, the ranked level_gap guard, and the enrichment cursor (Battle
+Intelligence F1)."""
 
 import json
 import sqlite3
+from datetime import datetime, timedelta, timezone
 
 from db.schema import build_database
-from storage.battle_intel import enrich_battles
+from storage.battle_intel import ENRICH_CURSOR_KEY, backfill, enrich_battles
 
 
 def _deck(*ids, evo=None):
@@ -113,3 +115,77 @@ def test_ranked_suppresses_level_gap(tmp_path):
     conn.commit()
     enrich_battles(100, conn=conn)
     assert conn.execute("SELECT level_gap FROM battle_enrichment").fetchone()[0] is None
+
+
+def _ago(days: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _cursor(conn) -> int:
+    return conn.execute(
+        "SELECT cursor_int FROM stream_cursors WHERE consumer_key = ?", (ENRICH_CURSOR_KEY,)
+    ).fetchone()[0]
+
+
+def test_a_short_batch_resumes_from_the_cursor(tmp_path):
+    conn = _db(tmp_path)
+    for i in range(5):
+        _insert_battle(
+            conn, f"b{i}", battle_time=f"2026-07-20T00:0{i}:00Z", deck_json=_deck(*range(1, 9))
+        )
+    _insert_battle(conn, "duel", deck_json=_deck(*range(1, 9)), rounds_json="[]")
+    conn.commit()
+
+    assert enrich_battles(2, conn=conn)["enriched"] == 2
+    keys = {r[0] for r in conn.execute("SELECT battle_dedup_key FROM battle_enrichment")}
+    assert keys == {"b0", "b1"}
+    assert (
+        _cursor(conn)
+        == conn.execute("SELECT rowid FROM battle_events WHERE dedup_key = 'b1'").fetchone()[0]
+    )
+
+    rest = enrich_battles(100, conn=conn)
+    assert rest["enriched"] == 3 and rest["scanned"] == 4  # the duel is read, not enriched
+    assert _cursor(conn) == conn.execute("SELECT MAX(rowid) FROM battle_events").fetchone()[0]
+
+
+def test_a_deck_filled_in_later_is_found_behind_the_cursor(tmp_path):
+    conn = _db(tmp_path)
+    # First mirrored thin, as an interactive refresh does: no deck yet.
+    _insert_battle(conn, "recent", battle_time=_ago(2))
+    _insert_battle(conn, "old", battle_time=_ago(40))
+    conn.commit()
+    assert enrich_battles(100, conn=conn)["enriched"] == 0
+    # The enrich-on-dedup UPDATE fills the deck in place; the rowid does not move.
+    conn.execute("UPDATE battle_events SET deck_json = ?", (_deck(*range(1, 9)),))
+    conn.commit()
+
+    assert enrich_battles(100, conn=conn)["enriched"] == 1  # within the look-back
+    # Older than the look-back: only the full sweep goes that far.
+    assert enrich_battles(100, conn=conn)["enriched"] == 0
+    conn.commit()
+    assert backfill(db_path=str(tmp_path / "t.db"))["enriched"] == 1
+
+
+def test_backfill_reparks_a_cursor_left_past_the_table(tmp_path):
+    conn = _db(tmp_path)
+    _insert_battle(conn, "b1", deck_json=_deck(*range(1, 9)))
+    conn.commit()
+    enrich_battles(100, conn=conn)
+    # VACUUM renumbered battle_events below a cursor it knows nothing about.
+    conn.execute(
+        "UPDATE stream_cursors SET cursor_int = 10000 WHERE consumer_key = ?", (ENRICH_CURSOR_KEY,)
+    )
+    _insert_battle(conn, "b2", battle_time="2026-07-21T00:00:00Z", deck_json=_deck(*range(1, 9)))
+    conn.commit()
+    assert enrich_battles(100, conn=conn)["enriched"] == 0
+
+    assert backfill(db_path=str(tmp_path / "t.db")) == {
+        "enriched": 1,
+        "card_plays": 8,
+        "batches": 1,
+    }
+    assert _cursor(conn) == conn.execute("SELECT MAX(rowid) FROM battle_events").fetchone()[0]
+    _insert_battle(conn, "b3", battle_time="2026-07-22T00:00:00Z", deck_json=_deck(*range(1, 9)))
+    conn.commit()
+    assert enrich_battles(100, conn=conn)["enriched"] == 1
@@ -0,0 +1,189 @@
+"""The columnar card-play store must answer exactly what the SQL GROUP BYs did.
+
+Seeded with a few weeks of plays on both sides, including NULL forms, draws,
+NULL outcomes and mixed competitive flags, then grown, purged and tampered with
+the way the enrichment job, retention and a bad write would.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+
+from capabilities import battle_intel
+from storage import card_play_columns
+
+CARDS = list(range(26000000, 26000012))
+TAGS = [f"#P{i}" for i in range(8)]
+
+
+def _plays(conn, rng: random.Random, start: int, count: int, *, day0: int = 1) -> None:
+    for i in range(start, start + count):
+        stamp = f"2026-07-{rng.randint(day0, 28):02d}T{rng.randrange(24):02d}:{i % 60:02d}:00Z"
+        conn.execute(
+            "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (f"b{i}", rng.choice(TAGS), stamp, stamp),
+        )
+        for side in ("member", "opponent"):
+            for card in rng.sample(CARDS, 8):
+                conn.execute(
+                    "INSERT INTO battle_card_plays (battle_dedup_key, side, card_id, "
+                    "evolution_level, player_tag, battle_time, outcome, is_competitive) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        f"b{i}",
+                        side,
+                        card,
+                        rng.choice([None, 0, 0, 1, 2]),
+                        rng.choice(TAGS),
+                        stamp,
+                        rng.choice(["W", "W", "L", "L", "D", None]),
+                        rng.choice([0, 1, 1, None]),
+                    ),
+                )
+
+
+def _sql_baselines(conn) -> dict:
+    return {
+        r[0]: (r[1], r[2])
+        for r in conn.execute(
+            "SELECT player_tag, SUM(outcome = 'W'), SUM(outcome = 'L') "
+            "FROM battle_card_plays WHERE side = 'member' GROUP BY player_tag"
+        )
+    }
+
+
+def _sql_totals(conn, since, competitive_only) -> list[tuple]:
+    where = ["side = 'opponent'"]
+    params: list = []
+    if competitive_only:
+        where.append("is_competitive = 1")
+    if since:
+        where.append("battle_time >= ?")
+        params.append(since)
+    return [
+        tuple(r)
+        for r in conn.execute(
+            "SELECT card_id, evolution_level, TOTAL(outcome = 'W'), TOTAL(outcome = 'L'), "
+            f"COUNT(*) FROM battle_card_plays WHERE {' AND '.join(where)} "
+            "GROUP BY card_id, evolution_level ORDER BY card_id, evolution_level",
+            params,
+        )
+    ]
+
+
+def _assert_parity(conn) -> None:
+    assert card_play_columns.member_baselines(conn) == _sql_baselines(conn)
+    for since in (None, "2026-07-01T00:00:00Z", "2026-07-14T12:30:00Z", "2026-07-29T00:00:00Z"):
+        for competitive_only in (False, True):
+            got = card_play_columns.opponent_card_totals(
+                conn, since=since, competitive_only=competitive_only
+            )
+            assert got == _sql_totals(conn, since, competitive_only)
+
+
+def test_store_matches_sql_through_growth_purge_and_drift(engine_conn):
+    card_play_columns._clear_card_play_columns()
+    rng = random.Random(2026_07_28)
+    _plays(engine_conn, rng, 0, 400)
+    engine_conn.commit()
+    # A read never pays for the full build: SQL answers until the job has built it.
+    assert card_play_columns.member_baselines(engine_conn) is None
+    assert card_play_columns.refresh_card_play_columns(conn=engine_conn)["rebuilt"]
+    _assert_parity(engine_conn)
+    path = card_play_columns._db_path(engine_conn)
+    built = card_play_columns._STORES[path]
+
+    # A writer mid-batch: its own connection must not fold rows that could roll back.
+    _plays(engine_conn, rng, 400, 50, day0=20)
+    assert card_play_columns.member_baselines(engine_conn) is None
+    engine_conn.commit()
+    _assert_parity(engine_conn)
+    assert card_play_columns._STORES[path] is built, "growth is incremental"
+
+    # Retention takes the oldest rows first: that moves MIN(rowid), which rebuilds.
+    engine_conn.execute("DELETE FROM battle_card_plays WHERE rowid <= 800")
+    engine_conn.commit()
+    assert card_play_columns.opponent_card_totals(engine_conn) is None
+    card_play_columns.refresh_card_play_columns(conn=engine_conn)
+    _assert_parity(engine_conn)
+    rebuilt = card_play_columns._STORES[path]
+    assert rebuilt is not built
+
+    # Writes the rowid marks cannot see — a delete inside the range, an in-place
+    # UPDATE — are what the checker is for.
+    assert card_play_columns.check_card_play_columns(conn=engine_conn)["mismatched_days"] == []
+    engine_conn.execute(
+        "DELETE FROM battle_card_plays WHERE rowid IN (SELECT rowid FROM battle_card_plays "
+        "WHERE battle_time LIKE '2026-07-12%' LIMIT 2)"
+    )
+    engine_conn.execute(
+        "UPDATE battle_card_plays SET outcome = 'W' WHERE rowid IN "
+        "(SELECT rowid FROM battle_card_plays WHERE outcome = 'L' AND battle_time LIKE "
+        "'2026-07-10%' LIMIT 3)"
+    )
+    engine_conn.commit()
+    assert card_play_columns._STORES[path] is rebuilt
+    report = card_play_columns.check_card_play_columns(conn=engine_conn)
+    assert report["mismatched_days"] == ["2026-07-10", "2026-07-12"] and report["repaired"]
+    _assert_parity(engine_conn)
+    assert card_play_columns.check_card_play_columns(conn=engine_conn)["mismatched_days"] == []
+
+
+def test_nemesis_view_reads_the_same_from_either_path(engine_conn, monkeypatch):
+    card_play_columns._clear_card_play_columns()
+    _plays(engine_conn, random.Random(11), 0, 600)
+    engine_conn.commit()
+    card_play_columns.refresh_card_play_columns(conn=engine_conn)
+    views = {
+        (scope, days): battle_intel._nemesis_view(engine_conn, None, scope, days)
+        for scope in ("all", "competitive")
+        for days in (None, 7)
+    }
+    assert any(v["cards_evaluated"] for v in views.values())
+    monkeypatch.setattr(card_play_columns, "opponent_card_totals", lambda *a, **k: None)
+    for (scope, days), view in views.items():
+        assert view == battle_intel._nemesis_view(engine_conn, None, scope, days)
+
+
+def test_reads_answer_from_sql_while_the_store_builds(engine_conn, monkeypatch):
+    card_play_columns._clear_card_play_columns()
+    _plays(engine_conn, random.Random(5), 0, 50)
+    engine_conn.commit()
+    loading, release = threading.Event(), threading.Event()
+    real_load = card_play_columns.CardPlayColumns.load
+
+    def slow_load(self, conn, **kwargs):
+        loading.set()
+        assert release.wait(10)
+        return real_load(self, conn, **kwargs)
+
+    monkeypatch.setattr(card_play_columns.CardPlayColumns, "load", slow_load)
+    builder = threading.Thread(target=card_play_columns.refresh_card_play_columns)
+    builder.start()
+    try:
+        assert loading.wait(10)
+        # Neither a read nor a second build queues behind the one in flight.
+        assert card_play_columns.member_baselines(engine_conn) is None
+        assert card_play_columns.refresh_card_play_columns(conn=engine_conn)["building"]
+    finally:
+        release.set()
+        builder.join(10)
+    assert card_play_columns.member_baselines(engine_conn) == _sql_baselines(engine_conn)
+
+
+def test_non_canonical_times_fall_back_to_sql(engine_conn):
+    card_play_columns._clear_card_play_columns()
+    engine_conn.execute(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at) "
+        "VALUES ('x', '#P0', '2026-07-18T12:00:00Z', '2026-07-18T12:00:00Z')"
+    )
+    engine_conn.execute(
+        "INSERT INTO battle_card_plays (battle_dedup_key, side, card_id, player_tag, "
+        "battle_time, outcome) VALUES ('x', 'member', 26000000, '#P0', "
+        "'20260718T120000.000Z', 'W')"
+    )
+    engine_conn.commit()
+    assert card_play_columns.member_baselines(engine_conn) is None
+    assert card_play_columns.check_card_play_columns(conn=engine_conn)["checked"] is False
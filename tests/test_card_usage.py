@@ -0,0 +1,208 @@
+"""The daily card-usage rollup must add up to exactly what the plays scan did.
+
+Battles are enriched the way the Stage-A job does it — across Chicago midnights,
+in every mode group, with draws — then grown with late-arriving days, tampered
+with, and read through the clan-wide card and nemesis views both ways.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+from capabilities import battle_intel
+from db import chicago_date_for_cr_timestamp
+from storage import card_play_columns, card_usage
+from storage.battle_intel import enrich_battles
+
+CARDS = list(range(26000000, 26000014))
+TAGS = [f"#P{i}" for i in range(6)]
+MODES = [("ladder", 1), ("ranked", 1), ("war", 1), ("friendly", 0), ("special_event", 1)]
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _stamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _deck(rng: random.Random) -> str:
+    return json.dumps(
+        [
+            {"id": card, "name": f"c{card}", "level": 11}
+            | ({"evolution_level": rng.choice([1, 2])} if rng.random() < 0.15 else {})
+            for card in rng.sample(CARDS, 8)
+        ]
+    )
+
+
+def _battles(conn, rng: random.Random, start: int, count: int, *, days: int = 40) -> None:
+    for i in range(start, start + count):
+        stamp = _stamp(NOW - timedelta(seconds=rng.randrange(days * 86400)))
+        mode, competitive = rng.choice(MODES)
+        conn.execute(
+            "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, "
+            "outcome, mode_group, is_competitive, is_war, is_ranked, is_ladder, deck_json, "
+            "opponent_deck_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                f"b{i}",
+                rng.choice(TAGS),
+                stamp,
+                _stamp(NOW),
+                rng.choice(["W", "W", "L", "L", "D"]),
+                mode,
+                competitive,
+                int(mode == "war"),
+                int(mode == "ranked"),
+                int(mode == "ladder"),
+                _deck(rng),
+                _deck(rng) if rng.random() < 0.9 else None,
+            ),
+        )
+    conn.commit()
+    enrich_battles(20000, conn=conn)
+    conn.commit()
+
+
+def _scanned(conn) -> dict:
+    out: dict[tuple, list] = {}
+    for r in conn.execute(
+        "SELECT battle_time, card_id, evolution_level, side, mode_group, outcome, player_tag "
+        "FROM battle_card_plays"
+    ):
+        key = (chicago_date_for_cr_timestamp(r[0]), r[1], r[2] or 0, r[3], r[4] or "")
+        acc = out.setdefault(key, [0, 0, 0, set()])
+        acc[0] += 1
+        acc[1] += r[5] == "W"
+        acc[2] += r[5] == "L"
+        acc[3].add(r[6])
+    return {key: (n, w, losses, len(who)) for key, (n, w, losses, who) in out.items()}
+
+
+def _rolled(conn) -> dict:
+    return {
+        tuple(r[:5]): tuple(r[5:])
+        for r in conn.execute(
+            "SELECT metric_date, card_id, evolution_level, side, mode_group, plays, wins, "
+            "losses, members FROM card_usage_daily"
+        )
+    }
+
+
+def _sql_totals(conn, since, groups, card_id) -> dict:
+    where, params = ["1 = 1"], []
+    if since:
+        where.append("battle_time >= ?")
+        params.append(since)
+    if groups is not None:
+        where.append(f"mode_group IN ({', '.join('?' * len(groups))})")
+        params.extend(sorted(groups))
+    if card_id is not None:
+        where.append("card_id = ?")
+        params.append(card_id)
+    return {
+        (r[0], r[1], r[2]): [r[3], r[4], r[5]]
+        for r in conn.execute(
+            "SELECT card_id, evolution_level, side, SUM(outcome = 'W'), SUM(outcome = 'L'), "
+            f"COUNT(*) FROM battle_card_plays WHERE {' AND '.join(where)} GROUP BY 1, 2, 3",
+            params,
+        )
+    }
+
+
+def _assert_parity(conn) -> None:
+    assert _rolled(conn) == _scanned(conn)
+    for since in (None, _stamp(NOW - timedelta(days=7)), _stamp(NOW - timedelta(hours=30))):
+        for groups in (None, battle_intel._SCOPE_MODE_GROUPS["competitive"], {"war"}):
+            for card_id in (None, CARDS[3]):
+                got = card_usage.card_totals(conn, since=since, mode_groups=groups, card_id=card_id)
+                assert got == _sql_totals(conn, since, groups, card_id)
+
+
+def test_the_rollup_adds_up_to_the_plays_through_growth(engine_conn):
+    card_usage._forget()
+    rng = random.Random(2026_10_17)
+    _battles(engine_conn, rng, 0, 300)
+    assert engine_conn.execute("SELECT COUNT(*) FROM card_usage_daily").fetchone()[0]
+    _assert_parity(engine_conn)
+
+    # New battles today, and a poll that turned up a member's older ones.
+    _battles(engine_conn, rng, 300, 40, days=1)
+    _battles(engine_conn, rng, 340, 40, days=60)
+    _assert_parity(engine_conn)
+    report = card_usage.check_card_usage(conn=engine_conn)
+    assert report["mismatched_days"] == [] and report["unplaced_plays"] == 0
+
+
+def test_reads_fall_back_until_the_rollup_covers_the_plays(engine_conn):
+    card_usage._forget()
+    _battles(engine_conn, random.Random(5), 0, 80)
+    assert card_usage.card_totals(engine_conn) is not None
+    # Plays written around the enrichment writer: the rollup no longer adds up.
+    engine_conn.execute(
+        "INSERT INTO battle_card_plays (battle_dedup_key, side, card_id, player_tag, "
+        "battle_time, outcome, mode_group) "
+        "SELECT dedup_key, 'member', 1, player_tag, battle_time, outcome, mode_group "
+        "FROM battle_events LIMIT 1"
+    )
+    engine_conn.commit()
+    assert card_usage.card_totals(engine_conn) is None
+    assert card_usage.card_totals(engine_conn, since="2026-10-01 00:00:00") is None
+    assert card_usage.rebuild_card_usage(conn=engine_conn)["rows"]
+    engine_conn.commit()
+    _assert_parity(engine_conn)
+
+
+def test_the_check_finds_and_repairs_drift(engine_conn):
+    card_usage._forget()
+    _battles(engine_conn, random.Random(9), 0, 150)
+    days = sorted({r[0] for r in engine_conn.execute("SELECT metric_date FROM card_usage_daily")})
+    engine_conn.execute(
+        "UPDATE card_usage_daily SET wins = wins + 1 WHERE rowid = "
+        "(SELECT MIN(rowid) FROM card_usage_daily WHERE metric_date = ?)",
+        (days[1],),
+    )
+    engine_conn.execute("DELETE FROM card_usage_daily WHERE metric_date = ?", (days[4],))
+    engine_conn.execute(
+        "INSERT INTO card_usage_daily (metric_date, card_id, side, plays, wins, losses, members) "
+        "VALUES ('2020-01-01', 1, 'member', 1, 1, 0, 1)"
+    )
+    engine_conn.commit()
+    report = card_usage.check_card_usage(conn=engine_conn)
+    assert report["mismatched_days"] == ["2020-01-01", days[1], days[4]] and report["repaired"]
+    engine_conn.commit()
+    assert card_usage.check_card_usage(conn=engine_conn)["mismatched_days"] == []
+    _assert_parity(engine_conn)
+
+
+def test_clan_views_read_the_same_from_the_rollup_as_from_sql(engine_conn, monkeypatch):
+    card_usage._forget()
+    card_play_columns._clear_card_play_columns()
+    _battles(engine_conn, random.Random(13), 0, 500)
+    engine_conn.execute(
+        "INSERT INTO card_catalog (card_id, name, card_type, synced_at, first_seen_at) "
+        "VALUES (?, 'Knight', 'troop', 'x', 'x')",
+        (CARDS[0],),
+    )
+    engine_conn.commit()
+    # The store serves the all/competitive nemesis reads; take it out of the way.
+    monkeypatch.setattr(card_play_columns, "opponent_card_totals", lambda *a, **k: None)
+    assert card_usage.card_totals(engine_conn) is not None
+    reads = {}
+    for scope in ("all", "competitive", "war", "ranked"):
+        for days in (None, 7, 30):
+            reads[("card", scope, days)] = battle_intel._card_view(
+                engine_conn, None, "Knight", scope, days
+            )
+            reads[("nemesis", scope, days)] = battle_intel._nemesis_view(
+                engine_conn, None, scope, days
+            )
+    assert any(v.get("cards_evaluated") for v in reads.values())
+    calls = []
+    monkeypatch.setattr(card_usage, "card_totals", lambda *a, **k: calls.append(1))
+    for (view, scope, days), got in reads.items():
+        if view == "card":
+            assert got == battle_intel._card_view(engine_conn, None, "Knight", scope, days)
+        else:
+            assert got == battle_intel._nemesis_view(engine_conn, None, scope, days)
+    assert len(calls) == len(reads)
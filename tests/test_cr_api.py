@@ -11,9 +11,13 @@ import cr_api
 @pytest.fixture(autouse=True)
 def _clear_cr_api_cache():
     cr_api._cache_clear()
+    cr_api._validators_clear()
+    cr_api._RATE_LIMIT_GATE.reset()
     with patch("cr_api._persist_raw_payload"):
         yield
         cr_api._cache_clear()
+        cr_api._validators_clear()
+        cr_api._RATE_LIMIT_GATE.reset()
 
 
 # ---------------------------------------------------------------------------
@@ -21,10 +25,11 @@ def _clear_cr_api_cache():
 # ---------------------------------------------------------------------------
 
 
-def _mock_response(json_data, status_code=200):
+def _mock_response(json_data, status_code=200, headers=None):
     """Create a mock requests.Response that behaves like a successful response."""
     resp = MagicMock(spec=requests.Response)
     resp.status_code = status_code
+    resp.headers = headers or {}
     resp.json.return_value = json_data
     resp.raise_for_status.return_value = None
     return resp
@@ -47,7 +52,7 @@ def _mock_response_http_error(status_code=404, headers=None):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_success(mock_get, mock_record):
     """Successful request returns parsed JSON and records the call."""
     payload = {"name": "POAP KINGS", "tag": "#ABC123"}
@@ -65,7 +70,7 @@ def test_request_json_success(mock_get, mock_record):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_retries_on_connection_error(mock_get, mock_record, mock_sleep):
     """ConnectionError triggers retries up to _MAX_RETRIES, then re-raises."""
     mock_get.side_effect = requests.ConnectionError("connection refused")
@@ -81,7 +86,7 @@ def test_request_json_retries_on_connection_error(mock_get, mock_record, mock_sl
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_retries_on_timeout(mock_get, mock_record, mock_sleep):
     """Timeout triggers retries up to _MAX_RETRIES, then re-raises."""
     mock_get.side_effect = requests.Timeout("read timed out")
@@ -95,7 +100,7 @@ def test_request_json_retries_on_timeout(mock_get, mock_record, mock_sleep):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_retry_then_succeed(mock_get, mock_record, mock_sleep):
     """Request succeeds on retry after initial ConnectionError."""
     success_resp = _mock_response({"ok": True})
@@ -109,7 +114,7 @@ def test_request_json_retry_then_succeed(mock_get, mock_record, mock_sleep):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_raises_immediately_on_permanent_http_error(mock_get, mock_record):
     """4xx (non-429) is permanent — raised without retry."""
     mock_get.return_value = _mock_response_http_error(404)
@@ -125,7 +130,7 @@ def test_request_json_raises_immediately_on_permanent_http_error(mock_get, mock_
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_retries_on_429(mock_get, mock_record, mock_sleep):
     """429 (rate limit) is transient — retried up to _MAX_RETRIES."""
     mock_get.return_value = _mock_response_http_error(429)
@@ -139,7 +144,7 @@ def test_request_json_retries_on_429(mock_get, mock_record, mock_sleep):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_retries_on_5xx(mock_get, mock_record, mock_sleep):
     """5xx (transient server error) is retried."""
     mock_get.return_value = _mock_response_http_error(503)
@@ -152,7 +157,7 @@ def test_request_json_retries_on_5xx(mock_get, mock_record, mock_sleep):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_retry_honors_retry_after_header(mock_get, mock_record, mock_sleep):
     """Retry-After header is respected over exponential backoff."""
     mock_get.return_value = _mock_response_http_error(429, headers={"Retry-After": "7"})
@@ -168,7 +173,7 @@ def test_request_json_retry_honors_retry_after_header(mock_get, mock_record, moc
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_request_json_429_then_success(mock_get, mock_record, mock_sleep):
     """A 429 followed by a 200 succeeds via retry."""
     mock_get.side_effect = [
@@ -189,7 +194,7 @@ def test_request_json_429_then_success(mock_get, mock_record, mock_sleep):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_player_strips_hash(mock_get, mock_record):
     """get_player strips leading '#' from the tag."""
     mock_get.return_value = _mock_response({"name": "Jamie", "tag": "#ABC123"})
@@ -203,7 +208,7 @@ def test_get_player_strips_hash(mock_get, mock_record):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_player_no_hash(mock_get, mock_record):
     """get_player works when tag has no '#' prefix."""
     mock_get.return_value = _mock_response({"name": "Jamie"})
@@ -217,7 +222,7 @@ def test_get_player_no_hash(mock_get, mock_record):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_player_returns_none_on_error(mock_get, mock_record, mock_sleep):
     """get_player returns None when the API raises RequestException."""
     mock_get.side_effect = requests.ConnectionError("down")
@@ -233,7 +238,7 @@ def test_get_player_returns_none_on_error(mock_get, mock_record, mock_sleep):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_player_chests_extracts_items(mock_get, mock_record):
     """get_player_chests returns the 'items' list from the response."""
     chests = [{"index": 0, "name": "Silver Chest"}, {"index": 1, "name": "Gold Chest"}]
@@ -245,7 +250,7 @@ def test_get_player_chests_extracts_items(mock_get, mock_record):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_player_chests_empty_items(mock_get, mock_record):
     """get_player_chests returns empty list when 'items' key is missing."""
     mock_get.return_value = _mock_response({})
@@ -257,7 +262,7 @@ def test_get_player_chests_empty_items(mock_get, mock_record):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_player_chests_returns_none_on_error(mock_get, mock_record, mock_sleep):
     """get_player_chests returns None on RequestException."""
     mock_get.side_effect = requests.ConnectionError("down")
@@ -274,7 +279,7 @@ def test_get_player_chests_returns_none_on_error(mock_get, mock_record, mock_sle
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_current_war_returns_none_on_error(mock_get, mock_record, mock_sleep):
     """get_current_war returns None when the API is unreachable."""
     mock_get.side_effect = requests.ConnectionError("timeout")
@@ -285,7 +290,7 @@ def test_get_current_war_returns_none_on_error(mock_get, mock_record, mock_sleep
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_current_war_success(mock_get, mock_record):
     """get_current_war returns war data on success."""
     war_data = {"state": "warDay", "clan": {"tag": "#ABC"}}
@@ -302,7 +307,7 @@ def test_get_current_war_success(mock_get, mock_record):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_cards_success(mock_get, mock_record):
     """get_cards returns the full card catalog."""
     cards_data = {
@@ -320,7 +325,7 @@ def test_get_cards_success(mock_get, mock_record):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_cards_returns_none_on_error(mock_get, mock_record, mock_sleep):
     """get_cards returns None on RequestException."""
     mock_get.side_effect = requests.Timeout("slow")
@@ -336,7 +341,7 @@ def test_get_cards_returns_none_on_error(mock_get, mock_record, mock_sleep):
 
 
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_events_success(mock_get, mock_record):
     """get_events returns the bare /events array."""
     events = [{"eventTag": "#2PRC9GU0", "title": "Princess Gambit"}]
@@ -351,7 +356,7 @@ def test_get_events_success(mock_get, mock_record):
 
 @patch("cr_api.time.sleep")
 @patch("cr_api.runtime_status.record_api_call")
-@patch("cr_api.requests.get")
+@patch("cr_api._SESSION.get")
 def test_get_events_returns_none_on_error(mock_get, mock_record, mock_sleep):
     """get_events returns None on RequestException."""
     mock_get.side_effect = requests.Timeout("slow")
@@ -359,3 +364,114 @@ def test_get_events_returns_none_on_error(mock_get, mock_record, mock_sleep):
     result = cr_api.get_events()
 
     assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Shared 429 gate
+# ---------------------------------------------------------------------------
+
+
+@patch("cr_api.time.sleep")
+@patch("cr_api.runtime_status.record_api_call")
+@patch("cr_api._SESSION.get")
+def test_429_holds_back_the_next_caller(mock_get, mock_record, mock_sleep):
+    """A throttled call publishes its Retry-After; the next caller — another
+    worker of the tick's fetch pool — waits it out before its own request."""
+    mock_get.return_value = _mock_response_http_error(429, headers={"Retry-After": "5"})
+    with pytest.raises(requests.HTTPError):
+        cr_api._request_json("/a", endpoint_name="player", entity_key="A")
+    own_sleeps = mock_sleep.call_count
+    assert own_sleeps == cr_api._MAX_RETRIES
+
+    mock_get.return_value = _mock_response({"ok": True})
+    assert cr_api._request_json("/b", endpoint_name="player", entity_key="B") == {"ok": True}
+    assert mock_sleep.call_count == own_sleeps + 1
+    waited = mock_sleep.call_args.args[0]
+    assert 4.0 < waited <= 5.0
+
+
+@patch("cr_api.time.sleep")
+def test_rate_limit_gate_exempts_the_caller_that_served_it(mock_sleep):
+    gate = cr_api._RateLimitGate()
+    served = gate.hold(3.0)
+    gate.wait(served)
+    mock_sleep.assert_not_called()
+    gate.wait()
+    mock_sleep.assert_called_once()
+    gate.reset()
+    gate.wait()
+    mock_sleep.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Pooled session and conditional requests
+# ---------------------------------------------------------------------------
+
+
+def test_session_pools_connections_and_asks_for_gzip():
+    adapter = cr_api._SESSION.get_adapter("https://api.clashroyale.com/v1/cards")
+    assert adapter._pool_maxsize == cr_api._POOL_MAXSIZE
+    assert "gzip" in cr_api._SESSION.headers["Accept-Encoding"]
+    assert cr_api._timeout("cards") == (cr_api._CONNECT_TIMEOUT_SECONDS, 20.0)
+    assert cr_api._timeout("player")[1] == cr_api._READ_TIMEOUT_SECONDS
+
+
+@patch("cr_api._persist_unchanged_payload")
+@patch("cr_api.runtime_status.record_api_call")
+@patch("cr_api._SESSION.get")
+def test_304_replays_the_validated_body(mock_get, mock_record, mock_unchanged):
+    payload = {"tag": "#ABC", "name": "Player"}
+    stored = {"payload_id": 7, "payload_hash": "h"}
+    mock_get.side_effect = [
+        _mock_response(payload, headers={"ETag": '"v1"', "Last-Modified": "Mon"}),
+        _mock_response(None, status_code=304),
+    ]
+    cr_api._persist_raw_payload.return_value = stored
+
+    assert cr_api._request_json("/players/%23ABC", endpoint_name="player", entity_key="ABC") == (
+        payload
+    )
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    replayed = cr_api._request_json("/players/%23ABC", endpoint_name="player", entity_key="ABC")
+
+    assert replayed is payload
+    sent = mock_get.call_args.kwargs["headers"]
+    assert sent["If-None-Match"] == '"v1"'
+    assert sent["If-Modified-Since"] == "Mon"
+    assert cr_api._persist_raw_payload.call_count == 1
+    mock_unchanged.assert_called_once_with("player", "ABC", payload, stored)
+    assert mock_record.call_args.kwargs["status_code"] == 304
+
+
+@patch("cr_api.runtime_status.record_api_call")
+@patch("cr_api._SESSION.get")
+def test_responses_without_validators_are_not_revalidated(mock_get, mock_record):
+    mock_get.return_value = _mock_response({"ok": True})
+    cr_api._request_json("/a", endpoint_name="cards")
+    cr_api._request_json("/a", endpoint_name="cards")
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    assert cr_api._persist_raw_payload.call_count == 2
+
+
+def test_unchanged_receipt_skips_payload_rewrite(tmp_path, monkeypatch):
+    import db
+    from db.schema import build_database
+
+    db_path = str(tmp_path / "receipts.db")
+    build_database(db_path, None)
+    monkeypatch.setenv("ELIXIR_DB_PATH", db_path)
+    conn = db.get_connection(db_path)
+    try:
+        stored = db._store_raw_payload(conn, "player", "#ABC", {"tag": "#ABC"})
+        again = db._store_unchanged_receipt(conn, "player", "#ABC", stored)
+        conn.commit()
+        assert again["payload_id"] == stored["payload_id"]
+        assert again["payload_hash"] == stored["payload_hash"]
+        assert again["receipt_id"] > stored["receipt_id"]
+        assert conn.execute("SELECT COUNT(*) FROM raw_api_payloads").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM api_observation_receipts").fetchone()[0] == 2
+
+        conn.execute("DELETE FROM raw_api_payloads")
+        assert db._store_unchanged_receipt(conn, "player", "#ABC", stored) is None
+    finally:
+        conn.close()
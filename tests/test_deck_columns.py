@@ -0,0 +1,252 @@
+"""The clan card reports must answer exactly what the row-by-row decode did.
+
+Seeded with a few weeks of member battles (including decks still missing, empty
+decks, nameless entries and former members), then grown, enriched, purged and
+tampered with the way ingest, retention and a bad write would. Every read is
+compared with the original per-row ``json.loads`` loop and per-member
+collection loads.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+
+from storage import cards, deck_columns
+
+NAMES = ["Knight", "Archers", "Hog Rider", "Fireball", "Zap", "Log", "Valkyrie", "Musketeer"]
+NAMES += ["Golem", "Miner", "Balloon", "Ronin"]
+MEMBERS = [f"#P{i}" for i in range(6)]
+FORMER = ["#GONE0", "#GONE1"]
+
+
+def _seed_roster(conn) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO clans (clan_tag, name, first_seen_at, last_seen_at, is_home) "
+        "VALUES ('#J2RGCRVG', 'POAP KINGS', '2026-02-04', '2026-07-30', 1)"
+    )
+    for tag in MEMBERS + FORMER:
+        conn.execute(
+            "INSERT INTO players (player_tag, current_name, first_seen_at, last_seen_at) "
+            "VALUES (?, ?, '2026-01-01', '2026-07-30')",
+            (tag, tag[1:]),
+        )
+        conn.execute(
+            "INSERT INTO clan_memberships (player_tag, joined_at, left_at, join_source) "
+            "VALUES (?, '2026-01-01', ?, 'test')",
+            (tag, "2026-06-01" if tag in FORMER else None),
+        )
+    conn.commit()
+
+
+def _deck(rng: random.Random):
+    roll = rng.random()
+    if roll < 0.08:
+        return None  # not captured yet; ingest may fill it in later
+    if roll < 0.1:
+        return rng.choice(["", "[]"])
+    deck = [{"name": name, "level": rng.randint(9, 16)} for name in rng.sample(NAMES, 8)]
+    if roll < 0.15:
+        deck.append({"id": 1})  # no name: not counted
+    if roll < 0.17:
+        deck.append(dict(deck[0]))  # listed twice: counted twice
+    return json.dumps(deck)
+
+
+def _battles(conn, rng: random.Random, start: int, count: int, *, day0: int = 1) -> None:
+    for i in range(start, start + count):
+        stamp = f"2026-07-{rng.randint(day0, 28):02d}T{rng.randrange(24):02d}:{i % 60:02d}:00Z"
+        conn.execute(
+            "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, "
+            "deck_json) VALUES (?, ?, ?, ?, ?)",
+            (f"b{i}", rng.choice(MEMBERS + FORMER), stamp, stamp, _deck(rng)),
+        )
+    conn.commit()
+
+
+def _decoded_row_by_row(conn, cutoff: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for row in conn.execute(
+        "SELECT bf.deck_json FROM battle_events bf WHERE bf.battle_time >= ? AND EXISTS ("
+        "  SELECT 1 FROM clan_memberships cm WHERE cm.player_tag = bf.player_tag "
+        "AND cm.left_at IS NULL)",
+        (cutoff,),
+    ):
+        for card in json.loads(row["deck_json"] or "[]"):
+            if isinstance(card, dict) and card.get("name"):
+                counts[card["name"]] = counts.get(card["name"], 0) + 1
+    return counts
+
+
+CUTOFFS = ["2026-06-01T00:00:00Z", "2026-07-10T00:00:00Z", "2026-07-20T13:30:00Z"]
+
+
+def _assert_matches(conn, *, from_store: bool = True) -> None:
+    served = deck_columns.member_deck_card_counts(conn, since=CUTOFFS[0], player_tags=MEMBERS)
+    assert (served is not None) is from_store
+    for cutoff in CUTOFFS:
+        assert cards._member_deck_card_counts(conn, cutoff) == _decoded_row_by_row(conn, cutoff)
+
+
+def test_the_store_answers_what_the_decode_loop_did(engine_conn, monkeypatch, new_generation):
+    deck_columns._clear_deck_columns()
+    _seed_roster(engine_conn)
+    rng = random.Random(2026_07_30)
+    _battles(engine_conn, rng, 0, 400)
+    loads = []
+    real_decode = deck_columns.DeckColumns._decode
+    monkeypatch.setattr(
+        deck_columns.DeckColumns,
+        "_decode",
+        lambda self, text: loads.append(1) or real_decode(self, text),
+    )
+    # A read never pays for the full build: SQL answers until the job has built it.
+    _assert_matches(engine_conn, from_store=False)
+    assert not loads
+    assert deck_columns.refresh_deck_columns(conn=engine_conn)["rebuilt"]
+    first_build = len(loads)
+    assert first_build
+    _assert_matches(engine_conn)
+    assert len(loads) == first_build, "a warm read decoded decks again"
+    monkeypatch.undo()
+
+    # Ingest appends battles...
+    _battles(engine_conn, rng, 400, 60, day0=20)
+    _assert_matches(engine_conn)
+
+    # ...and fills in decks on battles it first saw without one.
+    missing = [
+        r[0] for r in engine_conn.execute("SELECT rowid FROM battle_events WHERE deck_json IS NULL")
+    ]
+    assert missing
+    for rowid in missing[: len(missing) // 2]:
+        engine_conn.execute(
+            "UPDATE battle_events SET deck_json = ? WHERE rowid = ?",
+            (json.dumps([{"name": "Ronin"}, {"name": "Log"}]), rowid),
+        )
+    engine_conn.commit()
+    new_generation(engine_conn)
+    _assert_matches(engine_conn)
+
+    # Retention purges the oldest battles.
+    engine_conn.execute(
+        "DELETE FROM battle_events WHERE rowid IN "
+        "(SELECT rowid FROM battle_events ORDER BY rowid LIMIT 50)"
+    )
+    engine_conn.commit()
+    _assert_matches(engine_conn, from_store=False)
+    deck_columns.refresh_deck_columns(conn=engine_conn)
+    _assert_matches(engine_conn)
+    assert deck_columns.check_deck_columns(conn=engine_conn)["mismatched_days"] == []
+
+
+def test_the_check_finds_and_repairs_drift(engine_conn):
+    deck_columns._clear_deck_columns()
+    _seed_roster(engine_conn)
+    _battles(engine_conn, random.Random(7), 0, 200)
+    deck_columns.refresh_deck_columns(conn=engine_conn)
+    _assert_matches(engine_conn)
+    # A delete inside the rowid range moves neither high water mark.
+    engine_conn.execute(
+        "DELETE FROM battle_events WHERE rowid = (SELECT rowid FROM battle_events "
+        "WHERE deck_json LIKE '[{%' ORDER BY rowid LIMIT 1 OFFSET 100)"
+    )
+    engine_conn.commit()
+    report = deck_columns.check_deck_columns(conn=engine_conn)
+    assert report["checked"] and report["mismatched_days"] and report["repaired"]
+    assert deck_columns.check_deck_columns(conn=engine_conn)["mismatched_days"] == []
+    _assert_matches(engine_conn)
+
+
+def test_reads_fall_back_to_sql_when_the_store_cannot_be_exact(engine_conn):
+    deck_columns._clear_deck_columns()
+    _seed_roster(engine_conn)
+    _battles(engine_conn, random.Random(11), 0, 50)
+    engine_conn.execute(
+        "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, deck_json) "
+        "VALUES ('odd', '#P0', '2026-07-21 10:00:00', '2026-07-21', ?)",
+        (json.dumps([{"name": "Zap"}]),),
+    )
+    engine_conn.commit()
+    assert deck_columns.refresh_deck_columns(conn=engine_conn)["exact"] is False
+    assert (
+        deck_columns.member_deck_card_counts(engine_conn, since=CUTOFFS[0], player_tags=MEMBERS)
+        is None
+    )
+    _assert_matches(engine_conn, from_store=False)
+
+    engine_conn.execute("UPDATE battle_events SET player_tag = player_tag WHERE rowid = 1")
+    assert engine_conn.in_transaction
+    assert (
+        deck_columns.member_deck_card_counts(engine_conn, since=CUTOFFS[0], player_tags=MEMBERS)
+        is None
+    )
+    engine_conn.rollback()
+
+
+def test_reads_answer_from_sql_while_the_store_builds(engine_conn, monkeypatch):
+    deck_columns._clear_deck_columns()
+    _seed_roster(engine_conn)
+    _battles(engine_conn, random.Random(5), 0, 50)
+    loading, release = threading.Event(), threading.Event()
+    real_load = deck_columns.DeckColumns.load
+
+    def slow_load(self, conn, **kwargs):
+        loading.set()
+        assert release.wait(10)
+        return real_load(self, conn, **kwargs)
+
+    monkeypatch.setattr(deck_columns.DeckColumns, "load", slow_load)
+    builder = threading.Thread(target=deck_columns.refresh_deck_columns)
+    builder.start()
+    try:
+        assert loading.wait(10)
+        # Neither a read nor a second build queues behind the one in flight.
+        _assert_matches(engine_conn, from_store=False)
+        assert deck_columns.refresh_deck_columns(conn=engine_conn)["building"]
+    finally:
+        release.set()
+        builder.join(10)
+    _assert_matches(engine_conn)
+
+
+def _per_member_owned(conn, min_level: int) -> dict[str, int]:
+    owned: dict[str, int] = {}
+    for tag in MEMBERS:
+        _fetched, collection = cards._load_collection_cards(conn, tag)
+        for raw in collection:
+            level = cards._card_level(raw)
+            if level is not None and level >= min_level:
+                owned[raw["name"]] = owned.get(raw["name"], 0) + 1
+    return owned
+
+
+def test_overlooked_cards_read_every_collection_at_once(engine_conn):
+    deck_columns._clear_deck_columns()
+    _seed_roster(engine_conn)
+    rng = random.Random(3)
+    for i, name in enumerate(NAMES):
+        engine_conn.execute(
+            "INSERT INTO card_catalog (card_id, name, max_level, rarity, card_type, synced_at) "
+            "VALUES (?, ?, ?, 'common', 'troop', '2026-07-01')",
+            (26000000 + i, name, rng.choice([14, 12, 9, 6])),
+        )
+    for tag in MEMBERS + FORMER:
+        for i in range(len(NAMES) + 2):  # two cards the catalog does not know
+            engine_conn.execute(
+                "INSERT INTO player_card_collection (player_tag, card_id, level, observed_at) "
+                "VALUES (?, ?, ?, '2026-07-30')",
+                (tag, 26000000 + i, rng.randint(5, 14)),
+            )
+    engine_conn.commit()
+
+    owned = _per_member_owned(engine_conn, 12)
+    result = cards.get_clan_overlooked_cards(
+        min_owners=2, min_level=12, battle_days=3650, limit=50, conn=engine_conn
+    )
+    assert result  # nobody has battled, so every card owned by two is overlooked
+    assert result == sorted(
+        ({"card_name": name, "owners_at_level": n} for name, n in owned.items() if n >= 2),
+        key=lambda item: (-item["owners_at_level"], item["card_name"].lower()),
+    )
@@ -0,0 +1,188 @@
+"""The buildable-deck index must return exactly what the deck_profile scan did.
+
+``_legacy_candidates`` is the scan the index replaced, kept as the reference.
+Seeded with a random corpus that includes incomplete and malformed profiles,
+Evo/Hero forms and champions, then grown and restated the way the battle-intel
+job does, with a second connection reading across the uncommitted window.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+
+from capabilities import deck_intel
+from engine import card_roles
+from storage import battle_intel, deck_index
+
+CARDS = list(range(26000000, 26000040))
+CHAMPION = CARDS[0]
+
+
+def _legacy_candidates(conn, cat, own, forms, *, require_structure=True) -> list[dict]:
+    champions = deck_intel._champion_ids(conn)
+    out = []
+    for r in conn.execute(
+        "SELECT deck_hash, archetype, family, avg_elixir, cards_json, air_answer_count, "
+        "has_big_spell, has_small_spell FROM deck_profile WHERE facts_complete = 1"
+    ):
+        pairs = [(p[0], p[1] or 0) for p in json.loads(r["cards_json"])]
+        if len(pairs) != 8:
+            continue
+        if any(cid not in own or cid not in cat for cid, _ in pairs):
+            continue
+        if any(f and forms.get(cid, 0) < f for cid, f in pairs):
+            continue
+        if require_structure and (
+            r["air_answer_count"] < card_roles.min_air_answers(r["avg_elixir"])
+            or not r["has_small_spell"]
+        ):
+            continue
+        if sum(1 for cid, f in pairs if f or cid in champions) > card_roles.MAX_SPECIAL_SLOTS:
+            continue
+        gaps = [cat[cid]["max_level"] - own[cid] for cid, _ in pairs]
+        out.append(
+            {
+                "deck_hash": r["deck_hash"],
+                "archetype": r["archetype"],
+                "family": r["family"],
+                "avg_elixir": r["avg_elixir"],
+                "air_answers": r["air_answer_count"],
+                "has_big_spell": bool(r["has_big_spell"]),
+                "has_small_spell": bool(r["has_small_spell"]),
+                "cards": pairs,
+                "card_ids": frozenset(cid for cid, _ in pairs),
+                "levels_from_max": round(sum(gaps) / 8, 2),
+                "worst_card_from_max": max(gaps),
+            }
+        )
+    out.sort(key=lambda d: (d["levels_from_max"], d["worst_card_from_max"]))
+    return out
+
+
+def _profile(conn, rng: random.Random, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        size = 7 if rng.random() < 0.02 else 8
+        cards = [[cid, rng.choice([0, 0, 0, 1, 2])] for cid in rng.sample(CARDS, size)]
+        complete = rng.choice([1, 1, 1, 1, 0, None])
+        conn.execute(
+            "INSERT INTO deck_profile (deck_hash, family, archetype, avg_elixir, cards_json, "
+            "air_answer_count, has_big_spell, has_small_spell, facts_complete, scored_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '2026-07-01')",
+            (
+                f"deck{i:05d}",
+                rng.choice(["beatdown", "cycle", "control", "bait"]),
+                f"arch{rng.randrange(12)}",
+                # Coarse elixir so readiness ties are common and order matters.
+                rng.choice([2.6, 3.0, 3.5, 4.1]),
+                json.dumps(cards),
+                rng.choice([0, 1, 2, 3]) if complete is not None else None,
+                rng.choice([0, 1]),
+                rng.choice([0, 1, 1]),
+                complete,
+            ),
+        )
+
+
+def _member(rng: random.Random):
+    cat = {cid: {"max_level": rng.choice([14, 16])} for cid in CARDS[:-2]}
+    own = {cid: rng.randint(9, 16) for cid in CARDS if rng.random() < 0.93}
+    forms = {cid: rng.choice([0, 1, 2]) for cid in own}
+    return cat, own, forms
+
+
+def _assert_parity(conn, members) -> None:
+    for cat, own, forms in members:
+        for structure in (True, False):
+            expected = _legacy_candidates(conn, cat, own, forms, require_structure=structure)
+            got = deck_intel._candidates(conn, cat, own, forms, require_structure=structure)
+            assert got == expected
+        anchor = next(iter(own))
+        assert deck_intel._candidates(conn, cat, own, forms, anchor=anchor) == [
+            d for d in _legacy_candidates(conn, cat, own, forms) if anchor in d["card_ids"]
+        ]
+
+
+def test_index_matches_the_profile_scan_through_growth_and_fact_fill(engine_conn):
+    deck_index._clear_deck_index()
+    rng = random.Random(2026_07_01)
+    engine_conn.execute(
+        "INSERT INTO card_facts (card_id, evolution_level, role) VALUES (?, 0, 'champion')",
+        (CHAMPION,),
+    )
+    _profile(engine_conn, rng, 0, 1500)
+    engine_conn.commit()
+    members = [_member(rng) for _ in range(4)]
+    _assert_parity(engine_conn, members)
+    assert any(deck_intel._candidates(engine_conn, *m) for m in members)
+    path = deck_index._db_path(engine_conn)
+    built = deck_index._INDEXES[path]
+
+    # A profiling pass appends rows; a fact fill completes some old ones.
+    _profile(engine_conn, rng, 1500, 200)
+    incomplete = [
+        r["deck_hash"]
+        for r in engine_conn.execute(
+            "SELECT deck_hash FROM deck_profile WHERE facts_complete IS NOT 1 LIMIT 60"
+        )
+    ]
+    battle_intel._flush_deck_facts(engine_conn, [(3, 1, 1, 0, 0, 1, 1, 1, h) for h in incomplete])
+    assert deck_index._PENDING[path]
+
+    # Another connection reading before the commit sees the old rows, and must not
+    # settle the pending updates against them.
+    reader = sqlite3.connect(path)
+    reader.row_factory = sqlite3.Row
+    try:
+        _assert_parity(reader, members)
+        assert deck_index._PENDING[path]
+        engine_conn.commit()
+        _assert_parity(reader, members)
+    finally:
+        reader.close()
+    assert not deck_index._PENDING[path]
+    assert deck_index._INDEXES[path] is built, "growth and fills are incremental"
+
+    # A new champion changes slot legality everywhere: that one is a rebuild.
+    engine_conn.execute(
+        "INSERT INTO card_facts (card_id, evolution_level, role) VALUES (?, 0, 'champion')",
+        (CARDS[1],),
+    )
+    engine_conn.commit()
+    _assert_parity(engine_conn, members)
+    assert deck_index._INDEXES[path] is not built
+
+
+def test_fielded_by_reads_only_the_requested_decks(engine_conn):
+    assert deck_intel._fielded_by(engine_conn, []) == {}
+    assert deck_intel._fielded_by(engine_conn, ["nope"]) == {}
+
+
+def test_battle_tags_rebuild_on_a_file_database(engine_conn):
+    """Battle tags never touch the index; on a file DB, where the index is live,
+    tagging must not be handed to it as if its rows were deck_profile facts."""
+    deck = json.dumps(
+        [
+            {"id": cid, "name": f"C{cid}", "level": 11, "evolution_level": None}
+            for cid in CARDS[2:10]
+        ]
+    )
+    for i in range(3):
+        engine_conn.execute(
+            "INSERT INTO battle_events (dedup_key, player_tag, battle_time, observed_at, outcome, "
+            "mode_group, is_competitive, is_ranked, deck_json, opponent_deck_json) "
+            "VALUES (?, '#M', ?, '2026-07-20T01:00:00Z', 'W', 'ladder', 1, 0, ?, ?)",
+            (f"b{i}", f"2026-07-20T00:00:0{i}Z", deck, deck),
+        )
+    engine_conn.executemany(
+        "INSERT INTO card_facts (card_id, evolution_level, role) VALUES (?, 0, 'support')",
+        [(cid,) for cid in CARDS[2:10]],
+    )
+    engine_conn.commit()
+    battle_intel.enrich_battles(100, conn=engine_conn)
+    battle_intel.rebuild_deck_intel(conn=engine_conn)
+
+    assert battle_intel._flush_battle_tags(engine_conn, [("valid", None, "b0")]) == 1
+    result = battle_intel.rebuild_interpreted(force=True, conn=engine_conn)
+    assert result["battle_tags"] == 3
@@ -502,3 +502,20 @@ def test_badge_earned_never_invents_a_card_absent_from_the_catalog(engine_conn):
     )
     assert payload["badge_label"] == "a new Card Mastery badge"
     assert "card_name" not in payload and "card_id" not in payload
+
+
+def test_baseline_stores_the_canonical_text_and_hash(engine_conn):
+    from engine.baselines import get_baseline, set_baseline
+    from engine.db import canonical_payload
+
+    state = {"b": 2, "a": {"z": 1, "y": [3, 1]}}
+    canonical = canonical_payload(state)
+    set_baseline(engine_conn, "player", "#ABC", "profile", canonical, "2026-07-01T00:00:00Z")
+    row = get_baseline(engine_conn, "player", "#ABC", "profile")
+    assert row["payload_json"] == canonical.text == '{"a":{"y":[3,1],"z":1},"b":2}'
+    assert row["payload_hash"] == canonical.hash
+
+    set_baseline(engine_conn, "player", "#ABC", "profile", dict(state), "2026-07-01T00:10:00Z")
+    again = get_baseline(engine_conn, "player", "#ABC", "profile")
+    assert again["payload_hash"] == canonical.hash
+    assert again["prev_observed_at"] == "2026-07-01T00:00:00Z"
@@ -0,0 +1,98 @@
+"""Set-based form projection must write exactly what the per-scope queries did."""
+
+from __future__ import annotations
+
+import random
+
+from engine import projections
+from engine.db import ensure_player
+from engine.ingest import mirror_battles
+from tests.conftest import load_cr_fixture
+
+NOW = "2026-07-01T12:00:00Z"
+
+
+def _legacy_refresh_form(conn, player_tag, now):
+    """The per-scope implementation this replaced: one query + upsert per scope."""
+    tag = projections.canon_tag(player_tag)
+    for scope, predicate in projections.FORM_SCOPES.items():
+        rows = conn.execute(
+            f"""SELECT outcome, crowns_for, crowns_against, trophy_change
+                FROM battle_events WHERE player_tag = ? AND {predicate}
+                ORDER BY battle_time DESC LIMIT {projections.FORM_SAMPLE}""",
+            (tag,),
+        ).fetchall()
+        conn.execute(projections._FORM_UPSERT, projections._form_values(tag, scope, now, rows))
+
+
+def _seed_battles(conn, tag: str, count: int, rng: random.Random) -> None:
+    ensure_player(conn, tag, tag.strip("#"), NOW)
+    for i in range(count):
+        battle_type = rng.choice(
+            ["PvP", "pathOfLegend", "clanMate", "friendly", "tournament", "clanMate2v2", None]
+        )
+        crowns_for = rng.choice([0, 1, 2, 3, None])
+        conn.execute(
+            """INSERT INTO battle_events
+                   (dedup_key, player_tag, battle_time, observed_at, battle_type,
+                    opponent_tag, crowns_for, crowns_against, game_mode_id,
+                    game_mode_name, outcome, is_war, is_ladder, is_ranked,
+                    is_competitive, is_special_event, trophy_change,
+                    is_hosted_match, tournament_tag)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                f"{tag}:{i}",
+                tag,
+                # Coarse timestamps so a few battles share a battle_time.
+                f"2026-06-{1 + i // 12:02d}T{(i % 12) // 2:02d}:00:00Z",
+                NOW,
+                battle_type,
+                f"#OPP{i}",
+                crowns_for,
+                rng.choice([0, 1, 2, 3, None]),
+                rng.choice([72000006, 72000014, 72000051, None]),
+                rng.choice(["Ladder", "TeamVsTeam", None]),
+                rng.choice(["W", "L", "D", None]),
+                rng.choice([0, 1, None]),
+                rng.choice([0, 1, None]),
+                rng.choice([0, 1, None]),
+                rng.choice([0, 1, None]),
+                rng.choice([0, 1, None]),
+                rng.choice([-30, 0, 28, None]),
+                rng.choice([0, 1, None]),
+                rng.choice(["#T1", None, None, None]),
+            ),
+        )
+
+
+def _form_table(conn) -> list[tuple]:
+    return [
+        tuple(row)
+        for row in conn.execute("SELECT * FROM player_recent_form ORDER BY player_tag, scope")
+    ]
+
+
+def test_set_based_form_matches_per_scope_queries(engine_conn):
+    rng = random.Random(20260701)
+    tags = ["#AAA111", "#BBB222", "#CCC333", "#EMPTY00"]
+    for tag, count in zip(tags, (140, 35, 7, 0), strict=True):
+        _seed_battles(engine_conn, tag, count, rng)
+    battlelog = load_cr_fixture("battlelog")
+    subject = battlelog[0]["team"][0]["tag"]
+    ensure_player(engine_conn, subject, None, NOW)
+    mirror_battles(engine_conn, subject, battlelog, NOW, None)
+    tags.append(subject)
+
+    for tag in tags:
+        _legacy_refresh_form(engine_conn, tag, NOW)
+    expected = _form_table(engine_conn)
+    engine_conn.execute("DELETE FROM player_recent_form")
+
+    projections.refresh_forms(engine_conn, tags, now=NOW)
+    assert _form_table(engine_conn) == expected
+    assert len(expected) == len(tags) * len(projections.FORM_SCOPES)
+
+    # The single-player entry point writes the same rows over existing ones.
+    for tag in tags:
+        projections.refresh_form(engine_conn, tag, now=NOW)
+    assert _form_table(engine_conn) == expected
@@ -0,0 +1,163 @@
+"""The local intent fast path learns from captured router decisions and defers when unsure."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from agent import intent_fastpath, intent_router
+from agent.core import _serialize_prompt
+from storage import telemetry
+
+# (route, mode, target_member), workflow, mentioned, open channel, phrasings
+CORPUS = [
+    (
+        ("help", None, None),
+        "interactive",
+        True,
+        False,
+        ["what can you do", "how can you help me", "what are your commands", "list your features"],
+    ),
+    (
+        ("deck_review", "regular", "self"),
+        "interactive",
+        True,
+        False,
+        ["review my deck", "any tips to improve my deck", "fix my deck", "rate my current deck"],
+    ),
+    (
+        ("kick_risk", None, None),
+        "clanops",
+        True,
+        False,
+        ["who is at risk of a kick", "show the kick risk list", "who should we kick"],
+    ),
+    (
+        ("not_for_bot", None, None),
+        "interactive",
+        False,
+        True,
+        ["lol nice one", "see you all tomorrow", "thanks guys", "gg everyone well played"],
+    ),
+]
+FILLERS = ["", "hey ", "ok ", "yo "], ["", " please", " today", " now", " thanks"]
+
+
+def _capture(question, label, workflow, mentioned, open_reply, *, history=None) -> None:
+    user_msg = intent_router._build_user_message(
+        question,
+        workflow=workflow,
+        mentioned=mentioned,
+        allows_open_channel_reply=open_reply,
+        history_text=history or "",
+    )
+    route, mode, target = label
+    telemetry.record_llm_call(
+        intent_router.INTENT_ROUTER_WORKFLOW,
+        "haiku",
+        duration_ms=650,
+        prompt_json=_serialize_prompt(
+            "router prompt", [{"role": "user", "content": user_msg}], [], 256, 0.0
+        ),
+        response_json=json.dumps(
+            {
+                "text": "",
+                "tool_uses": [
+                    {
+                        "name": "select_route",
+                        "input": {"route": route, "mode": mode, "target_member": target},
+                    }
+                ],
+            }
+        ),
+    )
+
+
+def _seed() -> int:
+    n = 0
+    for label, workflow, mentioned, open_reply, phrasings in CORPUS:
+        for phrase in phrasings:
+            for before in FILLERS[0]:
+                for after in FILLERS[1]:
+                    _capture(f"{before}{phrase}{after}", label, workflow, mentioned, open_reply)
+                    n += 1
+    return n
+
+
+@pytest.fixture
+def fitted(monkeypatch):
+    intent_fastpath._forget()
+    monkeypatch.setattr(intent_fastpath, "AUDIT_RATE", 0.0)
+    assert _seed() >= intent_fastpath.MIN_EXAMPLES
+    yield
+    intent_fastpath._forget()
+
+
+def test_captures_parse_back_into_the_routers_inputs():
+    _capture(
+        "make it cheaper", ("deck_review", "war", "self"), "clanops", True, False, history="user: x"
+    )
+    [routed] = intent_fastpath.load_routed_messages()
+    assert routed.question == "make it cheaper"
+    assert (routed.workflow, routed.mentioned, routed.allows_open_channel_reply) == (
+        "clanops",
+        True,
+        False,
+    )
+    assert routed.has_history and routed.label == ("deck_review", "war", "self")
+    assert routed.duration_ms == 650
+
+
+def test_confident_messages_are_answered_in_process(fitted):
+    intent = intent_fastpath.fast_intent(
+        "hey could you review my deck please", workflow="interactive", mentioned=True
+    )
+    assert intent["route"] == "deck_review" and intent["mode"] == "regular"
+    assert intent["target_member"] == "self" and intent["model"] == intent_fastpath.FASTPATH_MODEL
+    assert intent["confidence"] >= intent_fastpath.MIN_CONFIDENCE
+    kick = intent_fastpath.fast_intent("who should we kick", workflow="clanops", mentioned=True)
+    assert kick["route"] == "kick_risk"
+
+
+def test_unsure_or_out_of_bounds_messages_go_to_the_router(fitted):
+    def ask(question, **kw):
+        kw.setdefault("workflow", "interactive")
+        kw.setdefault("mentioned", True)
+        return intent_fastpath.fast_intent(question, **kw)
+
+    assert ask("what is the best card against golem") is None  # never seen
+    assert ask("how is the war going") is None  # one shared word with "how can you help me"
+    assert ask("thanks guys", mentioned=True) is None  # the mention rule
+    assert ask("thanks guys", mentioned=False, allows_open_channel_reply=True) is not None
+    history = [{"role": "assistant", "content": "Here is your deck."}]
+    assert ask("review my deck", conversation_history=history) is not None
+    assert ask("make it cheaper", conversation_history=history) is None
+    assert ask("who should we kick", workflow="interactive") is None  # clanops-only route
+    assert ask("review my deck", workflow="reception") is None
+
+
+def test_too_few_captures_keep_the_router_in_charge():
+    intent_fastpath._forget()
+    _capture("review my deck", ("deck_review", "regular", "self"), "interactive", True, False)
+    assert (
+        intent_fastpath.fast_intent("review my deck", workflow="interactive", mentioned=True)
+        is None
+    )
+    intent_fastpath._forget()
+
+
+def test_classify_intent_skips_the_llm_on_the_fast_path(fitted):
+    with patch("agent.intent_router._create_chat_completion", side_effect=AssertionError):
+        intent = intent_router.classify_intent(
+            "what can you do", workflow="interactive", mentioned=True
+        )
+    assert intent["route"] == "help" and intent["model"] == intent_fastpath.FASTPATH_MODEL
+    with patch(
+        "agent.intent_router._create_chat_completion", side_effect=RuntimeError("down")
+    ) as llm:
+        intent = intent_router.classify_intent(
+            "what can you do", workflow="interactive", mentioned=True, fast_path=False
+        )
+    assert llm.called and intent["fallback_reason"].startswith("llm_error")
@@ -0,0 +1,252 @@
+"""Roster-wide management reads must reproduce the per-member ones exactly.
+
+The elder scores, the elder band and the kick verdicts are read for the whole
+roster in grouped queries; the per-member functions they replaced stay as the
+reference. Seeded from the recorded clan roster with interleaved, randomized
+evidence so grouping and row order both get exercised.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+from engine import management
+from tests.conftest import load_cr_fixture
+
+NOW_DT = datetime(2026, 6, 29, 7, 0, tzinfo=timezone.utc)
+NOW = "2026-06-29T07:00:00Z"
+ROSTER = 30  # under the cap, so the contribution grace is live
+
+
+def _seed_roster(conn, rng: random.Random) -> list[dict]:
+    members = load_cr_fixture("clan")["memberList"][:ROSTER]
+    conn.execute(
+        "INSERT OR IGNORE INTO clans (clan_tag, name, first_seen_at, last_seen_at, is_home) "
+        "VALUES ('#J2RGCRVG', 'POAP KINGS', '2026-02-04', ?, 1)",
+        (NOW,),
+    )
+    for m in members:
+        tag, tenure = m["tag"], rng.choice([5, 20, 28, 90, 400])
+        joined = (NOW_DT - timedelta(days=tenure)).strftime("%Y-%m-%d")
+        conn.execute(
+            "INSERT INTO players (player_tag, current_name, first_seen_at, last_seen_at) "
+            "VALUES (?, ?, ?, ?)",
+            (tag, m["name"], joined, NOW),
+        )
+        conn.execute(
+            "INSERT INTO clan_memberships (player_tag, joined_at, join_source) "
+            "VALUES (?, ?, 'test')",
+            (tag, joined),
+        )
+        conn.execute(
+            "INSERT INTO player_current_state (player_tag, observed_at, role, trophies, "
+            "ranked_league, ranked_trophies) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                tag,
+                NOW,
+                m["role"],
+                m["trophies"],
+                rng.choice([None, 2, 4, 6]),
+                rng.choice([None, 0, 1500]),
+            ),
+        )
+        baseline = rng.choice(
+            [
+                None,
+                json.dumps({"last": {"league": rng.choice([3, 5, 7]), "trophies": 1700}}),
+                json.dumps({"last": None}),
+                "not json",
+            ]
+        )
+        if baseline is not None:
+            conn.execute(
+                "INSERT INTO state_baselines (entity_kind, entity_tag, aspect, payload_json, "
+                "payload_hash, observed_at) VALUES ('player', ?, 'ranked', ?, 'h', ?)",
+                (tag, baseline, NOW),
+            )
+        conn.execute(
+            "INSERT INTO member_management (player_tag, computed_at, week_anchor, "
+            "tenure_days, role, donations_4wk_avg) VALUES (?, ?, '2026-06-22', ?, ?, ?)",
+            (tag, NOW, tenure, m["role"], rng.choice([None, 0, m["donations"], 42.5])),
+        )
+
+    # Evidence inserted round-robin across the roster so each member's rows are
+    # scattered through the table, as live ingestion leaves them.
+    for day in range(12):
+        for m in members:
+            if rng.random() < 0.5:
+                obs = (NOW_DT - timedelta(days=2 + day * 3)).strftime("%Y-%m-%dT%H:00:00Z")
+                conn.execute(
+                    "INSERT INTO war_attendance_days (season_id, section_index, war_day_index, "
+                    "player_tag, decks_used, decks_available, observed_at) "
+                    "VALUES (133, ?, ?, ?, ?, ?, ?)",
+                    (day, day % 4, m["tag"], rng.randint(0, 4), rng.choice([0, 4, 4]), obs),
+                )
+            if rng.random() < 0.6:
+                played = NOW_DT - timedelta(days=rng.uniform(0, 35))
+                conn.execute(
+                    "INSERT INTO battle_events (dedup_key, player_tag, battle_time, "
+                    "observed_at, mode_group) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        f"{m['tag']}:{day}",
+                        m["tag"],
+                        played.strftime("%Y%m%dT%H%M%S.000Z"),
+                        NOW,
+                        rng.choice(["ranked", "ranked", "ladder", None]),
+                    ),
+                )
+    conn.commit()
+    return members
+
+
+def _legacy_elder_scores(conn, now: str) -> dict:
+    """The per-member scoring loop the roster reads replaced."""
+    members = conn.execute(
+        """SELECT mm.player_tag, mm.role, mm.tenure_days, mm.donations_4wk_avg,
+                  COALESCE(p.display_name, p.current_name) AS current_name
+           FROM member_management mm
+           LEFT JOIN players p ON p.player_tag = mm.player_tag
+           WHERE EXISTS (SELECT 1 FROM clan_memberships cm
+                         WHERE cm.player_tag = mm.player_tag AND cm.left_at IS NULL)"""
+    ).fetchall()
+    raw = {}
+    for m in members:
+        if (m["role"] or "member") in management.LEADERSHIP_ROLES:
+            continue
+        tag = m["player_tag"]
+        raw[tag] = {
+            "role": m["role"] or "member",
+            "tenure": m["tenure_days"] or 0,
+            "name": m["current_name"],
+            "war_rate": management._war_rate(conn, tag, now),
+            "ranked_league": management._ranked_standing(conn, tag)[0],
+            "ranked_battles": management._ranked_battles(
+                conn, tag, now, management.WAR_RATE_WINDOW
+            ),
+            "donations": m["donations_4wk_avg"] or 0,
+        }
+    vals = {k: [r[k] for r in raw.values()] for k in ("war_rate", "donations", "ranked_battles")}
+    for r in raw.values():
+        r["war_pct"] = management._participation_percentile(r["war_rate"], vals["war_rate"])
+        r["donation_pct"] = management._participation_percentile(r["donations"], vals["donations"])
+        r["ranked_pct"] = management._participation_percentile(
+            r["ranked_battles"], vals["ranked_battles"]
+        )
+        r["competitive"] = r["war_pct"] + management.RANKED_WEIGHT * r["ranked_pct"] * (
+            1 - r["war_pct"]
+        )
+        r["score"] = (
+            management.SCORE_W_WAR * r["competitive"]
+            + management.SCORE_W_DONATION * r["donation_pct"]
+        )
+    return raw
+
+
+def test_roster_reads_match_the_per_member_queries(engine_conn):
+    members = _seed_roster(engine_conn, random.Random(2026_06_29))
+    tags = [m["tag"] for m in members] + ["#NOBODY"]
+
+    standings = management._roster_ranked_standings(engine_conn, tags)
+    war_rates = management._roster_war_rates(engine_conn, tags, NOW)
+    floor_ok = management._roster_competitive_floor(engine_conn, tags, NOW)
+    for window in (management.WAR_FLOOR_WINDOW, management.WAR_RATE_WINDOW):
+        battles = management._roster_ranked_battles(engine_conn, tags, NOW, window)
+        for tag in tags:
+            assert battles[tag] == management._ranked_battles(engine_conn, tag, NOW, window)
+    for tag in tags:
+        assert standings[tag] == management._ranked_standing(engine_conn, tag)
+        # Exact equality, not approx: the summation order is part of the contract.
+        assert war_rates[tag] == management._war_rate(engine_conn, tag, NOW)
+        assert (tag in floor_ok) == management._passes_competitive_floor(engine_conn, tag, NOW)
+    assert 0 < len(floor_ok) < len(tags), "seed should exercise both floor outcomes"
+
+    values = [0, 3.5, 3.5, 0.0, 12, 1, 3.5, -1]
+    assert management._participation_percentiles(values) == [
+        management._participation_percentile(v, values) for v in values
+    ]
+
+
+def test_elder_scores_and_band_match_the_per_member_path(engine_conn, monkeypatch):
+    _seed_roster(engine_conn, random.Random(7))
+
+    scores = management._elder_scores(engine_conn, NOW, NOW[:10])
+    assert scores == _legacy_elder_scores(engine_conn, NOW)
+    band = management._elder_band(engine_conn, scores, NOW)
+
+    monkeypatch.setattr(
+        management,
+        "_roster_competitive_floor",
+        lambda conn, tags, now: {
+            t for t in tags if management._passes_competitive_floor(conn, t, now)
+        },
+    )
+    assert management._elder_band(engine_conn, scores, NOW) == band
+
+
+def _legacy_kick_state(conn, tag: str, role: str, joined_at: str, slack: float) -> str:
+    """The verdict the per-member kick loop reached for a member starting at 'none'."""
+    last = conn.execute(
+        "SELECT MAX(battle_time) FROM battle_events WHERE player_tag = ?", (tag,)
+    ).fetchone()[0]
+    anchors = [management._parse_ts(v) for v in (last, joined_at) if v]
+    days_idle = (NOW_DT - max(anchors)).total_seconds() / 86400.0
+    confirm = management.KICK_CONFIRM_DAYS
+    if slack > 0 and (
+        management._passes_war_floor(conn, tag, NOW)
+        or management._passes_ranked_floor(conn, tag, NOW)
+    ):
+        confirm += round(management.KICK_CONTRIB_GRACE_MAX * slack)
+    if days_idle >= management.KICK_AT_RISK_DAYS + confirm:
+        state = "recommended"
+    elif days_idle >= management.KICK_AT_RISK_DAYS:
+        state = "at_risk"
+    elif days_idle >= management.KICK_WATCH_DAYS:
+        state = "watch"
+    else:
+        state = "none"
+    if state == "recommended" and role in management.ELDER_PLUS:
+        state = "at_risk"
+    return state
+
+
+def test_kick_verdicts_match_the_per_member_path(engine_conn, monkeypatch):
+    members = _seed_roster(engine_conn, random.Random(11))
+    monkeypatch.setattr(management, "_has_leadership_hold", lambda tag: False)
+    monkeypatch.setattr(management, "_has_member_shield", lambda tag: False)
+    slack = (management.ROSTER_CAP - ROSTER) / management.ROSTER_CAP
+    joined = dict(
+        engine_conn.execute("SELECT player_tag, joined_at FROM clan_memberships").fetchall()
+    )
+    expected = {
+        m["tag"]: _legacy_kick_state(engine_conn, m["tag"], m["role"], joined[m["tag"]], slack)
+        for m in members
+    }
+    # Every member is ready except one held, which must be skipped and stamped.
+    held = members[0]["tag"]
+    readiness = {
+        "members": {
+            m["tag"]: {"status": "ready", "reasons": [], "evidence_as_of": NOW} for m in members[1:]
+        }
+    }
+
+    fired = management.run_tick_evaluators(engine_conn, now=NOW, readiness=readiness)
+
+    rows = {
+        r["player_tag"]: r
+        for r in engine_conn.execute(
+            "SELECT player_tag, kick_state, kick_state_since, judgment_status, "
+            "judgment_reason FROM member_management"
+        )
+    }
+    expected[held] = "none"
+    assert {tag: r["kick_state"] for tag, r in rows.items()} == expected
+    assert {t["player_tag"] for t in fired} == {
+        tag for tag, state in expected.items() if state == "recommended"
+    }
+    assert len(set(expected.values())) >= 3, "seed should span several verdicts"
+    for r in rows.values():
+        assert r["judgment_status"] == ("held" if r["player_tag"] == held else "ready")
+        assert r["kick_state_since"] == (None if r["kick_state"] == "none" else NOW)
+    assert rows[held]["judgment_reason"] == "freshness_unknown"
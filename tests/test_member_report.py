@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import asyncio
 import re
+import threading
+import time
 
 import pytest
 
 import agent.mail.outbound as outbound
 import db
-from runtime import email_dedup, member_report
+from runtime import email_dedup, member_report, member_report_pipeline
 from runtime import status as runtime_status
 from runtime.jobs import _core
 
@@ -201,7 +203,8 @@ def _job_stubs(monkeypatch, sends):
     monkeypatch.setattr(
         member_report, "build_member_report_context", lambda tag, name, **kw: _ctx(name)
     )
-    monkeypatch.setattr(member_report, "facts_for_model", lambda ctx: "FACTS")
+    # Generation runs concurrently, so stubs key on the member, not on call order.
+    monkeypatch.setattr(member_report, "facts_for_model", lambda ctx: ctx["name"])
 
 
 def test_weekly_member_report_sends_individually(monkeypatch):
@@ -224,12 +227,8 @@ def test_weekly_member_report_isolates_one_failure(monkeypatch):
     sends: list[dict] = []
     _job_stubs(monkeypatch, sends)
 
-    # Make the failure land on the FIRST member deterministically.
-    calls = {"n": 0}
-
     def _gen(facts):
-        calls["n"] += 1
-        if calls["n"] == 1:
+        if facts == "Ada":
             raise RuntimeError("LLM hiccup")
         return {"overview": "o", "closer": "c"}
 
@@ -262,7 +261,7 @@ def test_catch_up_retries_only_missing_recipients_under_the_owed_key(monkeypatch
 
     def _gen(facts):
         nonlocal failed_once
-        if not failed_once:
+        if facts == "Ada" and not failed_once:
             failed_once = True
             raise RuntimeError("one recipient failed")
         return {"overview": "o", "closer": "c"}
@@ -340,6 +339,86 @@ def test_weekly_member_report_no_recipients(monkeypatch):
     assert result == {"sent": 0, "total": 0}
 
 
+# --- The pipeline: shared clan context, bounded generation, ordered delivery ---
+
+
+def _roster(n):
+    return [
+        {"player_tag": f"#M{i}", "member_name": f"M{i}", "email": f"m{i}@x.com"} for i in range(n)
+    ]
+
+
+def test_shared_clan_context_matches_the_per_member_build():
+    now = "2026-07-08T12:00:00Z"
+    clan = member_report.build_clan_report_context(now=now)
+    alone = member_report.build_member_report_context("#AAA", "Ada", now=now)
+    shared = member_report.build_member_report_context("#AAA", "Ada", now=now, clan=clan)
+    assert shared == alone
+
+
+def test_pipeline_builds_the_clan_context_once_and_delivers_in_roster_order(monkeypatch):
+    clans: list[dict] = []
+    monkeypatch.setattr(
+        member_report,
+        "build_clan_report_context",
+        lambda **kw: clans.append({"shared": True}) or clans[-1],
+    )
+    seen_clans: list[int] = []
+
+    def _build(tag, name, *, clan, conn):
+        seen_clans.append(id(clan))
+        return _ctx(name)
+
+    monkeypatch.setattr(member_report, "build_member_report_context", _build)
+    monkeypatch.setattr(member_report, "facts_for_model", lambda ctx: ctx["name"])
+    monkeypatch.setattr(email_dedup, "already_sent", lambda kind, key: key.startswith("#M3:"))
+    monkeypatch.setattr(email_dedup, "record_sent", lambda kind, key, **kw: True)
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def _gen(facts):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05 if facts == "M0" else 0.01)  # the first member finishes last
+        with lock:
+            running["now"] -= 1
+        if facts == "M5":
+            raise RuntimeError("LLM hiccup")
+        return {"overview": "o", "closer": "c"}
+
+    sends: list[str] = []
+    outcomes = member_report_pipeline.run_member_reports(
+        _roster(8),
+        week_key="2026-W28",
+        generate=_gen,
+        send=lambda rec, subject, body: sends.append(rec["email"]),
+        workers=3,
+    )
+
+    assert len(clans) == 1 and set(seen_clans) == {id(clans[0])}
+    assert outcomes == ["sent"] * 3 + ["already", "sent", "failed", "sent", "sent"]
+    assert sends == [f"m{i}@x.com" for i in (0, 1, 2, 4, 6, 7)]
+    assert 1 < running["peak"] <= 3
+
+
+def test_pipeline_returns_every_recipient_failed_when_the_builder_cannot_connect(monkeypatch):
+    def _no_db():
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(db, "get_connection", _no_db)
+    sends: list[str] = []
+    outcomes = member_report_pipeline.run_member_reports(
+        _roster(3),
+        week_key="2026-W28",
+        generate=lambda facts: {"overview": "o", "closer": "c"},
+        send=lambda rec, subject, body: sends.append(rec["email"]),
+        workers=2,
+    )
+    assert outcomes == ["failed"] * 3
+    assert sends == []
+
+
 # ── Battle + Deck Intelligence in the dispatch ────────────────────────────────
 #
 # The report reads both capabilities rather than recomputing them, so what these
@@ -452,3 +452,37 @@ def test_explicit_expiry_still_wins_over_the_default():
         assert m["expires_at"].startswith("2027-01-01")
     finally:
         conn.close()
+
+
+def test_candidate_hydration_is_batched_not_per_candidate():
+    """Recall hydrates every candidate in one row read + one tag read, so the
+    statement count does not grow with the number of candidates."""
+    conn = db.get_connection()
+    try:
+        memory_store.ensure_memory_schema(conn)
+        ids = [
+            _seed(conn, title=f"quuxite note {i}", body="quuxite", member_tag="#HYD1")
+            for i in range(30)
+        ]
+        for memory_id in ids[:3]:
+            memory_store.attach_tags(memory_id, ["b-tag", "a-tag"], actor="test", conn=conn)
+        memory_store.archive_memory(ids[-1], actor="test", conn=conn)
+
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        picked = memory_store.select_memories(
+            member_tag="#HYD1", query="quuxite", viewer_scope="public", limit=50, conn=conn
+        )
+        hits = memory_store.search_memories("quuxite", viewer_scope="public", limit=50, conn=conn)
+        conn.set_trace_callback(None)
+
+        assert sorted(m["memory_id"] for m in picked) == sorted(ids[:-1])
+        assert sorted(h.memory["memory_id"] for h in hits) == sorted(ids[:-1])
+        tagged = {m["memory_id"]: m["tags"] for m in picked}
+        assert all(tagged[i] == ["a-tag", "b-tag"] for i in ids[:3])
+        assert tagged[ids[3]] == []
+        row_reads = [s for s in statements if s.lstrip().startswith("SELECT * FROM memories")]
+        tag_reads = [s for s in statements if "FROM memory_tags" in s]
+        assert len(row_reads) == 2 and len(tag_reads) == 2  # one each per call
+    finally:
+        conn.close()
@@ -340,3 +340,39 @@ def test_rejected_observation_marks_its_network_receipt(engine_conn):
     ).fetchone()
     assert row["admission_status"] == "rejected"
     assert "name:not_nonempty_string" in json.loads(row["admission_errors_json"])
+
+
+def test_canonical_payload_is_byte_identical_to_the_stored_form():
+    import hashlib
+
+    from engine.db import canonical_payload, payload_hash
+
+    for name in ("clan", "player_evo", "battlelog", "riverrace_warday"):
+        payload = load_cr_fixture(name)
+        legacy = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        canonical = canonical_payload(payload)
+        assert canonical.text == legacy
+        assert canonical.hash == hashlib.sha256(legacy.encode()).hexdigest()
+        assert payload_hash(payload) == canonical.hash
+    # Non-ASCII names stay \u-escaped, exactly as the hashes already stored.
+    assert (
+        canonical_payload({"name": "Ünïcödé ⚡"}).text
+        == '{"name":"\\u00dcn\\u00efc\\u00f6d\\u00e9 \\u26a1"}'
+    )
+
+
+def test_observation_carries_the_canonical_payload_cr_api_remembered():
+    from engine.db import canonical_payload
+
+    player = load_cr_fixture("player_plain")
+    remembered = canonical_payload(player, remember=True)
+    decision, observation = observations.observe(
+        "player", player["tag"], player, "2026-07-01T00:00:00Z", source="test"
+    )
+
+    assert decision.accepted
+    assert observation.canonical is remembered
+    assert observation.payload_hash == remembered.hash
+    # An equal but distinct object is canonicalized afresh, never aliased.
+    assert canonical_payload(copy.deepcopy(player)) is not remembered
+    assert canonical_payload(remembered) is remembered
@@ -0,0 +1,107 @@
+"""Read-only tool calls from one model round run concurrently in _chat_with_tools.
+
+Writes stay in order against them: a write waits for the reads the model asked
+for before it, and a read asked for after a write sees the write. Tool results
+and the trace keep the model's order whatever finishes first.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Full runtime/agent init first — see test_awareness_write_tools.
+import elixir  # noqa: F401
+from agent import chat as agent_chat
+from agent import core as agent_core
+from agent.tool_policy import TOOL_DEFINITIONS_BY_NAME, TOOLSETS_BY_WORKFLOW
+
+_READ_DELAY = 0.2
+_FINAL = {"event_type": "channel_response", "content": "done"}
+
+
+def _response(blocks, stop_reason="end_turn"):
+    return SimpleNamespace(content=blocks, stop_reason=stop_reason)
+
+
+def _run(tool_uses, fake_tool):
+    sent = []
+    responses = iter(
+        [
+            _response(tool_uses, stop_reason="tool_use"),
+            _response([SimpleNamespace(type="text", text=json.dumps(_FINAL))]),
+        ]
+    )
+
+    def fake_completion(**kwargs):
+        sent.append(list(kwargs["messages"]))
+        return next(responses)
+
+    tool_stats: dict = {}
+    with (
+        patch.object(agent_chat, "_create_chat_completion", side_effect=fake_completion),
+        patch.object(agent_chat, "_execute_tool", side_effect=fake_tool),
+    ):
+        result = agent_chat._chat_with_tools(
+            "system",
+            "user",
+            workflow="clanops",
+            allowed_tools=TOOLSETS_BY_WORKFLOW["clanops"],
+            response_schema={"required": ["content"]},
+            tool_stats=tool_stats,
+        )
+    assert result == _FINAL
+    return sent[-1][-1]["content"], tool_stats["tool_trace"]
+
+
+def test_reads_overlap_and_writes_keep_their_place(tool_use):
+    assert TOOL_DEFINITIONS_BY_NAME["get_member"]["side_effect"] == "read"
+    assert TOOL_DEFINITIONS_BY_NAME["save_clan_memory"]["side_effect"] == "write"
+    spans: dict[str, tuple[float, float]] = {}
+    turn_ids = set()
+    lock = threading.Lock()
+
+    def fake_tool(name, arguments, workflow=None):
+        started = time.perf_counter()
+        turn_ids.add(agent_core._turn_id.get())
+        key = arguments.get("member_tag") or arguments.get("title") or name
+        if name != "save_clan_memory":
+            # Later reads finish first, so completion order != call order.
+            time.sleep(_READ_DELAY * (1.5 if key == "#A" else 1.0))
+        with lock:
+            spans[key] = (started, time.perf_counter())
+        return json.dumps({"tool": name, "key": key})
+
+    calls = [
+        tool_use("t1", "get_member", {"member_tag": "#A"}),
+        tool_use("t2", "get_member", {"member_tag": "#B"}),
+        tool_use("t3", "get_river_race", {}),
+        tool_use("t4", "save_clan_memory", {"title": "note", "body": "b"}),
+        tool_use("t5", "get_member", {"member_tag": "#C"}),
+    ]
+    results, trace = _run(calls, fake_tool)
+
+    assert [block["tool_use_id"] for block in results] == ["t1", "t2", "t3", "t4", "t5"]
+    keys = [json.loads(block["content"])["data"]["key"] for block in results]
+    assert keys == ["#A", "#B", "get_river_race", "note", "#C"]
+    assert [entry["tool"] for entry in trace] == [call.name for call in calls]
+
+    # The three reads before the write overlapped...
+    assert max(spans[k][0] for k in ("#A", "#B", "get_river_race")) < spans["#B"][1]
+    # ...the write waited for all of them, and the read after it waited for it.
+    assert spans["note"][0] >= max(spans[k][1] for k in ("#A", "#B", "get_river_race"))
+    assert spans["#C"][0] >= spans["note"][1]
+    # Pooled calls still run inside the turn.
+    assert len(turn_ids) == 1 and None not in turn_ids
+
+
+def test_a_lone_read_runs_inline(tool_use):
+    threads = []
+
+    def fake_tool(name, arguments, workflow=None):
+        threads.append(threading.current_thread())
+        return json.dumps({"ok": True})
+
+    _run([tool_use("t1", "get_river_race", {})], fake_tool)
+    assert threads == [threading.main_thread()]
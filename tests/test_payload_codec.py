@@ -0,0 +1,105 @@
+"""Encoded raw payload bodies: compression, battlelog deltas, transparent reads, retention."""
+
+from datetime import datetime, timedelta, timezone
+
+import db
+from storage import metadata, payload_codec
+from storage.payload_codec import PayloadReader
+from tests.conftest import load_cr_fixture
+
+
+def _polls(count: int, window: int = 25) -> list[list]:
+    """Successive battlelogs for one player: each poll finds one more battle on top."""
+    battles = load_cr_fixture("battlelog")
+    newest = len(battles) - window
+    return [battles[newest - i : newest - i + window] for i in range(count)]
+
+
+def _store(conn, endpoint, payload, *, at: datetime, entity="#P2Q") -> int:
+    stored = db._store_raw_payload(
+        conn, endpoint, entity, payload, fetched_at=at.strftime("%Y-%m-%dT%H:%M:%SZ")
+    )
+    return stored["payload_id"]
+
+
+def _rows(conn):
+    return conn.execute(
+        "SELECT payload_id, payload_codec, payload_json, base_payload_id "
+        "FROM raw_api_payloads ORDER BY payload_id"
+    ).fetchall()
+
+
+def test_battlelogs_store_as_deltas_and_read_back_byte_true(engine_conn):
+    start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    polls = _polls(5)
+    ids = [
+        _store(engine_conn, "player_battlelog", p, at=start + timedelta(hours=i))
+        for i, p in enumerate(polls)
+    ]
+    profile = load_cr_fixture("player_plain")
+    profile_id = _store(engine_conn, "player", profile, at=start)
+
+    rows = {row["payload_id"]: row for row in _rows(engine_conn)}
+    assert [rows[i]["payload_codec"] for i in ids] == ["zlib:1"] + ["delta:1"] * 4
+    assert [rows[i]["base_payload_id"] for i in ids[1:]] == ids[:-1]
+    assert rows[profile_id]["payload_codec"] == "zlib:1"
+    assert all(row["payload_json"] == "" for row in rows.values())
+
+    reader = PayloadReader(engine_conn)
+    for payload_id, payload in zip(ids + [profile_id], polls + [profile], strict=True):
+        row = rows[payload_id]
+        text = reader.text(payload_id, row["payload_codec"], row["payload_json"])
+        assert text == db._json_or_none(payload)
+    # A cold single-row read walks the chain on its own.
+    assert payload_codec.payload_json(engine_conn, ids[-1]) == db._json_or_none(polls[-1])
+
+
+def test_chains_are_cut_and_unrelated_logs_stored_whole(engine_conn, monkeypatch):
+    monkeypatch.setattr(payload_codec, "MAX_DELTA_CHAIN", 2)
+    start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    for i, poll in enumerate(_polls(5)):
+        _store(engine_conn, "player_battlelog", poll, at=start + timedelta(hours=i))
+    # Nothing in common with the last log: a full body, not a delta.
+    _store(engine_conn, "player_battlelog", [{"battleTime": "x"}], at=start + timedelta(hours=9))
+
+    codecs = [row["payload_codec"] for row in _rows(engine_conn)]
+    assert codecs == ["zlib:1", "delta:1", "delta:1", "zlib:1", "delta:1", "zlib:1"]
+
+
+def test_plain_codec_and_repeated_bodies_store_as_before(engine_conn, monkeypatch):
+    monkeypatch.setattr(payload_codec, "CODEC", "json")
+    at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    poll = _polls(1)[0]
+    first = _store(engine_conn, "player_battlelog", poll, at=at)
+    again = _store(engine_conn, "player_battlelog", poll, at=at + timedelta(hours=1))
+
+    assert first == again
+    (row,) = _rows(engine_conn)
+    assert row["payload_codec"] == "json" and row["payload_json"] == db._json_or_none(poll)
+    last = engine_conn.execute("SELECT last_fetched_at FROM raw_api_payloads").fetchone()[0]
+    assert last == "2026-10-01T01:00:00Z"
+
+
+def test_retention_keeps_a_base_until_its_deltas_expire(engine_conn):
+    now = datetime.now(timezone.utc)
+    expired = now - timedelta(days=db.RAW_PAYLOAD_RETENTION_DAYS + 2)
+    polls = _polls(4)
+    ids = [
+        _store(engine_conn, "player_battlelog", polls[i], at=expired + timedelta(hours=i))
+        for i in range(3)
+    ]
+    live = _store(engine_conn, "player_battlelog", polls[3], at=now - timedelta(days=1))
+
+    stats = metadata.purge_old_data(conn=engine_conn)
+
+    assert stats["raw_api_payloads"] == 0
+    assert payload_codec.payload_json(engine_conn, live) == db._json_or_none(polls[3])
+
+    engine_conn.execute(
+        "UPDATE raw_api_payloads SET last_fetched_at = ? WHERE payload_id = ?",
+        (expired.strftime("%Y-%m-%dT%H:%M:%SZ"), live),
+    )
+    stats = metadata.purge_old_data(conn=engine_conn)
+
+    assert stats["raw_api_payloads"] == len(ids) + 1
+    assert _rows(engine_conn) == []
@@ -0,0 +1,126 @@
+"""Write-behind raw-payload persistence: batching, 304 chaining, backpressure."""
+
+import db
+from storage import payload_writer
+from storage.payload_writer import PayloadWriter
+
+
+def _counts(conn):
+    payloads = conn.execute("SELECT COUNT(*) FROM raw_api_payloads").fetchone()[0]
+    receipts = conn.execute("SELECT COUNT(*) FROM api_observation_receipts").fetchone()[0]
+    return payloads, receipts
+
+
+def test_batches_commit_deduped_payloads_and_every_receipt(engine_conn):
+    writer = PayloadWriter(batch_size=3, flush_interval_ms=10_000)
+    try:
+        handles = [writer.submit("player", f"#P{i % 2}", {"tag": f"#P{i % 2}"}) for i in range(7)]
+        assert writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert all(handle.done for handle in handles)
+    assert {handle.result()["payload_id"] for handle in handles} == {
+        handles[0].result()["payload_id"],
+        handles[1].result()["payload_id"],
+    }
+    assert _counts(engine_conn) == (2, 7)
+    stats = writer.stats()
+    assert stats["written"] == 7
+    # 3 + 3 by size, then the flush barrier closes the last one early.
+    assert stats["batches"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["last_flush_ms"] is not None
+    assert stats["avg_flush_ms"] is not None
+
+
+def test_receipt_keeps_the_submit_time(engine_conn, monkeypatch):
+    monkeypatch.setattr(db, "_utcnow", lambda: "2026-10-16T12:00:00")
+    writer = PayloadWriter()
+    try:
+        handle = writer.submit("player", "#ABC", {"tag": "#ABC"})
+        monkeypatch.setattr(db, "_utcnow", lambda: "2026-10-16T12:05:00")
+        writer.flush(timeout=10)
+    finally:
+        writer.close()
+    row = engine_conn.execute(
+        "SELECT fetched_at FROM api_observation_receipts WHERE receipt_id = ?",
+        (handle.result()["receipt_id"],),
+    ).fetchone()
+    assert row[0] == "2026-10-16T12:00:00"
+
+
+def test_304_receipts_against_the_prior_write_in_the_same_batch(engine_conn):
+    writer = PayloadWriter(flush_interval_ms=10_000)
+    try:
+        first = writer.submit("player", "#ABC", {"tag": "#ABC"})
+        replay = writer.submit("player", "#ABC", {"tag": "#ABC"}, prior=first)
+        writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert replay.result()["payload_id"] == first.result()["payload_id"]
+    assert replay.result()["receipt_id"] > first.result()["receipt_id"]
+    assert _counts(engine_conn) == (1, 2)
+
+
+def test_304_after_a_dropped_write_stores_the_body_in_full(engine_conn):
+    writer = PayloadWriter()
+    lost = payload_writer.PendingWrite()
+    lost._resolve(None)
+    try:
+        replay = writer.submit("player", "#ABC", {"tag": "#ABC"}, prior=lost)
+        writer.flush(timeout=10)
+    finally:
+        writer.close()
+    assert replay.result() is not None
+    assert _counts(engine_conn) == (1, 1)
+
+
+def test_full_queue_drops_instead_of_blocking_the_caller(engine_conn, monkeypatch):
+    writer = PayloadWriter(max_items=1, put_timeout=0.01)
+    # No writer thread: the queue fills and stays full.
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)
+    kept = writer.submit("player", "#A", {"tag": "#A"})
+    dropped = writer.submit("player", "#B", {"tag": "#B"})
+
+    assert not kept.done
+    assert dropped.done and dropped.result() is None
+    stats = writer.stats()
+    assert stats["dropped"] == 1
+    assert stats["queue_depth"] == stats["max_queue_depth"] == 1
+    assert writer._queue.get_nowait().entity_key == "#A"
+
+
+def test_a_failing_item_does_not_take_its_batch_with_it(engine_conn, monkeypatch):
+    real_store = db._store_raw_payload
+
+    def store(conn, endpoint, entity_key, payload, **kwargs):
+        if payload.get("poison"):
+            raise RuntimeError("boom")
+        return real_store(conn, endpoint, entity_key, payload, **kwargs)
+
+    monkeypatch.setattr(db, "_store_raw_payload", store)
+    writer = PayloadWriter(flush_interval_ms=10_000)
+    try:
+        good = writer.submit("player", "#A", {"tag": "#A"})
+        bad = writer.submit("player", "#B", {"tag": "#B", "poison": True})
+        writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert good.result() is not None
+    assert bad.result() is None
+    assert writer.stats()["failed"] == 1
+    assert _counts(engine_conn) == (1, 1)
+
+
+def test_close_drains_and_later_submits_write_inline(engine_conn):
+    writer = PayloadWriter(flush_interval_ms=10_000)
+    writer.submit("player", "#A", {"tag": "#A"})
+    writer.close()
+    assert _counts(engine_conn) == (1, 1)
+
+    late = writer.submit("player", "#B", {"tag": "#B"})
+    assert late.done and late.result() is not None
+    assert _counts(engine_conn) == (2, 2)
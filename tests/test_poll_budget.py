@@ -0,0 +1,133 @@
+"""engine.polling.adaptive_budget — the per-tick budget and cadence follow API pressure."""
+
+from __future__ import annotations
+
+from db.schema import build_database
+from engine import db as engine_db
+from engine import polling
+from engine import tick as tick_mod
+from runtime import status as runtime_status
+from tests.test_cold_start_tick import NOW, _ColdApi
+
+
+def _pressure(*, calls=60, rate=2.0, throttled=0, retry_after=None, p90_ms=400.0) -> dict:
+    return {
+        "calls": calls,
+        "calls_per_minute": rate,
+        "throttled": throttled,
+        "retry_after_max": retry_after,
+        "by_endpoint": {
+            "player": {"calls": calls // 2, "p50_ms": p90_ms / 2, "p90_ms": p90_ms},
+            "player_battlelog": {"calls": calls // 2, "p50_ms": p90_ms / 2, "p90_ms": p90_ms},
+        },
+    }
+
+
+def test_no_history_or_a_quiet_api_keeps_the_ratified_budget():
+    base = polling.POLL_BUDGET_PER_TICK
+    assert polling.adaptive_budget(None) == polling.PollBudget(base, 1.0, "baseline")
+    assert polling.adaptive_budget({"calls": 0}, battle_day=True).budget == base
+    assert polling.adaptive_budget(_pressure()) == polling.PollBudget(base, 1.0, "steady")
+
+
+def test_throttling_shrinks_budget_and_stretches_cadence_down_to_the_minimum():
+    sized = [polling.adaptive_budget(_pressure(throttled=n), battle_day=True) for n in (1, 2, 9)]
+    assert [s.budget for s in sized] == [20, polling.POLL_BUDGET_MIN, polling.POLL_BUDGET_MIN]
+    assert [s.cadence_scale for s in sized] == [2.0, 4.0, 8.0]
+    assert {s.reason for s in sized} == {"throttled"}
+    long_wait = polling.adaptive_budget(_pressure(throttled=1, retry_after=60.0))
+    assert long_wait.budget == polling.POLL_BUDGET_MIN
+
+
+def test_rate_and_latency_cap_the_budget():
+    over = polling.adaptive_budget(_pressure(rate=polling.TARGET_CALLS_PER_MINUTE * 2))
+    assert (over.budget, over.reason) == (polling.POLL_BUDGET_PER_TICK // 2, "rate")
+    # 6 workers x 30 s at a 9 s p90 = 20 calls.
+    slow = polling.adaptive_budget(_pressure(p90_ms=9000.0), battle_day=True, workers=6)
+    assert (slow.budget, slow.reason) == (20, "latency")
+    glacial = polling.adaptive_budget(_pressure(p90_ms=120000.0), workers=1)
+    assert glacial.budget == polling.POLL_BUDGET_MIN
+
+
+def test_battle_days_spend_headroom_only_when_it_exists():
+    grown = polling.adaptive_budget(_pressure(), battle_day=True)
+    assert grown == polling.PollBudget(polling.POLL_BUDGET_PER_TICK * 2, 0.5, "battle_day")
+    busy = _pressure(rate=polling.TARGET_CALLS_PER_MINUTE * 0.75)
+    assert polling.adaptive_budget(busy, battle_day=True).reason == "steady"
+    assert polling.adaptive_budget(_pressure(p90_ms=4000.0), battle_day=True).budget == 45
+
+
+def test_cadence_scale_never_moves_the_fairness_floor(tmp_path):
+    db_path = str(tmp_path / "plan.db")
+    build_database(db_path, None)
+    conn = engine_db.connect(db_path)
+    try:
+        # #A warm, 45 min since both polls; #B cold, 7 h since its battlelog.
+        for tag, heat, battlelog, profile in (
+            ("#A", 2, "2026-07-04T11:15:00Z", "2026-07-04T11:15:00Z"),
+            ("#B", 0, "2026-07-04T05:00:00Z", "2026-07-04T10:00:00Z"),
+        ):
+            conn.execute(
+                "INSERT INTO players (player_tag, current_name, first_seen_at, last_seen_at) "
+                "VALUES (?, ?, ?, ?)",
+                (tag, tag, battlelog, battlelog),
+            )
+            conn.execute(
+                "INSERT INTO poll_state (player_tag, temperature, heat, last_battlelog_poll, "
+                "last_profile_poll, updated_at) VALUES (?, 'warm', ?, ?, ?, ?)",
+                (tag, heat, battlelog, profile, battlelog),
+            )
+        now = "2026-07-04T12:00:00Z"
+        roster = ["#A", "#B"]
+        assert polling.plan(conn, now, roster_tags=roster) == [
+            ("battlelog", "#B"),
+            ("battlelog", "#A"),
+        ]
+        assert polling.plan(conn, now, roster_tags=roster, cadence_scale=4.0) == [
+            ("battlelog", "#B"),
+        ]
+        assert polling.plan(conn, now, 1, roster_tags=roster, cadence_scale=0.5) == [
+            ("battlelog", "#B"),
+        ]
+    finally:
+        conn.close()
+
+
+def test_api_pressure_reads_recent_calls_and_429s():
+    with runtime_status._LOCK:
+        runtime_status._API_SAMPLES.clear()
+    for ms in (100, 200, 300, 400, 900):
+        runtime_status.record_api_call("player", "#A", ok=True, status_code=200, duration_ms=ms)
+    runtime_status.record_api_call(
+        "player_battlelog", "#A", ok=False, status_code=429, duration_ms=50, retry_after=4.0
+    )
+    pressure = runtime_status.api_pressure(window_seconds=60)
+    assert pressure["calls"] == 6 and pressure["calls_per_minute"] == 6.0
+    assert pressure["throttled"] == 1 and pressure["retry_after_max"] == 4.0
+    assert pressure["by_endpoint"]["player"] == {
+        "calls": 5,
+        "throttled": 0,
+        "p50_ms": 300,
+        "p90_ms": 900,
+    }
+    endpoint = runtime_status.snapshot()["api"]["by_endpoint"]["player_battlelog"]
+    assert endpoint["throttled_count"] >= 1 and endpoint["last_retry_after"] == 4.0
+    with runtime_status._LOCK:
+        runtime_status._API_SAMPLES.clear()
+
+
+def test_tick_plans_with_the_seams_pressure(tmp_path):
+    class _ThrottledApi(_ColdApi):
+        def api_pressure(self):
+            return _pressure(throttled=5)
+
+    db_path = str(tmp_path / "tick.db")
+    build_database(db_path, None)
+    conn = engine_db.connect(db_path)
+    try:
+        counters = tick_mod.run_tick(conn, NOW, api=_ThrottledApi(), fetch_workers=1)
+    finally:
+        conn.close()
+    assert counters["poll_budget"] == polling.POLL_BUDGET_MIN
+    assert counters["poll_budget_reason"] == "throttled"
+    assert counters["planned_calls"] == 4  # the floors still reach every cold-start member
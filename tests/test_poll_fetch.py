@@ -0,0 +1,93 @@
+"""engine.polling.fetch_plan — overlapped per-player fetches, plan-ordered results."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from db.schema import build_database
+from engine import db as engine_db
+from engine import polling
+from engine import tick as tick_mod
+from tests.test_cold_start_tick import NOW, _ColdApi
+
+
+class _SlowApi:
+    """Earlier plan entries answer slower, so completion order is reversed."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, tag: str, kind: str):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.01 * (self.n - int(tag.strip("#P"))))
+            return {"tag": tag, "kind": kind}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def get_player(self, tag):
+        return self._call(tag, "profile")
+
+    def get_player_battle_log(self, tag):
+        return self._call(tag, "battlelog")
+
+
+def test_fetch_plan_overlaps_calls_and_keeps_plan_order():
+    planned = [("battlelog" if i % 2 else "profile", f"#P{i}") for i in range(8)]
+    api = _SlowApi(len(planned))
+
+    fetched = polling.fetch_plan(api, planned, workers=4)
+
+    assert [(f.endpoint, f.player_tag) for f in fetched] == planned
+    assert [f.payload["kind"] for f in fetched] == [endpoint for endpoint, _ in planned]
+    assert api.peak > 1
+
+
+def test_fetch_plan_single_worker_is_the_serial_walk():
+    planned = [("profile", "#P0"), ("battlelog", "#P1")]
+    api = _SlowApi(len(planned))
+    assert [f.payload["tag"] for f in polling.fetch_plan(api, planned, workers=1)] == [
+        "#P0",
+        "#P1",
+    ]
+    assert api.peak == 1
+    assert polling.fetch_plan(api, [], workers=4) == []
+
+
+def test_fetch_plan_surfaces_a_failed_call():
+    class _Boom(_SlowApi):
+        def get_player(self, tag):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        polling.fetch_plan(_Boom(2), [("battlelog", "#P0"), ("profile", "#P1")], workers=2)
+
+
+def test_concurrent_tick_matches_serial_tick(tmp_path):
+    results = []
+    for workers in (1, 4):
+        db_path = str(tmp_path / f"tick-{workers}.db")
+        build_database(db_path, None)
+        conn = engine_db.connect(db_path)
+        try:
+            counters = tick_mod.run_tick(conn, NOW, api=_ColdApi(), fetch_workers=workers)
+            baselines = conn.execute(
+                "SELECT entity_kind, entity_tag, aspect, payload_json "
+                "FROM state_baselines ORDER BY 1, 2, 3"
+            ).fetchall()
+        finally:
+            conn.close()
+        counters.pop("materialization_id")
+        counters.pop("tick_completed_at")
+        results.append((counters, [tuple(row) for row in baselines]))
+    assert results[0] == results[1]
+    assert results[0][0]["planned_calls"] == 4
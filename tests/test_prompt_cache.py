@@ -0,0 +1,148 @@
+"""Prompt assembly is cached without ever serving a stale prompt.
+
+Prompt files are re-read only when their stat changes, parsed DISCORD.md / CLAN.md
+sections only when the text changes, and the live join floor once per data
+generation. System prompts are interned by content hash, so an unchanged prefix
+is the same string every time.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+import db
+import prompts
+from agent import core as agent_core
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    prompts._clear_prompt_cache()
+    agent_core._clear_system_prompts()
+    yield
+    prompts._clear_prompt_cache()
+    agent_core._clear_system_prompts()
+
+
+def _settle(path, seconds_ago: int) -> None:
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+def test_an_edited_prompt_file_is_picked_up(tmp_path, monkeypatch):
+    path = tmp_path / "LANE.md"
+    path.write_text("first\n")
+    _settle(path, 60)
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda *a, **k: opened.append(a[0]) or real_open(*a, **k))
+
+    first = prompts._read_prompt_file(str(path))
+    assert prompts._read_prompt_file(str(path)) is first
+    assert opened == [str(path)]
+
+    # Same size, new mtime: still a change.
+    with real_open(path, "w") as f:
+        f.write("again\n")
+    _settle(path, 30)
+    assert prompts._read_prompt_file(str(path)) == "again"
+
+
+def test_a_freshly_written_file_is_not_trusted_to_the_cache(tmp_path):
+    path = tmp_path / "JOB.md"
+    path.write_text("one\n")
+    assert prompts._read_prompt_file(str(path)) == "one"
+    # Rewritten within the mtime granularity, same size: must not be served stale.
+    stat = os.stat(path)
+    path.write_text("two\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert prompts._read_prompt_file(str(path)) == "two"
+
+
+def test_parsed_sections_are_memoized_copies(monkeypatch):
+    channels = prompts.discord_channel_configs()
+    channels[0]["lane"] = "mutated by a caller"
+    assert prompts.discord_channel_configs()[0]["lane"] != "mutated by a caller"
+    assert prompts.thresholds() == prompts._parse_config_section(prompts._clan_raw(), "Thresholds")
+
+    parses = []
+    real_parse = prompts._parse_discord_channels
+    monkeypatch.setattr(
+        prompts, "_parse_discord_channels", lambda text: parses.append(1) or real_parse(text)
+    )
+    prompts.discord_channel_configs()
+    assert parses == []
+    edited = prompts.discord().replace("## #welcome", "## #lobby", 1)
+    monkeypatch.setattr(prompts, "discord", lambda: edited)
+    assert prompts.discord_channel_configs()[0]["name"] == "#lobby"
+    assert parses == [1]
+
+
+def _set_floor(conn, value: int) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO clans (clan_tag, name, first_seen_at, last_seen_at, is_home) "
+        "VALUES ('#J2RGCRVG', 'POAP KINGS', '2026-02-04', '2026-07-30', 1)"
+    )
+    conn.execute(
+        "INSERT INTO clan_daily_metrics (clan_tag, metric_date, required_trophies, observed_at) "
+        "VALUES ('#J2RGCRVG', '2026-07-30', ?, '2026-07-30T00:00:00Z') "
+        "ON CONFLICT (clan_tag, metric_date) DO UPDATE SET required_trophies = excluded.required_trophies",
+        (value,),
+    )
+    conn.commit()
+
+
+def test_the_floor_is_read_once_per_generation(engine_conn, monkeypatch, new_generation):
+    reads = []
+    real_read = prompts._read_required_trophies
+    monkeypatch.setattr(prompts, "_read_required_trophies", lambda: reads.append(1) or real_read())
+
+    # No applied generation: nothing to key on, so every prompt reads live.
+    _set_floor(engine_conn, 7000)
+    assert prompts._live_required_trophies() == 7000
+    assert prompts._live_required_trophies() == 7000
+    assert len(reads) == 2
+
+    new_generation(engine_conn)
+    assert prompts._live_required_trophies() == 7000
+    assert prompts._live_required_trophies() == 7000
+    assert len(reads) == 3
+
+    # The engine writes the floor as part of the next generation.
+    _set_floor(engine_conn, 8000)
+    new_generation(engine_conn)
+    assert prompts._live_required_trophies() == 8000
+    assert "8,000" in prompts.clan()
+    assert len(reads) == 4
+
+    # The live clan refresh snapshots the metrics outside any generation.
+    db.snapshot_clan_daily_metrics(
+        {"tag": "#J2RGCRVG", "requiredTrophies": 8500, "memberList": []},
+        observed_at="2026-07-30T06:00:00Z",
+    )
+    assert prompts._live_required_trophies() == 8500
+    assert prompts._live_required_trophies() == 8500
+    assert len(reads) == 5
+
+
+def test_identical_system_prompts_are_the_same_string():
+    first = agent_core._build_system_prompt("identity", "knowledge " * 3, None)
+    second = agent_core._build_system_prompt("identity", "knowledge " * 3, "")
+    assert first is second
+    assert agent_core.system_prompt_hash(first) == agent_core.system_prompt_hash(second)
+    assert agent_core._build_system_prompt("identity", "other") != first
+
+
+def test_prefix_churn_is_counted_per_workflow():
+    stable = agent_core._build_system_prompt("stable")
+    for _ in range(3):
+        agent_core._note_system_prefix("awareness", stable)
+    agent_core._note_system_prefix("awareness", agent_core._build_system_prompt("drifted"))
+    stats = agent_core.system_prefix_stats()["awareness"]
+    assert stats["calls"] == 4 and stats["changes"] == 1
+    assert stats["hash"] == agent_core.system_prompt_hash(
+        agent_core._build_system_prompt("drifted")
+    )
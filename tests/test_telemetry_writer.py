@@ -0,0 +1,98 @@
+"""Write-behind telemetry: batching, read-your-writes, backpressure, shutdown."""
+
+from storage import telemetry
+from storage.telemetry_writer import TelemetryWriter
+
+_INSERT = (
+    "INSERT INTO db_transactions (recorded_at, call_site, held_ms, statements, outcome) "
+    "VALUES ('2026-10-17T00:00:00Z', ?, 1, 1, 'commit')"
+)
+
+
+def _sites():
+    rows = telemetry.connect().execute("SELECT call_site FROM db_transactions ORDER BY txn_id")
+    return [row[0] for row in rows]
+
+
+def test_rows_commit_in_batches_by_size_and_barrier():
+    writer = TelemetryWriter(batch_size=3, flush_interval_ms=10_000)
+    path = telemetry.telemetry_path()
+    try:
+        for i in range(7):
+            assert writer.submit(path, _INSERT, (f"site{i}",))
+        assert writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert _sites() == [f"site{i}" for i in range(7)]
+    stats = writer.stats()
+    assert stats["written"] == 7 and stats["dropped"] == 0
+    # 3 + 3 by size, then the flush barrier closes the last one early.
+    assert stats["batches"] == 3
+    assert stats["queue_depth"] == 0 and stats["avg_flush_ms"] is not None
+
+
+def test_records_are_queued_and_connect_reads_them_back():
+    telemetry.record_llm_call("interactive", "haiku", duration_ms=420, turn_id="t1")
+    telemetry.record_transaction("engine/tick.py:1", 250, statements=9, outcome="commit")
+    telemetry.record_wake_observation(
+        mode="shadow", wake_class="hard", wake_model="m", signal_keys=["k"], event_types=["e"]
+    )
+
+    conn = telemetry.connect()  # flushes the queue first
+    call = conn.execute("SELECT workflow, duration_ms, turn_id FROM llm_calls").fetchone()
+    assert tuple(call) == ("interactive", 420, "t1")
+    assert _sites() == ["engine/tick.py:1"]
+    assert conn.execute("SELECT COUNT(*) FROM wake_observations").fetchone()[0] == 1
+
+
+def test_a_stalled_transaction_lands_inline_and_its_finalize_is_queued():
+    txn_id = telemetry.record_transaction("engine/tick.py:9", 46_100, outcome="stalled")
+    assert txn_id is not None
+    assert (
+        telemetry.record_transaction(
+            "engine/tick.py:9", 47_000, statements=3, outcome="commit", txn_id=txn_id
+        )
+        == txn_id
+    )
+
+    rows = telemetry.connect().execute("SELECT txn_id, held_ms, outcome FROM db_transactions")
+    assert [tuple(r) for r in rows] == [(txn_id, 47_000, "commit")]
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking(monkeypatch):
+    writer = TelemetryWriter(max_items=1)
+    # No writer thread: the queue fills and stays full.
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)
+    path = telemetry.telemetry_path()
+
+    assert writer.submit(path, _INSERT, ("kept",))
+    assert not writer.submit(path, _INSERT, ("dropped",))
+    stats = writer.stats()
+    assert stats["submitted"] == 2 and stats["dropped"] == 1
+    assert stats["queue_depth"] == stats["max_queue_depth"] == 1
+
+
+def test_a_failing_row_does_not_take_its_batch_with_it():
+    writer = TelemetryWriter(flush_interval_ms=10_000)
+    path = telemetry.telemetry_path()
+    try:
+        writer.submit(path, _INSERT, ("good",))
+        writer.submit(path, "INSERT INTO no_such_table VALUES (?)", ("bad",))
+        writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert _sites() == ["good"]
+    assert writer.stats()["failed"] == 1 and writer.stats()["written"] == 1
+
+
+def test_close_drains_and_later_submits_write_inline():
+    writer = TelemetryWriter(flush_interval_ms=10_000)
+    path = telemetry.telemetry_path()
+    writer.submit(path, _INSERT, ("queued",))
+    writer.close()
+    assert _sites() == ["queued"]
+
+    assert writer.submit(path, _INSERT, ("late",))
+    assert _sites() == ["queued", "late"]
@@ -0,0 +1,155 @@
+"""Read-tool results are memoized for one turn, keyed on the data generation.
+
+A repeat of the same read (same workflow, tool and args) within a turn replays
+the earlier raw result, so the model sees exactly what it saw the first time.
+Any write tool, or a new materialization generation, forces a fresh read.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Full runtime/agent init first — see test_awareness_write_tools.
+import elixir  # noqa: F401
+from agent import chat as agent_chat
+from agent.core import current_tool_cache, turn
+from agent.tool_policy import TOOLSETS_BY_WORKFLOW
+
+_FINAL = {"event_type": "channel_response", "content": "done"}
+
+
+def _run(rounds, *, before_round=None):
+    """Drive _chat_with_tools through ``rounds`` of tool calls, then a final answer.
+
+    Returns (executions, tool_result contents per round, tool_stats)."""
+    executions = []
+    sent = []
+    scripted = [SimpleNamespace(content=calls, stop_reason="tool_use") for calls in rounds]
+    scripted.append(
+        SimpleNamespace(content=[SimpleNamespace(type="text", text=json.dumps(_FINAL))])
+    )
+    responses = iter(scripted)
+
+    def fake_completion(**kwargs):
+        sent.append(kwargs["messages"][-1]["content"])
+        if before_round is not None:
+            before_round(len(sent) - 1)
+        return next(responses)
+
+    def fake_tool(name, arguments, workflow=None):
+        executions.append((name, json.dumps(arguments, sort_keys=True)))
+        return json.dumps({"tool": name, "args": arguments, "n": len(executions)})
+
+    tool_stats: dict = {}
+    with (
+        patch.object(agent_chat, "_create_chat_completion", side_effect=fake_completion),
+        patch.object(agent_chat, "_execute_tool", side_effect=fake_tool),
+    ):
+        result = agent_chat._chat_with_tools(
+            "system",
+            "user",
+            workflow="clanops",
+            allowed_tools=TOOLSETS_BY_WORKFLOW["clanops"],
+            response_schema={"required": ["content"]},
+            tool_stats=tool_stats,
+        )
+    assert result == _FINAL
+    return executions, sent[1:], tool_stats
+
+
+def test_repeats_replay_until_a_write_clears_the_turn(tool_use):
+    executions, results, stats = _run(
+        [
+            [tool_use("r1", "get_member", {"member_tag": "#A"})],
+            [
+                tool_use("r2a", "get_member", {"member_tag": "#A"}),
+                tool_use("r2b", "get_elixir_state", {"view": "summary"}),
+                tool_use("r2c", "get_elixir_state", {"view": "summary"}),
+            ],
+            [tool_use("w3", "save_clan_memory", {"title": "t", "body": "b"})],
+            [tool_use("r4", "get_member", {"member_tag": "#A"})],
+        ]
+    )
+
+    assert [name for name, _args in executions] == [
+        "get_member",
+        "get_elixir_state",
+        "save_clan_memory",
+        "get_member",
+    ]
+    # The replay is byte-identical to what the model saw the first time.
+    assert results[1][0]["content"] == results[0][0]["content"]
+    assert results[1][1]["content"] == results[1][2]["content"]
+    assert results[3][0]["content"] != results[0][0]["content"]
+    assert stats["tool_cache"] == {
+        "hits": 2,
+        "misses": 3,
+        "invalidations": 1,
+        "hit_rate": 0.4,
+    }
+    assert [entry["tool"] for entry in stats["tool_trace"]] == [
+        "get_member",
+        "get_member",
+        "get_elixir_state",
+        "get_elixir_state",
+        "save_clan_memory",
+        "get_member",
+    ]
+
+
+def test_a_new_generation_mid_turn_is_a_miss(tool_use, new_generation):
+    executions, _results, stats = _run(
+        [
+            [tool_use("r1", "get_member", {"member_tag": "#A"})],
+            [tool_use("r2", "get_member", {"member_tag": "#A"})],
+            [tool_use("r3", "get_member", {"member_tag": "#A"})],
+        ],
+        before_round=lambda index: new_generation() if index == 2 else None,
+    )
+    assert len(executions) == 2
+    assert stats["tool_cache"]["hits"] == 1 and stats["tool_cache"]["misses"] == 2
+
+
+def test_live_lookups_and_failures_are_not_replayed(tool_use):
+    calls = []
+
+    def fake_tool(name, arguments, workflow=None):
+        calls.append(name)
+        if name == "get_member":
+            return json.dumps({"error": "member_not_found"})
+        return json.dumps({"ok": True})
+
+    rounds = [
+        [tool_use("c1", "cr_api", {"aspect": "player", "tag": "#X"})],
+        [tool_use("c2", "cr_api", {"aspect": "player", "tag": "#X"})],
+        [tool_use("m1", "get_member", {"member_tag": "#Z"})],
+        [tool_use("m2", "get_member", {"member_tag": "#Z"})],
+    ]
+    scripted = iter(
+        [SimpleNamespace(content=r, stop_reason="tool_use") for r in rounds]
+        + [SimpleNamespace(content=[SimpleNamespace(type="text", text=json.dumps(_FINAL))])]
+    )
+    with (
+        patch.object(
+            agent_chat, "_create_chat_completion", side_effect=lambda **kw: next(scripted)
+        ),
+        patch.object(agent_chat, "_execute_tool", side_effect=fake_tool),
+    ):
+        agent_chat._chat_with_tools(
+            "system",
+            "user",
+            workflow="clanops",
+            allowed_tools=TOOLSETS_BY_WORKFLOW["clanops"],
+            response_schema={"required": ["content"]},
+        )
+    assert calls == ["cr_api", "cr_api", "get_member", "get_member"]
+
+
+def test_the_cache_lives_and_dies_with_the_outer_turn():
+    assert current_tool_cache() is None
+    with turn():
+        outer = current_tool_cache()
+        with turn():
+            assert current_tool_cache() is outer
+        assert current_tool_cache() is outer
+    assert current_tool_cache() is None
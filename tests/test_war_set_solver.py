@@ -0,0 +1,126 @@
+"""The war-set search must find the best disjoint set, and never do worse than greedy.
+
+Checked against exhaustive enumeration on small candidate pools shaped like real
+ones: decks built mostly from their archetype's cards plus a skewed pick of
+popular ones (which is what makes disjointness bind), a handful of families, and
+some decks the member has played.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+from capabilities import deck_intel
+
+FAMILIES = ["beatdown", "cycle", "control", "bait", "siege"]
+CORES = 8  # archetypes, each drawing most of its deck from its own ten cards
+POPULARITY = [1.0 / (1 + i) ** 0.7 for i in range(CORES * 10)]  # a few cards recur everywhere
+
+
+def _cands(rng: random.Random, n: int) -> list[dict]:
+    out = []
+    for i in range(n):
+        core = rng.randrange(CORES)
+        cards = set(rng.sample(range(core * 10, core * 10 + 10), 7))
+        while len(cards) < 8:
+            cards.add(rng.choices(range(CORES * 10), POPULARITY)[0])
+        out.append(
+            {
+                "deck_hash": f"h{i}",
+                "family": FAMILIES[core % 5] if rng.random() < 0.7 else rng.choice(FAMILIES),
+                "card_ids": frozenset(cards),
+                "levels_from_max": round(rng.uniform(0, 3), 2),
+                "worst_card_from_max": rng.randint(0, 5),
+            }
+        )
+    return out
+
+
+def _brute_force(cands, count, played) -> tuple[float, float] | None:
+    rank = deck_intel._familiarity_rank(played)
+    best = None
+    for combo in itertools.combinations(cands, count):
+        ids = [c for d in combo for c in d["card_ids"]]
+        if len(ids) != len(set(ids)):
+            continue
+        if len({d["family"] for d in combo}) < count - 1:
+            continue
+        # Rounded: 0.67 and 0.6699999999999999 are the same readiness.
+        score = tuple(round(v, 6) for v in deck_intel._set_score(combo, rank))
+        if best is None or score < best:
+            best = score
+    return best
+
+
+def _valid(picks, count) -> bool:
+    ids = [c for d in picks for c in d["card_ids"]]
+    return (
+        len(picks) == count
+        and len(ids) == len(set(ids))
+        and len({d["family"] for d in picks}) >= count - 1
+    )
+
+
+def test_search_matches_exhaustive_optimum_and_never_loses_to_greedy():
+    rng = random.Random(2026_10_16)
+    beaten = 0
+    for trial in range(60):
+        cands = _cands(rng, rng.randint(8, 20))
+        played = frozenset(d["deck_hash"] for d in cands if rng.random() < 0.15)
+        rank = deck_intel._familiarity_rank(played)
+        greedy = deck_intel._greedy_disjoint(cands, 4, played=played)
+        picks, report = deck_intel._pick_disjoint(cands, 4, played=played, budget=10.0)
+        optimum = _brute_force(cands, 4, played)
+
+        assert report["complete"] is True
+        if optimum is None:
+            assert len(picks) < 4, f"trial {trial}: found a set exhaustive search says is absent"
+            continue
+        assert _valid(picks, 4), f"trial {trial}: invalid set {picks}"
+        score = tuple(round(v, 6) for v in deck_intel._set_score(picks, rank))
+        assert score == optimum, f"trial {trial}: {score} is not the optimum {optimum}"
+        if len(greedy) == 4:
+            assert score <= tuple(round(v, 6) for v in deck_intel._set_score(greedy, rank))
+        if report["beat_greedy"]:
+            beaten += 1
+            assert picks != greedy
+        else:
+            assert picks == greedy, "a tie must keep greedy's set"
+    assert beaten, "the seed should include pools where greedy is suboptimal"
+
+
+def test_search_finds_a_set_greedy_blocks_itself_out_of():
+    # The best deck holds card 0, which both of two other decks need; taking it
+    # leaves only three disjoint decks, skipping it leaves four.
+    def deck(h, cards, lfm, fam):
+        return {
+            "deck_hash": h,
+            "family": fam,
+            "card_ids": frozenset(cards),
+            "levels_from_max": lfm,
+            "worst_card_from_max": 0,
+        }
+
+    cands = [
+        deck("best", [0, 1, 2, 3, 4, 5, 6, 7], 0.1, "cycle"),
+        deck("a", [0, 11, 12, 13, 14, 15, 16, 17], 0.5, "bait"),
+        deck("b", [1, 21, 22, 23, 24, 25, 26, 27], 0.5, "control"),
+        deck("c", [31, 32, 33, 34, 35, 36, 37, 38], 0.6, "siege"),
+        deck("d", [41, 42, 43, 44, 45, 46, 47, 48], 0.7, "beatdown"),
+    ]
+    assert len(deck_intel._greedy_disjoint(cands, 4)) == 3
+    picks, report = deck_intel._pick_disjoint(cands, 4)
+    assert [d["deck_hash"] for d in picks] == ["a", "b", "c", "d"]
+    assert report["beat_greedy"] is True and report["worst_gain"] is None
+
+
+def test_exhausted_budget_returns_the_best_set_so_far():
+    rng = random.Random(5)
+    cands = _cands(rng, 400)
+    greedy = deck_intel._greedy_disjoint(cands, 4)
+    picks, report = deck_intel._pick_disjoint(cands, 4, budget=0.0)
+    assert len(picks) == 4 or len(greedy) < 4
+    if len(greedy) == 4 and not report["complete"]:
+        rank = deck_intel._familiarity_rank(frozenset())
+        assert deck_intel._set_score(picks, rank) <= deck_intel._set_score(greedy, rank)